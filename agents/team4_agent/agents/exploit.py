@@ -1,5 +1,6 @@
 from google.adk.agents import Agent
 
+from ..tools.ranges import get_opponent_ranges
 from .model import AGENT_MODEL
 
 preflop_exploit_agent = Agent(
@@ -13,6 +14,8 @@ preflop_exploit_agent = Agent(
 あなたには以下の情報が与えられます:
 - **your_id**: あなたのプレイヤーID
 - **phase**: 現在のゲームフェーズ（preflop/flop/turn/river）
+- **your_cards**: プレイヤーの手札（♥♦♠♣で表記）
+- **community**: コミュニティカード（フェーズに応じて0-5枚）
 - **your_chips**: プレイヤーの残りチップ数
 - **your_bet_this_round**: 現在のラウンドでのベット額
 - **your_total_bet_this_hand**: そのハンド全体でこれまでに投じた累計ベット額（ブラインド含む）
@@ -32,7 +35,11 @@ preflop_exploit_agent = Agent(
 - activeな各プレイヤーのチップ数
 - potの量、その変化
 - 現在のゲームで負けるときのリスク
+
+また、tool `get_opponent_ranges` を使用して、historyから推定した各相手のレンジの広さ（range_percent, %表記）と、
+そのレンジに対する自分の手札のエクイティ（equity, %表記）を求め、相手毎にaction agentに渡してください。
     """,
+    tools=[get_opponent_ranges],
 )
 
 flop_exploit_agent = Agent(
@@ -46,6 +53,8 @@ flop_exploit_agent = Agent(
 あなたには以下の情報が与えられます:
 - **your_id**: あなたのプレイヤーID
 - **phase**: 現在のゲームフェーズ（preflop/flop/turn/river）
+- **your_cards**: プレイヤーの手札（♥♦♠♣で表記）
+- **community**: コミュニティカード（フェーズに応じて0-5枚）
 - **your_chips**: プレイヤーの残りチップ数
 - **your_bet_this_round**: 現在のラウンドでのベット額
 - **your_total_bet_this_hand**: そのハンド全体でこれまでに投じた累計ベット額（ブラインド含む）
@@ -65,7 +74,11 @@ flop_exploit_agent = Agent(
 - activeな各プレイヤーのチップ数
 - potの量、その変化
 - 現在のゲームで負けるときのリスク
+
+また、tool `get_opponent_ranges` を使用して、historyから推定した各相手のレンジの広さ（range_percent, %表記）と、
+そのレンジに対する自分の手札のエクイティ（equity, %表記）を求め、相手毎にaction agentに渡してください。
     """,
+    tools=[get_opponent_ranges],
 )
 turn_exploit_agent = Agent(
     name="exploit_agent",
@@ -78,6 +91,8 @@ turn_exploit_agent = Agent(
 あなたには以下の情報が与えられます:
 - **your_id**: あなたのプレイヤーID
 - **phase**: 現在のゲームフェーズ（preflop/flop/turn/river）
+- **your_cards**: プレイヤーの手札（♥♦♠♣で表記）
+- **community**: コミュニティカード（フェーズに応じて0-5枚）
 - **your_chips**: プレイヤーの残りチップ数
 - **your_bet_this_round**: 現在のラウンドでのベット額
 - **your_total_bet_this_hand**: そのハンド全体でこれまでに投じた累計ベット額（ブラインド含む）
@@ -97,7 +112,11 @@ turn_exploit_agent = Agent(
 - activeな各プレイヤーのチップ数
 - potの量、その変化
 - 現在のゲームで負けるときのリスク
+
+また、tool `get_opponent_ranges` を使用して、historyから推定した各相手のレンジの広さ（range_percent, %表記）と、
+そのレンジに対する自分の手札のエクイティ（equity, %表記）を求め、相手毎にaction agentに渡してください。
     """,
+    tools=[get_opponent_ranges],
 )
 
 river_exploit_agent = Agent(
@@ -111,6 +130,8 @@ river_exploit_agent = Agent(
 あなたには以下の情報が与えられます:
 - **your_id**: あなたのプレイヤーID
 - **phase**: 現在のゲームフェーズ（preflop/flop/turn/river）
+- **your_cards**: プレイヤーの手札（♥♦♠♣で表記）
+- **community**: コミュニティカード（フェーズに応じて0-5枚）
 - **your_chips**: プレイヤーの残りチップ数
 - **your_bet_this_round**: 現在のラウンドでのベット額
 - **your_total_bet_this_hand**: そのハンド全体でこれまでに投じた累計ベット額（ブラインド含む）
@@ -130,5 +151,9 @@ river_exploit_agent = Agent(
 - activeな各プレイヤーのチップ数
 - potの量、その変化
 - 現在のゲームで負けるときのリスク
+
+また、tool `get_opponent_ranges` を使用して、historyから推定した各相手のレンジの広さ（range_percent, %表記）と、
+そのレンジに対する自分の手札のエクイティ（equity, %表記）を求め、相手毎にaction agentに渡してください。
     """,
+    tools=[get_opponent_ranges],
 )
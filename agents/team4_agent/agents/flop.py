@@ -20,6 +20,7 @@ flop_agent = Agent(
     "2. tool `get_outs_info`を使用してそれよりも強い役それぞれについて、次の要素を箇条書きとで出力してください。 "
     "3. tool `get_outs_info`を使用してそれよりも強い役それぞれについて、次の要素を箇条書きとで出力してください。 "
     "対象の役の名前, outs数, ドローで引く確率, outsとなるカードのリスト(`rank suit'の表記方法)"
+    "最後に tool `get_outs_info` の equity（ランダムな手札の相手1人に対するエクイティ, %表記）を出力してください。"
     "役の名前は強い順に以下に示します。"
     "1. ROYAL_FLUSH"
     "2. STRAIGHT_FLUSH"
@@ -1,20 +1,15 @@
 from typing import Optional
 
 from .poker.evaluator import HandEvaluator, HandRank
-from .poker.game_models import Card
-
-RANK = {name: rank for rank, name in Card.RANK_NAMES.items()}
-SUIT = {symbol: suit for suit, symbol in Card.SUIT_SYMBOLS.items()}
+from .poker.game_models import Card, cards_from_strs
 
 
 def parse_card(card: str) -> Card:
-    rank = RANK[card[:-1]]
-    suit = SUIT[card[-1]]
-    return Card(rank, suit)
+    return Card.from_str(card)
 
 
 def parse_cards(cards: list[str]) -> list[Card]:
-    return [parse_card(card) for card in cards]
+    return cards_from_strs(cards)
 
 
 def get_hand_rank(hands: list[str], community: list[str]) -> str:
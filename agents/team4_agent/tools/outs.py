@@ -1,188 +1,219 @@
-from .card import parse_cards
-from .poker.evaluator import HandEvaluator, HandRank
-from .poker.game_models import Card, Suit
+import os
+from functools import lru_cache
+from itertools import chain, combinations
+from math import comb
+
+import numpy as np
 
-PROBABILITY = [[0.0, 2.2, 4.3, 6.5, 8.7, 10.9, 13.0, 15.2, 17.4, 19.6, 21.7,
-                23.9, 26.1, 28.3, 30.4, 32.6, 34.8, 37.0, 39.1, 41.3, 43.5],
-               [0.0, 4.3, 8.4, 12.5, 16.5, 20.3, 24.1, 27.8, 31.5, 35.0, 38.4,
-                41.7, 45.0, 48.1, 51.2, 54.1, 57.0, 59.8, 62.4, 65.0, 67.5]]
+from .card import parse_cards
+from .poker.batch_evaluator import evaluate_masks
+from .poker.canonical import (
+    canonical_key,
+    canonical_suit_map,
+    canonicalize,
+    get_default_cache,
+    invert_suit_map,
+    relabel,
+)
+from .poker.evaluator import HandRank
+from .poker.fast_evaluator import CATEGORY_SHIFT, evaluate_mask
+from .poker.flop_table import load_table, lookup
+from .poker.game_models import Card, cards_to_mask
+
+# 正規化した (手札, ボード) 毎の結果を共有キャッシュに保存する名前空間
+OUTS_CACHE_NAMESPACE = "team4.outs"
+# 正規化したボード毎の相手の強さの表を保持する数（ターンの表は1つ1MB程度）
+OPPONENT_TABLE_CACHE_SIZE = 8
+# フロップのエクイティ表（全1755フロップ x 1326組）。作り直す場合はリポジトリのルートで:
+#   uv run python -m poker.flop_table --output agents/team4_agent/tools/flop_equity.npz
+FLOP_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "flop_equity.npz"
+)
+
+_flop_table = None
 
 
 def get_outs_info(hands: list[str], community: list[str]) -> dict:
     """
     現在の役よりも強い役について、outsの情報を求める。
     現在の役よりも弱い役についての情報は出力されない。
+    残りのボード（フロップなら2枚、ターンなら1枚）を全通り列挙して正確に計算する。
+    フロップのエクイティは同じ完全列挙で事前に計算した表（flop_equity.npz）から引く。
     Args:
         hands (list[str]): 自身のカード (2枚)
         community (list[str]): 場のカード (3, 4枚)
     Return:
-        現在よりも強い役にそれぞれ対するoutsの情報についての辞書
+        現在よりも強い役にそれぞれ対するoutsの情報と、エクイティについての辞書
         以下の形式で出力される。
         {
         役の名前: {
-            "cards": [outsとなるカードのリスト],
+            "card": [次の1枚でその役になるカードのリスト],
             "outs": outs数,
-            "probability": 残りのドローでそれを引く確率 (%表記),
-            }
+            "probability": リバーまでにその役が完成する確率 (%表記),
+            },
+        "equity": ランダムな手札の相手1人に対するエクイティ (%表記、引き分けは半分),
         }
     """
-    calc = CalcOuts(hands, community)
-    outs_by_rank = calc.get_outs_by_rank()
+    hole, board, suit_map = canonicalize(parse_cards(hands), parse_cards(community))
+    if len(hole) != 2 or len(board) not in (3, 4):
+        raise ValueError("hands must be 2 cards and community must be 3 or 4 cards")
+
+    # スートの入れ替えで同じになる状況は、正規形の代表で求めた結果を共有する
+    result = get_default_cache().get_or_compute(
+        OUTS_CACHE_NAMESPACE,
+        canonical_key(hole, board),
+        lambda: _calc_outs_info(hole, board),
+    )
+
+    # 代表のスートで表したカードを元のスートに戻す
+    inverse = invert_suit_map(suit_map)
+    info = {}
+    for name, entry in result.items():
+        if name == "equity":
+            info[name] = entry
+        else:
+            cards = [str(card) for card in relabel(entry["card"], inverse)]
+            info[name] = {**entry, "card": cards}
+    return info
+
+
+def _calc_outs_info(hole: list[Card], board: list[Card]) -> dict:
+    hole_mask = cards_to_mask(hole)
+    base = hole_mask | cards_to_mask(board)
+    current = evaluate_mask(base) >> CATEGORY_SHIFT
+    remaining = [card_id for card_id in range(52) if not base >> card_id & 1]
+    draws = 5 - len(board)
+
+    # 残りのボードを全通り列挙: 完成する役の回数と、エクイティ計算用の自分の強さ
+    final_counts = [0] * (len(HandRank) + 1)
+    strengths = np.zeros((52,) * draws, dtype=np.int64)
+    for runout in combinations(remaining, draws):
+        mask = base
+        for card_id in runout:
+            mask |= 1 << card_id
+        strength = evaluate_mask(mask)
+        final_counts[strength >> CATEGORY_SHIFT] += 1
+        strengths[runout] = strength
+        strengths[runout[::-1]] = strength
+    total = sum(final_counts)
+
+    # 次の1枚で完成する役毎の outs
+    outs: dict[int, list[Card]] = {}
+    for card_id in remaining:
+        category = evaluate_mask(base | 1 << card_id) >> CATEGORY_SHIFT
+        if category > current:
+            outs.setdefault(category, []).append(Card.from_id(card_id))
 
     result = dict()
-    for rank, outs in outs_by_rank.items():
-        result[rank.name] = {
-            "card": [str(card) for card in outs],
-            "outs": len(outs),
-            "probability": PROBABILITY[6-len(calc.all_cards)][len(outs)]
+    for hand_rank in reversed(HandRank):
+        if hand_rank.value <= current:
+            continue
+        count = final_counts[hand_rank.value]
+        cards = outs.get(hand_rank.value, [])
+        if not count and not cards:
+            continue
+        result[hand_rank.name] = {
+            "card": [str(card) for card in cards],
+            "outs": len(cards),
+            "probability": round(100 * count / total, 1),
         }
 
+    if len(board) == 3:
+        equity = lookup(*_load_flop_table(), hole, board)
+    else:
+        equity = _equity_vs_random(hole_mask, board, strengths)
+    result["equity"] = round(100 * equity, 1)
     return result
 
 
-class CalcOuts:
-    def __init__(self, hands: list[str], community: list[str]):
-        self.hands = parse_cards(hands)
-        self.community = parse_cards(community)
-
-        self.count()
-        self.result = HandEvaluator.evaluate_hand(self.hands, self.community)
-
-    @property
-    def all_cards(self) -> list[Card]:
-        return self.hands + self.community
-
-    def count(self):
-        self.rank_counts = {rank: 0 for rank in Card.RANK_NAMES}
-        for card in self.all_cards:
-            self.rank_counts[card.rank] += 1
-
-        self.ranks_by_count = {count: [] for count in range(5)}
-        for rank, count in self.rank_counts.items():
-            self.ranks_by_count[count].append(rank)
-
-        self.suit_counts = {suit: 0 for suit in Suit}
-        for card in self.all_cards:
-            self.suit_counts[card.suit] += 1
-
-    def get_outs_by_rank(self):
-        outs_by_rank: dict[HandRank, set[Card]] = dict()
-        for hand_rank in reversed(HandRank):
-            if hand_rank.value <= self.result.rank.value:
-                continue
-            match hand_rank:
-                case HandRank.ROYAL_FLUSH:
-                    outs_by_rank[hand_rank] = self.get_royal_flush_outs()
-                case HandRank.STRAIGHT_FLUSH:
-                    outs_by_rank[hand_rank] = self.get_straight_flush_outs()
-                case HandRank.FOUR_OF_A_KIND:
-                    outs_by_rank[hand_rank] = self.get_four_of_a_kind_outs()
-                case HandRank.FULL_HOUSE:
-                    outs_by_rank[hand_rank] = self.get_full_house_outs()
-                case HandRank.FLUSH:
-                    outs_by_rank[hand_rank] = self.get_flush_outs()
-                case HandRank.STRAIGHT:
-                    outs_by_rank[hand_rank] = self.get_straight_outs()
-                case HandRank.THREE_OF_A_KIND:
-                    outs_by_rank[hand_rank] = self.get_three_of_a_kind_outs()
-                case HandRank.TWO_PAIR:
-                    outs_by_rank[hand_rank] = self.get_two_pair_outs()
-                case HandRank.ONE_PAIR:
-                    outs_by_rank[hand_rank] = self.get_one_pair_outs()
-
-            for rank, outs in outs_by_rank.items():
-                if hand_rank.value <= rank.value:
-                    continue
-                outs.difference_update(outs_by_rank[hand_rank])
-
-        return outs_by_rank
-
-    def get_royal_flush_outs(self) -> set[Card]:
-        for suit in Suit:
-            needed_cards = {Card(rank, suit) for rank in range(10, 15)}
-            needed_cards.difference_update(self.all_cards)
-            if len(needed_cards) <= 1:
-                return needed_cards
-        return set()
-
-    def get_straight_flush_outs(self) -> set[Card]:
-        outs = set()
-        for suit in Suit:
-            for start in range(2, 10):
-                needed_cards = {Card(rank, suit)
-                                for rank in range(start, start + 5)}
-                needed_cards.difference_update(self.all_cards)
-                if len(needed_cards) <= 1:
-                    outs.update(needed_cards)
-
-        return outs
-
-    def get_four_of_a_kind_outs(self) -> set[Card]:
-        outs = set()
-        for rank in self.ranks_by_count[3]:
-            outs.update({Card(rank, suit) for suit in Suit})
-
-        outs.difference_update(self.all_cards)
-        return outs
-
-    def get_full_house_outs(self) -> set[Card]:
-        outs = set()
-        if self.ranks_by_count[3]:  # 3枚組があれば1枚の残りがoutsになる
-            for rank in self.ranks_by_count[1]:
-                outs.update({Card(rank, suit) for suit in Suit})
-        elif len(self.ranks_by_count[2]) >= 2:  # 2枚組が2つ以上2枚組の残りがoutsになる
-            for rank in self.ranks_by_count[2]:
-                outs.update({Card(rank, suit) for suit in Suit})
-
-        outs.difference_update(self.all_cards)
-        return outs
-
-    def get_flush_outs(self) -> set[Card]:
-        outs = set()
-        for suit, count in self.suit_counts.items():
-            if count >= 4:
-                outs.update({Card(rank, suit) for rank in range(2, 15)})
-                break
-
-        outs.difference_update(self.all_cards)
-        return outs
-
-    def get_straight_outs(self) -> set[Card]:
-        ranks = {card.rank for card in self.all_cards}
-        outs = set()
-        for start in range(2, 11):
-            needed_ranks = set(range(start, start + 5))
-            needed_ranks.difference_update(ranks)
-
-            if len(needed_ranks) <= 1:
-                rank = needed_ranks.pop()
-                outs.update({Card(rank, suit) for suit in Suit})
-
-        return outs
-
-    def get_three_of_a_kind_outs(self) -> set[Card]:
-        outs = set()
-        for rank in self.ranks_by_count[2]:
-            outs.update({Card(rank, suit) for suit in Suit})
-
-        outs.difference_update(self.all_cards)
-        return outs
-
-    def get_two_pair_outs(self) -> set[Card]:
-        outs = set()
-        if not self.ranks_by_count[2]:
-            return outs
-
-        for rank in self.ranks_by_count[1]:
-            outs.update({Card(rank, suit) for suit in Suit})
-
-        outs.difference_update(self.all_cards)
-        return outs
-
-    def get_one_pair_outs(self) -> set[Card]:
-        outs = set()
-        for rank in self.ranks_by_count[1]:
-            outs.update({Card(rank, suit) for suit in Suit})
-
-        outs.difference_update(self.all_cards)
-        return outs
+def _load_flop_table() -> tuple[np.ndarray, np.ndarray]:
+    """
+    フロップのエクイティ表を初回だけ読み込む
+
+    フロップでの完全列挙は相手の表（211,876組）の評価だけで数十msかかるので、
+    正規化した全フロップについて事前に計算した表を引く。
+    """
+    global _flop_table
+    if _flop_table is None:
+        _flop_table = load_table(FLOP_TABLE_PATH)
+    return _flop_table
+
+
+def _equity_vs_random(
+    hole_mask: int, board: list[Card], strengths: np.ndarray
+) -> float:
+    """
+    ランダムな手札の相手1人に対するエクイティを完全列挙で求める
+
+    strengths は残りのボード（カードIDの組）-> 自分の強さ。
+    """
+    # 相手の表はボードだけで正規化した空間で共有するので、自分側もその空間に移す
+    suit_map = canonical_suit_map([], board)
+    id_map = np.array([suit_map[c // 13] * 13 + c % 13 for c in range(52)])
+    mapped = np.zeros_like(strengths)
+    mapped[np.ix_(*(id_map,) * strengths.ndim)] = strengths
+    hole_mask = _relabel_mask(hole_mask, suit_map)
+    board_ids = tuple(sorted(card.id for card in relabel(board, suit_map)))
+
+    ids, masks, opponent = _opponent_table(board_ids)
+    valid = (masks & hole_mask) == 0
+    ids, opponent = ids[valid], opponent[valid]
+
+    # 相手の手札2枚 + 残りのボードの組を、どれをボードにするかで分けて比較
+    draws = strengths.ndim
+    wins = ties = total = 0
+    for columns in combinations(range(ids.shape[1]), draws):
+        mine = mapped[tuple(ids[:, column] for column in columns)]
+        wins += int(np.count_nonzero(mine > opponent))
+        ties += int(np.count_nonzero(mine == opponent))
+        total += len(opponent)
+    return (wins + ties / 2) / total
+
+
+def _relabel_mask(mask: int, suit_map: list[int]) -> int:
+    relabeled = 0
+    for suit in range(4):
+        relabeled |= (mask >> (13 * suit) & 0x1FFF) << (13 * suit_map[suit])
+    return relabeled
+
+
+@lru_cache(maxsize=OPPONENT_TABLE_CACHE_SIZE)
+def _opponent_table(
+    board_ids: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    正規化したボード毎の、(残りのボード + 相手の手札) のカードの組 -> 相手の強さ
+
+    相手の7枚はこの組で決まり、どのカードがボードになるかには依存しないので、
+    ターンなら残り48枚から3枚（17,296組）を1回ずつ評価すれば済む。
+    Returns:
+        (カードIDの組 (N, k), 組のビットマスク (N,), 相手の強さ (N,))
+    """
+    board_mask = 0
+    for card_id in board_ids:
+        board_mask |= 1 << card_id
+    rest = np.array([c for c in range(52) if not board_mask >> c & 1])
+    size = 7 - len(board_ids)
+    ids = rest[_combination_indices(len(rest), size)]
+    count = len(ids)
+
+    suit_masks = np.zeros((count, 4), dtype=np.int64)
+    for card_id in board_ids:
+        suit_masks[:, card_id // 13] |= 1 << (card_id % 13)
+    rows = np.arange(count)
+    suits = ids // 13
+    rank_bits = np.left_shift(1, ids % 13)
+    for column in range(size):
+        suit_masks[rows, suits[:, column]] |= rank_bits[:, column]
+    masks = np.bitwise_or.reduce(np.left_shift(1, ids), axis=1)
+    return ids, masks, evaluate_masks(suit_masks)
+
+
+@lru_cache(maxsize=None)
+def _combination_indices(n: int, k: int) -> np.ndarray:
+    """range(n) から k 個選ぶ組み合わせ全体 (C(n, k), k)。ボードによらないので使い回す"""
+    return np.fromiter(
+        chain.from_iterable(combinations(range(n), k)),
+        dtype=np.int64,
+        count=comb(n, k) * k,
+    ).reshape(-1, k)
@@ -0,0 +1,202 @@
+"""
+Vectorized NumPy hand evaluator for evaluating many hands at once
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from . import fast_evaluator as fe
+from .game_models import Card
+
+# fast_evaluator と同じテーブルを NumPy 配列として保持
+TOP5 = np.asarray(fe.TOP5, dtype=np.int64)
+STRAIGHT_HIGH = np.asarray(fe.STRAIGHT_HIGH, dtype=np.int64)
+# 13ビットのランク集合 -> 最上位ビットのランク（空集合は0）/ 最上位ビットそのもの
+HIGH_RANK = np.asarray(
+    [mask.bit_length() + 1 if mask else 0 for mask in range(fe.RANK_MASK + 1)],
+    dtype=np.int64,
+)
+HIGH_BIT = np.asarray(
+    [1 << (mask.bit_length() - 1) if mask else 0 for mask in range(fe.RANK_MASK + 1)],
+    dtype=np.int64,
+)
+POPCOUNT = np.asarray(
+    [mask.bit_count() for mask in range(fe.RANK_MASK + 1)], dtype=np.int64
+)
+
+_SHIFT = fe.CATEGORY_SHIFT
+
+
+def cards_to_array(hands: Sequence[Sequence[Card]], width: int = 0) -> np.ndarray:
+    """
+    カード列のリストを整数ID（Card.id）の2次元配列に変換
+
+    Args:
+        hands: カード列のリスト
+        width: 列数（不足分は -1 で埋める）。0 の場合は最長の長さ
+
+    Returns:
+        np.ndarray: shape (len(hands), width) の int64 配列
+    """
+    width = width or max((len(cards) for cards in hands), default=0)
+    array = np.full((len(hands), width), -1, dtype=np.int64)
+    for row, cards in enumerate(hands):
+        array[row, : len(cards)] = [card.id for card in cards]
+    return array
+
+
+def suit_masks(cards: np.ndarray) -> np.ndarray:
+    """
+    カードIDの2次元配列 (N, K) からスート毎の13ビットランク集合 (N, 4) を作成
+
+    -1 のセルは空きとして無視する。
+    """
+    cards = np.asarray(cards, dtype=np.int64)
+    valid = cards >= 0
+    suits = np.where(valid, cards // 13, -1)
+    bits = np.where(valid, np.left_shift(1, cards % 13), 0)
+    return np.stack(
+        [np.where(suits == suit, bits, 0).sum(axis=1) for suit in range(4)], axis=1
+    )
+
+
+def evaluate_array(cards: np.ndarray) -> np.ndarray:
+    """
+    カードIDの2次元配列 (N, K) を一括評価
+
+    各行は5〜7枚の有効なカード（残りは -1）を含むこと。
+    戻り値は fast_evaluator.evaluate_mask と完全に同じ強さの整数。
+    """
+    return evaluate_masks(suit_masks(cards))
+
+
+def evaluate_masks(masks: np.ndarray) -> np.ndarray:
+    """
+    スート毎の13ビットランク集合 (N, 4) を一括評価
+
+    カードの組をスート毎のマスクで直接組み立てられる場合（ボード共通の列挙など）は
+    evaluate_array を通さずにこちらを使うとカードID配列を作る手間が省ける。
+    """
+    masks = np.asarray(masks, dtype=np.int64)
+    s0, s1, s2, s3 = masks[:, 0], masks[:, 1], masks[:, 2], masks[:, 3]
+
+    ranks = s0 | s1 | s2 | s3
+    pairs = (s0 & s1) | (s0 & s2) | (s0 & s3) | (s1 & s2) | (s1 & s3) | (s2 & s3)
+    trips = (s0 & s1 & s2) | (s0 & s1 & s3) | (s0 & s2 & s3) | (s1 & s2 & s3)
+    quads = s0 & s1 & s2 & s3
+
+    # ハイカード
+    result = fe.HIGH_CARD << _SHIFT | TOP5[ranks]
+
+    # ワンペア
+    result = np.where(
+        pairs != 0,
+        fe.ONE_PAIR << _SHIFT
+        | HIGH_RANK[pairs] << 16
+        | (TOP5[ranks & ~pairs] >> 8) << 4,
+        result,
+    )
+
+    # ツーペア
+    high_pair = HIGH_BIT[pairs]
+    low_pair = HIGH_BIT[pairs & ~high_pair]
+    result = np.where(
+        low_pair != 0,
+        fe.TWO_PAIR << _SHIFT
+        | HIGH_RANK[high_pair] << 16
+        | HIGH_RANK[low_pair] << 12
+        | (TOP5[ranks & ~high_pair & ~low_pair] >> 16) << 8,
+        result,
+    )
+
+    # スリーカード
+    trip_bit = HIGH_BIT[trips]
+    result = np.where(
+        trips != 0,
+        fe.THREE_OF_A_KIND << _SHIFT
+        | HIGH_RANK[trips] << 16
+        | (TOP5[ranks & ~trip_bit] >> 12) << 8,
+        result,
+    )
+
+    # ストレート
+    straight = STRAIGHT_HIGH[ranks]
+    result = np.where(straight != 0, fe.STRAIGHT << _SHIFT | straight << 16, result)
+
+    # フラッシュ（7枚以下ではフルハウス/フォーカードとは両立しない）
+    counts = POPCOUNT[masks]
+    flush_suit = counts.argmax(axis=1)
+    flush_ranks = masks[np.arange(len(masks)), flush_suit]
+    has_flush = counts.max(axis=1) >= 5
+    result = np.where(has_flush, fe.FLUSH << _SHIFT | TOP5[flush_ranks], result)
+
+    # フルハウス
+    rest_pair = pairs & ~trip_bit
+    result = np.where(
+        (trips != 0) & (rest_pair != 0),
+        fe.FULL_HOUSE << _SHIFT | HIGH_RANK[trips] << 16 | HIGH_RANK[rest_pair] << 12,
+        result,
+    )
+
+    # フォーカード
+    result = np.where(
+        quads != 0,
+        fe.FOUR_OF_A_KIND << _SHIFT
+        | HIGH_RANK[quads] << 16
+        | (TOP5[ranks & ~HIGH_BIT[quads]] >> 16) << 12,
+        result,
+    )
+
+    # ストレートフラッシュ / ロイヤルフラッシュ
+    straight_flush = np.where(has_flush, STRAIGHT_HIGH[flush_ranks], 0)
+    category = np.where(straight_flush == 14, fe.ROYAL_FLUSH, fe.STRAIGHT_FLUSH)
+    result = np.where(
+        straight_flush != 0,
+        category.astype(np.int64) << _SHIFT | straight_flush << 16,
+        result,
+    )
+    return result
+
+
+def evaluate_batch(hole: np.ndarray, board: np.ndarray) -> np.ndarray:
+    """
+    ホールカード (N, 2) とボード (N, 5) のカードIDからハンドの強さを一括計算
+
+    Args:
+        hole: ホールカードのカードID配列
+        board: ボードのカードID配列（ボードが全行共通なら shape (5,) も可）
+
+    Returns:
+        np.ndarray: shape (N,) の強さ（fast_evaluator と同じ整数）
+    """
+    hole = np.asarray(hole, dtype=np.int64)
+    board = np.asarray(board, dtype=np.int64)
+    if board.ndim == 1:
+        board = np.broadcast_to(board, (hole.shape[0], board.shape[0]))
+    return evaluate_array(np.concatenate([hole, board], axis=1))
+
+
+def compare_batch(
+    hole1: np.ndarray, hole2: np.ndarray, board: np.ndarray
+) -> np.ndarray:
+    """
+    同じボードで2つのホールカードを一括比較
+
+    Returns:
+        np.ndarray: 1 (hole1の勝ち) / -1 (hole2の勝ち) / 0 (引き分け)
+    """
+    return np.sign(evaluate_batch(hole1, board) - evaluate_batch(hole2, board))
+
+
+def strengths_to_categories(strengths: np.ndarray) -> np.ndarray:
+    """強さの配列から役（HandRank.value）の配列を取り出す"""
+    return np.asarray(strengths) >> _SHIFT
+
+
+def array_to_cards(cards: np.ndarray) -> List[List[Card]]:
+    """カードID配列を Card のリストに戻す（-1 は無視）"""
+    return [
+        [Card.from_id(int(card_id)) for card_id in row if card_id >= 0]
+        for row in np.atleast_2d(cards)
+    ]
@@ -0,0 +1,226 @@
+"""
+Suit-isomorphic canonical keys for hole/board cards and a shared result cache
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .game_models import ALL_CARDS, Card
+
+CardLike = Union[Card, str, int]
+CanonicalKey = Tuple[int, int, int, int]
+
+# メモリ上に保持する結果の数
+DEFAULT_CACHE_SIZE = 65536
+# 既定のキャッシュをディスクにも保存する場合の SQLite ファイルのパス
+CACHE_PATH_ENV = "ADK_POKER_CANONICAL_CACHE"
+
+
+def _card(card: CardLike) -> Card:
+    """Card / 文字列 / 整数IDを Card に変換"""
+    if isinstance(card, Card):
+        return card
+    if isinstance(card, str):
+        return Card.from_str(card)
+    return Card.from_id(int(card))
+
+
+def suit_signatures(*groups: Iterable[CardLike]) -> List[int]:
+    """
+    スート毎に、各グループ（手札, ボード, ...）でのランク集合を並べた整数を返す
+
+    グループ i のランク集合（13ビット）は 13 * i ビット目から入る。
+    2つの状況がスートの入れ替えで一致する ⇔ 4スートのシグネチャの多重集合が等しい。
+    """
+    signatures = [0, 0, 0, 0]
+    for index, cards in enumerate(groups):
+        shift = 13 * index
+        for card in cards:
+            card_id = _card(card).id
+            signatures[card_id // 13] |= 1 << (card_id % 13 + shift)
+    return signatures
+
+
+def canonical_key(
+    hole: Iterable[CardLike], board: Iterable[CardLike] = (), *more
+) -> CanonicalKey:
+    """
+    スートの入れ替えで移り合う (手札, ボード) に共通のキー
+
+    カードの並び順にもよらない。more にはデッドカード等の追加グループを渡せる。
+    """
+    return tuple(sorted(suit_signatures(hole, board, *more), reverse=True))
+
+
+def canonical_suit_map(
+    hole: Iterable[CardLike], board: Iterable[CardLike] = (), *more
+) -> List[int]:
+    """元のスート番号 -> 正規形でのスート番号（シグネチャの大きい順に 0, 1, ...）"""
+    signatures = suit_signatures(hole, board, *more)
+    order = sorted(range(4), key=lambda suit: -signatures[suit])
+    suit_map = [0, 0, 0, 0]
+    for canonical, suit in enumerate(order):
+        suit_map[suit] = canonical
+    return suit_map
+
+
+def invert_suit_map(suit_map: List[int]) -> List[int]:
+    """正規形のスート番号 -> 元のスート番号"""
+    inverse = [0, 0, 0, 0]
+    for suit, canonical in enumerate(suit_map):
+        inverse[canonical] = suit
+    return inverse
+
+
+def relabel(cards: Iterable[CardLike], suit_map: List[int]) -> List[Card]:
+    """suit_map に従ってカードのスートを付け替える"""
+    relabeled = []
+    for card in cards:
+        card_id = _card(card).id
+        relabeled.append(ALL_CARDS[suit_map[card_id // 13] * 13 + card_id % 13])
+    return relabeled
+
+
+def canonicalize(
+    hole: Iterable[CardLike], board: Iterable[CardLike] = ()
+) -> Tuple[List[Card], List[Card], List[int]]:
+    """
+    (手札, ボード) を正規形の代表に変換
+
+    Returns:
+        (正規形の手札, 正規形のボード, suit_map)。代表で計算した結果に含まれるカードは
+        relabel(cards, invert_suit_map(suit_map)) で元のスートに戻せる。
+    """
+    hole = [_card(card) for card in hole]
+    board = [_card(card) for card in board]
+    suit_map = canonical_suit_map(hole, board)
+    return relabel(hole, suit_map), relabel(board, suit_map), suit_map
+
+
+class CanonicalCache:
+    """
+    正規化したキーで計算結果を共有するキャッシュ
+
+    メモリ上の LRU に加え、path を指定すると SQLite ファイルにも保存し、別プロセス
+    （ツール呼び出しやシミュレーションのワーカー）と結果を共有する。
+    ディスクに保存する値とキーは JSON に変換できるものに限る。返した値は共有されるため
+    呼び出し側で変更しないこと。
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, memory_key: Tuple[str, Hashable], value: Any):
+        self._memory[memory_key] = value
+        self._memory.move_to_end(memory_key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, namespace: str, key: Hashable, default: Any = None) -> Any:
+        """namespace 内の key に対応する結果（無ければ default）"""
+        memory_key = (namespace, key)
+        with self._lock:
+            if memory_key in self._memory:
+                self._memory.move_to_end(memory_key)
+                self.hits += 1
+                return self._memory[memory_key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE namespace = ? AND key = ?",
+                    (namespace, json.dumps(key)),
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(memory_key, value)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return default
+
+    def put(self, namespace: str, key: Hashable, value: Any):
+        """結果を保存"""
+        with self._lock:
+            self._remember((namespace, key), value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    (namespace, json.dumps(key), json.dumps(value)),
+                )
+                self._db.commit()
+
+    def get_or_compute(
+        self, namespace: str, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        """キャッシュにあればそれを、無ければ compute() の結果を保存して返す"""
+        missing = object()
+        value = self.get(namespace, key, missing)
+        if value is missing:
+            value = compute()
+            self.put(namespace, key, value)
+        return value
+
+    def clear(self):
+        """メモリとディスクの結果をすべて削除"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self):
+        """ディスクのキャッシュを閉じる（以降はメモリのみ）"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_default_cache: Optional[CanonicalCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> CanonicalCache:
+    """
+    プロセス内で共有する既定のキャッシュ
+
+    初回呼び出し時に作成し、環境変数 ADK_POKER_CANONICAL_CACHE があればそのファイルにも保存する。
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CanonicalCache(path=os.environ.get(CACHE_PATH_ENV) or None)
+        return _default_cache
+
+
+def set_default_cache(cache: Optional[CanonicalCache]):
+    """既定のキャッシュを差し替える（None なら次回の get_default_cache で作り直す）"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is not None and _default_cache is not cache:
+            _default_cache.close()
+        _default_cache = cache
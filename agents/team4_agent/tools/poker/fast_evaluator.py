@@ -0,0 +1,184 @@
+"""
+Table-driven hand evaluator working on integer card encodings
+"""
+
+from typing import Iterable, List
+
+from .game_models import Card
+
+# カードID（Card.id）はスート毎に13ビットのブロックを割り当てている（スート番号 * 13 + (rank - 2)）
+# 7枚のハンドは52ビットのマスク1つで表現でき、スート毎のランク集合はシフトで取り出せる
+RANK_MASK = 0x1FFF
+
+# 強さの整数表現: 役(HandRank.value) << 20 | キッカー5つ分を4ビットずつ上位から詰めたもの
+# HandResultの (rank.value, kickers) の辞書式順序と完全に一致する
+CATEGORY_SHIFT = 20
+
+HIGH_CARD = 1
+ONE_PAIR = 2
+TWO_PAIR = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+# 役毎のキッカー数（HandResult.kickers の長さ）
+KICKER_COUNTS = {
+    HIGH_CARD: 5,
+    ONE_PAIR: 4,
+    TWO_PAIR: 3,
+    THREE_OF_A_KIND: 3,
+    STRAIGHT: 1,
+    FLUSH: 5,
+    FULL_HOUSE: 2,
+    FOUR_OF_A_KIND: 2,
+    STRAIGHT_FLUSH: 1,
+    ROYAL_FLUSH: 1,
+}
+
+
+def _build_top5_table() -> List[int]:
+    """13ビットのランク集合 -> 上位5ランクを4ビットずつ詰めた値"""
+    table = [0] * (RANK_MASK + 1)
+    for mask in range(RANK_MASK + 1):
+        packed = 0
+        taken = 0
+        for bit in range(12, -1, -1):
+            if taken == 5:
+                break
+            if mask & (1 << bit):
+                packed |= (bit + 2) << (4 * (4 - taken))
+                taken += 1
+        table[mask] = packed
+    return table
+
+
+def _build_straight_table() -> List[int]:
+    """13ビットのランク集合 -> 最も高いストレートのトップランク（無ければ0、A-5は5）"""
+    table = [0] * (RANK_MASK + 1)
+    windows = [(0x1F << (top - 6), top) for top in range(14, 5, -1)]
+    # A-5ストレート（A, 5, 4, 3, 2）
+    windows.append(((1 << 12) | 0xF, 5))
+    for mask in range(RANK_MASK + 1):
+        for window, top in windows:
+            if mask & window == window:
+                table[mask] = top
+                break
+    return table
+
+
+TOP5 = _build_top5_table()
+STRAIGHT_HIGH = _build_straight_table()
+
+
+def card_to_id(card: Card) -> int:
+    """カードを0〜51の整数IDに変換"""
+    return card.id
+
+
+def evaluate_mask(mask: int) -> int:
+    """
+    ビットマスクで表現した5〜7枚のカードから最強ハンドの強さを1パスで計算
+
+    Args:
+        mask: cards_to_mask で作成したカード集合
+
+    Returns:
+        int: 大きいほど強いハンドの強さ（同じ値なら引き分け）
+    """
+    s0 = mask & RANK_MASK
+    s1 = (mask >> 13) & RANK_MASK
+    s2 = (mask >> 26) & RANK_MASK
+    s3 = (mask >> 39) & RANK_MASK
+
+    # フラッシュ（7枚以下ではフラッシュとフォーカード/フルハウスは両立しない）
+    for suited in (s0, s1, s2, s3):
+        if suited.bit_count() >= 5:
+            top = STRAIGHT_HIGH[suited]
+            if top == 14:
+                return ROYAL_FLUSH << CATEGORY_SHIFT | 14 << 16
+            if top:
+                return STRAIGHT_FLUSH << CATEGORY_SHIFT | top << 16
+            return FLUSH << CATEGORY_SHIFT | TOP5[suited]
+
+    ranks = s0 | s1 | s2 | s3
+    pairs_or_more = (
+        (s0 & s1) | (s0 & s2) | (s0 & s3) | (s1 & s2) | (s1 & s3) | (s2 & s3)
+    )
+
+    if not pairs_or_more:
+        top = STRAIGHT_HIGH[ranks]
+        if top:
+            return STRAIGHT << CATEGORY_SHIFT | top << 16
+        return HIGH_CARD << CATEGORY_SHIFT | TOP5[ranks]
+
+    quads = s0 & s1 & s2 & s3
+    if quads:
+        quad_bit = 1 << (quads.bit_length() - 1)
+        return (
+            FOUR_OF_A_KIND << CATEGORY_SHIFT
+            | (quads.bit_length() + 1) << 16
+            | (TOP5[ranks & ~quad_bit] >> 16) << 12
+        )
+
+    trips = (s0 & s1 & s2) | (s0 & s1 & s3) | (s0 & s2 & s3) | (s1 & s2 & s3)
+    if trips:
+        trip_bit = 1 << (trips.bit_length() - 1)
+        rest = pairs_or_more & ~trip_bit
+        if rest:
+            return (
+                FULL_HOUSE << CATEGORY_SHIFT
+                | (trips.bit_length() + 1) << 16
+                | (rest.bit_length() + 1) << 12
+            )
+
+    top = STRAIGHT_HIGH[ranks]
+    if top:
+        return STRAIGHT << CATEGORY_SHIFT | top << 16
+
+    if trips:
+        return (
+            THREE_OF_A_KIND << CATEGORY_SHIFT
+            | (trips.bit_length() + 1) << 16
+            | (TOP5[ranks & ~trip_bit] >> 12) << 8
+        )
+
+    if pairs_or_more & (pairs_or_more - 1):
+        high_pair = pairs_or_more.bit_length() - 1
+        low_pairs = pairs_or_more & ~(1 << high_pair)
+        low_pair = low_pairs.bit_length() - 1
+        kickers = ranks & ~(1 << high_pair) & ~(1 << low_pair)
+        return (
+            TWO_PAIR << CATEGORY_SHIFT
+            | (high_pair + 2) << 16
+            | (low_pair + 2) << 12
+            | (TOP5[kickers] >> 16) << 8
+        )
+
+    return (
+        ONE_PAIR << CATEGORY_SHIFT
+        | (pairs_or_more.bit_length() + 1) << 16
+        | (TOP5[ranks & ~pairs_or_more] >> 8) << 4
+    )
+
+
+def evaluate_cards(cards: Iterable[Card]) -> int:
+    """カード列（5〜7枚）からハンドの強さを計算"""
+    mask = 0
+    for card in cards:
+        mask |= card.mask
+    return evaluate_mask(mask)
+
+
+def strength_category(strength: int) -> int:
+    """強さの整数から役（HandRank.value）を取り出す"""
+    return strength >> CATEGORY_SHIFT
+
+
+def strength_kickers(strength: int) -> List[int]:
+    """強さの整数から HandResult.kickers 互換のキッカーリストを取り出す"""
+    count = KICKER_COUNTS[strength >> CATEGORY_SHIFT]
+    return [(strength >> (16 - 4 * i)) & 0xF for i in range(count)]
@@ -3,7 +3,7 @@ Poker game models: Card, Deck, Suit classes and game state types
 """
 
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
@@ -18,7 +18,15 @@ class Suit(Enum):
 
 
 class Card:
-    """トランプカードクラス"""
+    """
+    トランプカードクラス
+
+    52枚のカードはそれぞれ1つのインスタンスとして共有される（Card(14, Suit.SPADES) は
+    常に同じオブジェクトを返す）。各カードは 0〜51 の整数ID
+    （スート番号 * 13 + (rank - 2)）と、そのIDのビットだけを立てた64ビットマスクを持つ。
+    """
+
+    __slots__ = ("rank", "suit", "id", "mask", "_label")
 
     # スートの記号マップ
     SUIT_SYMBOLS = {
@@ -45,7 +53,7 @@ class Card:
         14: "A",
     }
 
-    def __init__(self, rank: int, suit: Suit):
+    def __new__(cls, rank: int, suit: Suit) -> "Card":
         """
         Args:
             rank: カードのランク（2-14, 11=J, 12=Q, 13=K, 14=A）
@@ -53,8 +61,40 @@ class Card:
         """
         if rank < 2 or rank > 14:
             raise ValueError("Rank must be between 2 and 14")
-        self.rank = rank
-        self.suit = suit
+        offset = _SUIT_OFFSETS.get(suit)
+        if offset is None:
+            raise ValueError(f"Invalid suit: {suit!r}")
+        return _CARD_POOL[offset + rank]
+
+    @classmethod
+    def _create(cls, rank: int, suit: Suit, card_id: int) -> "Card":
+        """カードプール構築用（モジュール読み込み時に52回だけ呼ばれる）"""
+        card = object.__new__(cls)
+        card.rank = rank
+        card.suit = suit
+        card.id = card_id
+        card.mask = 1 << card_id
+        card._label = f"{cls.RANK_NAMES[rank]}{cls.SUIT_SYMBOLS[suit]}"
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """整数ID（0〜51）からカードを取得"""
+        if not 0 <= card_id < 52:
+            raise ValueError(f"Card id must be between 0 and 51: {card_id}")
+        return _CARD_POOL[card_id]
+
+    @classmethod
+    def from_str(cls, text: str) -> "Card":
+        """文字列表現（例: "A♠", "10♥", "T♦"）からカードを取得"""
+        card = _CARDS_BY_LABEL.get(text.strip())
+        if card is None:
+            raise ValueError(f"Invalid card string: {text!r}")
+        return card
+
+    def to_id(self) -> int:
+        """整数ID（0〜51）を取得"""
+        return self.id
 
     @property
     def rank_name(self) -> str:
@@ -68,19 +108,89 @@ class Card:
 
     def __str__(self) -> str:
         """カードの文字列表現（例: A♠）"""
-        return f"{self.rank_name}{self.suit_symbol}"
+        return self._label
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self.id
 
     def __repr__(self) -> str:
         return f"Card({self.rank_name}, {self.suit.value})"
 
+    def __reduce__(self):
+        # pickle/deepcopy でもプール内のインスタンスを返す
+        return (Card.from_id, (self.id,))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
+
+_SUIT_OFFSETS = {suit: index * 13 - 2 for index, suit in enumerate(Suit)}
+_CARD_POOL: List[Card] = [
+    Card._create(rank, suit, index * 13 + rank - 2)
+    for index, suit in enumerate(Suit)
+    for rank in range(2, 15)
+]
+_CARDS_BY_LABEL: Dict[str, Card] = {str(card): card for card in _CARD_POOL}
+# "T" 表記も受け付ける
+_CARDS_BY_LABEL.update(
+    {"T" + str(card)[2:]: card for card in _CARD_POOL if card.rank == 10}
+)
+
+# 全52枚（ID順）
+ALL_CARDS: Tuple[Card, ...] = tuple(_CARD_POOL)
+FULL_DECK_MASK = (1 << 52) - 1
+
+
+def cards_to_ids(cards: Iterable[Card]) -> List[int]:
+    """カード列を整数IDのリストに変換"""
+    return [card.id for card in cards]
+
+
+def cards_from_ids(card_ids: Iterable[int]) -> List[Card]:
+    """整数IDのリストをカード列に変換"""
+    return [_CARD_POOL[card_id] for card_id in card_ids]
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """カード列をビットマスクに変換"""
+    mask = 0
+    for card in cards:
+        mask |= card.mask
+    return mask
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """ビットマスクをカード列（ID順）に変換"""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(_CARD_POOL[low.bit_length() - 1])
+        mask ^= low
+    return cards
+
+
+def cards_from_strs(texts: Iterable[str]) -> List[Card]:
+    """文字列表現のリスト（例: ["A♠", "10♥"]）をカード列に変換"""
+    return [Card.from_str(text) for text in texts]
+
+
+def strs_to_mask(texts: Iterable[str]) -> int:
+    """文字列表現のリストを直接ビットマスクに変換"""
+    mask = 0
+    for text in texts:
+        mask |= Card.from_str(text).mask
+    return mask
+
 
 class Deck:
     """トランプデッキクラス"""
@@ -92,10 +202,7 @@ class Deck:
 
     def reset(self):
         """デッキをリセットして全カードを追加"""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(2, 15):  # 2-14 (A)
-                self.cards.append(Card(rank, suit))
+        self.cards = list(ALL_CARDS)
         self.shuffle()
 
     def shuffle(self):
@@ -14,23 +14,42 @@ preflop.py
 返り値:
     スターティングハンドの勝率（0.0〜1.0のfloat）
 
-内部でagents/team4_agent/tools/starting_hand_dataset.pyのSTARTING_HAND_DATASETを参照し、
-手札の組み合わせ・スート・人数に応じた勝率を返します。
-該当データがない場合はKeyErrorを投げます。
+勝率は同じディレクトリの preflop_equity.npy（全169クラス x 2〜10人の
+オールイン・エクイティ）から引きます。表はゲームエンジンのエクイティ計算で
+生成したもので、作り直す場合はリポジトリのルートで次を実行します:
+
+    uv run python -m poker.preflop_table --output agents/team4_agent/tools/preflop_equity.npy
+
+表は初回呼び出し時に mmap で読み込みます。
+人数が範囲外の場合はKeyErrorを投げます。
 
 スクリプト単体実行時は簡易テストも可能です。
 """
 
-import sys
+import os
 
-if __name__ == "__main__":
-    # スクリプト実行時は絶対インポート
-    from starting_hand_dataset import STARTING_HAND_DATASET
-else:
-    # パッケージとしてimportされる場合は相対インポート
-    from .starting_hand_dataset import STARTING_HAND_DATASET
+import numpy as np
+
+TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "preflop_equity.npy"
+)
+MIN_PLAYERS = 2
+MAX_PLAYERS = 10
 
+# 表のグリッドの並び（"T" と "10" のどちらの表記も受け付ける）
 RANK_ORDER = ["A", "K", "Q", "J", "10", "9", "8", "7", "6", "5", "4", "3", "2"]
+_RANK_INDEX = {rank: index for index, rank in enumerate(RANK_ORDER)}
+_RANK_INDEX["T"] = _RANK_INDEX["10"]
+
+_table = None
+
+
+def load_table() -> np.ndarray:
+    """表を初回だけ mmap で読み込む"""
+    global _table
+    if _table is None:
+        _table = np.load(TABLE_PATH, mmap_mode="r")
+    return _table
 
 
 def preflop(your_cards: list[str], players: list[dict]) -> float:
@@ -38,7 +57,7 @@ def preflop(your_cards: list[str], players: list[dict]) -> float:
     プリフロップ（手札2枚配布時）のスターティングハンド勝率を返す。
 
     Returns the preflop starting hand win rate for Texas Hold'em poker.
-    Uses the STARTING_HAND_DATASET to look up the win rate based on hand, suit, and player count.
+    Looks up the all-in equity against random hands for the hand class and player count.
 
     Parameters
     ----------
@@ -50,12 +69,12 @@ def preflop(your_cards: list[str], players: list[dict]) -> float:
     Returns
     -------
     float
-        スターティングハンドの勝率（0.0〜1.0）
+        スターティングハンドの勝率（0.0〜1.0、引き分けは山分けとして計算）
 
     Raises
     ------
     KeyError
-        データセットに該当する勝率が存在しない場合
+        人数が2〜10人の範囲外の場合
 
     Examples
     --------
@@ -65,29 +84,14 @@ def preflop(your_cards: list[str], players: list[dict]) -> float:
     # 2枚のカードのランクとスートを分解
     rank1, suit1 = your_cards[0][:-1], your_cards[0][-1]
     rank2, suit2 = your_cards[1][:-1], your_cards[1][-1]
-    print(rank1, suit1, rank2, suit2)
     num_players = len(players) + 1
+    if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+        raise KeyError(f"No winrate found for {num_players} players")
 
-    # ペアの場合
-    if rank1 == rank2:
-        return STARTING_HAND_DATASET[(rank1, rank2, "pair", num_players)]
-
-    # ポーカーの強さ順で並べる
-    if RANK_ORDER.index(rank1) < RANK_ORDER.index(rank2):
-        ranks = (rank1, rank2)
-    else:
-        ranks = (rank2, rank1)
-
-    # スーテッド or オフスート or combined/any
-    suit_type = "suited" if suit1 == suit2 else "offsuit"
-    for key_type in [suit_type, "combined", "any"]:
-        key = (ranks[0], ranks[1], key_type, num_players)
-        if key in STARTING_HAND_DATASET:
-            return STARTING_HAND_DATASET[key]
-    # 万一該当がなければKeyErrorを投げる
-    raise KeyError(
-        f"No winrate found for {ranks[0]}, {ranks[1]}, {suit_type}, {num_players}"
-    )
+    # ペアは対角、スーテッドは上三角、オフスートは下三角
+    high, low = sorted((_RANK_INDEX[rank1], _RANK_INDEX[rank2]))
+    row, col = (high, low) if suit1 == suit2 else (low, high)
+    return float(load_table()[row, col, num_players - MIN_PLAYERS])
 
 
 if __name__ == "__main__":
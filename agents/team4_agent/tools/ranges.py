@@ -0,0 +1,102 @@
+from .poker.canonical import canonical_key, get_default_cache
+from .poker.game_models import cards_from_strs
+from .poker.ranges import (
+    estimate_ranges,
+    hand_vs_range,
+    parse_history,
+    preflop_strengths,
+    range_fraction,
+)
+from .preflop import load_table
+
+STREET_NAMES = {0: "preflop", 3: "flop", 4: "turn", 5: "river"}
+# 正規化した (手札, ボード)、自分のID、読み取ったアクション毎の結果を保存する名前空間
+RANGES_CACHE_NAMESPACE = "team4.ranges"
+# リバーだけ完全列挙し、それより前は (相手の組, 残りのボード) の対をサンプリングする
+EQUITY_MAX_RUNOUTS = 1
+EQUITY_SAMPLES = 8000
+# サンプリングは同じ状況で同じ値を返すように固定する
+EQUITY_SEED = 0
+
+_preflop_strengths = None
+
+
+def _load_preflop_strengths():
+    """プリフロップ表から組毎の強さを初回だけ作る"""
+    global _preflop_strengths
+    if _preflop_strengths is None:
+        _preflop_strengths = preflop_strengths(load_table())
+    return _preflop_strengths
+
+
+def get_opponent_ranges(
+    your_id: int, your_cards: list[str], community: list[str], history: list[str]
+) -> dict:
+    """
+    historyから現在のハンドでの各相手のアクションを読み取り、相手のレンジ（持ち得る手札）を推定する。
+    ランダムな手札から始め、コール・レイズ・オールインの度に強い手札に絞り込む（チェックは絞らない）。
+    フォールドした相手は含まれない。
+    スートの入れ替えで同じになる状況の結果はキャッシュして再利用する。
+    Args:
+        your_id (int): 自分のプレイヤーID
+        your_cards (list[str]): 自分の手札2枚（例: ["A♥", "K♠"]）
+        community (list[str]): コミュニティカード（0, 3, 4, 5枚）
+        history (list[str]): 直近のアクション履歴
+    Return:
+        相手毎の推定レンジの情報の辞書
+        以下の形式で出力される。
+        {
+        "Player 相手のID": {
+            "actions": ["フェーズ: アクション", ...],
+            "range_percent": 推定レンジの広さ（全1326通りの手札に対する%表記）,
+            "equity": 自分の手札のそのレンジに対するエクイティ (%表記、引き分けは半分),
+            },
+        }
+    """
+    observed = parse_history(history, community)
+    # 推定とエクイティはスートの付け替えで変わらず、結果もカードを含まない
+    key = (
+        canonical_key(cards_from_strs(your_cards), cards_from_strs(community)),
+        your_id,
+        tuple(observed),
+    )
+    return get_default_cache().get_or_compute(
+        RANGES_CACHE_NAMESPACE,
+        key,
+        lambda: _opponent_ranges(your_id, your_cards, community, observed),
+    )
+
+
+def _opponent_ranges(
+    your_id: int, your_cards: list[str], community: list[str], observed: list
+) -> dict:
+    ranges = estimate_ranges(
+        observed,
+        community,
+        _load_preflop_strengths(),
+        dead_cards=your_cards,
+    )
+
+    info = {}
+    for player_id, weights in ranges.items():
+        if player_id == your_id or weights.sum() <= 0:
+            continue
+        actions = [
+            f"{STREET_NAMES[board_size]}: {action}"
+            for actor, action, board_size in observed
+            if actor == player_id
+        ]
+        equity = hand_vs_range(
+            your_cards,
+            weights,
+            community,
+            max_runouts=EQUITY_MAX_RUNOUTS,
+            seed=EQUITY_SEED,
+            samples=EQUITY_SAMPLES,
+        )
+        info[f"Player {player_id}"] = {
+            "actions": actions,
+            "range_percent": round(100 * range_fraction(weights), 1),
+            "equity": round(100 * equity, 1),
+        }
+    return info
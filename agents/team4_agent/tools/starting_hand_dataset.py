@@ -1,653 +0,0 @@
-"""
-Texas Hold'em Poker Starting Hand Win Rate Dataset
-
-This module contains comprehensive win rate data for Texas Hold'em poker starting hands.
-The dataset includes win rates for different starting hand combinations across various
-player counts (2-9 players).
-
-Data Format:
-- Key: (first_card, second_card, suit_type, num_players)
-  - first_card/second_card: Card values (A, K, Q, J, T, 9, 8, 7, 6, 5, 4, 3, 2)
-  - suit_type: "pair", "suited", "offsuit", "any"
-  - num_players: Number of players in the hand (2-9)
-- Value: Win rate as a decimal (0.0 to 1.0)
-
-Hand Categories:
-- Pocket Pairs: AA, KK, QQ, JJ, etc.
-- Ace High: AK, AQ, AJ, etc. (suited/offsuit)
-- King High: KQ, KJ, KT, etc. (suited/offsuit)
-- Queen High: QJ, QT, Q9, etc. (suited/offsuit)
-- Jack High: JT, J9, J8, etc. (suited/offsuit)
-- Ten High: T9, T8, T7, etc. (suited/offsuit)
-- Nine High: 98, 97, 96, etc. (suited/offsuit)
-- Eight High: 87, 86, 85, etc. (suited/offsuit)
-- Seven High: 76, 75, 74, etc. (suited/offsuit)
-- Six High: 65, 64, 63, 62 (suited/offsuit)
-- Five High: 54, 53, 52 (suited/offsuit)
-- Four High: 43, 42 (suited/offsuit)
-- Three High: 32 (suited/offsuit)
-
-Usage:
-    from starting_hand_dataset import STARTING_HAND_DATASET
-
-    # Get win rate for pocket aces against 2 players
-    win_rate = STARTING_HAND_DATASET[("A", "A", "pair", 2)]
-
-    # Get win rate for suited AK against 6 players
-    win_rate = STARTING_HAND_DATASET[("A", "K", "suited", 6)]
-"""
-
-STARTING_HAND_DATASET = {
-    # pocket pair
-    ("A", "A", "pair", 2): 0.849,
-    ("A", "A", "pair", 3): 0.732,
-    ("A", "A", "pair", 4): 0.636,
-    ("A", "A", "pair", 5): 0.556,
-    ("K", "K", "pair", 2): 0.821,
-    ("K", "K", "pair", 3): 0.686,
-    ("K", "K", "pair", 4): 0.580,
-    ("K", "K", "pair", 5): 0.495,
-    ("Q", "Q", "pair", 2): 0.796,
-    ("Q", "Q", "pair", 3): 0.647,
-    ("Q", "Q", "pair", 4): 0.532,
-    ("Q", "Q", "pair", 5): 0.444,
-    ("J", "J", "pair", 2): 0.771,
-    ("J", "J", "pair", 3): 0.609,
-    ("J", "J", "pair", 4): 0.489,
-    ("J", "J", "pair", 5): 0.400,
-    ("10", "10", "pair", 2): 0.747,
-    ("10", "10", "pair", 3): 0.572,
-    ("10", "10", "pair", 4): 0.449,
-    ("10", "10", "pair", 5): 0.360,
-    ("9", "9", "pair", 2): 0.717,
-    ("9", "9", "pair", 3): 0.533,
-    ("9", "9", "pair", 4): 0.408,
-    ("9", "9", "pair", 5): 0.323,
-    ("8", "8", "pair", 2): 0.687,
-    ("8", "8", "pair", 3): 0.496,
-    ("8", "8", "pair", 4): 0.373,
-    ("8", "8", "pair", 5): 0.291,
-    ("7", "7", "pair", 2): 0.657,
-    ("7", "7", "pair", 3): 0.461,
-    ("7", "7", "pair", 4): 0.341,
-    ("7", "7", "pair", 5): 0.264,
-    ("6", "6", "pair", 2): 0.627,
-    ("6", "6", "pair", 3): 0.428,
-    ("6", "6", "pair", 4): 0.312,
-    ("6", "6", "pair", 5): 0.242,
-    ("5", "5", "pair", 2): 0.596,
-    ("5", "5", "pair", 3): 0.396,
-    ("5", "5", "pair", 4): 0.286,
-    ("5", "5", "pair", 5): 0.221,
-    ("4", "4", "pair", 2): 0.563,
-    ("4", "4", "pair", 3): 0.364,
-    ("4", "4", "pair", 4): 0.260,
-    ("4", "4", "pair", 5): 0.203,
-    ("3", "3", "pair", 2): 0.529,
-    ("3", "3", "pair", 3): 0.332,
-    ("3", "3", "pair", 4): 0.237,
-    ("3", "3", "pair", 5): 0.188,
-    ("2", "2", "pair", 2): 0.493,
-    ("2", "2", "pair", 3): 0.302,
-    ("2", "2", "pair", 4): 0.217,
-    ("2", "2", "pair", 5): 0.176,
-    ("A", "K", "suited", 2): 0.662,
-    ("A", "K", "suited", 3): 0.498,
-    ("A", "K", "suited", 4): 0.405,
-    ("A", "K", "suited", 5): 0.345,
-    ("A", "K", "offsuit", 2): 0.645,
-    ("A", "K", "offsuit", 3): 0.473,
-    ("A", "K", "offsuit", 4): 0.376,
-    ("A", "K", "offsuit", 5): 0.314,
-    ("A", "K", "combined", 2): 0.649,
-    ("A", "K", "combined", 3): 0.479,
-    ("A", "K", "combined", 4): 0.384,
-    ("A", "K", "combined", 5): 0.3214,
-    ("A", "Q", "combined", 2): 0.640,
-    ("A", "Q", "combined", 3): 0.464,
-    ("A", "Q", "combined", 4): 0.365,
-    ("A", "Q", "combined", 5): 0.302,
-    ("A", "J", "combined", 2): 0.630,
-    ("A", "J", "combined", 3): 0.450,
-    ("A", "J", "combined", 4): 0.349,
-    ("A", "J", "combined", 5): 0.285,
-    ("A", "10", "combined", 2): 0.620,
-    ("A", "10", "combined", 3): 0.437,
-    ("A", "10", "combined", 4): 0.334,
-    ("A", "10", "combined", 5): 0.270,
-    ("A", "9", "combined", 2): 0.600,
-    ("A", "9", "combined", 3): 0.408,
-    ("A", "9", "combined", 4): 0.304,
-    ("A", "9", "combined", 5): 0.241,
-    ("A", "8", "combined", 2): 0.589,
-    ("A", "8", "combined", 3): 0.396,
-    ("A", "8", "combined", 4): 0.291,
-    ("A", "8", "combined", 5): 0.229,
-    ("A", "7", "combined", 2): 0.577,
-    ("A", "7", "combined", 3): 0.382,
-    ("A", "7", "combined", 4): 0.279,
-    ("A", "7", "combined", 5): 0.217,
-    ("A", "6", "combined", 2): 0.564,
-    ("A", "6", "combined", 3): 0.368,
-    ("A", "6", "combined", 4): 0.266,
-    ("A", "6", "combined", 5): 0.207,
-    ("A", "5", "combined", 2): 0.563,
-    ("A", "5", "combined", 3): 0.370,
-    ("A", "5", "combined", 4): 0.270,
-    ("A", "5", "combined", 5): 0.211,
-    ("A", "4", "combined", 2): 0.553,
-    ("A", "4", "combined", 3): 0.360,
-    ("A", "4", "combined", 4): 0.262,
-    ("A", "4", "combined", 5): 0.205,
-    ("A", "3", "combined", 2): 0.545,
-    ("A", "3", "combined", 3): 0.351,
-    ("A", "3", "combined", 4): 0.254,
-    ("A", "3", "combined", 5): 0.199,
-    ("A", "2", "combined", 2): 0.536,
-    ("A", "2", "combined", 3): 0.342,
-    ("A", "2", "combined", 4): 0.246,
-    ("A", "2", "combined", 5): 0.192,
-    # king high
-    ("K", "Q", "suited", 2): 0.624,
-    ("K", "Q", "suited", 3): 0.461,
-    ("K", "Q", "suited", 4): 0.372,
-    ("K", "Q", "suited", 5): 0.315,
-    ("K", "Q", "offsuit", 2): 0.605,
-    ("K", "Q", "offsuit", 3): 0.434,
-    ("K", "Q", "offsuit", 4): 0.342,
-    ("K", "Q", "offsuit", 5): 0.283,
-    ("K", "Q", "combined", 2): 0.609,
-    ("K", "Q", "combined", 3): 0.440,
-    ("K", "Q", "combined", 4): 0.349,
-    ("K", "Q", "combined", 5): 0.290,
-    ("K", "J", "combined", 2): 0.599,
-    ("K", "J", "combined", 3): 0.426,
-    ("K", "J", "combined", 4): 0.333,
-    ("K", "J", "combined", 5): 0.274,
-    ("K", "10", "combined", 2): 0.590,
-    ("K", "10", "combined", 3): 0.413,
-    ("K", "10", "combined", 4): 0.319,
-    ("K", "10", "combined", 5): 0.260,
-    ("K", "9", "combined", 2): 0.570,
-    ("K", "9", "combined", 3): 0.386,
-    ("K", "9", "combined", 4): 0.290,
-    ("K", "9", "combined", 5): 0.231,
-    ("K", "8", "combined", 2): 0.550,
-    ("K", "8", "combined", 3): 0.361,
-    ("K", "8", "combined", 4): 0.265,
-    ("K", "8", "combined", 5): 0.208,
-    ("K", "7", "combined", 2): 0.540,
-    ("K", "7", "combined", 3): 0.350,
-    ("K", "7", "combined", 4): 0.255,
-    ("K", "7", "combined", 5): 0.199,
-    ("K", "6", "combined", 2): 0.529,
-    ("K", "6", "combined", 3): 0.338,
-    ("K", "6", "combined", 4): 0.244,
-    ("K", "6", "combined", 5): 0.190,
-    ("K", "5", "combined", 2): 0.519,
-    ("K", "5", "combined", 3): 0.329,
-    ("K", "5", "combined", 4): 0.236,
-    ("K", "5", "combined", 5): 0.183,
-    ("K", "4", "combined", 2): 0.509,
-    ("K", "4", "combined", 3): 0.319,
-    ("K", "4", "combined", 4): 0.228,
-    ("K", "4", "combined", 5): 0.176,
-    ("K", "3", "combined", 2): 0.500,
-    ("K", "3", "combined", 3): 0.310,
-    ("K", "3", "combined", 4): 0.220,
-    ("K", "3", "combined", 5): 0.172,
-    ("K", "2", "combined", 2): 0.491,
-    ("K", "2", "combined", 3): 0.302,
-    ("K", "2", "combined", 4): 0.215,
-    ("K", "2", "combined", 5): 0.167,
-    # queen high
-    ("Q", "J", "suited", 2): 0.591,
-    ("Q", "J", "suited", 3): 0.431,
-    ("Q", "J", "suited", 4): 0.345,
-    ("Q", "J", "suited", 5): 0.291,
-    ("Q", "J", "offsuit", 2): 0.570,
-    ("Q", "J", "offsuit", 3): 0.402,
-    ("Q", "J", "offsuit", 4): 0.314,
-    ("Q", "J", "offsuit", 5): 0.258,
-    ("Q", "J", "any", 2): 0.574,
-    ("Q", "J", "any", 3): 0.409,
-    ("Q", "J", "any", 4): 0.322,
-    ("Q", "J", "any", 5): 0.266,
-    ("Q", "10", "any", 2): 0.565,
-    ("Q", "10", "any", 3): 0.396,
-    ("Q", "10", "any", 4): 0.309,
-    ("Q", "10", "any", 5): 0.253,
-    ("Q", "9", "any", 2): 0.545,
-    ("Q", "9", "any", 3): 0.369,
-    ("Q", "9", "any", 4): 0.280,
-    ("Q", "9", "any", 5): 0.224,
-    ("Q", "8", "any", 2): 0.526,
-    ("Q", "8", "any", 3): 0.345,
-    ("Q", "8", "any", 4): 0.256,
-    ("Q", "8", "any", 5): 0.202,
-    ("Q", "7", "any", 2): 0.505,
-    ("Q", "7", "any", 3): 0.322,
-    ("Q", "7", "any", 4): 0.233,
-    ("Q", "7", "any", 5): 0.181,
-    ("Q", "6", "any", 2): 0.497,
-    ("Q", "6", "any", 3): 0.313,
-    ("Q", "6", "any", 4): 0.225,
-    ("Q", "6", "any", 5): 0.174,
-    ("Q", "5", "any", 2): 0.486,
-    ("Q", "5", "any", 3): 0.303,
-    ("Q", "5", "any", 4): 0.216,
-    ("Q", "5", "any", 5): 0.167,
-    ("Q", "4", "any", 2): 0.477,
-    ("Q", "4", "any", 3): 0.294,
-    ("Q", "4", "any", 4): 0.210,
-    ("Q", "4", "any", 5): 0.161,
-    ("Q", "3", "any", 2): 0.468,
-    ("Q", "3", "any", 3): 0.286,
-    ("Q", "3", "any", 4): 0.203,
-    ("Q", "3", "any", 5): 0.156,
-    ("Q", "2", "any", 2): 0.459,
-    ("Q", "2", "any", 3): 0.278,
-    ("Q", "2", "any", 4): 0.196,
-    ("Q", "2", "any", 5): 0.151,
-    # jack high
-    ("J", "10", "suited", 2): 0.562,
-    ("J", "10", "suited", 3): 0.407,
-    ("J", "10", "suited", 4): 0.326,
-    ("J", "10", "suited", 5): 0.274,
-    ("J", "10", "offsuit", 2): 0.538,
-    ("J", "10", "offsuit", 3): 0.377,
-    ("J", "10", "offsuit", 4): 0.294,
-    ("J", "10", "offsuit", 5): 0.241,
-    ("J", "10", "combined", 2): 0.544,
-    ("J", "10", "combined", 3): 0.385,
-    ("J", "10", "combined", 4): 0.302,
-    ("J", "10", "combined", 5): 0.249,
-    ("J", "9", "combined", 2): 0.523,
-    ("J", "9", "combined", 3): 0.357,
-    ("J", "9", "combined", 4): 0.274,
-    ("J", "9", "combined", 5): 0.221,
-    ("J", "8", "combined", 2): 0.504,
-    ("J", "8", "combined", 3): 0.334,
-    ("J", "8", "combined", 4): 0.251,
-    ("J", "8", "combined", 5): 0.199,
-    ("J", "7", "combined", 2): 0.484,
-    ("J", "7", "combined", 3): 0.312,
-    ("J", "7", "combined", 4): 0.228,
-    ("J", "7", "combined", 5): 0.179,
-    ("J", "6", "combined", 2): 0.464,
-    ("J", "6", "combined", 3): 0.289,
-    ("J", "6", "combined", 4): 0.208,
-    ("J", "6", "combined", 5): 0.160,
-    ("J", "5", "combined", 2): 0.456,
-    ("J", "5", "combined", 3): 0.282,
-    ("J", "5", "combined", 4): 0.201,
-    ("J", "5", "combined", 5): 0.155,
-    ("J", "4", "combined", 2): 0.446,
-    ("J", "4", "combined", 3): 0.273,
-    ("J", "4", "combined", 4): 0.194,
-    ("J", "4", "combined", 5): 0.149,
-    ("J", "3", "combined", 2): 0.438,
-    ("J", "3", "combined", 3): 0.265,
-    ("J", "3", "combined", 4): 0.188,
-    ("J", "3", "combined", 5): 0.144,
-    ("J", "2", "combined", 2): 0.428,
-    ("J", "2", "combined", 3): 0.257,
-    ("J", "2", "combined", 4): 0.182,
-    ("J", "2", "combined", 5): 0.140,
-    # ten high
-    ("10", "9", "suited", 2): 0.524,
-    ("10", "9", "suited", 3): 0.374,
-    ("10", "9", "suited", 4): 0.297,
-    ("10", "9", "suited", 5): 0.247,
-    ("10", "9", "offsuit", 2): 0.498,
-    ("10", "9", "offsuit", 3): 0.342,
-    ("10", "9", "offsuit", 4): 0.263,
-    ("10", "9", "offsuit", 5): 0.212,
-    ("10", "9", "any", 2): 0.505,
-    ("10", "9", "any", 3): 0.350,
-    ("10", "9", "any", 4): 0.271,
-    ("10", "9", "any", 5): 0.221,
-    ("10", "8", "any", 2): 0.485,
-    ("10", "8", "any", 3): 0.327,
-    ("10", "8", "any", 4): 0.249,
-    ("10", "8", "any", 5): 0.199,
-    ("10", "7", "any", 2): 0.465,
-    ("10", "7", "any", 3): 0.305,
-    ("10", "7", "any", 4): 0.227,
-    ("10", "7", "any", 5): 0.179,
-    ("10", "6", "any", 2): 0.446,
-    ("10", "6", "any", 3): 0.283,
-    ("10", "6", "any", 4): 0.207,
-    ("10", "6", "any", 5): 0.161,
-    ("10", "5", "any", 2): 0.426,
-    ("10", "5", "any", 3): 0.262,
-    ("10", "5", "any", 4): 0.188,
-    ("10", "5", "any", 5): 0.144,
-    ("10", "4", "any", 2): 0.418,
-    ("10", "4", "any", 3): 0.256,
-    ("10", "4", "any", 4): 0.182,
-    ("10", "4", "any", 5): 0.139,
-    ("10", "3", "any", 2): 0.409,
-    ("10", "3", "any", 3): 0.248,
-    ("10", "3", "any", 4): 0.176,
-    ("10", "3", "any", 5): 0.135,
-    ("10", "2", "any", 2): 0.401,
-    ("10", "2", "any", 3): 0.240,
-    ("10", "2", "any", 4): 0.170,
-    ("10", "2", "any", 5): 0.130,
-    # nine high
-    ("9", "8", "suited", 2): 0.489,
-    ("9", "8", "suited", 3): 0.345,
-    ("9", "8", "suited", 4): 0.272,
-    ("9", "8", "suited", 5): 0.224,
-    ("9", "8", "offsuit", 2): 0.461,
-    ("9", "8", "offsuit", 3): 0.312,
-    ("9", "8", "offsuit", 4): 0.236,
-    ("9", "8", "offsuit", 5): 0.188,
-    ("9", "8", "any", 2): 0.468,
-    ("9", "8", "any", 3): 0.320,
-    ("9", "8", "any", 4): 0.245,
-    ("9", "8", "any", 5): 0.197,
-    ("9", "7", "any", 2): 0.448,
-    ("9", "7", "any", 3): 0.299,
-    ("9", "7", "any", 4): 0.226,
-    ("9", "7", "any", 5): 0.179,
-    ("9", "6", "any", 2): 0.429,
-    ("9", "6", "any", 3): 0.278,
-    ("9", "6", "any", 4): 0.206,
-    ("9", "6", "any", 5): 0.162,
-    ("9", "5", "any", 2): 0.409,
-    ("9", "5", "any", 3): 0.258,
-    ("9", "5", "any", 4): 0.187,
-    ("9", "5", "any", 5): 0.144,
-    ("9", "4", "any", 2): 0.389,
-    ("9", "4", "any", 3): 0.238,
-    ("9", "4", "any", 4): 0.170,
-    ("9", "4", "any", 5): 0.129,
-    ("9", "3", "any", 2): 0.383,
-    ("9", "3", "any", 3): 0.232,
-    ("9", "3", "any", 4): 0.164,
-    ("9", "3", "any", 5): 0.125,
-    ("9", "2", "any", 2): 0.374,
-    ("9", "2", "any", 3): 0.225,
-    ("9", "2", "any", 4): 0.158,
-    ("9", "2", "any", 5): 0.121,
-    # eight high
-    ("8", "7", "suited", 2): 0.457,
-    ("8", "7", "suited", 3): 0.323,
-    ("8", "7", "suited", 4): 0.253,
-    ("8", "7", "suited", 5): 0.209,
-    ("8", "7", "suited", 6): 0.178,
-    ("8", "7", "suited", 7): 0.156,
-    ("8", "7", "suited", 8): 0.140,
-    ("8", "7", "suited", 9): 0.127,
-    ("8", "7", "offsuit", 2): 0.427,
-    ("8", "7", "offsuit", 3): 0.289,
-    ("8", "7", "offsuit", 4): 0.217,
-    ("8", "7", "offsuit", 5): 0.172,
-    ("8", "7", "offsuit", 6): 0.140,
-    ("8", "7", "offsuit", 7): 0.119,
-    ("8", "7", "offsuit", 8): 0.103,
-    ("8", "7", "offsuit", 9): 0.090,
-    ("8", "7", "any", 2): 0.434,
-    ("8", "7", "any", 3): 0.297,
-    ("8", "7", "any", 4): 0.226,
-    ("8", "7", "any", 5): 0.181,
-    ("8", "7", "any", 6): 0.150,
-    ("8", "7", "any", 7): 0.128,
-    ("8", "7", "any", 8): 0.112,
-    ("8", "7", "any", 9): 0.100,
-    ("8", "6", "any", 2): 0.415,
-    ("8", "6", "any", 3): 0.277,
-    ("8", "6", "any", 4): 0.208,
-    ("8", "6", "any", 5): 0.165,
-    ("8", "6", "any", 6): 0.136,
-    ("8", "6", "any", 7): 0.116,
-    ("8", "6", "any", 8): 0.101,
-    ("8", "6", "any", 9): 0.090,
-    ("8", "5", "any", 2): 0.396,
-    ("8", "5", "any", 3): 0.257,
-    ("8", "5", "any", 4): 0.189,
-    ("8", "5", "any", 5): 0.148,
-    ("8", "5", "any", 6): 0.121,
-    ("8", "5", "any", 7): 0.102,
-    ("8", "5", "any", 8): 0.089,
-    ("8", "5", "any", 9): 0.079,
-    ("8", "4", "any", 2): 0.375,
-    ("8", "4", "any", 3): 0.237,
-    ("8", "4", "any", 4): 0.171,
-    ("8", "4", "any", 5): 0.132,
-    ("8", "4", "any", 6): 0.107,
-    ("8", "4", "any", 7): 0.090,
-    ("8", "4", "any", 8): 0.078,
-    ("8", "4", "any", 9): 0.068,
-    ("8", "3", "any", 2): 0.356,
-    ("8", "3", "any", 3): 0.218,
-    ("8", "3", "any", 4): 0.154,
-    ("8", "3", "any", 5): 0.118,
-    ("8", "3", "any", 6): 0.094,
-    ("8", "3", "any", 7): 0.078,
-    ("8", "3", "any", 8): 0.067,
-    ("8", "3", "any", 9): 0.059,
-    ("8", "2", "any", 2): 0.350,
-    ("8", "2", "any", 3): 0.212,
-    ("8", "2", "any", 4): 0.150,
-    ("8", "2", "any", 5): 0.114,
-    ("8", "2", "any", 6): 0.092,
-    ("8", "2", "any", 7): 0.076,
-    ("8", "2", "any", 8): 0.066,
-    ("8", "2", "any", 9): 0.057,
-    # seven high
-    ("7", "6", "suited", 2): 0.429,
-    ("7", "6", "suited", 3): 0.304,
-    ("7", "6", "suited", 4): 0.238,
-    ("7", "6", "suited", 5): 0.195,
-    ("7", "6", "suited", 6): 0.168,
-    ("7", "6", "suited", 7): 0.148,
-    ("7", "6", "suited", 8): 0.133,
-    ("7", "6", "suited", 9): 0.121,
-    ("7", "6", "offsuit", 2): 0.397,
-    ("7", "6", "offsuit", 3): 0.268,
-    ("7", "6", "offsuit", 4): 0.200,
-    ("7", "6", "offsuit", 5): 0.158,
-    ("7", "6", "offsuit", 6): 0.130,
-    ("7", "6", "offsuit", 7): 0.110,
-    ("7", "6", "offsuit", 8): 0.096,
-    ("7", "6", "offsuit", 9): 0.085,
-    ("7", "6", "any", 2): 0.404,
-    ("7", "6", "any", 3): 0.277,
-    ("7", "6", "any", 4): 0.300,
-    ("7", "6", "any", 5): 0.167,
-    ("7", "6", "any", 6): 0.139,
-    ("7", "6", "any", 7): 0.119,
-    ("7", "6", "any", 8): 0.105,
-    ("7", "6", "any", 9): 0.095,
-    ("7", "5", "any", 2): 0.385,
-    ("7", "5", "any", 3): 0.258,
-    ("7", "5", "any", 4): 0.192,
-    ("7", "5", "any", 5): 0.153,
-    ("7", "5", "any", 6): 0.126,
-    ("7", "5", "any", 7): 0.108,
-    ("7", "5", "any", 8): 0.095,
-    ("7", "5", "any", 9): 0.085,
-    ("7", "4", "any", 2): 0.365,
-    ("7", "4", "any", 3): 0.238,
-    ("7", "4", "any", 4): 0.175,
-    ("7", "4", "any", 5): 0.137,
-    ("7", "4", "any", 6): 0.113,
-    ("7", "4", "any", 7): 0.096,
-    ("7", "4", "any", 8): 0.084,
-    ("7", "4", "any", 9): 0.075,
-    ("7", "3", "any", 2): 0.346,
-    ("7", "3", "any", 3): 0.219,
-    ("7", "3", "any", 4): 0.158,
-    ("7", "3", "any", 5): 0.122,
-    ("7", "3", "any", 6): 0.099,
-    ("7", "3", "any", 7): 0.084,
-    ("7", "3", "any", 8): 0.073,
-    ("7", "3", "any", 9): 0.065,
-    ("7", "2", "any", 2): 0.326,
-    ("7", "2", "any", 3): 0.200,
-    ("7", "2", "any", 4): 0.141,
-    ("7", "2", "any", 5): 0.108,
-    ("7", "2", "any", 6): 0.087,
-    ("7", "2", "any", 7): 0.073,
-    ("7", "2", "any", 8): 0.063,
-    ("7", "2", "any", 9): 0.055,
-    ("7", "2", "offsuit", 2): 0.317,
-    ("7", "2", "offsuit", 3): 0.190,
-    ("7", "2", "offsuit", 4): 0.131,
-    ("7", "2", "offsuit", 5): 0.097,
-    ("7", "2", "offsuit", 6): 0.076,
-    ("7", "2", "offsuit", 7): 0.063,
-    ("7", "2", "offsuit", 8): 0.053,
-    ("7", "2", "offsuit", 9): 0.046,
-    # six high
-    ("6", "5", "suited", 2): 0.403,
-    ("6", "5", "suited", 3): 0.287,
-    ("6", "5", "suited", 4): 0.223,
-    ("6", "5", "suited", 5): 0.185,
-    ("6", "5", "suited", 6): 0.160,
-    ("6", "5", "suited", 7): 0.141,
-    ("6", "5", "suited", 8): 0.128,
-    ("6", "5", "suited", 9): 0.118,
-    ("6", "5", "offsuit", 2): 0.370,
-    ("6", "5", "offsuit", 3): 0.251,
-    ("6", "5", "offsuit", 4): 0.186,
-    ("6", "5", "offsuit", 5): 0.146,
-    ("6", "5", "offsuit", 6): 0.121,
-    ("6", "5", "offsuit", 7): 0.104,
-    ("6", "5", "offsuit", 8): 0.091,
-    ("6", "5", "offsuit", 9): 0.082,
-    ("6", "5", "any", 2): 0.378,
-    ("6", "5", "any", 3): 0.260,
-    ("6", "5", "any", 4): 0.195,
-    ("6", "5", "any", 5): 0.156,
-    ("6", "5", "any", 6): 0.131,
-    ("6", "5", "any", 7): 0.113,
-    ("6", "5", "any", 8): 0.100,
-    ("6", "5", "any", 9): 0.091,
-    ("6", "4", "any", 2): 0.359,
-    ("6", "4", "any", 3): 0.241,
-    ("6", "4", "any", 4): 0.180,
-    ("6", "4", "any", 5): 0.143,
-    ("6", "4", "any", 6): 0.119,
-    ("6", "4", "any", 7): 0.103,
-    ("6", "4", "any", 8): 0.091,
-    ("6", "4", "any", 9): 0.082,
-    ("6", "3", "any", 2): 0.340,
-    ("6", "3", "any", 3): 0.222,
-    ("6", "3", "any", 4): 0.162,
-    ("6", "3", "any", 5): 0.127,
-    ("6", "3", "any", 6): 0.106,
-    ("6", "3", "any", 7): 0.091,
-    ("6", "3", "any", 8): 0.080,
-    ("6", "3", "any", 9): 0.072,
-    ("6", "2", "any", 2): 0.320,
-    ("6", "2", "any", 3): 0.204,
-    ("6", "2", "any", 4): 0.146,
-    ("6", "2", "any", 5): 0.113,
-    ("6", "2", "any", 6): 0.093,
-    ("6", "2", "any", 7): 0.079,
-    ("6", "2", "any", 8): 0.069,
-    ("6", "2", "any", 9): 0.062,
-    # five high
-    ("5", "4", "suited", 2): 0.385,
-    ("5", "4", "suited", 3): 0.275,
-    ("5", "4", "suited", 4): 0.214,
-    ("5", "4", "suited", 5): 0.178,
-    ("5", "4", "suited", 6): 0.154,
-    ("5", "4", "suited", 7): 0.138,
-    ("5", "4", "suited", 8): 0.125,
-    ("5", "4", "suited", 9): 0.115,
-    ("5", "4", "offsuit", 2): 0.351,
-    ("5", "4", "offsuit", 3): 0.238,
-    ("5", "4", "offsuit", 4): 0.175,
-    ("5", "4", "offsuit", 5): 0.139,
-    ("5", "4", "offsuit", 6): 0.115,
-    ("5", "4", "offsuit", 7): 0.099,
-    ("5", "4", "offsuit", 8): 0.088,
-    ("5", "4", "offsuit", 9): 0.079,
-    ("5", "4", "any", 2): 0.360,
-    ("5", "4", "any", 3): 0.247,
-    ("5", "4", "any", 4): 0.185,
-    ("5", "4", "any", 5): 0.149,
-    ("5", "4", "any", 6): 0.125,
-    ("5", "4", "any", 7): 0.109,
-    ("5", "4", "any", 8): 0.097,
-    ("5", "4", "any", 9): 0.088,
-    ("5", "3", "any", 2): 0.340,
-    ("5", "3", "any", 3): 0.229,
-    ("5", "3", "any", 4): 0.170,
-    ("5", "3", "any", 5): 0.135,
-    ("5", "3", "any", 6): 0.113,
-    ("5", "3", "any", 7): 0.099,
-    ("5", "3", "any", 8): 0.088,
-    ("5", "3", "any", 9): 0.080,
-    ("5", "2", "any", 2): 0.321,
-    ("5", "2", "any", 3): 0.201,
-    ("5", "2", "any", 4): 0.153,
-    ("5", "2", "any", 5): 0.121,
-    ("5", "2", "any", 6): 0.101,
-    ("5", "2", "any", 7): 0.088,
-    ("5", "2", "any", 8): 0.078,
-    ("5", "2", "any", 9): 0.070,
-    # four high
-    ("4", "3", "suited", 2): 0.357,
-    ("4", "3", "suited", 3): 0.250,
-    ("4", "3", "suited", 4): 0.193,
-    ("4", "3", "suited", 5): 0.160,
-    ("4", "3", "suited", 6): 0.138,
-    ("4", "3", "suited", 7): 0.124,
-    ("4", "3", "suited", 8): 0.113,
-    ("4", "3", "suited", 9): 0.104,
-    ("4", "3", "offsuit", 2): 0.321,
-    ("4", "3", "offsuit", 3): 0.211,
-    ("4", "3", "offsuit", 4): 0.152,
-    ("4", "3", "offsuit", 5): 0.119,
-    ("4", "3", "offsuit", 6): 0.098,
-    ("4", "3", "offsuit", 7): 0.085,
-    ("4", "3", "offsuit", 8): 0.075,
-    ("4", "3", "offsuit", 9): 0.067,
-    ("4", "3", "any", 2): 0.330,
-    ("4", "3", "any", 3): 0.221,
-    ("4", "3", "any", 4): 0.163,
-    ("4", "3", "any", 5): 0.129,
-    ("4", "3", "any", 6): 0.109,
-    ("4", "3", "any", 7): 0.094,
-    ("4", "3", "any", 8): 0.084,
-    ("4", "3", "any", 9): 0.076,
-    ("4", "2", "any", 2): 0.311,
-    ("4", "2", "any", 3): 0.202,
-    ("4", "2", "any", 4): 0.147,
-    ("4", "2", "any", 5): 0.116,
-    ("4", "2", "any", 6): 0.097,
-    ("4", "2", "any", 7): 0.085,
-    ("4", "2", "any", 8): 0.076,
-    ("4", "2", "any", 9): 0.068,
-    # three high
-    ("3", "2", "suited", 2): 0.331,
-    ("3", "2", "suited", 3): 0.225,
-    ("3", "2", "suited", 4): 0.172,
-    ("3", "2", "suited", 5): 0.142,
-    ("3", "2", "suited", 6): 0.123,
-    ("3", "2", "suited", 7): 0.111,
-    ("3", "2", "suited", 8): 0.101,
-    ("3", "2", "suited", 9): 0.093,
-    ("3", "2", "offsuit", 2): 0.293,
-    ("3", "2", "offsuit", 3): 0.184,
-    ("3", "2", "offsuit", 4): 0.129,
-    ("3", "2", "offsuit", 5): 0.100,
-    ("3", "2", "offsuit", 6): 0.082,
-    ("3", "2", "offsuit", 7): 0.071,
-    ("3", "2", "offsuit", 8): 0.062,
-    ("3", "2", "offsuit", 9): 0.055,
-    ("3", "2", "any", 2): 0.302,
-    ("3", "2", "any", 3): 0.194,
-    ("3", "2", "any", 4): 0.140,
-    ("3", "2", "any", 5): 0.110,
-    ("3", "2", "any", 6): 0.083,
-    ("3", "2", "any", 7): 0.081,
-    ("3", "2", "any", 8): 0.072,
-    ("3", "2", "any", 9): 0.065,
-}
@@ -3,17 +3,251 @@ Poker Game Log Viewer - ポーカーゲームのログを可視化するWebア
 """
 
 import flet as ft
+import bisect
+import ctypes
+import ctypes.util
+import heapq
 import os
 import re
 import json
+import mmap
+import select
+import struct
 import sys
 import argparse
-import time
 import threading
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterable,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from enum import Enum
 
+from poker.hand_history import HandHistoryReader, hand_history_path_for
+
+# ログ行: "2025-01-01 12:34:56,789 - poker_game.engine - INFO - message"
+_LOG_LINE_RE = re.compile(
+    rb"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - poker_game(?:\.\w+)? - (\w+) - "
+)
+_TIMESTAMP_PREFIX_RE = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}")
+_HAND_NUMBER_RE = re.compile(r"HAND #(\d+)")
+_PHASE_CHANGE_RE = re.compile(r"Phase changed: (\w+) -> (\w+)")
+_LLM_PROMPT_RE = re.compile(r"LLM Prompt for (\w+):")
+_LLM_DECISION_RE = re.compile(
+    r"\[(.+?)\] Successfully parsed decision: (.+?), (\d+), (.+)"
+)
+_POT_RE = re.compile(r"Pot: (\d+)")
+_CURRENT_BET_RE = re.compile(r"Current bet: (\d+)")
+_PLAYER_INFO_RE = re.compile(
+    r"P(\d+)\(([^)]+)\):\s*chips=(\d+),\s*bet=(\d+),\s*status=(\w+)"
+)
+# ACTION_EXECUTED: Player 0 (You) calls 20
+# ACTION_EXECUTED: Player 1 (Agent1) folds
+# ACTION_EXECUTED: Player 2 (Agent2) raises to 50
+_ACTION_RES = [
+    re.compile(pattern)
+    for pattern in (
+        r"Player (\d+) \((.+?)\) (folds|checks|calls|raises to|goes all-in)(?: (\d+))?",
+        r"Player (\d+) \((.+?)\) (folds|checks|calls) (\d+)",
+        r"Player (\d+) \((.+?)\) raises to (\d+)",
+        r"Player (\d+) \((.+?)\) goes all-in for (\d+)",
+    )
+]
+# inotify で待つ変更（監視対象のディレクトリ内のファイルについて届く）
+_IN_MODIFY = 0x002
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_INOTIFY_MASK = _IN_MODIFY | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# inotify が使えない環境で stat をポーリングする間隔（秒）
+STAT_POLL_INTERVAL = 0.5
+
+# ハンド開始行（インデックス作成時は正規表現を使わずこのバイト列を検索する）
+_HAND_START_MARKER = b"=== STARTING NEW HAND #"
+
+# ハンド番号 -> バイトオフセットのインデックス（ログファイルと並べて保存）
+LOG_INDEX_SUFFIX = ".logidx"
+LOG_INDEX_VERSION = 1
+# インデックスがどのファイルのものかを確認するために保存する先頭のバイト数
+_INDEX_HEAD_BYTES = 256
+
+# ビューワーでファイルを開いたときに読み込む直近のハンド数
+VIEWER_INITIAL_HANDS = 200
+# イベント一覧に同時に描画する行数と、端までスクロールしたときにずらす行数
+EVENT_WINDOW_SIZE = 200
+EVENT_WINDOW_STEP = 100
+# 描画済みコントロールをキャッシュするイベント数の上限
+EVENT_CONTROL_CACHE_SIZE = 2000
+# この距離（px）まで端に近づいたら表示範囲をずらす
+EVENT_SCROLL_EDGE = 50
+
+
+class _TimestampDecoder:
+    """
+    "YYYY-MM-DD HH:MM:SS,mmm" 形式の固定長タイムスタンプを高速に datetime に変換
+
+    strptime を使わず、同じ秒の行が続く場合は秒までの部分を使い回す。
+    """
+
+    def __init__(self):
+        self._second_key = b""
+        self._second_value = datetime.min
+
+    def __call__(self, text: bytes) -> datetime:
+        key = text[:19]
+        if key != self._second_key:
+            self._second_key = key
+            self._second_value = datetime(
+                int(text[0:4]),
+                int(text[5:7]),
+                int(text[8:10]),
+                int(text[11:13]),
+                int(text[14:16]),
+                int(text[17:19]),
+            )
+        return self._second_value + timedelta(milliseconds=int(text[20:23]))
+
+
+def log_index_path_for(log_path: str) -> str:
+    """ログファイルに対応するインデックスファイルのパス"""
+    return log_path + LOG_INDEX_SUFFIX
+
+
+class LogIndex:
+    """
+    ログファイル中の各ハンド開始行のバイトオフセット
+
+    追記されたログはインデックス済みの位置から先だけを走査して更新する。
+    同じハンド番号が複数回現れる場合（1つのログに複数ゲーム）は最後のものを引く。
+    """
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self.path = log_index_path_for(log_path)
+        self.hands: List[Tuple[int, int]] = []  # (hand_number, offset) ファイル内の順
+        self._positions: Dict[int, int] = {}  # hand_number -> hands 内の位置
+        self.indexed_size = 0
+        self._head = ""
+
+    def load(self) -> bool:
+        """保存済みのインデックスを読み込む（対象ファイルと一致しなければ False）"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != LOG_INDEX_VERSION:
+            return False
+        self.hands = [(hand, offset) for hand, offset in data["hands"]]
+        self._positions = {hand: i for i, (hand, _) in enumerate(self.hands)}
+        self.indexed_size = data["size"]
+        self._head = data["head"]
+        return True
+
+    def save(self):
+        """インデックスを保存（書き込めない場所では何もしない）"""
+        data = {
+            "version": LOG_INDEX_VERSION,
+            "size": self.indexed_size,
+            "head": self._head,
+            "hands": self.hands,
+        }
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+        except OSError:
+            pass
+
+    def add(self, hand_number: int, offset: int):
+        """ハンド開始位置を追加"""
+        if self.hands and offset <= self.hands[-1][1]:
+            return  # インデックス済み
+        self._positions[hand_number] = len(self.hands)
+        self.hands.append((hand_number, offset))
+
+    def update(self, buf, size: int) -> bool:
+        """
+        buf（ログ全体の mmap / bytes）のうち未インデックス部分を走査
+
+        ファイルが差し替えられていれば作り直す。変更があれば True を返す。
+        """
+        head = bytes(buf[:_INDEX_HEAD_BYTES]).hex()
+        if size < self.indexed_size or not head.startswith(self._head):
+            self.hands, self._positions, self.indexed_size = [], {}, 0
+        self._head = head
+        if size == self.indexed_size:
+            return False
+
+        # 最後まで書かれた行だけを対象にする
+        end = buf.rfind(b"\n", self.indexed_size, size) + 1
+        if end <= self.indexed_size:
+            return False
+        position = self.indexed_size
+        while True:
+            position = buf.find(_HAND_START_MARKER, position, end)
+            if position == -1:
+                break
+            line_start = buf.rfind(b"\n", 0, position) + 1
+            number_start = position + len(_HAND_START_MARKER)
+            number_end = number_start
+            while number_end < end and buf[number_end : number_end + 1].isdigit():
+                number_end += 1
+            if number_end > number_start:
+                self.add(int(buf[number_start:number_end]), line_start)
+            position = number_end
+        self.indexed_size = end
+        return True
+
+    def range_of(self, hand_number: int) -> Optional[Tuple[int, int]]:
+        """ハンドの (開始, 終了) バイトオフセット（終了は次のハンドの開始）"""
+        position = self._positions.get(hand_number)
+        if position is None:
+            return None
+        start = self.hands[position][1]
+        if position + 1 < len(self.hands):
+            return start, self.hands[position + 1][1]
+        return start, self.indexed_size
+
+
+class _map_file:
+    """
+    ファイル全体を読み取り専用で mmap するコンテキストマネージャ（空ファイルは b""）
+
+    パスの代わりに開いているファイルを渡した場合、そのファイルは閉じない。
+    """
+
+    def __init__(self, source: Union[str, BinaryIO]):
+        self._owns_file = isinstance(source, str)
+        self._file = open(source, "rb") if isinstance(source, str) else source
+        self._map: Optional[mmap.mmap] = None
+
+    def __enter__(self):
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""  # 空ファイルは mmap できない
+        return self._map
+
+    def __exit__(self, *exc):
+        if self._map is not None:
+            self._map.close()
+        if self._owns_file:
+            self._file.close()
+
 
 class LogEventType(Enum):
     """ログイベントのタイプ"""
@@ -52,87 +286,145 @@ class LogParser:
         self.players = {}
         self.game_state = GameState()
         self.last_file_position = 0
-
-    def parse_file(self, filepath: str) -> List[Dict[str, Any]]:
-        """ログファイルを解析してイベントリストを返す"""
+        self.index: Optional[LogIndex] = None
+        self._decode_timestamp = _TimestampDecoder()
+        # ログと並んで保存される構造化ハンド履歴（古いログには無い）
+        self.hand_history: Optional[HandHistoryReader] = None
+
+    def open_hand_history(self, filepath: str) -> Optional[HandHistoryReader]:
+        """ログファイルに対応するハンド履歴があれば開く"""
+        self.hand_history = None
+        history_path = hand_history_path_for(filepath)
+        if os.path.exists(history_path):
+            try:
+                self.hand_history = HandHistoryReader(history_path)
+            except (OSError, ValueError) as e:
+                print(f"DEBUG: Failed to open hand history {history_path}: {e}")
+        return self.hand_history
+
+    def load_hand(self, hand_number: int) -> Optional[Dict[str, Any]]:
+        """
+        ハンド履歴から1ハンド分のレコードを直接読み込む
+
+        テキストログを解析し直さずにインデックスでシークする。履歴が無ければ None。
+        """
+        if self.hand_history is None:
+            return None
+        try:
+            return self.hand_history.read_hand(hand_number)
+        except KeyError:
+            self.hand_history.refresh()  # 書き足された分を取り込んで再試行
+            try:
+                return self.hand_history.read_hand(hand_number)
+            except KeyError:
+                return None
+
+    def parse_file(
+        self, filepath: str, max_hands: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        ログファイルを解析してイベントリストを返す
+
+        max_hands を指定すると、インデックスを使って最後の max_hands ハンドだけを解析する
+        （巨大なログでもすぐに開ける）。
+        """
         self.events = []
         self.current_hand = None
         self.players = {}
+        self.game_state = GameState()
+        self.last_file_position = 0
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # タイムスタンプとログレベルを抽出
-            timestamp_match = re.match(
-                r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - poker_game - (\w+) - (.+)",
-                line,
-            )
-            if not timestamp_match:
-                i += 1
-                continue
-
-            timestamp_str, log_level, message = timestamp_match.groups()
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S,%f")
-
-            # イベントタイプを判定して解析
-            event = self._parse_message(message, timestamp, log_level, lines, i)
-            if event:
-                self.events.append(event)
-                self._update_game_state(event)
-
-            i += 1
+        with _map_file(filepath) as buf:
+            size = len(buf)
+            self.index = self._load_index(filepath, buf, size)
+            start = 0
+            if max_hands is not None and len(self.index.hands) > max_hands:
+                start = self.index.hands[-max_hands][1]
+            self.last_file_position = self._parse_range(buf, start, size, self.events)
 
         return self.events
 
+    def parse_hand(self, filepath: str, hand_number: int) -> List[Dict[str, Any]]:
+        """インデックスで指定ハンドの位置へ直接移動し、そのハンドのイベントだけを返す"""
+        with _map_file(filepath) as buf:
+            if self.index is None or self.index.log_path != filepath:
+                self.index = self._load_index(filepath, buf, len(buf))
+            else:
+                self.index.update(buf, len(buf))
+            hand_range = self.index.range_of(hand_number)
+            if hand_range is None:
+                return []
+            events: List[Dict[str, Any]] = []
+            self._parse_range(buf, hand_range[0], hand_range[1], events)
+            return events
+
     def parse_new_lines(self, filepath: str) -> List[Dict[str, Any]]:
         """ログファイルの新しい行のみを解析"""
-        new_events = []
-
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                f.seek(self.last_file_position)
-                new_lines = f.readlines()
-                self.last_file_position = f.tell()
-        except (FileNotFoundError, IOError):
-            return new_events
-
-        # 複数行にわたるメッセージを正しく処理するため、行リスト全体を処理
-        i = 0
-        while i < len(new_lines):
-            line = new_lines[i].strip()
-            if not line:
-                i += 1
-                continue
+            with _map_file(filepath) as buf:
+                return self.parse_appended(filepath, buf)
+        except OSError:
+            return []
+
+    def parse_appended(self, filepath: str, buf) -> List[Dict[str, Any]]:
+        """mmap 済みのログ全体から、前回解析した位置以降の行だけを解析"""
+        new_events: List[Dict[str, Any]] = []
+        size = len(buf)
+        if size < self.last_file_position:
+            # ファイルが作り直された
+            self.last_file_position = 0
+        if self.index is not None and self.index.log_path == filepath:
+            self.index.update(buf, size)
+        self.last_file_position = self._parse_range(
+            buf, self.last_file_position, size, new_events
+        )
 
-            # タイムスタンプとログレベルを抽出
-            timestamp_match = re.match(
-                r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - poker_game - (\w+) - (.+)",
-                line,
-            )
-            if not timestamp_match:
-                i += 1
+        self.events.extend(new_events)
+        return new_events
+
+    def _load_index(self, filepath: str, buf, size: int) -> LogIndex:
+        """サイドカーのインデックスを読み込み、追記された部分だけ更新して保存"""
+        index = LogIndex(filepath)
+        index.load()
+        if index.update(buf, size):
+            index.save()
+        return index
+
+    def _parse_range(
+        self, buf, start: int, end: int, events: List[Dict[str, Any]]
+    ) -> int:
+        """
+        buf[start:end] の行を順に解析して events に追加
+
+        書きかけの最終行は解析せず、解析を終えた位置（次に読み始める位置）を返す。
+        """
+        decode_timestamp = self._decode_timestamp
+        match_line = _LOG_LINE_RE.match
+        find = buf.find
+        position = start
+        while position < end:
+            newline = find(b"\n", position, end)
+            if newline == -1:
+                break  # 書きかけの行
+            header = match_line(buf, position, newline)
+            position = newline + 1
+            if not header:
                 continue
 
-            timestamp_str, log_level, message = timestamp_match.groups()
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S,%f")
+            timestamp_bytes, level_bytes = header.groups()
+            message = (
+                buf[header.end() : newline].decode("utf-8", "replace").rstrip("\r")
+            )
+            timestamp = decode_timestamp(timestamp_bytes)
 
-            # イベントタイプを判定して解析（全行リストを渡して複数行JSONに対応）
-            event = self._parse_message(message, timestamp, log_level, new_lines, i)
+            event = self._parse_message(
+                message, timestamp, level_bytes.decode(), buf, position, end
+            )
             if event:
-                new_events.append(event)
-                self.events.append(event)
+                events.append(event)
                 self._update_game_state(event)
 
-            i += 1
-
-        return new_events
+        return position
 
     def _update_game_state(self, event: Dict[str, Any]):
         """イベントからゲーム状態を更新"""
@@ -204,28 +496,24 @@ class LogParser:
             pass
 
     def _collect_multi_line_json(
-        self, lines: List[str], start_index: int, first_line: str
+        self, buf, position: int, end: int, first_line: str
     ) -> str:
-        """複数行にわたるJSONメッセージを収集"""
+        """複数行にわたるJSONメッセージを収集（position は次の行の先頭）"""
         json_lines = [first_line]
 
         # 次の行から完全なJSONを探す
-        i = start_index + 1
         brace_count = first_line.count("{") - first_line.count("}")
-        # print(f"DEBUG: Starting multi-line JSON collection, initial brace_count: {brace_count}")
-
-        while i < len(lines) and brace_count > 0:
-            line = lines[i].strip()
-            # ログ形式の行（日時から始まる）でない場合はJSONの続き
-            timestamp_pattern = r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}"
-            if not re.match(timestamp_pattern, line):
-                json_lines.append(line)
-                brace_count += line.count("{") - line.count("}")
-                # print(f"DEBUG: Added line {i}, brace_count: {brace_count}, line: {line[:50]}...")
-            else:
-                # print(f"DEBUG: Found timestamp line, breaking: {line[:50]}...")
+        while position < end and brace_count > 0:
+            newline = buf.find(b"\n", position, end)
+            if newline == -1:
+                break
+            # ログ形式の行（日時から始まる）が来たらJSONは終わり
+            if _TIMESTAMP_PREFIX_RE.match(buf, position, newline):
                 break
-            i += 1
+            line = buf[position:newline].decode("utf-8", "replace").strip()
+            json_lines.append(line)
+            brace_count += line.count("{") - line.count("}")
+            position = newline + 1
 
         result = "\n".join(json_lines)
         print(
@@ -358,17 +646,13 @@ class LogParser:
         """ゲーム状態メッセージからプレイヤー情報を抽出"""
         # "  P0(You): chips=980, bet=20, status=active" の形式を解析
         # より柔軟な正規表現パターンに修正
-        player_pattern = (
-            r"P(\d+)\(([^)]+)\):\s*chips=(\d+),\s*bet=(\d+),\s*status=(\w+)"
-        )
-
         # 行ごとに処理
         for line in message.split("\n"):
             line = line.strip()
             if not line or "P" not in line or "chips=" not in line:
                 continue
 
-            matches = re.findall(player_pattern, line)
+            matches = _PLAYER_INFO_RE.findall(line)
             print(f"DEBUG: Processing line: {line}")
             print(f"DEBUG: Found {len(matches)} matches")
 
@@ -411,14 +695,15 @@ class LogParser:
         message: str,
         timestamp: datetime,
         log_level: str,
-        lines: List[str],
-        line_index: int,
+        buf,
+        next_position: int,
+        end: int,
     ) -> Optional[Dict[str, Any]]:
         """メッセージを解析してイベントを生成"""
 
         # ハンド開始
         if "=== STARTING NEW HAND #" in message:
-            match = re.search(r"HAND #(\d+)", message)
+            match = _HAND_NUMBER_RE.search(message)
             if match:
                 self.current_hand = int(match.group(1))
                 return {
@@ -439,7 +724,7 @@ class LogParser:
 
         # フェーズ変更
         elif "Phase changed:" in message:
-            match = re.search(r"Phase changed: (\w+) -> (\w+)", message)
+            match = _PHASE_CHANGE_RE.search(message)
             if match:
                 return {
                     "type": LogEventType.PHASE_CHANGE,
@@ -466,13 +751,13 @@ class LogParser:
         # LLMプロンプト（デバッグログレベルもチェック）
         elif "LLM Prompt for" in message and log_level in ["DEBUG", "INFO"]:
             print(f"DEBUG: Found LLM Prompt for {message.split(':')[0].split()[-1]}")
-            player_match = re.search(r"LLM Prompt for (\w+):", message)
+            player_match = _LLM_PROMPT_RE.search(message)
             if player_match:
                 player_name = player_match.group(1)
 
                 # 複数行のJSONを収集
                 full_json_message = self._collect_multi_line_json(
-                    lines, line_index, message
+                    buf, next_position, end, message
                 )
 
                 # カード情報を抽出してゲーム状態を更新
@@ -533,9 +818,7 @@ class LogParser:
         # LLMの決定
         elif "Successfully parsed decision:" in message:
             # パターンを修正: "action, amount, reasoning" の形式
-            match = re.search(
-                r"\[(.+?)\] Successfully parsed decision: (.+?), (\d+), (.+)", message
-            )
+            match = _LLM_DECISION_RE.search(message)
             if match:
                 player_name = match.group(1)
                 action = match.group(2)
@@ -555,8 +838,8 @@ class LogParser:
 
         # ゲーム状態
         elif "Pot:" in message and "Current bet:" in message:
-            pot_match = re.search(r"Pot: (\d+)", message)
-            bet_match = re.search(r"Current bet: (\d+)", message)
+            pot_match = _POT_RE.search(message)
+            bet_match = _CURRENT_BET_RE.search(message)
             if pot_match and bet_match:
                 return {
                     "type": LogEventType.GAME_STATE,
@@ -573,19 +856,8 @@ class LogParser:
         self, message: str, timestamp: datetime
     ) -> Optional[Dict[str, Any]]:
         """アクションメッセージを解析"""
-        # ACTION_EXECUTED: Player 0 (You) calls 20
-        # ACTION_EXECUTED: Player 1 (Agent1) folds
-        # ACTION_EXECUTED: Player 2 (Agent2) raises to 50
-
-        patterns = [
-            r"Player (\d+) \((.+?)\) (folds|checks|calls|raises to|goes all-in)(?: (\d+))?",
-            r"Player (\d+) \((.+?)\) (folds|checks|calls) (\d+)",
-            r"Player (\d+) \((.+?)\) raises to (\d+)",
-            r"Player (\d+) \((.+?)\) goes all-in for (\d+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message)
+        for pattern in _ACTION_RES:
+            match = pattern.search(message)
             if match:
                 groups = match.groups()
                 player_id = int(groups[0])
@@ -607,19 +879,261 @@ class LogParser:
         return None
 
 
+class _InotifyWatch:
+    """
+    inotify でログファイルの変更を待つ
+
+    標準ライブラリには inotify が無いため libc を ctypes で呼ぶ。ローテーションで
+    ファイルが置き換えられても追えるよう、ファイルではなく親ディレクトリを監視して
+    対象ファイル名のイベントだけを拾う。
+    """
+
+    def __init__(self, filepath: str):
+        self.name = os.fsencode(os.path.basename(filepath))
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        directory = os.fsencode(os.path.dirname(os.path.abspath(filepath)))
+        if libc.inotify_add_watch(fd, directory, _INOTIFY_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        self.fd = fd
+        # wake() で select を抜けるためのパイプ
+        self._wake_r, self._wake_w = os.pipe()
+
+    def wait(self) -> bool:
+        """対象ファイルが変更されるまでブロックする。wake() で起こされた場合は False"""
+        while True:
+            readable, _, _ = select.select([self.fd, self._wake_r], [], [])
+            if self._wake_r in readable:
+                return False
+            if self._read_events():
+                return True
+
+    def _read_events(self) -> bool:
+        """溜まったイベントを読み捨て、対象ファイルへの変更が含まれていれば True"""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        changed = False
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW or name == self.name:
+                changed = True
+        return changed
+
+    def wake(self):
+        os.write(self._wake_w, b"\0")
+
+    def close(self):
+        for fd in (self.fd, self._wake_r, self._wake_w):
+            os.close(fd)
+
+
+class _StatPollWatch:
+    """inotify が使えない環境向け: stat を一定間隔でポーリングして変更を待つ"""
+
+    def __init__(self, filepath: str, interval: float = STAT_POLL_INTERVAL):
+        self.filepath = filepath
+        self.interval = interval
+        self._woken = threading.Event()
+        self._signature = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def wait(self) -> bool:
+        """対象ファイルが変更されるまでブロックする。wake() で起こされた場合は False"""
+        while not self._woken.wait(self.interval):
+            signature = self._stat()
+            if signature != self._signature:
+                self._signature = signature
+                return True
+        return False
+
+    def wake(self):
+        self._woken.set()
+
+    def close(self):
+        pass
+
+
+class LogTailer:
+    """
+    ログファイルを開いたまま監視し、追記された行だけを解析して通知する
+
+    変更は inotify で待ち（使えなければ stat ポーリング）、待っている間は CPU を
+    使わない。ファイルが置き換えられた・切り詰められた場合は開き直して先頭から
+    解析し直す。on_events(events, reset) は監視スレッドから呼ばれ、reset が False
+    なら events は新しく解析した分だけ、True なら解析し直したイベント全体。
+    """
+
+    def __init__(
+        self,
+        parser: LogParser,
+        filepath: str,
+        on_events: Callable[[List[Dict[str, Any]], bool], None],
+        max_hands: Optional[int] = None,
+    ):
+        self.parser = parser
+        self.filepath = filepath
+        self.on_events = on_events
+        # 解析し直すときに parse_file に渡す
+        self.max_hands = max_hands
+        self._file: Optional[BinaryIO] = None
+        self._watch: Union[_InotifyWatch, _StatPollWatch, None] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """監視スレッドを開始"""
+        if self._thread is not None:
+            return
+        try:
+            self._watch = _InotifyWatch(self.filepath)
+        except (OSError, AttributeError, TypeError):
+            # inotify の無い OS / libc
+            self._watch = _StatPollWatch(self.filepath)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="LogTailer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """監視スレッドを停止してファイルを閉じる"""
+        if self._thread is not None:
+            self._running = False
+            self._watch.wake()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._watch.close()
+            self._thread = None
+        # poll() だけで使った場合もファイルを閉じる
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def poll(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """ファイルの変化を取り込み、(イベント, 先頭から解析し直したか) を返す"""
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return [], False  # ローテーション中。作り直されるのを待つ
+
+        reset = False
+        if self._file is None:
+            self._file = open(self.filepath, "rb")
+        else:
+            opened = os.fstat(self._file.fileno())
+            if (opened.st_ino, opened.st_dev) != (stat.st_ino, stat.st_dev):
+                # 別のファイルに置き換えられた（ローテーション）
+                self._file.close()
+                self._file = open(self.filepath, "rb")
+                reset = True
+        if stat.st_size < self.parser.last_file_position:
+            reset = True  # 切り詰められた
+
+        if reset:
+            return self.parser.parse_file(self.filepath, self.max_hands), True
+        if stat.st_size == self.parser.last_file_position:
+            return [], False
+        with _map_file(self._file) as buf:
+            return self.parser.parse_appended(self.filepath, buf), False
+
+    def _run(self):
+        # 監視を始める前に書かれた分があれば最初に取り込む
+        while self._running:
+            try:
+                events, reset = self.poll()
+                if events or reset:
+                    self.on_events(events, reset)
+            except Exception as e:
+                print(f"リアルタイム更新エラー: {e}")
+            if not self._running or not self._watch.wait():
+                break
+
+
+# 一覧に行として表示するイベントの種類（GAME_STATE / OTHER はゲーム状況パネル用）
+DISPLAYED_EVENT_TYPES = frozenset(
+    {
+        LogEventType.HAND_START,
+        LogEventType.HAND_END,
+        LogEventType.PLAYER_ACTION,
+        LogEventType.PHASE_CHANGE,
+        LogEventType.SHOWDOWN,
+        LogEventType.LLM_DECISION,
+    }
+)
+
+
+class EventIndex:
+    """
+    イベントの種類毎に、イベントリスト内の位置を保持するインデックス
+
+    イベントリストは追記のみなので位置をそのままイベント ID として使う。
+    フィルターは全イベントを走査せず、表示する種類の位置リストをマージして求める。
+    """
+
+    def __init__(self):
+        self.positions: Dict[LogEventType, List[int]] = {}
+        self.size = 0
+
+    def reset(self):
+        self.positions = {}
+        self.size = 0
+
+    def extend(self, events: Iterable[Dict[str, Any]]):
+        """イベントリストの末尾に追加されたイベントを登録"""
+        position = self.size
+        for event in events:
+            self.positions.setdefault(event["type"], []).append(position)
+            position += 1
+        self.size = position
+
+    def select(self, types: Iterable[LogEventType], start: int = 0) -> List[int]:
+        """指定した種類のイベントの位置（start 以降）を昇順で返す"""
+        selected = []
+        for event_type in types:
+            positions = self.positions.get(event_type)
+            if positions:
+                selected.append(positions[bisect.bisect_left(positions, start) :])
+        if len(selected) == 1:
+            return selected[0]
+        return list(heapq.merge(*selected))
+
+
 class LogViewerApp:
     """ログビューワーのメインアプリケーション"""
 
     def __init__(self, initial_log_file=None):
         self.parser = LogParser()
         self.events = []
-        self.filtered_events = []
+        # 表示中のイベントの種類と、それに該当するイベントの位置
+        self.visible_types: Set[LogEventType] = set(DISPLAYED_EVENT_TYPES)
+        self.event_index = EventIndex()
+        self.filtered_positions: List[int] = []
+        # イベント一覧に描画している範囲（filtered_positions の添字）
+        self.window_start = 0
+        self.window_end = 0
+        # イベントの位置 -> 作成済みのコントロール（新しく使ったものほど後ろ）
+        self._control_cache: "OrderedDict[int, Optional[ft.Control]]" = OrderedDict()
         self.current_file = None
         self.initial_log_file = initial_log_file
         self.auto_refresh = True
-        self.refresh_thread = None
+        self.tailer: Optional[LogTailer] = None
         self.page = None
-        self._needs_ui_update = False
+        # 監視スレッドと UI スレッドからの画面更新を直列化する
+        self._ui_lock = threading.Lock()
 
         # Agent毎の色設定
         self.agent_colors = {
@@ -662,8 +1176,13 @@ class LogViewerApp:
         self.file_list = ft.ListView(expand=1, spacing=5, padding=ft.padding.all(10))
 
         # イベントリスト
+        # 全イベントではなく EVENT_WINDOW_SIZE 行だけを描画し、スクロールに合わせてずらす
         self.event_list = ft.ListView(
-            expand=1, spacing=10, padding=ft.padding.all(10), auto_scroll=True
+            expand=1,
+            spacing=10,
+            padding=ft.padding.all(10),
+            auto_scroll=True,
+            on_scroll=self._on_event_list_scroll,
         )
 
         # フィルター機能を削除 - すべてのイベントを表示
@@ -746,28 +1265,6 @@ class LogViewerApp:
         # ページ終了時のクリーンアップを設定
         page.on_window_event = self.on_window_event
 
-        # UI更新チェック用のタイマーを設定（1秒間隔）
-        def check_ui_updates():
-            if self._needs_ui_update:
-                try:
-                    self.apply_filters(None)
-                    self.update_game_status()
-                    page.update()
-                    self._needs_ui_update = False
-                    print("DEBUG: UI updated via timer")
-                except Exception as timer_error:
-                    print(f"タイマーUI更新エラー: {timer_error}")
-
-        # UI更新チェック用のタイマーを開始
-        def timer_loop():
-            while True:
-                if hasattr(self, "page") and self.page:
-                    check_ui_updates()
-                time.sleep(1)
-
-        timer_thread = threading.Thread(target=timer_loop, daemon=True)
-        timer_thread.start()
-
     def auto_select_latest_log(self, page: ft.Page):
         """最新のログファイルを自動選択して読み込む"""
         log_dir = "logs"
@@ -830,17 +1327,25 @@ class LogViewerApp:
 
     def load_log_file(self, filepath: str, page: ft.Page):
         """選択されたログファイルを読み込む"""
+        self.stop_auto_refresh()
         self.current_file = filepath
-        self.events = self.parser.parse_file(filepath)
-        self.apply_filters(None)
+        # 大きなログでもすぐ開けるよう、インデックスを使って直近のハンドだけ解析
+        self.events = self.parser.parse_file(filepath, max_hands=VIEWER_INITIAL_HANDS)
+        hand_history = self.parser.open_hand_history(filepath)
+        self.update_event_list()
 
         # ゲーム状況を更新
         self.update_game_status()
 
-        # 統計情報を更新
-        hand_count = len(
-            [e for e in self.events if e["type"] == LogEventType.HAND_START]
-        )
+        # 統計情報を更新（ハンド履歴があれば完了したハンド数をインデックスから取得）
+        if hand_history is not None:
+            hand_count = len(hand_history)
+        elif self.parser.index is not None:
+            hand_count = len(self.parser.index.hands)
+        else:
+            hand_count = len(
+                [e for e in self.events if e["type"] == LogEventType.HAND_START]
+            )
 
         self.stats_text.value = (
             f"ハンド数: {hand_count}, 総イベント数: {len(self.events)}"
@@ -853,24 +1358,93 @@ class LogViewerApp:
         page.update()
 
     def apply_filters(self, e):
-        """フィルター機能を削除 - 全イベントを表示"""
-        if not self.events:
+        """visible_types に該当するイベントを種類毎のインデックスから求めて表示"""
+        self.filtered_positions = self.event_index.select(self.visible_types)
+
+        # 最新のイベントが見える位置から表示
+        total = len(self.filtered_positions)
+        self._show_window(max(0, total - EVENT_WINDOW_SIZE), total)
+
+    def _rebuild_event_index(self):
+        """self.events を読み込み直した後にインデックスとキャッシュを作り直す"""
+        self.event_index.reset()
+        self.event_index.extend(self.events)
+        self._control_cache.clear()
+
+    def update_event_list(self, new_events: Optional[List[Dict[str, Any]]] = None):
+        """
+        イベントリストを更新
+
+        new_events を渡すと（self.events に追記済みの）その分だけをインデックスに
+        登録し、末尾を表示中なら描画範囲に追加する。
+        """
+        if new_events is None:
+            self._rebuild_event_index()
+            self.apply_filters(None)
             return
 
-        # 全イベントを表示
-        self.filtered_events = self.events
-
-        # イベントリストを更新
-        self.update_event_list()
-
-    def update_event_list(self):
-        """イベントリストを更新"""
-        self.event_list.controls.clear()
+        start = self.event_index.size
+        self.event_index.extend(new_events)
+        following = self.window_end == len(self.filtered_positions)
+        self.filtered_positions.extend(
+            self.event_index.select(self.visible_types, start)
+        )
+        if not following:
+            return  # 過去のイベントを見ている間は表示を動かさない
+
+        total = len(self.filtered_positions)
+        for index in range(self.window_end, total):
+            control = self._control_at(index)
+            if control is not None:
+                self.event_list.controls.append(control)
+        self.window_end = total
+        if total - self.window_start > EVENT_WINDOW_SIZE:
+            self._show_window(total - EVENT_WINDOW_SIZE, total)
+
+    def _control_at(self, index: int) -> Optional[ft.Control]:
+        """filtered_positions[index] のイベントのコントロール（キャッシュ済みなら再利用）"""
+        position = self.filtered_positions[index]
+        if position in self._control_cache:
+            self._control_cache.move_to_end(position)
+            return self._control_cache[position]
+        control = self.create_event_control(self.events[position])
+        if control is not None:
+            control.key = str(position)
+        self._control_cache[position] = control
+        if len(self._control_cache) > EVENT_CONTROL_CACHE_SIZE:
+            self._control_cache.popitem(last=False)
+        return control
+
+    def _show_window(self, start: int, end: int):
+        """filtered_positions[start:end] のイベントだけを一覧に描画"""
+        self.window_start = start
+        self.window_end = end
+        controls = [self._control_at(index) for index in range(start, end)]
+        self.event_list.controls = [c for c in controls if c is not None]
+        # 末尾を表示しているときだけ新しいイベントに追従する
+        self.event_list.auto_scroll = end == len(self.filtered_positions)
+
+    def _on_event_list_scroll(self, e):
+        """一覧の端までスクロールしたら描画範囲を前後にずらす"""
+        with self._ui_lock:
+            total = len(self.filtered_positions)
+            if e.pixels <= EVENT_SCROLL_EDGE and self.window_start > 0:
+                start = max(0, self.window_start - EVENT_WINDOW_STEP)
+                anchor = self.window_start
+            elif (
+                e.pixels >= e.max_scroll_extent - EVENT_SCROLL_EDGE
+                and self.window_end < total
+            ):
+                end = min(total, self.window_end + EVENT_WINDOW_STEP)
+                start = max(0, end - EVENT_WINDOW_SIZE)
+                anchor = self.window_end - 1
+            else:
+                return
 
-        for event in self.filtered_events:
-            event_control = self.create_event_control(event)
-            if event_control:
-                self.event_list.controls.append(event_control)
+            self._show_window(start, min(total, start + EVENT_WINDOW_SIZE))
+            self.event_list.update()
+            # 見ていた行が同じ位置に来るようにスクロール
+            self.event_list.scroll_to(key=str(self.filtered_positions[anchor]))
 
     def create_event_control(self, event: Dict[str, Any]) -> Optional[ft.Control]:
         """イベントに応じたUIコントロールを作成"""
@@ -1095,35 +1669,37 @@ class LogViewerApp:
             self.stop_auto_refresh()
 
     def start_auto_refresh(self):
-        """リアルタイム更新を開始"""
-        if self.refresh_thread and self.refresh_thread.is_alive():
+        """リアルタイム更新を開始（ファイルの変更を監視して追記分だけ反映）"""
+        if self.tailer is not None or not self.current_file:
             return
 
-        self.refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
-        self.refresh_thread.start()
+        self.tailer = LogTailer(
+            self.parser,
+            self.current_file,
+            self._on_new_events,
+            max_hands=VIEWER_INITIAL_HANDS,
+        )
+        self.tailer.start()
 
     def stop_auto_refresh(self):
         """リアルタイム更新を停止"""
-        self.auto_refresh = False
-
-    def _refresh_loop(self):
-        """リアルタイム更新のメインループ"""
-        while self.auto_refresh and self.current_file:
-            try:
-                # 新しいログ行を解析
-                new_events = self.parser.parse_new_lines(self.current_file)
-
-                # 新しいイベントがある場合はUI更新フラグを設定
-                if new_events:
-                    self._needs_ui_update = True
-                    print(
-                        f"DEBUG: Marked UI for update with {len(new_events)} new events"
-                    )
+        if self.tailer is not None:
+            self.tailer.stop()
+            self.tailer = None
 
-                time.sleep(2)  # 2秒間隔で更新
-            except Exception as e:
-                print(f"リアルタイム更新エラー: {e}")
-                break
+    def _on_new_events(self, new_events: List[Dict[str, Any]], reset: bool):
+        """LogTailer から呼ばれ、新しいイベントを画面に反映する"""
+        if self.page is None:
+            return
+        with self._ui_lock:
+            if reset:
+                # ファイルが置き換えられたので一覧を作り直す
+                self.events = self.parser.events
+                self.update_event_list()
+            else:
+                self.update_event_list(new_events)
+            self.update_game_status()
+            self.page.update()
 
     def update_game_status(self):
         """ゲーム状況表示を更新"""
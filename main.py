@@ -5,49 +5,14 @@ Texas Hold'em Poker Game - Main Entry Point
 import sys
 import argparse
 import asyncio
-import logging
-import os
-from datetime import datetime
 from poker.cli_ui import PokerUI
 from poker.flet_ui import run_flet_poker_app
-
-
-def setup_logging():
-    """ログ設定をセットアップ（常にデバッグモード）"""
-    # ログディレクトリの作成
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-
-    # タイムスタンプ付きのログファイル名を生成
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = os.path.join(log_dir, f"poker_game_{timestamp}.log")
-
-    # poker_gameロガーの設定
-    poker_logger = logging.getLogger("poker_game")
-    poker_logger.setLevel(logging.DEBUG)
-
-    # 既存のハンドラーをクリア（重複を避けるため）
-    poker_logger.handlers.clear()
-
-    # ファイルハンドラーを追加（常に）
-    file_handler = logging.FileHandler(log_filename, encoding="utf-8")
-    file_handler.setLevel(logging.DEBUG)
-
-    # フォーマッターを設定
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    file_handler.setFormatter(formatter)
-
-    # コンソールハンドラーを追加（常に）
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-
-    # ハンドラーをロガーに追加
-    poker_logger.addHandler(file_handler)
-    poker_logger.addHandler(console_handler)
+from poker.hand_history import (
+    HandHistoryWriter,
+    hand_history_path_for,
+    set_default_writer,
+)
+from poker.logging_config import parse_log_levels, setup_logging
 
 
 def main():
@@ -75,6 +40,11 @@ def main():
         action="store_true",
         help="CPU専用モード（全プレイヤーがCPU、自動進行）",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="CPU専用モードをヘッドレス（ログ・待機・表示なし）で高速に実行",
+    )
     parser.add_argument(
         "--agent-only",
         action="store_true",
@@ -98,17 +68,98 @@ def main():
         default=1,
         help="CPU専用モードでの詳細表示間隔（デフォルト: 1）",
     )
+    parser.add_argument(
+        "--tables",
+        type=int,
+        default=1,
+        help="エージェント専用モードで同時に進行するテーブル数（デフォルト: 1）",
+    )
+    parser.add_argument(
+        "--agent-concurrency",
+        type=int,
+        default=4,
+        help="複数テーブル時のエージェント毎の同時LLMリクエスト数（デフォルト: 4）",
+    )
+    parser.add_argument(
+        "--log-levels",
+        type=str,
+        default="",
+        help="サブシステム毎のログレベル（例: engine=INFO,players=DEBUG,ui=WARNING）",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    tournament_parser = subparsers.add_parser(
+        "tournament",
+        help="複数テーブルをマルチプロセスで並列実行してエージェントの強さを比較",
+    )
+    tournament_parser.add_argument(
+        "--agents",
+        type=str,
+        default="random:4",
+        help="ラインナップ（例: team1_agent:2,random:2）。random はCPUプレイヤー",
+    )
+    tournament_parser.add_argument(
+        "--tables", type=int, default=8, help="テーブル数（デフォルト: 8）"
+    )
+    tournament_parser.add_argument(
+        "--hands",
+        type=int,
+        default=1000,
+        help="1テーブルあたりのハンド数（デフォルト: 1000）",
+    )
+    tournament_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="ワーカープロセス数（デフォルト: CPUコア数）",
+    )
+    tournament_parser.add_argument(
+        "--seed", type=int, default=None, help="乱数シード（再現用）"
+    )
+    tournament_parser.add_argument(
+        "--initial-chips",
+        type=int,
+        default=2000,
+        help="初期チップ（デフォルト: 2000）",
+    )
     args = parser.parse_args()
 
-    # ログ設定をセットアップ（常にデバッグモード）
-    setup_logging()
+    if args.command == "tournament":
+        # トーナメントはヘッドレスで実行するためログ設定は行わない
+        from poker.tournament import print_tournament_result, run_tournament
+
+        print_tournament_result(
+            run_tournament(
+                lineup=args.agents,
+                num_tables=args.tables,
+                hands_per_table=args.hands,
+                workers=args.workers,
+                seed=args.seed,
+                initial_chips=args.initial_chips,
+            )
+        )
+        return
+
+    # ログ設定をセットアップ（ファイルは常にデバッグレベル、書き込みはバックグラウンド）
+    # サブシステム毎のレベルは --log-levels、未指定なら環境変数 ADK_POKER_LOG_LEVELS
+    try:
+        levels = parse_log_levels(args.log_levels) if args.log_levels else None
+    except ValueError as e:
+        parser.error(str(e))
+    log_file = setup_logging(levels=levels)
+    # テキストログと並べてハンド毎の構造化履歴（JSONL）も保存
+    set_default_writer(HandHistoryWriter(hand_history_path_for(log_file)))
 
     try:
         if args.cli:
             # CLI モード
             ui = PokerUI()
 
-            if args.cpu_only:
+            if args.cpu_only and args.headless:
+                # ヘッドレスシミュレーションを実行
+                from poker.simulation import SimulationRunner, print_result
+
+                print_result(SimulationRunner().run(args.max_hands))
+            elif args.cpu_only:
                 # CPU専用モードを実行
                 print("CPU専用モードで実行します...")
                 ui.run_cpu_only_game(
@@ -120,7 +171,26 @@ def main():
                 max_hands = (
                     args.max_hands if args.max_hands != 10 else 20
                 )  # エージェント専用モードのデフォルトは20
-                ui.run_agent_only_mode(max_hands=max_hands, agents_config=args.agents)
+                if args.tables > 1:
+                    # 複数テーブルを1つのイベントループで同時進行
+                    from poker.tournament import (
+                        print_tournament_result,
+                        run_concurrent_tables,
+                    )
+
+                    print(f"{args.tables}テーブルを同時に進行します...")
+                    print_tournament_result(
+                        run_concurrent_tables(
+                            lineup=args.agents,
+                            num_tables=args.tables,
+                            hands_per_table=max_hands,
+                            per_agent_limit=args.agent_concurrency,
+                        )
+                    )
+                else:
+                    ui.run_agent_only_mode(
+                        max_hands=max_hands, agents_config=args.agents
+                    )
             else:
                 # 通常のゲームを実行
                 ui.run_game()
@@ -6,7 +6,7 @@ import json
 from time import sleep
 from typing import Dict, Any, Tuple, Optional, List
 from .game import PokerGame, GamePhase
-from .player_models import Player, HumanPlayer, PlayerStatus
+from .player_models import DecisionRunner, Player, HumanPlayer, PlayerStatus
 from .evaluator import HandEvaluator
 
 
@@ -15,6 +15,8 @@ class PokerUI:
 
     def __init__(self):
         self.game = None
+        # AIプレイヤーの判断を実行するイベントループ（ゲーム中は使い回す）
+        self.decision_runner: Optional[DecisionRunner] = None
 
     def clear_screen(self):
         """画面をクリア（簡易版）"""
@@ -165,11 +167,11 @@ class PokerUI:
 
     def _display_recent_actions(self):
         """最近のアクション履歴を表示"""
-        if not self.game.action_history:
+        recent_actions = self.game.action_log.render(3)
+        if not recent_actions:
             return
 
         print("最近のアクション:")
-        recent_actions = self.game.action_history[-3:]
         for action in recent_actions:
             print(f"  • {action}")
         print()
@@ -357,6 +359,18 @@ class PokerUI:
 
         input("\n続行するには Enter キーを押してください...")
 
+    def _decide(self, player: Player, game_state) -> Dict[str, Any]:
+        """AIプレイヤーの判断を共有のイベントループ上で実行（make_decision_async）"""
+        if self.decision_runner is None:
+            self.decision_runner = DecisionRunner()
+        return self.decision_runner.decide(player, game_state)
+
+    def _close_decision_runner(self):
+        """判断用のイベントループを閉じる"""
+        if self.decision_runner is not None:
+            self.decision_runner.close()
+            self.decision_runner = None
+
     def run_game(self):
         """メインゲームループを実行"""
         self.display_welcome_message()
@@ -407,7 +421,7 @@ class PokerUI:
                         else:
                             # AIプレイヤーのアクション
                             game_state = self.game.get_llm_game_state(current_player.id)
-                            decision = current_player.make_decision(game_state)
+                            decision = self._decide(current_player, game_state)
 
                             success = self.game.process_player_action(
                                 current_player.id,
@@ -484,6 +498,8 @@ class PokerUI:
         except Exception as e:
             print(f"\nエラーが発生しました: {e}")
             print("ゲームを終了します。")
+        finally:
+            self._close_decision_runner()
 
     def run_agent_only_mode(
         self, max_hands: int = 20, agents_config: str = "team1_agent:2,team2_agent:2"
@@ -573,7 +589,7 @@ class PokerUI:
 
                         # エージェントプレイヤーのアクション
                         game_state = self.game.get_llm_game_state(current_player.id)
-                        decision = current_player.make_decision(game_state)
+                        decision = self._decide(current_player, game_state)
 
                         success = self.game.process_player_action(
                             current_player.id,
@@ -721,6 +737,8 @@ class PokerUI:
             import traceback
 
             traceback.print_exc()
+        finally:
+            self._close_decision_runner()
 
     def _parse_agents_config(self, agents_config: str) -> List[Dict[str, Any]]:
         """
@@ -856,7 +874,7 @@ class PokerUI:
 
                         # CPUプレイヤーのアクション
                         game_state = self.game.get_llm_game_state(current_player.id)
-                        decision = current_player.make_decision(game_state)
+                        decision = self._decide(current_player, game_state)
 
                         success = self.game.process_player_action(
                             current_player.id,
@@ -953,3 +971,5 @@ class PokerUI:
         except Exception as e:
             print(f"\nエラーが発生しました: {e}")
             print("ゲームを終了します。")
+        finally:
+            self._close_decision_runner()
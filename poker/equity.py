@@ -0,0 +1,455 @@
+"""
+Equity calculator: exact enumeration and Monte Carlo on top of the batch evaluator
+"""
+
+import math
+import time
+import concurrent.futures as cf
+from dataclasses import dataclass, asdict
+from itertools import combinations
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .game_models import Card
+from .batch_evaluator import evaluate_array
+from .canonical import CanonicalCache, canonical_key
+
+CardLike = Union[Card, str, int]
+# 相手のレンジ指定: None（ランダム）/ ホールカード2枚組のリスト / {2枚組: 重み}
+RangeSpec = Optional[
+    Union[Sequence[Sequence[CardLike]], Mapping[Tuple[CardLike, CardLike], float]]
+]
+
+# 完全列挙に切り替える評価行数の上限（これ以下なら exact モード）
+DEFAULT_EXACT_LIMIT = 300_000
+DEFAULT_BATCH_SIZE = 4096
+# CanonicalCache に完全列挙の結果を保存する名前空間
+EQUITY_CACHE_NAMESPACE = "equity.exact"
+
+
+@dataclass
+class EquityResult:
+    """エクイティ計算結果（各値は0.0〜1.0）"""
+
+    win: float
+    tie: float
+    lose: float
+    equity: float  # 引き分けを山分けした期待取り分
+    samples: int
+    std_error: float
+    exact: bool
+    elapsed: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return asdict(self)
+
+
+def _card_id(card: CardLike) -> int:
+    """Card / 文字列 / 整数IDをカードIDに変換"""
+    if isinstance(card, Card):
+        return card.id
+    if isinstance(card, str):
+        return Card.from_str(card).id
+    return Card.from_id(int(card)).id
+
+
+def _card_ids(cards: Sequence[CardLike]) -> List[int]:
+    return [_card_id(card) for card in cards]
+
+
+def _normalize_range(
+    spec: RangeSpec, dead: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    レンジ指定を (2枚組のカードID配列 (M, 2), 重み (M,)) に変換
+
+    デッドカード（自分の手札・ボード等）と重なる組は除外する。None はランダムな相手。
+    """
+    if spec is None:
+        return None
+    if isinstance(spec, Mapping):
+        items = list(spec.items())
+    else:
+        items = [(combo, 1.0) for combo in spec]
+
+    pairs = []
+    weights = []
+    for combo, weight in items:
+        first, second = _card_ids(combo)
+        if first == second or dead[first] or dead[second] or weight <= 0:
+            continue
+        pairs.append((first, second))
+        weights.append(float(weight))
+
+    if not pairs:
+        raise ValueError("Opponent range has no combos left after removing dead cards")
+    return np.asarray(pairs, dtype=np.int64), np.asarray(weights, dtype=np.float64)
+
+
+def _score(
+    hero: np.ndarray, opponents: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    強さの配列から (勝ち, 引き分け, 取り分) の配列を作成
+
+    Args:
+        hero: 自分の強さ (N,)
+        opponents: 相手の強さ (N, k)
+    """
+    best = opponents.max(axis=1)
+    win = hero > best
+    tie = hero == best
+    tied_count = (opponents == hero[:, None]).sum(axis=1)
+    share = np.where(win, 1.0, np.where(tie, 1.0 / (tied_count + 1), 0.0))
+    return win, tie, share
+
+
+def _exact_row_estimate(
+    num_remaining: int, need: int, specs: List[Optional[Tuple[np.ndarray, np.ndarray]]]
+) -> int:
+    """完全列挙時の評価行数の見積もり（重なりを除外する前の上限）"""
+    rows = math.comb(num_remaining, need)
+    left = num_remaining - need
+    for spec in specs:
+        rows *= math.comb(left, 2) if spec is None else len(spec[0])
+        left -= 2
+    return rows
+
+
+def _evaluate_rows(
+    hero: List[int], board: List[int], rows: np.ndarray, need: int, num_opponents: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    列挙/サンプリングした行（ボード補完 + 各相手の2枚）を評価
+
+    Returns:
+        (勝ち, 引き分け, 取り分) の配列
+    """
+    count = len(rows)
+    known_board = np.broadcast_to(
+        np.asarray(board, dtype=np.int64), (count, len(board))
+    )
+    full_board = np.concatenate([known_board, rows[:, :need]], axis=1)
+    hero_cards = np.broadcast_to(np.asarray(hero, dtype=np.int64), (count, 2))
+    hero_strength = evaluate_array(np.concatenate([hero_cards, full_board], axis=1))
+    opponent_strengths = np.stack(
+        [
+            evaluate_array(
+                np.concatenate(
+                    [rows[:, need + 2 * i : need + 2 * i + 2], full_board], axis=1
+                )
+            )
+            for i in range(num_opponents)
+        ],
+        axis=1,
+    )
+    return _score(hero_strength, opponent_strengths)
+
+
+def _enumerate_rows(
+    remaining: np.ndarray,
+    need: int,
+    specs: List[Optional[Tuple[np.ndarray, np.ndarray]]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """ボード補完と各相手のホールカードの全組み合わせ（カードの重複なし）を列挙"""
+    if need:
+        rows = np.asarray(list(combinations(remaining.tolist(), need)), dtype=np.int64)
+    else:
+        rows = np.empty((1, 0), dtype=np.int64)
+    weights = np.ones(len(rows), dtype=np.float64)
+    all_pairs = np.asarray(list(combinations(remaining.tolist(), 2)), dtype=np.int64)
+
+    for spec in specs:
+        pairs, pair_weights = (
+            (all_pairs, np.ones(len(all_pairs))) if spec is None else spec
+        )
+        joined = np.concatenate(
+            [np.repeat(rows, len(pairs), axis=0), np.tile(pairs, (len(rows), 1))],
+            axis=1,
+        )
+        joined_weights = np.repeat(weights, len(pairs)) * np.tile(
+            pair_weights, len(rows)
+        )
+        overlap = (joined[:, :-2, None] == joined[:, None, -2:]).any(axis=(1, 2))
+        rows, weights = joined[~overlap], joined_weights[~overlap]
+    return rows, weights
+
+
+def _sample_rows(
+    rng: np.random.Generator,
+    dead: np.ndarray,
+    need: int,
+    specs: List[Optional[Tuple[np.ndarray, np.ndarray]]],
+    size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ボード補完と各相手のホールカードをランダムに size 行サンプリング
+
+    Returns:
+        (行 (size, need + 2k), 有効フラグ (size,)) レンジ同士が重なった行は無効
+    """
+    keys = rng.random((size, 52))
+    keys[:, dead] = 2.0
+    row_index = np.arange(size)[:, None]
+    valid = np.ones(size, dtype=bool)
+    columns: List[Optional[np.ndarray]] = []
+
+    # レンジ指定の相手を先に決める
+    for spec in specs:
+        if spec is None:
+            columns.append(None)
+            continue
+        pairs, weights = spec
+        chosen = pairs[rng.choice(len(pairs), size=size, p=weights / weights.sum())]
+        valid &= ~(keys[row_index, chosen] >= 2.0).any(axis=1)
+        keys[row_index, chosen] = 2.0
+        columns.append(chosen)
+
+    # 残りのカードをランダムに配る
+    num_random = need + 2 * sum(1 for spec in specs if spec is None)
+    picked = np.argpartition(keys, num_random - 1, axis=1)[:, :num_random]
+    order = np.argsort(np.take_along_axis(keys, picked, axis=1), axis=1)
+    picked = np.take_along_axis(picked, order, axis=1)
+
+    parts = [picked[:, :need]]
+    cursor = need
+    for chosen in columns:
+        if chosen is None:
+            parts.append(picked[:, cursor : cursor + 2])
+            cursor += 2
+        else:
+            parts.append(chosen)
+    return np.concatenate(parts, axis=1), valid
+
+
+def _monte_carlo(
+    hero: List[int],
+    board: List[int],
+    dead: np.ndarray,
+    specs: List[Optional[Tuple[np.ndarray, np.ndarray]]],
+    seed: Any,
+    target_std_error: float,
+    time_budget: float,
+    max_samples: int,
+    batch_size: int,
+) -> Tuple[int, float, float, float, float]:
+    """
+    モンテカルロ法で集計値を計算
+
+    Returns:
+        (サンプル数, 勝ち数, 引き分け数, 取り分の合計, 取り分の二乗和)
+    """
+    rng = np.random.default_rng(seed)
+    need = 5 - len(board)
+    deadline = time.perf_counter() + time_budget
+    samples = 0
+    wins = ties = share_sum = share_sq = 0.0
+
+    while samples < max_samples:
+        size = min(batch_size, max_samples - samples)
+        rows, valid = _sample_rows(rng, dead, need, specs, size)
+        rows = rows[valid]
+        if len(rows):
+            win, tie, share = _evaluate_rows(hero, board, rows, need, len(specs))
+            samples += len(rows)
+            wins += win.sum()
+            ties += tie.sum()
+            share_sum += share.sum()
+            share_sq += (share * share).sum()
+
+        if samples >= batch_size and target_std_error > 0:
+            mean = share_sum / samples
+            variance = max(share_sq / samples - mean * mean, 0.0)
+            if math.sqrt(variance / samples) <= target_std_error:
+                break
+        if time.perf_counter() >= deadline:
+            break
+
+    return samples, float(wins), float(ties), float(share_sum), float(share_sq)
+
+
+_pool: Optional[cf.ProcessPoolExecutor] = None
+_pool_size = 0
+_pool_lock = Lock()
+
+
+def _get_pool(processes: int) -> cf.ProcessPoolExecutor:
+    """プロセスプールを取得（呼び出し毎の起動コストを避けるため使い回す）"""
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size != processes:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = cf.ProcessPoolExecutor(max_workers=processes)
+            _pool_size = processes
+        return _pool
+
+
+def shutdown_pool():
+    """エクイティ計算用のプロセスプールを終了"""
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        _pool_size = 0
+
+
+def calculate_equity(
+    hole_cards: Sequence[CardLike],
+    community_cards: Sequence[CardLike] = (),
+    num_opponents: int = 1,
+    opponent_ranges: Optional[Sequence[RangeSpec]] = None,
+    dead_cards: Sequence[CardLike] = (),
+    mode: str = "auto",
+    target_std_error: float = 0.005,
+    time_budget: float = 0.05,
+    max_samples: int = 200_000,
+    exact_limit: int = DEFAULT_EXACT_LIMIT,
+    processes: int = 1,
+    seed: Any = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache: Optional[CanonicalCache] = None,
+) -> EquityResult:
+    """
+    自分のハンドの勝率（勝ち/引き分け/負け）とエクイティを計算
+
+    Args:
+        hole_cards: 自分の手札2枚（Card / "A♠" 形式の文字列 / カードID）
+        community_cards: コミュニティカード（0, 3, 4, 5枚）
+        num_opponents: 相手の人数（opponent_ranges を指定した場合はその長さが優先）
+        opponent_ranges: 相手毎のレンジ。None の要素はランダムな手札
+        dead_cards: 既に見えていて配られないカード
+        mode: "auto"（見積もり行数が exact_limit 以下なら完全列挙）/ "exact" / "monte_carlo"
+        target_std_error: モンテカルロの収束目標（エクイティの標準誤差）
+        time_budget: モンテカルロの時間上限（秒、ワーカー毎）
+        max_samples: モンテカルロの最大サンプル数
+        exact_limit: auto モードで完全列挙を選ぶ行数の上限
+        processes: 2以上ならプロセスプールで並列計算
+        seed: 乱数シード
+        batch_size: 1回のNumPy評価で扱う行数
+        cache: 指定すると、相手が全員ランダムな完全列挙の結果をスートの入れ替えで
+            同じになる状況と共有する
+
+    Returns:
+        EquityResult: 計算結果
+    """
+    started = time.perf_counter()
+    hero = _card_ids(hole_cards)
+    board = _card_ids(community_cards)
+    if len(hero) != 2:
+        raise ValueError("hole_cards must contain exactly 2 cards")
+    if len(board) not in (0, 3, 4, 5):
+        raise ValueError("community_cards must contain 0, 3, 4 or 5 cards")
+
+    dead = np.zeros(52, dtype=bool)
+    for card_id in hero + board + _card_ids(dead_cards):
+        if dead[card_id]:
+            raise ValueError(f"Duplicate card: {Card.from_id(card_id)}")
+        dead[card_id] = True
+
+    if opponent_ranges is None:
+        opponent_ranges = [None] * num_opponents
+    if not 1 <= len(opponent_ranges) <= 9:
+        raise ValueError("Number of opponents must be between 1 and 9")
+    specs = [_normalize_range(spec, dead) for spec in opponent_ranges]
+
+    need = 5 - len(board)
+    remaining = np.flatnonzero(~dead)
+    if mode == "auto":
+        estimate = _exact_row_estimate(len(remaining), need, specs)
+        mode = "exact" if estimate <= exact_limit else "monte_carlo"
+
+    if mode == "exact":
+        cache_key = None
+        if cache is not None and all(spec is None for spec in opponent_ranges):
+            cache_key = (canonical_key(hero, board, dead_cards), len(specs))
+            cached = cache.get(EQUITY_CACHE_NAMESPACE, cache_key)
+            if cached is not None:
+                return EquityResult(
+                    **{**cached, "elapsed": time.perf_counter() - started}
+                )
+
+        rows, weights = _enumerate_rows(remaining, need, specs)
+        total = weights.sum()
+        if not len(rows) or total <= 0:
+            raise ValueError("No valid deal exists for the given cards and ranges")
+        win, tie, share = _evaluate_rows(hero, board, rows, need, len(specs))
+        win_rate = float(weights[win].sum() / total)
+        tie_rate = float(weights[tie].sum() / total)
+        result = EquityResult(
+            win=win_rate,
+            tie=tie_rate,
+            lose=max(0.0, 1.0 - win_rate - tie_rate),
+            equity=float((weights * share).sum() / total),
+            samples=len(rows),
+            std_error=0.0,
+            exact=True,
+            elapsed=time.perf_counter() - started,
+        )
+        if cache_key is not None:
+            cache.put(EQUITY_CACHE_NAMESPACE, cache_key, result.to_dict())
+        return result
+
+    if mode != "monte_carlo":
+        raise ValueError(f"Unknown mode: {mode}")
+
+    seeds = np.random.SeedSequence(seed).spawn(max(1, processes))
+    if processes > 1:
+        pool = _get_pool(processes)
+        per_worker = math.ceil(max_samples / processes)
+        worker_target = target_std_error * math.sqrt(processes)
+        futures = [
+            pool.submit(
+                _monte_carlo,
+                hero,
+                board,
+                dead,
+                specs,
+                worker_seed,
+                worker_target,
+                time_budget,
+                per_worker,
+                batch_size,
+            )
+            for worker_seed in seeds
+        ]
+        parts = [future.result() for future in futures]
+    else:
+        parts = [
+            _monte_carlo(
+                hero,
+                board,
+                dead,
+                specs,
+                seeds[0],
+                target_std_error,
+                time_budget,
+                max_samples,
+                batch_size,
+            )
+        ]
+
+    samples = sum(part[0] for part in parts)
+    if samples == 0:
+        raise ValueError("Monte Carlo produced no valid samples")
+    wins = sum(part[1] for part in parts)
+    ties = sum(part[2] for part in parts)
+    share_sum = sum(part[3] for part in parts)
+    share_sq = sum(part[4] for part in parts)
+    mean = share_sum / samples
+    variance = max(share_sq / samples - mean * mean, 0.0)
+
+    return EquityResult(
+        win=wins / samples,
+        tie=ties / samples,
+        lose=max(0.0, 1.0 - (wins + ties) / samples),
+        equity=mean,
+        samples=samples,
+        std_error=math.sqrt(variance / samples),
+        exact=False,
+        elapsed=time.perf_counter() - started,
+    )
@@ -6,6 +6,7 @@ from typing import List, Tuple, Optional
 from enum import Enum
 from collections import Counter
 from .game_models import Card
+from . import fast_evaluator
 
 
 class HandRank(Enum):
@@ -87,20 +88,120 @@ class HandEvaluator:
                 f"High Card: {sorted_cards[0]}",
             )
 
-        # 7枚から最強の5枚の組み合わせを探す
-        from itertools import combinations
+        strength = fast_evaluator.evaluate_cards(all_cards)
+        return HandEvaluator._build_hand_result(strength, all_cards)
 
-        best_hand = None
-        for five_cards in combinations(all_cards, 5):
-            hand_result = HandEvaluator._evaluate_five_cards(list(five_cards))
-            if (
-                best_hand is None
-                or hand_result.rank.value > best_hand.rank.value
-                or (hand_result.rank == best_hand.rank and not hand_result < best_hand)
-            ):
-                best_hand = hand_result
+    @staticmethod
+    def evaluate_strength(hole_cards: List[Card], community_cards: List[Card]) -> int:
+        """
+        ハンドの強さだけを整数で返す（HandResultを生成しない高速版）
+
+        Args:
+            hole_cards: プレイヤーの手札（2枚）
+            community_cards: コミュニティカード（3〜5枚）
+
+        Returns:
+            int: 大きいほど強い。同じ値なら引き分け
+        """
+        return fast_evaluator.evaluate_cards(hole_cards + community_cards)
+
+    @staticmethod
+    def evaluate_batch(hole, board):
+        """
+        多数のハンドをNumPyで一括評価
+
+        Args:
+            hole: ホールカードのカードID（Card.id）配列 shape (N, 2)
+            board: ボードのカードID配列 shape (N, 5)（全行共通なら shape (5,)）
+
+        Returns:
+            np.ndarray: shape (N,) の強さ。evaluate_strength と同じ整数
+        """
+        from . import batch_evaluator
+
+        return batch_evaluator.evaluate_batch(hole, board)
+
+    @staticmethod
+    def compare_batch(hole1, hole2, board):
+        """
+        同じボードでの2つのホールカードを一括比較（compare_hands の一括版）
+
+        Returns:
+            np.ndarray: 1 (hole1の勝ち) / -1 (hole2の勝ち) / 0 (引き分け)
+        """
+        from . import batch_evaluator
+
+        return batch_evaluator.compare_batch(hole1, hole2, board)
+
+    @staticmethod
+    def _build_hand_result(strength: int, all_cards: List[Card]) -> HandResult:
+        """強さの整数と元のカードから、役を構成する5枚と説明付きのHandResultを作成"""
+        category = fast_evaluator.strength_category(strength)
+        kickers = fast_evaluator.strength_kickers(strength)
+        rank = HandRank(category)
+
+        # 役を構成する (ランク, 枚数) の並びとスート制約を決める
+        suit = None
+        if category in (
+            fast_evaluator.FLUSH,
+            fast_evaluator.STRAIGHT_FLUSH,
+            fast_evaluator.ROYAL_FLUSH,
+        ):
+            suit_counts = Counter(card.suit for card in all_cards)
+            suit = suit_counts.most_common(1)[0][0]
+        if category in (
+            fast_evaluator.STRAIGHT,
+            fast_evaluator.STRAIGHT_FLUSH,
+            fast_evaluator.ROYAL_FLUSH,
+        ):
+            top = kickers[0]
+            needed = [(r if r > 1 else 14, 1) for r in range(top, top - 5, -1)]
+        elif category == fast_evaluator.FOUR_OF_A_KIND:
+            needed = [(kickers[0], 4), (kickers[1], 1)]
+        elif category == fast_evaluator.FULL_HOUSE:
+            needed = [(kickers[0], 3), (kickers[1], 2)]
+        elif category == fast_evaluator.THREE_OF_A_KIND:
+            needed = [(kickers[0], 3)] + [(k, 1) for k in kickers[1:]]
+        elif category == fast_evaluator.TWO_PAIR:
+            needed = [(kickers[0], 2), (kickers[1], 2), (kickers[2], 1)]
+        elif category == fast_evaluator.ONE_PAIR:
+            needed = [(kickers[0], 2)] + [(k, 1) for k in kickers[1:]]
+        else:
+            needed = [(k, 1) for k in kickers]
+
+        hand_cards: List[Card] = []
+        for needed_rank, count in needed:
+            for card in all_cards:
+                if count == 0:
+                    break
+                if card.rank == needed_rank and (suit is None or card.suit == suit):
+                    hand_cards.append(card)
+                    count -= 1
+        sorted_cards = sorted(hand_cards, key=lambda c: c.rank, reverse=True)
+
+        names = Card.RANK_NAMES
+        if rank == HandRank.ROYAL_FLUSH:
+            description = "Royal Flush"
+        elif rank == HandRank.STRAIGHT_FLUSH:
+            description = f"Straight Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.FOUR_OF_A_KIND:
+            description = f"Four of a Kind: {names[kickers[0]]}s"
+        elif rank == HandRank.FULL_HOUSE:
+            description = f"Full House: {names[kickers[0]]}s over {names[kickers[1]]}s"
+        elif rank == HandRank.FLUSH:
+            description = f"Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.STRAIGHT:
+            description = f"Straight: {names[kickers[0]]}-high"
+        elif rank == HandRank.THREE_OF_A_KIND:
+            description = f"Three of a Kind: {names[kickers[0]]}s"
+        elif rank == HandRank.TWO_PAIR:
+            description = f"Two Pair: {names[kickers[0]]}s and {names[kickers[1]]}s"
+        elif rank == HandRank.ONE_PAIR:
+            description = f"One Pair: {names[kickers[0]]}s"
+        else:
+            description = f"High Card: {sorted_cards[0]}"
 
-        return best_hand
+        return HandResult(rank, sorted_cards, kickers, description)
 
     @staticmethod
     def _evaluate_five_cards(cards: List[Card]) -> HandResult:
@@ -122,7 +223,7 @@ class HandEvaluator:
         is_straight = HandEvaluator._is_straight(ranks)
 
         # ロイヤルフラッシュ
-        if is_flush and is_straight and ranks[0] == 14:  # A-K-Q-J-10
+        if is_flush and is_straight and ranks[:2] == [14, 13]:  # A-K-Q-J-10
             return HandResult(HandRank.ROYAL_FLUSH, sorted_cards, [14], "Royal Flush")
 
         # ストレートフラッシュ
@@ -6,7 +6,7 @@ import json
 from typing import Dict, Any, List
 import flet as ft
 from .game import PokerGame, GamePhase
-from .player_models import Player, HumanPlayer, PlayerStatus
+from .player_models import DecisionRunner, Player, HumanPlayer, PlayerStatus
 from .setup_ui import SetupUI
 from .game_ui import GameUI
 from .shared_state import set_current_game
@@ -147,7 +147,15 @@ class PokerFletUI:
         threading.Thread(target=self.game_loop, daemon=True).start()
 
     def game_loop(self):
-        """メインゲームループ"""
+        """メインゲームループ（AIの判断はこのスレッドの1つのイベントループ上で実行）"""
+        self.decision_runner = DecisionRunner()
+        try:
+            self._run_game_loop()
+        finally:
+            self.decision_runner.close()
+
+    def _run_game_loop(self):
+        """メインゲームループの本体"""
         while not self.game.is_game_over():
             # 新しいハンドを開始
             self.game.start_new_hand()
@@ -215,7 +223,9 @@ class PokerFletUI:
                             old_player_index = self.game.current_player_index
 
                             game_state = self.game.get_llm_game_state(current_player.id)
-                            decision = current_player.make_decision(game_state)
+                            decision = self.decision_runner.decide(
+                                current_player, game_state
+                            )
 
                             self.game_ui.add_debug_message(
                                 f"Decision: {decision['action']} ({decision.get('amount', 0)})"
@@ -354,9 +364,9 @@ class PokerFletUI:
 
     def ask_continue_game(self) -> bool:
         """ゲーム続行確認"""
-        import logging
+        from .logging_config import get_logger
 
-        logger = logging.getLogger("poker_game")
+        logger = get_logger("ui")
         logger.debug("ask_continue_game called")
 
         import time
@@ -409,7 +419,7 @@ class PokerFletUI:
     def add_debug_message(self, message: str):
         """デバッグメッセージを追加"""
         import datetime
-        import logging
+        from .logging_config import get_logger
 
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         self.debug_messages.append(f"[{timestamp}] {message}")
@@ -417,7 +427,7 @@ class PokerFletUI:
         self.debug_messages = self.debug_messages[-5:]
 
         # ロガーを使用（main.pyの設定に従う）
-        logger = logging.getLogger("poker_game")
+        logger = get_logger("ui")
         logger.debug(message)
 
     def show_phase_transition_confirmation(self):
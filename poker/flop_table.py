@@ -0,0 +1,136 @@
+"""
+Exact flop equity table against one random hand for the 1755 canonical flops
+"""
+
+import argparse
+import time
+from itertools import combinations
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .canonical import canonical_suit_map
+from .game_models import Card
+from .ranges import NUM_COMBOS, combo_equities, combo_index, full_range
+
+CardLike = Union[Card, str, int]
+
+# スートの入れ替えで区別できないフロップの数
+NUM_FLOPS = 1755
+# [フロップ, 手札の組] -> エクイティ * EQUITY_SCALE（フロップと重なる組は0）
+TABLE_SHAPE = (NUM_FLOPS, NUM_COMBOS)
+TABLE_DTYPE = np.uint16
+EQUITY_SCALE = 65535
+
+
+def _card_id(card: CardLike) -> int:
+    if isinstance(card, Card):
+        return card.id
+    if isinstance(card, str):
+        return Card.from_str(card).id
+    return int(card)
+
+
+def _canonical_flop(flop: Sequence[int]) -> Tuple[Tuple[int, ...], list]:
+    """フロップ -> (正規形のカードIDの昇順, suit_map)"""
+    suit_map = canonical_suit_map([], flop)
+    ids = sorted(suit_map[card_id // 13] * 13 + card_id % 13 for card_id in flop)
+    return tuple(ids), suit_map
+
+
+def _flop_keys(flops: np.ndarray) -> np.ndarray:
+    """昇順のカードID (N, 3) -> 昇順に並ぶ整数キー (N,)"""
+    flops = np.asarray(flops, dtype=np.int64)
+    return (flops[:, 0] * 52 + flops[:, 1]) * 52 + flops[:, 2]
+
+
+def canonical_flops() -> np.ndarray:
+    """正規形のフロップ全体 (1755, 3)。行はカードIDの辞書順"""
+    flops = {_canonical_flop(flop)[0] for flop in combinations(range(52), 3)}
+    return np.asarray(sorted(flops), dtype=np.int64)
+
+
+def build_table(
+    progress: Optional[Callable[[int, np.ndarray], None]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    正規形の各フロップで、全1326組のランダムな手札1人に対するエクイティを完全列挙で計算
+
+    ターンとリバーの全通りと相手の全手札を数える（引き分けは半分）。
+    progress(行, フロップ) は行毎に呼ばれる。
+
+    Returns:
+        (正規形のフロップ (1755, 3), 表 (1755, 1326))
+    """
+    flops = canonical_flops()
+    table = np.zeros(TABLE_SHAPE, dtype=TABLE_DTYPE)
+    hands = full_range()
+    for row, flop in enumerate(flops):
+        equities = combo_equities(hands, hands, flop.tolist())
+        scaled = np.rint(np.nan_to_num(equities) * EQUITY_SCALE)
+        table[row] = scaled.astype(TABLE_DTYPE)
+        if progress is not None:
+            progress(row, flop)
+    return flops, table
+
+
+def save_table(flops: np.ndarray, table: np.ndarray, path: str):
+    """表を .npz 形式（非圧縮）で保存"""
+    if flops.shape != (NUM_FLOPS, 3) or table.shape != TABLE_SHAPE:
+        raise ValueError(f"Flop table must have shape {TABLE_SHAPE}")
+    np.savez(path, flops=flops.astype(np.int8), equity=table.astype(TABLE_DTYPE))
+
+
+def load_table(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """表を読み込む -> (フロップの整数キー (1755,), 表 (1755, 1326))"""
+    with np.load(path) as data:
+        flops, table = data["flops"], data["equity"]
+    if flops.shape != (NUM_FLOPS, 3) or table.shape != TABLE_SHAPE:
+        raise ValueError(f"{path} is not a flop equity table")
+    return _flop_keys(flops), table
+
+
+def lookup(
+    keys: np.ndarray,
+    table: np.ndarray,
+    hole: Sequence[CardLike],
+    flop: Sequence[CardLike],
+) -> float:
+    """手札2枚とフロップ3枚から、ランダムな手札1人に対するエクイティを引く"""
+    hole_ids = [_card_id(card) for card in hole]
+    flop_ids = [_card_id(card) for card in flop]
+    if len(hole_ids) != 2 or len(flop_ids) != 3:
+        raise ValueError("hole must be 2 cards and flop must be 3 cards")
+    if len(set(hole_ids + flop_ids)) != 5:
+        raise ValueError("hole and flop must not share cards")
+
+    # ボードだけで正規化した空間で引く（同じ suit_map で手札も付け替える）
+    canonical, suit_map = _canonical_flop(flop_ids)
+    row = int(np.searchsorted(keys, _flop_keys([canonical])[0]))
+    first, second = (suit_map[c // 13] * 13 + c % 13 for c in hole_ids)
+    return float(table[row, combo_index(first, second)]) / EQUITY_SCALE
+
+
+def main():
+    """表の生成（python -m poker.flop_table --output flop_equity.npz）"""
+    parser = argparse.ArgumentParser(
+        description="フロップのランダムな手札1人に対するエクイティ表を生成"
+    )
+    parser.add_argument("--output", default="flop_equity.npz", help="出力先（.npz）")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    def progress(row: int, flop: np.ndarray):
+        if row % 100 == 0 or row == NUM_FLOPS - 1:
+            cards = " ".join(str(Card.from_id(int(c))) for c in flop)
+            elapsed = time.perf_counter() - started
+            print(f"{row + 1:>4}/{NUM_FLOPS}: {cards}  ({elapsed:.0f}s)")
+
+    flops, table = build_table(progress=progress)
+    save_table(flops, table, args.output)
+    print(f"Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
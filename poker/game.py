@@ -2,13 +2,26 @@
 Texas Hold'em Poker Game Management
 """
 
+import functools
 import json
-import random
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import time
+import uuid
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from enum import Enum
 
-from .game_models import Deck, GamePhase, GameState, PlayerInfo
+from .game_models import (
+    ActionEvent,
+    ActionLog,
+    Card,
+    Deck,
+    GamePhase,
+    GameSnapshot,
+    GameState,
+    PlayerInfo,
+    Suit,
+    create_rng,
+)
 from .player_models import (
     Player,
     HumanPlayer,
@@ -19,37 +32,72 @@ from .player_models import (
 )
 from .evaluator import HandEvaluator, HandResult
 
-# ゲーム専用のロガーを設定
-game_logger = logging.getLogger("poker_game")
-game_logger.setLevel(logging.DEBUG)
+from .hand_history import HandHistoryWriter, get_default_writer
+from .logging_config import get_logger
+
+# ゲーム専用のロガー（出力先は main の setup_logging で設定する）
+game_logger = get_logger("engine")
+
+
+class _NullLogger:
+    """ヘッドレスモード用のロガー（何も出力しない）"""
+
+    def _discard(self, *args, **kwargs):
+        pass
+
+    debug = info = warning = error = exception = _discard
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 (logging.Logger 互換)
+        return False
+
+
+def _notifies_state_change(method):
+    """メソッドの実行後に状態変更リスナー（観戦サーバー等）へ通知するデコレータ"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if self._state_listeners:
+            self._notify_state_changed()
+        return result
 
-# ハンドラーが既に存在しない場合のみ追加
-if not game_logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    handler.setFormatter(formatter)
-    game_logger.addHandler(handler)
+    return wrapper
 
 
 class PokerGame:
     """テキサスホールデムゲーム管理クラス"""
 
     def __init__(
-        self, small_blind: int = 10, big_blind: int = 20, initial_chips: int = 2000
+        self,
+        small_blind: int = 10,
+        big_blind: int = 20,
+        initial_chips: int = 2000,
+        headless: bool = False,
+        rng: Any = None,
+        deck_buffer_size: int = 0,
+        action_log_capacity: int = 1000,
+        hand_history: Optional[HandHistoryWriter] = None,
     ):
         self.small_blind = small_blind
         self.big_blind = big_blind
         self.initial_chips = initial_chips
 
+        # ゲーム毎の乱数（シード / random.Random / numpy.random.Generator、None はグローバルな random）
+        # デッキ・ディーラー決定・このゲームが作る RandomPlayer で共有する
+        self.rng = create_rng(rng)
+
+        # ヘッドレスモード: ログ出力を行わず、履歴は現在のハンド分だけを保持する
+        # （シミュレーション用）
+        self.headless = headless
+        self.logger = _NullLogger() if headless else game_logger
+
         # プレイヤー管理
         self.players: List[Player] = []
         self.dealer_button = 0
         self.current_player_index = 0
 
         # ゲーム状態
-        self.deck = Deck()
+        self.deck = Deck(self.rng, buffer_size=deck_buffer_size)
         self.community_cards = []
         self.current_phase = GamePhase.PREFLOP
         self.pot = 0
@@ -62,8 +110,16 @@ class PokerGame:
         # このベッティングラウンドでブラインド以外の「ベット/レイズ」が発生したか
         self.has_bet_or_raise_this_round = False
 
-        # アクション履歴
-        self.action_history = []
+        # アクション履歴（構造化イベントのリングバッファ、文字列は表示時に生成）
+        self.action_log = ActionLog(action_log_capacity)
+
+        # ハンド履歴（JSONL）の出力先。省略時はヘッドレスでなければ既定のライターを使う
+        if hand_history is None and not headless:
+            hand_history = get_default_writer()
+        self.hand_history = hand_history
+        self.game_id = uuid.uuid4().hex[:8]
+        self._hand_start_chips: Dict[int, int] = {}
+        self._hand_started_at = 0.0
 
         # ゲーム統計
         self.game_stats = {"hands_played": 0, "players_eliminated": []}
@@ -71,13 +127,36 @@ class PokerGame:
         # 最後に実行したショーダウン結果（観戦UI向けに公開するため）
         self.last_showdown_results: Optional[Dict[str, Any]] = None
 
-        game_logger.info(
+        # 状態が変わった時に呼ばれるコールバック（観戦サーバーへのプッシュ用。
+        # バージョンは shared_state が一元管理する）
+        self._state_listeners: List[Callable[[], None]] = []
+
+        self.logger.info(
             "PokerGame initialized with SB=%d, BB=%d, initial_chips=%d",
             small_blind,
             big_blind,
             initial_chips,
         )
 
+    def add_state_listener(self, callback: Callable[[], None]):
+        """状態変更（アクション・フェーズ遷移・ショーダウン等）の通知先を登録（重複は無視）"""
+        if callback not in self._state_listeners:
+            self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable[[], None]):
+        """状態変更の通知先を解除"""
+        if callback in self._state_listeners:
+            self._state_listeners.remove(callback)
+
+    def _notify_state_changed(self):
+        """登録されたリスナーに状態変更を通知"""
+        for callback in list(self._state_listeners):
+            try:
+                callback()
+            except Exception:
+                self.logger.exception("State listener failed")
+
+    @_notifies_state_change
     def add_player(self, player: Player):
         """プレイヤーを追加"""
         if len(self.players) >= 10:
@@ -94,22 +173,22 @@ class PokerGame:
     def setup_default_game(self):
         """デフォルトの4人ゲームをセットアップ"""
         self.add_player(HumanPlayer(0, "You", self.initial_chips))
-        self.add_player(RandomPlayer(1, "CPU1", self.initial_chips))
-        self.add_player(RandomPlayer(2, "CPU2", self.initial_chips))
-        self.add_player(RandomPlayer(3, "CPU3", self.initial_chips))
+        self.add_player(RandomPlayer(1, "CPU1", self.initial_chips, rng=self.rng))
+        self.add_player(RandomPlayer(2, "CPU2", self.initial_chips, rng=self.rng))
+        self.add_player(RandomPlayer(3, "CPU3", self.initial_chips, rng=self.rng))
 
         # ディーラーボタンをランダムに決定
-        self.dealer_button = random.randint(0, 3)
+        self.dealer_button = self.rng.randint(0, 3)
 
     def setup_cpu_only_game(self):
         """全プレイヤーがCPU（ランダム）の4人ゲームをセットアップ"""
-        self.add_player(RandomPlayer(0, "CPU0", self.initial_chips))
-        self.add_player(RandomPlayer(1, "CPU1", self.initial_chips))
-        self.add_player(RandomPlayer(2, "CPU2", self.initial_chips))
-        self.add_player(RandomPlayer(3, "CPU3", self.initial_chips))
+        self.add_player(RandomPlayer(0, "CPU0", self.initial_chips, rng=self.rng))
+        self.add_player(RandomPlayer(1, "CPU1", self.initial_chips, rng=self.rng))
+        self.add_player(RandomPlayer(2, "CPU2", self.initial_chips, rng=self.rng))
+        self.add_player(RandomPlayer(3, "CPU3", self.initial_chips, rng=self.rng))
 
         # ディーラーボタンをランダムに決定
-        self.dealer_button = random.randint(0, 3)
+        self.dealer_button = self.rng.randint(0, 3)
 
     def setup_configurable_game(self, player_types: List[str]):
         """
@@ -127,14 +206,16 @@ class PokerGame:
                 else:
                     self.add_player(HumanPlayer(i, f"Player{i}", self.initial_chips))
             elif player_type == "random":
-                self.add_player(RandomPlayer(i, f"CPU{i}", self.initial_chips))
+                self.add_player(
+                    RandomPlayer(i, f"CPU{i}", self.initial_chips, rng=self.rng)
+                )
             elif player_type == "llm":
                 self.add_player(LLMPlayer(i, f"AI{i}", self.initial_chips))
             else:
                 raise ValueError(f"Unknown player type: {player_type}")
 
         # ディーラーボタンをランダムに決定
-        self.dealer_button = random.randint(0, len(self.players) - 1)
+        self.dealer_button = self.rng.randint(0, len(self.players) - 1)
 
     def setup_configurable_game_with_models(self, player_configs: List[Dict[str, Any]]):
         """
@@ -155,7 +236,9 @@ class PokerGame:
                 else:
                     self.add_player(HumanPlayer(i, f"Player{i}", self.initial_chips))
             elif player_type == "random":
-                self.add_player(RandomPlayer(i, f"CPU{i}", self.initial_chips))
+                self.add_player(
+                    RandomPlayer(i, f"CPU{i}", self.initial_chips, rng=self.rng)
+                )
             elif player_type == "llm":
                 if model:
                     self.add_player(
@@ -183,12 +266,13 @@ class PokerGame:
                 raise ValueError(f"Unknown player type: {player_type}")
 
         # ディーラーボタンをランダムに決定
-        self.dealer_button = random.randint(0, len(self.players) - 1)
+        self.dealer_button = self.rng.randint(0, len(self.players) - 1)
 
+    @_notifies_state_change
     def start_new_hand(self):
         """新しいハンドを開始"""
         self.hand_number += 1
-        game_logger.info(f"=== STARTING NEW HAND #{self.hand_number} ===")
+        self.logger.info("=== STARTING NEW HAND #%s ===", self.hand_number)
 
         self.deck.reset()
         self.community_cards = []
@@ -200,34 +284,40 @@ class PokerGame:
         self.has_bet_or_raise_this_round = False
         # 前ハンドのショーダウン表示内容をクリア
         self.last_showdown_results = None
+        if self.headless:
+            self.action_log.clear()
 
         # プレイヤーをリセット
         for player in self.players:
             player.reset_for_new_hand()
 
+        if self.hand_history is not None:
+            self._hand_start_chips = {p.id: p.chips for p in self.players}
+            self._hand_started_at = time.time()
+
         # アクティブなプレイヤー数をチェック
         active_players = [p for p in self.players if p.status != PlayerStatus.BUSTED]
-        game_logger.info(f"Active players for new hand: {len(active_players)}")
+        self.logger.info("Active players for new hand: %s", len(active_players))
 
         if len(active_players) < 2:
-            game_logger.info("Not enough players - setting phase to FINISHED")
+            self.logger.info("Not enough players - setting phase to FINISHED")
             self.current_phase = GamePhase.FINISHED
             return
 
         # ディーラーボタンを移動
-        game_logger.info("Moving dealer button")
+        self.logger.info("Moving dealer button")
         self._move_dealer_button()
 
         # ブラインドを設定
-        game_logger.info("Posting blinds")
+        self.logger.info("Posting blinds")
         self._post_blinds()
 
         # カードを配る
-        game_logger.info("Dealing hole cards")
+        self.logger.info("Dealing hole cards")
         self._deal_hole_cards()
 
         # 最初のアクションプレイヤーを設定
-        game_logger.info("Setting first actor for preflop")
+        self.logger.info("Setting first actor for preflop")
         self._set_first_actor_preflop()
 
         self._log_game_state("HAND_STARTED")
@@ -278,7 +368,7 @@ class PokerGame:
         self.players[sb_pos].is_small_blind = True
         sb_amount = self.players[sb_pos].bet(self.small_blind)
         self.pot += sb_amount
-        self.action_history.append(f"Player {sb_pos} posted small blind {sb_amount}")
+        self._record_event(sb_pos, "small_blind", sb_amount)
 
         self.players[bb_pos].is_big_blind = True
         bb_amount = self.players[bb_pos].bet(self.big_blind)
@@ -286,7 +376,7 @@ class PokerGame:
         self.current_bet = bb_amount
         # ビッグブラインドを最後のレイザーとして設定（プリフロップのベッティング制御のため）
         self.last_raiser_index = bb_pos
-        self.action_history.append(f"Player {bb_pos} posted big blind {bb_amount}")
+        self._record_event(bb_pos, "big_blind", bb_amount)
 
     def _deal_hole_cards(self):
         """各プレイヤーにホールカードを配る"""
@@ -356,8 +446,8 @@ class PokerGame:
         # コールに必要な額
         to_call = max(0, self.current_bet - player.current_bet)
 
-        # 最近のアクション履歴（最新20件）
-        recent_history = self.action_history[-20:] if self.action_history else []
+        # 最近のアクション履歴（最新20件、文字列化はここで初めて行いキャッシュ）
+        recent_history = self.action_log.render(20)
 
         return GameState(
             your_id=player_id,
@@ -442,6 +532,7 @@ class PokerGame:
 
         return actions
 
+    @_notifies_state_change
     def process_player_action(
         self, player_id: int, action: str, amount: int = 0
     ) -> bool:
@@ -451,64 +542,79 @@ class PokerGame:
         Returns:
             bool: アクションが正常に処理されたかどうか
         """
-        game_logger.info(
-            f">>> PROCESS_ACTION: Player {player_id} attempts '{action}' with amount {amount}"
-        )
-        self._log_game_state("BEFORE_ACTION")
+        if not self.headless:
+            self.logger.info(
+                ">>> PROCESS_ACTION: Player %s attempts '%s' with amount %s",
+                player_id,
+                action,
+                amount,
+            )
+            self._log_game_state("BEFORE_ACTION")
 
         if player_id != self.current_player_index:
-            game_logger.warning(
-                f"Player {player_id} tried to act but current player is {self.current_player_index}"
+            self.logger.warning(
+                "Player %s tried to act but current player is %s",
+                player_id,
+                self.current_player_index,
             )
             return False
 
         player = self.get_player(player_id)
         if player is None:
-            game_logger.error(f"Player {player_id} not found")
+            self.logger.error("Player %s not found", player_id)
             return False
         if player.status != PlayerStatus.ACTIVE:
-            game_logger.warning(
-                f"Player {player_id} is not active (status: {player.status})"
+            self.logger.warning(
+                "Player %s is not active (status: %s)",
+                player_id,
+                player.status,
             )
             return False
 
-        action_description = ""
-
         if action == "fold":
             player.fold()
-            action_description = f"Player {player_id} folded"
+            event = (player_id, "fold", 0)
 
         elif action == "check":
             if self.current_bet > player.current_bet:
-                game_logger.warning(
-                    f"Player {player_id} cannot check - current bet {self.current_bet} > player bet {player.current_bet}"
+                self.logger.warning(
+                    "Player %s cannot check - current bet %s > player bet %s",
+                    player_id,
+                    self.current_bet,
+                    player.current_bet,
                 )
                 return False  # チェックできない状況
-            action_description = f"Player {player_id} checked"
+            event = (player_id, "check", 0)
 
         elif action == "call":
             to_call = self.current_bet - player.current_bet
             # テキサスホールデムでは to_call == 0 のとき、"call" は実質的に "check" と同義
             if to_call <= 0:
-                action_description = f"Player {player_id} checked"
+                event = (player_id, "check", 0)
             else:
                 if player.chips < to_call:
-                    game_logger.warning(
-                        f"Player {player_id} cannot call - to_call: {to_call}, chips: {player.chips}"
+                    self.logger.warning(
+                        "Player %s cannot call - to_call: %s, chips: %s",
+                        player_id,
+                        to_call,
+                        player.chips,
                     )
                     return False
 
                 actual_call = player.bet(to_call)
                 self.pot += actual_call
-                action_description = f"Player {player_id} called {actual_call}"
+                event = (player_id, "call", actual_call)
 
         elif action == "raise":
             to_call = self.current_bet - player.current_bet
             total_needed = to_call + amount
 
             if player.chips < total_needed:
-                game_logger.warning(
-                    f"Player {player_id} cannot raise - needs {total_needed}, has {player.chips}"
+                self.logger.warning(
+                    "Player %s cannot raise - needs %s, has %s",
+                    player_id,
+                    total_needed,
+                    player.chips,
                 )
                 return False
 
@@ -517,12 +623,13 @@ class PokerGame:
             self.current_bet = player.current_bet
             self.last_raiser_index = player_id
             self.has_bet_or_raise_this_round = True
-            action_description = f"Player {player_id} raised to {self.current_bet}"
+            event = (player_id, "raise", self.current_bet)
 
         elif action == "all_in":
             if player.chips <= 0:
-                game_logger.warning(
-                    f"Player {player_id} cannot go all-in - no chips left"
+                self.logger.warning(
+                    "Player %s cannot go all-in - no chips left",
+                    player_id,
                 )
                 return False
 
@@ -536,42 +643,88 @@ class PokerGame:
                 self.has_bet_or_raise_this_round = True
 
             player.status = PlayerStatus.ALL_IN
-            action_description = f"Player {player_id} went all-in with {actual_bet}"
+            event = (player_id, "all_in", actual_bet)
 
         else:
-            game_logger.error(f"Unknown action: {action}")
+            self.logger.error("Unknown action: %s", action)
             return False
 
-        # アクション履歴に追加
-        self.action_history.append(action_description)
-        game_logger.info(f"ACTION_EXECUTED: {action_description}")
-
-        self._log_game_state("AFTER_ACTION", f"Action: {action_description}")
+        # アクション履歴に追加（文字列化は表示・プロンプト作成時まで遅延）
+        recorded = self._record_event(*event)
+        if not self.headless:
+            self.logger.info("ACTION_EXECUTED: %s", recorded)
+            self._log_game_state("AFTER_ACTION", "Action: %s", recorded)
 
         # 次のプレイヤーに移動
-        game_logger.info(">>> ADVANCING to next player")
+        self.logger.info(">>> ADVANCING to next player")
         self._advance_to_next_player()
 
         # ベッティングラウンド完了チェック
-        game_logger.info(">>> CHECKING betting round completion")
+        self.logger.info(">>> CHECKING betting round completion")
         self._check_betting_round_complete()
 
-        self._log_game_state(
-            "AFTER_BETTING_CHECK", f"Betting complete: {self.betting_round_complete}"
-        )
+        if not self.headless:
+            self._log_game_state(
+                "AFTER_BETTING_CHECK",
+                "Betting complete: %s",
+                self.betting_round_complete,
+            )
 
         return True
 
+    def _record_event(
+        self,
+        player_id: int,
+        action: str,
+        amount: int = 0,
+        cards: Tuple[int, ...] = (),
+        detail: str = "",
+    ) -> ActionEvent:
+        """アクション履歴に1件追加"""
+        event = ActionEvent(
+            player_id,
+            action,
+            amount,
+            self.hand_number,
+            self.current_phase.value,
+            time.time(),
+            cards,
+            detail,
+        )
+        self.action_log.append(event)
+        return event
+
+    @property
+    def action_history(self) -> List[str]:
+        """アクション履歴の文字列表現（表示用、古い順）"""
+        return self.action_log.render()
+
+    @action_history.setter
+    @_notifies_state_change
+    def action_history(self, entries: List[str]):
+        self.action_log.clear()
+        for entry in entries:
+            self._record_event(-1, "note", detail=entry)
+
+    @property
+    def hand_events(self) -> List[Tuple[int, str, int]]:
+        """現在のハンドの (player_id, action, amount) の一覧"""
+        return [
+            (event.player_id, event.action, event.amount)
+            for event in self.action_log
+            if event.hand_number == self.hand_number and event.action != "note"
+        ]
+
     def _advance_to_next_player(self):
         """次のアクティブプレイヤーに移動（座席順序を維持）"""
-        game_logger.debug("_advance_to_next_player called")
+        self.logger.debug("_advance_to_next_player called")
 
         # アクティブプレイヤー（アクションが必要なプレイヤー）を確認
         active_players = [
             i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
         ]
 
-        game_logger.debug(f"Active players: {active_players}")
+        self.logger.debug("Active players: %s", active_players)
 
         # 座席順序を維持して次のアクティブプレイヤーを探す
         old_player = self.current_player_index
@@ -585,37 +738,41 @@ class PokerGame:
             # アクティブなプレイヤーが見つかった場合
             if next_player.status == PlayerStatus.ACTIVE:
                 self.current_player_index = next_index
-                game_logger.info(
-                    f"Advanced from player {old_player} to player {self.current_player_index} (seat order)"
+                self.logger.info(
+                    "Advanced from player %s to player %s (seat order)",
+                    old_player,
+                    self.current_player_index,
                 )
                 return
 
         # ここに到達した場合はアクティブプレイヤーが見つからなかった
-        game_logger.warning(
+        self.logger.warning(
             "No active player found in seat order - marking betting round complete"
         )
         self.betting_round_complete = True
 
     def _check_betting_round_complete(self):
         """ベッティングラウンドが完了したかチェック（座席順序ベース）"""
-        game_logger.debug("_check_betting_round_complete called")
+        self.logger.debug("_check_betting_round_complete called")
 
         active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
         all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
 
-        game_logger.debug(
-            f"Active: {len(active_players)}, All-in: {len(all_in_players)}"
+        self.logger.debug(
+            "Active: %s, All-in: %s",
+            len(active_players),
+            len(all_in_players),
         )
 
         # 1人しか残っていない場合
         if len(active_players) + len(all_in_players) <= 1:
-            game_logger.info("Betting complete: Only 1 or fewer players remaining")
+            self.logger.info("Betting complete: Only 1 or fewer players remaining")
             self.betting_round_complete = True
             return
 
         # アクティブプレイヤーがいない場合（全員フォールドまたはオールイン）
         if len(active_players) == 0:
-            game_logger.info("Betting complete: No active players")
+            self.logger.info("Betting complete: No active players")
             self.betting_round_complete = True
             return
 
@@ -624,13 +781,16 @@ class PokerGame:
             # その1人がまだベットをマッチしていない場合は継続
             single_player = active_players[0]
             if single_player.current_bet < self.current_bet:
-                game_logger.debug(
-                    f"Single active player {single_player.name} needs to match bet: {single_player.current_bet} < {self.current_bet}"
+                self.logger.debug(
+                    "Single active player %s needs to match bet: %s < %s",
+                    single_player.name,
+                    single_player.current_bet,
+                    self.current_bet,
                 )
                 return
             else:
                 # ベットをマッチしている場合は終了
-                game_logger.info(
+                self.logger.info(
                     "Betting complete: Single active player has matched the bet"
                 )
                 self.betting_round_complete = True
@@ -639,12 +799,15 @@ class PokerGame:
         # アクティブなプレイヤーが全員同じベット額でない場合は継続
         player_bets = [p.current_bet for p in active_players]
         all_same_bet = all(p.current_bet == self.current_bet for p in active_players)
-        game_logger.debug(
-            f"Player bets: {player_bets}, Current bet: {self.current_bet}, All same: {all_same_bet}"
+        self.logger.debug(
+            "Player bets: %s, Current bet: %s, All same: %s",
+            player_bets,
+            self.current_bet,
+            all_same_bet,
         )
 
         if not all_same_bet:
-            game_logger.debug("Betting continues: Not all players have same bet")
+            self.logger.debug("Betting continues: Not all players have same bet")
             return
 
         # 全員が同じベット額の場合、ベッティングラウンド完了の条件をチェック
@@ -652,16 +815,16 @@ class PokerGame:
         if self.last_raiser_index is not None and getattr(
             self, "has_bet_or_raise_this_round", False
         ):
-            game_logger.info("Betting complete: All players matched after a bet/raise")
+            self.logger.info("Betting complete: All players matched after a bet/raise")
             self.betting_round_complete = True
             return
         active_players_indices = [
             i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
         ]
 
-        game_logger.debug(f"Active player indices: {active_players_indices}")
-        game_logger.debug(f"Last raiser index: {self.last_raiser_index}")
-        game_logger.debug(f"Current player index: {self.current_player_index}")
+        self.logger.debug("Active player indices: %s", active_players_indices)
+        self.logger.debug("Last raiser index: %s", self.last_raiser_index)
+        self.logger.debug("Current player index: %s", self.current_player_index)
 
         if self.last_raiser_index is None:
             # 誰もレイズしていない場合（全員チェック）、全員が一度アクションしたら終了
@@ -670,22 +833,26 @@ class PokerGame:
             # フロップ以降では、最初のアクター（ディーラーの次）から座席順序で一周した場合に終了
             first_actor_index = self._get_first_actor_for_phase()
 
-            game_logger.debug(f"First actor index: {first_actor_index}")
+            self.logger.debug("First actor index: %s", first_actor_index)
 
             # 現在のプレイヤーが最初のアクターに戻ってきた場合、全員がアクションを完了
             if self.current_player_index == first_actor_index:
-                game_logger.info(
-                    f"Betting complete: Back to first actor {first_actor_index} (all players have acted)"
+                self.logger.info(
+                    "Betting complete: Back to first actor %s (all players have acted)",
+                    first_actor_index,
                 )
                 self.betting_round_complete = True
             else:
-                game_logger.debug(
-                    f"Betting continues: Current player {self.current_player_index} != first actor {first_actor_index}"
+                self.logger.debug(
+                    "Betting continues: Current player %s != first actor %s",
+                    self.current_player_index,
+                    first_actor_index,
                 )
         elif self.last_raiser_index not in active_players_indices:
             # 最後にレイズしたプレイヤーがもうアクティブでない場合（フォールドまたはオールイン）
-            game_logger.info(
-                f"Betting complete: Last raiser {self.last_raiser_index} is no longer active"
+            self.logger.info(
+                "Betting complete: Last raiser %s is no longer active",
+                self.last_raiser_index,
             )
             self.betting_round_complete = True
         else:
@@ -694,20 +861,26 @@ class PokerGame:
                 self.last_raiser_index
             )
 
-            game_logger.debug(
-                f"Next after last raiser {self.last_raiser_index}: {next_after_raiser_index}"
+            self.logger.debug(
+                "Next after last raiser %s: %s",
+                self.last_raiser_index,
+                next_after_raiser_index,
             )
 
             # 現在のプレイヤーが最後にレイズしたプレイヤーの次のプレイヤーの場合、
             # 最後にレイズしたプレイヤーは既にアクションを完了しているのでベッティング終了
             if self.current_player_index == next_after_raiser_index:
-                game_logger.info(
-                    f"Betting complete: Back to player {next_after_raiser_index} after last raiser {self.last_raiser_index}"
+                self.logger.info(
+                    "Betting complete: Back to player %s after last raiser %s",
+                    next_after_raiser_index,
+                    self.last_raiser_index,
                 )
                 self.betting_round_complete = True
             else:
-                game_logger.debug(
-                    f"Betting continues: Current player {self.current_player_index} != next after raiser {next_after_raiser_index}"
+                self.logger.debug(
+                    "Betting continues: Current player %s != next after raiser %s",
+                    self.current_player_index,
+                    next_after_raiser_index,
                 )
 
     def _get_first_actor_for_phase(self):
@@ -756,15 +929,17 @@ class PokerGame:
 
         return None
 
+    @_notifies_state_change
     def advance_to_next_phase(self):
         """次のフェーズに進む"""
-        game_logger.info(
-            f">>> ADVANCE_TO_NEXT_PHASE called - Current phase: {self.current_phase.value}"
+        self.logger.info(
+            ">>> ADVANCE_TO_NEXT_PHASE called - Current phase: %s",
+            self.current_phase.value,
         )
-        game_logger.info(f"Betting round complete: {self.betting_round_complete}")
+        self.logger.info("Betting round complete: %s", self.betting_round_complete)
 
         if not self.betting_round_complete:
-            game_logger.warning("Cannot advance phase - betting round not complete")
+            self.logger.warning("Cannot advance phase - betting round not complete")
             return False
 
         # 残りプレイヤーチェック
@@ -774,14 +949,17 @@ class PokerGame:
             if p.status in [PlayerStatus.ACTIVE, PlayerStatus.ALL_IN]
         ]
 
-        game_logger.info(f"Remaining players: {len(remaining_players)}")
+        self.logger.info("Remaining players: %s", len(remaining_players))
         for i, p in enumerate(remaining_players):
-            game_logger.debug(
-                f"  Remaining P{p.id}: {p.name}, status: {p.status.value}"
+            self.logger.debug(
+                "  Remaining P%s: %s, status: %s",
+                p.id,
+                p.name,
+                p.status.value,
             )
 
         if len(remaining_players) <= 1:
-            game_logger.info("Going to SHOWDOWN - only 1 or fewer players remaining")
+            self.logger.info("Going to SHOWDOWN - only 1 or fewer players remaining")
             self.current_phase = GamePhase.SHOWDOWN
             self._log_game_state("PHASE_CHANGED_TO_SHOWDOWN")
             return True
@@ -791,31 +969,33 @@ class PokerGame:
         # フェーズを進める
         if self.current_phase == GamePhase.PREFLOP:
             self.current_phase = GamePhase.FLOP
-            game_logger.info("Phase changed: PREFLOP -> FLOP")
+            self.logger.info("Phase changed: PREFLOP -> FLOP")
             self._deal_flop()
         elif self.current_phase == GamePhase.FLOP:
             self.current_phase = GamePhase.TURN
-            game_logger.info("Phase changed: FLOP -> TURN")
+            self.logger.info("Phase changed: FLOP -> TURN")
             self._deal_turn()
         elif self.current_phase == GamePhase.TURN:
             self.current_phase = GamePhase.RIVER
-            game_logger.info("Phase changed: TURN -> RIVER")
+            self.logger.info("Phase changed: TURN -> RIVER")
             self._deal_river()
         elif self.current_phase == GamePhase.RIVER:
             self.current_phase = GamePhase.SHOWDOWN
-            game_logger.info("Phase changed: RIVER -> SHOWDOWN")
+            self.logger.info("Phase changed: RIVER -> SHOWDOWN")
             self._log_game_state("PHASE_CHANGED_TO_SHOWDOWN")
             return True
         else:
-            game_logger.error(f"Cannot advance from phase: {self.current_phase}")
+            self.logger.error("Cannot advance from phase: %s", self.current_phase)
             return False
 
         # 新しいベッティングラウンドを開始
-        game_logger.info("Starting new betting round")
+        self.logger.info("Starting new betting round")
         self._start_new_betting_round()
         self._log_game_state(
             "NEW_BETTING_ROUND_STARTED",
-            f"Phase: {old_phase.value} -> {self.current_phase.value}",
+            "Phase: %s -> %s",
+            old_phase.value,
+            self.current_phase.value,
         )
         return True
 
@@ -824,25 +1004,25 @@ class PokerGame:
         self.deck.deal_card()  # バーンカード
         for _ in range(3):
             self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(
-            f"Flop dealt: {', '.join(str(card) for card in self.community_cards)}"
+        self._record_event(
+            -1, "flop", cards=tuple(card.id for card in self.community_cards[:3])
         )
 
     def _deal_turn(self):
         """ターンを配る（1枚）"""
         self.deck.deal_card()  # バーンカード
         self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(f"Turn dealt: {str(self.community_cards[-1])}")
+        self._record_event(-1, "turn", cards=(self.community_cards[3].id,))
 
     def _deal_river(self):
         """リバーを配る（1枚）"""
         self.deck.deal_card()  # バーンカード
         self.community_cards.append(self.deck.deal_card())
-        self.action_history.append(f"River dealt: {str(self.community_cards[-1])}")
+        self._record_event(-1, "river", cards=(self.community_cards[4].id,))
 
     def _start_new_betting_round(self):
         """新しいベッティングラウンドを開始"""
-        game_logger.debug("_start_new_betting_round called")
+        self.logger.debug("_start_new_betting_round called")
 
         # プレイヤーのベットをリセット
         for player in self.players:
@@ -852,7 +1032,7 @@ class PokerGame:
         self.betting_round_complete = False
         self.last_raiser_index = None
 
-        game_logger.info(
+        self.logger.info(
             "Reset: current_bet=0, betting_round_complete=False, last_raiser_index=None"
         )
 
@@ -862,62 +1042,78 @@ class PokerGame:
             i for i, p in enumerate(self.players) if p.status == PlayerStatus.ACTIVE
         ]
 
-        game_logger.debug(f"Active players for new betting round: {active_players}")
-        game_logger.debug(f"Dealer button: {self.dealer_button}")
+        self.logger.debug("Active players for new betting round: %s", active_players)
+        self.logger.debug("Dealer button: %s", self.dealer_button)
 
         if len(active_players) > 0:
             first_actor_index = self._get_first_actor_for_phase()
             if first_actor_index is not None:
                 old_player = self.current_player_index
                 self.current_player_index = first_actor_index
-                game_logger.info(
-                    f"First actor: Player {self.current_player_index} (by phase rule), was {old_player}"
+                self.logger.info(
+                    "First actor: Player %s (by phase rule), was %s",
+                    self.current_player_index,
+                    old_player,
                 )
             else:
                 # 念のためのフォールバック（通常は到達しない）
                 old_player = self.current_player_index
                 self.current_player_index = active_players[0]
-                game_logger.info(
-                    f"First actor: Player {self.current_player_index} (fallback first active), was {old_player}"
+                self.logger.info(
+                    "First actor: Player %s (fallback first active), was %s",
+                    self.current_player_index,
+                    old_player,
                 )
         else:
             # アクティブプレイヤーがいない場合はベッティング終了
-            game_logger.warning("No active players - marking betting complete")
+            self.logger.warning("No active players - marking betting complete")
             self.betting_round_complete = True
 
+    @_notifies_state_change
     def conduct_showdown(self) -> Dict[str, Any]:
-        """ショーダウンを実行して勝者を決定"""
+        """ショーダウンを実行して勝者を決定（ハンド履歴が有効ならハンドを書き出す）"""
+        result = self._settle_showdown()
+        if self.hand_history is not None:
+            self.hand_history.write_hand(
+                self, self._hand_start_chips, self._hand_started_at
+            )
+        return result
+
+    def _settle_showdown(self) -> Dict[str, Any]:
+        """ショーダウンを実行して勝者を決定しポットを配分"""
         remaining_players = [
             p
             for p in self.players
             if p.status in [PlayerStatus.ACTIVE, PlayerStatus.ALL_IN]
         ]
 
-        # ログ: ショーダウン開始情報
-        try:
-            game_logger.info("=== SHOWDOWN_STARTED ===")
-            game_logger.info(
-                "Pot: %d, Community cards: %s",
-                self.pot,
-                [str(card) for card in self.community_cards],
-            )
-            for p in remaining_players:
-                game_logger.info(
-                    "  Player %d status=%s cards=%s",
-                    p.id,
-                    p.status.value,
-                    [str(card) for card in p.hole_cards],
+        # ログ: ショーダウン開始情報（カードの文字列化は出力される時だけ）
+        if self.logger.isEnabledFor(logging.INFO):
+            try:
+                self.logger.info("=== SHOWDOWN_STARTED ===")
+                self.logger.info(
+                    "Pot: %d, Community cards: %s",
+                    self.pot,
+                    [str(card) for card in self.community_cards],
                 )
-        except Exception as e:
-            # ログ出力はゲーム進行を止めない
-            game_logger.debug("Showdown logging (start) failed: %s", e)
+                for p in remaining_players:
+                    self.logger.info(
+                        "  Player %d status=%s cards=%s",
+                        p.id,
+                        p.status.value,
+                        [str(card) for card in p.hole_cards],
+                    )
+            except Exception as e:
+                # ログ出力はゲーム進行を止めない
+                self.logger.debug("Showdown logging (start) failed: %s", e)
 
         if len(remaining_players) == 0:
-            game_logger.warning("Showdown called with no remaining players")
+            self.logger.warning("Showdown called with no remaining players")
             result: Dict[str, Any] = {"winners": [], "results": []}
             self.last_showdown_results = result
             # 履歴にショーダウン結果を追記
-            self.action_history.append("Showdown: no remaining players")
+            if not self.headless:
+                self._record_event(-1, "note", detail="Showdown: no remaining players")
             return result
 
         if len(remaining_players) == 1:
@@ -925,14 +1121,14 @@ class PokerGame:
             winner = remaining_players[0]
             winner.chips += self.pot
             try:
-                game_logger.info(
+                self.logger.info(
                     "Showdown winner by default: Player %d awarded %d",
                     winner.id,
                     self.pot,
                 )
-                game_logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
+                self.logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
             except Exception as e:
-                game_logger.debug("Showdown logging (single winner) failed: %s", e)
+                self.logger.debug("Showdown logging (single winner) failed: %s", e)
             result = {
                 "winners": [winner.id],
                 "results": [
@@ -945,7 +1141,7 @@ class PokerGame:
             }
             self.last_showdown_results = result
             # 履歴にショーダウン結果を追記
-            self.action_history.append(f"Showdown: Player {winner.id} won {self.pot}")
+            self._record_event(winner.id, "win", self.pot)
             return result
 
         # 複数プレイヤーでのショーダウン
@@ -957,31 +1153,35 @@ class PokerGame:
             player_hands.append({"player": player, "hand": hand_result})
 
         # 履歴: ショーダウン参加者のハンド情報を追記
-        for ph in player_hands:
-            try:
-                self.action_history.append(
-                    "Showdown: Player "
-                    + str(ph["player"].id)
-                    + " hand="
-                    + str(ph["hand"])
-                    + " cards="
-                    + ", ".join(str(card) for card in ph["player"].hole_cards)
-                )
-            except Exception:
-                # 履歴追記はゲーム進行を止めない
-                pass
+        if not self.headless:
+            for ph in player_hands:
+                try:
+                    self._record_event(
+                        ph["player"].id,
+                        "note",
+                        detail="Showdown: Player "
+                        + str(ph["player"].id)
+                        + " hand="
+                        + str(ph["hand"])
+                        + " cards="
+                        + ", ".join(str(card) for card in ph["player"].hole_cards),
+                    )
+                except Exception:
+                    # 履歴追記はゲーム進行を止めない
+                    pass
 
         # 各プレイヤーの役をログ
-        try:
-            for ph in player_hands:
-                game_logger.info(
-                    "  Player %d hand=%s cards=%s",
-                    ph["player"].id,
-                    str(ph["hand"]),
-                    [str(card) for card in ph["player"].hole_cards],
-                )
-        except Exception as e:
-            game_logger.debug("Showdown logging (hands) failed: %s", e)
+        if self.logger.isEnabledFor(logging.INFO):
+            try:
+                for ph in player_hands:
+                    self.logger.info(
+                        "  Player %d hand=%s cards=%s",
+                        ph["player"].id,
+                        ph["hand"],
+                        [str(card) for card in ph["player"].hole_cards],
+                    )
+            except Exception as e:
+                self.logger.debug("Showdown logging (hands) failed: %s", e)
 
         # ID -> HandResult のマップ
         hands_by_id = {ph["player"].id: ph["hand"] for ph in player_hands}
@@ -1023,7 +1223,7 @@ class PokerGame:
         # レイヤー情報をログ
         try:
             for idx, layer in enumerate(pot_layers):
-                game_logger.info(
+                self.logger.info(
                     "Pot layer %d: amount=%d, contributors=%s",
                     idx,
                     layer["amount"],
@@ -1074,7 +1274,7 @@ class PokerGame:
 
             if not eligible_ids:
                 # 受給資格者がいない場合はスキップ（通常は発生しない想定）
-                game_logger.warning(
+                self.logger.warning(
                     "No eligible players for pot layer %d; amount=%d is unclaimed",
                     layer_idx,
                     amount,
@@ -1095,9 +1295,13 @@ class PokerGame:
                 total_awarded += share
 
             # 履歴用のサマリ
+            if self.headless:
+                continue
             try:
-                self.action_history.append(
-                    "Side pot layer "
+                self._record_event(
+                    -1,
+                    "note",
+                    detail="Side pot layer "
                     + str(layer_idx)
                     + ": amount="
                     + str(amount)
@@ -1107,7 +1311,7 @@ class PokerGame:
                         " best_hand=" + str(best_hand_in_layer)
                         if best_hand_in_layer is not None
                         else ""
-                    )
+                    ),
                 )
             except Exception:
                 pass
@@ -1119,6 +1323,8 @@ class PokerGame:
             if player is None:
                 continue
             player.chips += win_amount
+            if self.headless:
+                self._record_event(pid, "win", win_amount)
             results.append(
                 {
                     "player_id": pid,
@@ -1133,23 +1339,20 @@ class PokerGame:
 
         # ログ
         try:
-            game_logger.info(
+            self.logger.info(
                 "Showdown total awarded: %d (game.pot=%d)", total_awarded, self.pot
             )
-            game_logger.info(
-                "Showdown winners (aggregated): %s",
-                [pid for pid in sorted(winnings_map.keys())],
-            )
+            self.logger.info("Showdown winners (aggregated): %s", sorted(winnings_map))
             for r in results:
-                game_logger.info(
+                self.logger.info(
                     "  Awarded %d to Player %d (hand=%s)",
                     r["winnings"],
                     r["player_id"],
                     r["hand"],
                 )
-            game_logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
+            self.logger.info("=== SHOWDOWN_RESULTS_RECORDED ===")
         except Exception as e:
-            game_logger.debug("Showdown logging (results) failed: %s", e)
+            self.logger.debug("Showdown logging (results) failed: %s", e)
 
         # all_hands 情報
         all_hands_payload = [
@@ -1180,6 +1383,72 @@ class PokerGame:
         active_players = [p for p in self.players if p.chips > 0]
         return len(active_players) <= 1
 
+    def snapshot(self, include_rng: bool = False) -> GameSnapshot:
+        """
+        現在のゲーム状態をタプルで取得（探索・ロールアウト用の高速なコピー）
+
+        deepcopy や JSON を使わず、可変な値だけをタプルに詰め替える。
+        restore() で任意の意思決定ポイントから何度でも分岐できる。
+
+        Args:
+            include_rng: True なら乱数の内部状態も含める（restore 後に同じ展開を再現できる）。
+                False の場合は restore 後も乱数は進んだままなので、分岐毎に異なる展開になる
+
+        Note:
+            deck_buffer_size > 0 の場合、DeckPermutations にバッファ済みの並びは対象外
+        """
+        return GameSnapshot(
+            self.hand_number,
+            self.current_phase,
+            self.pot,
+            self.current_bet,
+            self.dealer_button,
+            self.current_player_index,
+            self.betting_round_complete,
+            self.last_raiser_index,
+            self.has_bet_or_raise_this_round,
+            tuple(self.community_cards),
+            tuple(self.deck.cards),
+            tuple(player.snapshot() for player in self.players),
+            tuple(self.action_log),
+            self.game_stats["hands_played"],
+            tuple(self.game_stats["players_eliminated"]),
+            self.last_showdown_results,
+            self.rng.getstate() if include_rng else None,
+        )
+
+    @_notifies_state_change
+    def restore(self, snapshot: GameSnapshot):
+        """snapshot() で取得した状態に戻す（プレイヤー構成は同じである必要がある）"""
+        if len(snapshot.players) != len(self.players):
+            raise ValueError(
+                f"Snapshot has {len(snapshot.players)} players, "
+                f"game has {len(self.players)}"
+            )
+
+        self.hand_number = snapshot.hand_number
+        self.current_phase = snapshot.phase
+        self.pot = snapshot.pot
+        self.current_bet = snapshot.current_bet
+        self.dealer_button = snapshot.dealer_button
+        self.current_player_index = snapshot.current_player_index
+        self.betting_round_complete = snapshot.betting_round_complete
+        self.last_raiser_index = snapshot.last_raiser_index
+        self.has_bet_or_raise_this_round = snapshot.has_bet_or_raise_this_round
+        self.community_cards = list(snapshot.community_cards)
+        self.deck.cards = list(snapshot.deck_cards)
+        for player, state in zip(self.players, snapshot.players):
+            player.restore(state)
+        self.action_log.clear()
+        self.action_log.extend(snapshot.action_events)
+        self.game_stats = {
+            "hands_played": snapshot.hands_played,
+            "players_eliminated": list(snapshot.players_eliminated),
+        }
+        self.last_showdown_results = snapshot.last_showdown_results
+        if snapshot.rng_state is not None:
+            self.rng.setstate(snapshot.rng_state)
+
     def save_game_state(self, filename: str):
         """ゲーム状態をJSONファイルに保存"""
         game_data = {
@@ -1188,10 +1457,19 @@ class PokerGame:
             "pot": self.pot,
             "current_bet": self.current_bet,
             "dealer_button": self.dealer_button,
+            "small_blind": self.small_blind,
+            "big_blind": self.big_blind,
+            "current_player_index": self.current_player_index,
+            "betting_round_complete": self.betting_round_complete,
+            "last_raiser_index": self.last_raiser_index,
+            "has_bet_or_raise_this_round": self.has_bet_or_raise_this_round,
             "community_cards": [
                 {"rank": card.rank, "suit": card.suit.value}
                 for card in self.community_cards
             ],
+            "deck": [
+                {"rank": card.rank, "suit": card.suit.value} for card in self.deck.cards
+            ],
             "players": [
                 {
                     "id": p.id,
@@ -1211,45 +1489,129 @@ class PokerGame:
                 for p in self.players
             ],
             "action_history": self.action_history,
+            "action_events": [list(event) for event in self.action_log],
             "game_stats": self.game_stats,
         }
 
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(game_data, f, ensure_ascii=False, indent=2)
 
+    @_notifies_state_change
     def load_game_state(self, filename: str):
-        """JSONファイルからゲーム状態を読み込み"""
-        # TODO: 実装（必要に応じて）
-        pass
+        """
+        save_game_state で保存したJSONファイルからゲーム状態を読み込み
 
-    def _log_game_state(self, context: str, extra_info: str = ""):
-        """現在のゲーム状態を詳細にログに記録"""
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-        folded_players = [p for p in self.players if p.status == PlayerStatus.FOLDED]
+        保存時と同じIDのプレイヤーが既に追加されていればその状態を上書きし、
+        存在しないIDのプレイヤーは RandomPlayer として作成する。
+        デッキの残りが保存されていない古い形式のファイルでは、
+        場に出ていないカードからデッキを作り直してシャッフルする。
+        """
+        with open(filename, "r", encoding="utf-8") as f:
+            game_data = json.load(f)
+
+        def to_cards(items: List[Dict[str, Any]]) -> List[Card]:
+            return [Card(item["rank"], Suit(item["suit"])) for item in items]
+
+        self.hand_number = game_data["hand_number"]
+        self.current_phase = GamePhase(game_data["phase"])
+        self.pot = game_data["pot"]
+        self.current_bet = game_data["current_bet"]
+        self.dealer_button = game_data["dealer_button"]
+        self.small_blind = game_data.get("small_blind", self.small_blind)
+        self.big_blind = game_data.get("big_blind", self.big_blind)
+        self.current_player_index = game_data.get("current_player_index", 0)
+        self.betting_round_complete = game_data.get("betting_round_complete", False)
+        self.last_raiser_index = game_data.get("last_raiser_index")
+        self.has_bet_or_raise_this_round = game_data.get(
+            "has_bet_or_raise_this_round", False
+        )
+        self.community_cards = to_cards(game_data["community_cards"])
 
-        player_info = []
-        for i, p in enumerate(self.players):
-            player_info.append(
-                f"P{i}({p.name}): chips={p.chips}, bet={p.current_bet}, status={p.status.value}"
+        players: List[Player] = []
+        for data in game_data["players"]:
+            player = self.get_player(data["id"])
+            if player is None:
+                player = RandomPlayer(
+                    data["id"], data["name"], data["chips"], rng=self.rng
+                )
+            player.name = data["name"]
+            player.chips = data["chips"]
+            player.current_bet = data["current_bet"]
+            player.total_bet_this_hand = data["total_bet_this_hand"]
+            player.status = PlayerStatus(data["status"])
+            player.hole_cards = to_cards(data["hole_cards"])
+            player.is_dealer = data["is_dealer"]
+            player.is_small_blind = data["is_small_blind"]
+            player.is_big_blind = data["is_big_blind"]
+            players.append(player)
+        self.players = players
+
+        if "deck" in game_data:
+            self.deck.cards = to_cards(game_data["deck"])
+        else:
+            used = set(self.community_cards)
+            for player in self.players:
+                used.update(player.hole_cards)
+            self.deck.reset()
+            self.deck.cards = [card for card in self.deck.cards if card not in used]
+
+        if "action_events" in game_data:
+            self.action_log.clear()
+            self.action_log.extend(
+                ActionEvent(*event[:6], tuple(event[6]), *event[7:])
+                for event in game_data["action_events"]
             )
-
-        game_logger.info(f"=== {context} ===")
-        game_logger.info(f"Hand #{self.hand_number}, Phase: {self.current_phase.value}")
-        game_logger.info(
-            f"Current player: {self.current_player_index}, Dealer: {self.dealer_button}"
+        else:
+            # 構造化イベントを持たない古い形式: 文字列とハンド内イベントから復元
+            self.action_history = game_data.get("action_history", [])
+            for event in game_data.get("hand_events", []):
+                self._record_event(*event)
+        self.game_stats = game_data.get(
+            "game_stats", {"hands_played": 0, "players_eliminated": []}
         )
-        game_logger.info(f"Pot: {self.pot}, Current bet: {self.current_bet}")
-        game_logger.info(f"Last raiser: {self.last_raiser_index}")
-        game_logger.info(f"Betting round complete: {self.betting_round_complete}")
-        game_logger.info(
-            f"Active players: {len(active_players)}, All-in: {len(all_in_players)}, Folded: {len(folded_players)}"
+        self.last_showdown_results = None
+
+    def _log_game_state(self, context: str, extra_info: str = "", *extra_args: Any):
+        """
+        現在のゲーム状態を詳細にログに記録
+
+        extra_info は % 形式のフォーマット文字列で、extra_args と合わせて
+        実際に出力される時だけ整形される。
+        """
+        if self.headless or not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        active_players = sum(p.status == PlayerStatus.ACTIVE for p in self.players)
+        all_in_players = sum(p.status == PlayerStatus.ALL_IN for p in self.players)
+        folded_players = sum(p.status == PlayerStatus.FOLDED for p in self.players)
+
+        log = self.logger.info
+        log("=== %s ===", context)
+        log("Hand #%s, Phase: %s", self.hand_number, self.current_phase.value)
+        log(
+            "Current player: %s, Dealer: %s",
+            self.current_player_index,
+            self.dealer_button,
         )
-        game_logger.info(
-            f"Community cards: {[str(card) for card in self.community_cards]}"
+        log("Pot: %s, Current bet: %s", self.pot, self.current_bet)
+        log("Last raiser: %s", self.last_raiser_index)
+        log("Betting round complete: %s", self.betting_round_complete)
+        log(
+            "Active players: %d, All-in: %d, Folded: %d",
+            active_players,
+            all_in_players,
+            folded_players,
         )
-        for info in player_info:
-            game_logger.info(f"  {info}")
+        log("Community cards: %s", [str(card) for card in self.community_cards])
+        for i, p in enumerate(self.players):
+            log(
+                "  P%d(%s): chips=%s, bet=%s, status=%s",
+                i,
+                p.name,
+                p.chips,
+                p.current_bet,
+                p.status.value,
+            )
         if extra_info:
-            game_logger.info(f"Extra: {extra_info}")
-        game_logger.info("=" * 50)
+            log("Extra: " + extra_info, *extra_args)
+        self.logger.info("=" * 50)
@@ -3,7 +3,9 @@ Poker game models: Card, Deck, Suit classes and game state types
 """
 
 import random
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional, Iterable, NamedTuple, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
@@ -18,7 +20,15 @@ class Suit(Enum):
 
 
 class Card:
-    """トランプカードクラス"""
+    """
+    トランプカードクラス
+
+    52枚のカードはそれぞれ1つのインスタンスとして共有される（Card(14, Suit.SPADES) は
+    常に同じオブジェクトを返す）。各カードは 0〜51 の整数ID
+    （スート番号 * 13 + (rank - 2)）と、そのIDのビットだけを立てた64ビットマスクを持つ。
+    """
+
+    __slots__ = ("rank", "suit", "id", "mask", "_label")
 
     # スートの記号マップ
     SUIT_SYMBOLS = {
@@ -45,7 +55,7 @@ class Card:
         14: "A",
     }
 
-    def __init__(self, rank: int, suit: Suit):
+    def __new__(cls, rank: int, suit: Suit) -> "Card":
         """
         Args:
             rank: カードのランク（2-14, 11=J, 12=Q, 13=K, 14=A）
@@ -53,8 +63,40 @@ class Card:
         """
         if rank < 2 or rank > 14:
             raise ValueError("Rank must be between 2 and 14")
-        self.rank = rank
-        self.suit = suit
+        offset = _SUIT_OFFSETS.get(suit)
+        if offset is None:
+            raise ValueError(f"Invalid suit: {suit!r}")
+        return _CARD_POOL[offset + rank]
+
+    @classmethod
+    def _create(cls, rank: int, suit: Suit, card_id: int) -> "Card":
+        """カードプール構築用（モジュール読み込み時に52回だけ呼ばれる）"""
+        card = object.__new__(cls)
+        card.rank = rank
+        card.suit = suit
+        card.id = card_id
+        card.mask = 1 << card_id
+        card._label = f"{cls.RANK_NAMES[rank]}{cls.SUIT_SYMBOLS[suit]}"
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """整数ID（0〜51）からカードを取得"""
+        if not 0 <= card_id < 52:
+            raise ValueError(f"Card id must be between 0 and 51: {card_id}")
+        return _CARD_POOL[card_id]
+
+    @classmethod
+    def from_str(cls, text: str) -> "Card":
+        """文字列表現（例: "A♠", "10♥", "T♦"）からカードを取得"""
+        card = _CARDS_BY_LABEL.get(text.strip())
+        if card is None:
+            raise ValueError(f"Invalid card string: {text!r}")
+        return card
+
+    def to_id(self) -> int:
+        """整数ID（0〜51）を取得"""
+        return self.id
 
     @property
     def rank_name(self) -> str:
@@ -68,39 +110,215 @@ class Card:
 
     def __str__(self) -> str:
         """カードの文字列表現（例: A♠）"""
-        return f"{self.rank_name}{self.suit_symbol}"
+        return self._label
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self.id
 
     def __repr__(self) -> str:
         return f"Card({self.rank_name}, {self.suit.value})"
 
+    def __reduce__(self):
+        # pickle/deepcopy でもプール内のインスタンスを返す
+        return (Card.from_id, (self.id,))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
+
+_SUIT_OFFSETS = {suit: index * 13 - 2 for index, suit in enumerate(Suit)}
+_CARD_POOL: List[Card] = [
+    Card._create(rank, suit, index * 13 + rank - 2)
+    for index, suit in enumerate(Suit)
+    for rank in range(2, 15)
+]
+_CARDS_BY_LABEL: Dict[str, Card] = {str(card): card for card in _CARD_POOL}
+# "T" 表記も受け付ける
+_CARDS_BY_LABEL.update(
+    {"T" + str(card)[2:]: card for card in _CARD_POOL if card.rank == 10}
+)
+
+# 全52枚（ID順）
+ALL_CARDS: Tuple[Card, ...] = tuple(_CARD_POOL)
+FULL_DECK_MASK = (1 << 52) - 1
+
+
+def cards_to_ids(cards: Iterable[Card]) -> List[int]:
+    """カード列を整数IDのリストに変換"""
+    return [card.id for card in cards]
+
+
+def cards_from_ids(card_ids: Iterable[int]) -> List[Card]:
+    """整数IDのリストをカード列に変換"""
+    return [_CARD_POOL[card_id] for card_id in card_ids]
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """カード列をビットマスクに変換"""
+    mask = 0
+    for card in cards:
+        mask |= card.mask
+    return mask
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """ビットマスクをカード列（ID順）に変換"""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(_CARD_POOL[low.bit_length() - 1])
+        mask ^= low
+    return cards
+
+
+def cards_from_strs(texts: Iterable[str]) -> List[Card]:
+    """文字列表現のリスト（例: ["A♠", "10♥"]）をカード列に変換"""
+    return [Card.from_str(text) for text in texts]
+
+
+def strs_to_mask(texts: Iterable[str]) -> int:
+    """文字列表現のリストを直接ビットマスクに変換"""
+    mask = 0
+    for text in texts:
+        mask |= Card.from_str(text).mask
+    return mask
+
+
+class NumpyRandom(random.Random):
+    """numpy.random.Generator を random.Random と同じインターフェースで使うアダプタ"""
+
+    def __init__(self, generator: Any = None):
+        super().__init__()
+        import numpy as np
+
+        if not isinstance(generator, np.random.Generator):
+            generator = np.random.default_rng(generator)
+        self.generator = generator
+
+    def seed(self, a: Any = None, version: int = 2):
+        """シードし直す（random.Random.__init__ から呼ばれる時点では何もしない）"""
+        if a is not None:
+            import numpy as np
+
+            self.generator = np.random.default_rng(a)
+
+    def random(self) -> float:
+        """[0.0, 1.0) の一様乱数"""
+        return float(self.generator.random())
+
+    def getrandbits(self, k: int) -> int:
+        """k ビットの乱数（randint / shuffle / choices が内部で使う）"""
+        num_bytes = (k + 7) // 8
+        value = int.from_bytes(self.generator.bytes(num_bytes), "little")
+        return value >> (num_bytes * 8 - k)
+
+    def getstate(self) -> Any:
+        """Generator の内部状態を取得"""
+        return self.generator.bit_generator.state
+
+    def setstate(self, state: Any):
+        """getstate で取得した状態に戻す"""
+        self.generator.bit_generator.state = state
+
+
+def create_rng(rng: Any = None) -> Any:
+    """
+    乱数生成器を random.Random 互換のオブジェクトに揃える
+
+    Args:
+        rng: None（グローバルな random モジュール）/ int シード / random.Random /
+            numpy.random.Generator
+
+    Returns:
+        shuffle / randint / choices などを持つ乱数生成器
+    """
+    if rng is None or rng is random:
+        return random
+    if isinstance(rng, random.Random):
+        return rng
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return NumpyRandom(rng)
+
+
+class DeckPermutations:
+    """
+    複数ハンド分のデッキの並びを NumPy でまとめて生成し、1つずつ払い出すバッファ
+
+    size 個の並び替えを1回のベクトル化されたシャッフルで作るため、
+    ハンド毎に random.shuffle を呼ぶより大幅に速い。
+    """
+
+    def __init__(self, rng: Any = None, size: int = 1024):
+        import numpy as np
+
+        if isinstance(rng, NumpyRandom):
+            self.generator = rng.generator
+        elif isinstance(rng, np.random.Generator):
+            self.generator = rng
+        else:
+            # random モジュール / random.Random から派生させ、元の乱数列で再現できるようにする
+            self.generator = np.random.default_rng(create_rng(rng).getrandbits(128))
+        self.size = size
+        self._rows: List[List[int]] = []
+        self._next = 0
+
+    def next_ids(self) -> List[int]:
+        """次のデッキの並び（カードIDのリスト）を取得"""
+        if self._next >= len(self._rows):
+            import numpy as np
+
+            ids = np.tile(np.arange(52), (self.size, 1))
+            self._rows = self.generator.permuted(ids, axis=1).tolist()
+            self._next = 0
+        row = self._rows[self._next]
+        self._next += 1
+        return row
+
+    def next_cards(self) -> List[Card]:
+        """次のデッキの並び（カードのリスト）を取得"""
+        return [_CARD_POOL[card_id] for card_id in self.next_ids()]
+
 
 class Deck:
     """トランプデッキクラス"""
 
-    def __init__(self):
-        """標準的な52枚のデッキを作成"""
+    def __init__(self, rng: Any = None, buffer_size: int = 0):
+        """
+        標準的な52枚のデッキを作成
+
+        Args:
+            rng: シャッフルに使う乱数（create_rng が受け付ける値）
+            buffer_size: 1以上なら DeckPermutations で buffer_size ハンド分ずつまとめて並びを生成
+        """
+        self.rng = create_rng(rng)
+        self.permutations = (
+            DeckPermutations(self.rng, buffer_size) if buffer_size > 0 else None
+        )
         self.cards: List[Card] = []
         self.reset()
 
     def reset(self):
         """デッキをリセットして全カードを追加"""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(2, 15):  # 2-14 (A)
-                self.cards.append(Card(rank, suit))
+        if self.permutations is not None:
+            self.cards = self.permutations.next_cards()
+            return
+        self.cards = list(ALL_CARDS)
         self.shuffle()
 
     def shuffle(self):
         """デッキをシャッフル"""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal_card(self) -> Card:
         """カードを1枚配る"""
@@ -204,3 +422,174 @@ class GameState:
             actions=data.get("actions", []),
             history=data.get("history", []),
         )
+
+
+class ActionEvent(NamedTuple):
+    """
+    アクション履歴の1件（構造化レコード）
+
+    表示用の文字列（"Player 3 raised to 120" など）は describe() で必要になった時だけ作る。
+    flop/turn/river ではカードをIDで cards に、プリフォーマット済みの行（ショーダウンの
+    詳細など）は action="note" として detail に保持する。
+    """
+
+    player_id: int  # ディール等プレイヤーに依らないイベントは -1
+    action: str
+    amount: int = 0
+    hand_number: int = 0
+    phase: str = ""
+    timestamp: float = 0.0
+    cards: Tuple[int, ...] = ()
+    detail: str = ""
+
+    def describe(self) -> str:
+        """action_history 形式の文字列に変換"""
+        player_id, action, amount = self.player_id, self.action, self.amount
+        if action == "small_blind":
+            return f"Player {player_id} posted small blind {amount}"
+        if action == "big_blind":
+            return f"Player {player_id} posted big blind {amount}"
+        if action == "fold":
+            return f"Player {player_id} folded"
+        if action == "check":
+            return f"Player {player_id} checked"
+        if action == "call":
+            return f"Player {player_id} called {amount}"
+        if action == "raise":
+            return f"Player {player_id} raised to {amount}"
+        if action == "all_in":
+            return f"Player {player_id} went all-in with {amount}"
+        if action == "flop":
+            cards = cards_from_ids(self.cards)
+            return f"Flop dealt: {', '.join(str(card) for card in cards)}"
+        if action == "turn":
+            return f"Turn dealt: {Card.from_id(self.cards[0])}"
+        if action == "river":
+            return f"River dealt: {Card.from_id(self.cards[0])}"
+        if action == "win":
+            return f"Showdown: Player {player_id} won {amount}"
+        if action == "note":
+            return self.detail
+        return f"Player {player_id} {action} {amount}"
+
+    def __str__(self) -> str:
+        return self.describe()
+
+
+# ActionLog.last_action で追跡するプレイヤーの任意アクション（ブラインド等は除く）
+PLAYER_ACTIONS = frozenset(("fold", "check", "call", "raise", "all_in"))
+
+
+class ActionLog:
+    """
+    ActionEvent のリングバッファ
+
+    capacity 件を超えると古いイベントから捨てる。プレイヤー毎の最新アクションは
+    追加時に索引しておき O(1) で引ける。文字列は render() で要求された分だけ
+    作ってキャッシュする。ゲームのスレッドが追加する間に状態サーバーのスレッドが
+    render() するので、イベントと文字列のキャッシュはロックで一緒に更新する。
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._events: Deque[ActionEvent] = deque(maxlen=capacity)
+        self._rendered: Deque[Optional[str]] = deque(maxlen=capacity)
+        self._last_by_player: Dict[int, ActionEvent] = {}
+        self._lock = threading.Lock()
+        # これまでに追加した総件数（捨てたイベントも含む）
+        self.total = 0
+        # clear() 毎に増える世代。世代が同じ間は total の差が追加された件数になる
+        self.generation = 0
+
+    def _append(self, event: ActionEvent):
+        self._events.append(event)
+        self._rendered.append(None)
+        self.total += 1
+        if event.action in PLAYER_ACTIONS:
+            self._last_by_player[event.player_id] = event
+
+    def append(self, event: ActionEvent):
+        """イベントを1件追加"""
+        with self._lock:
+            self._append(event)
+
+    def extend(self, events: Iterable[ActionEvent]):
+        """イベントをまとめて追加"""
+        with self._lock:
+            for event in events:
+                self._append(event)
+
+    def clear(self):
+        """全イベントを破棄（total はそのまま）"""
+        with self._lock:
+            self._events.clear()
+            self._rendered.clear()
+            self._last_by_player.clear()
+            self.generation += 1
+
+    def last_action(self, player_id: int) -> Optional[ActionEvent]:
+        """プレイヤーの最新の任意アクション（fold/check/call/raise/all_in）"""
+        return self._last_by_player.get(player_id)
+
+    def _render(self, last_n: Optional[int]) -> List[str]:
+        size = len(self._events)
+        start = size - min(size if last_n is None else last_n, size)
+        rendered = self._rendered
+        events = self._events
+        result = []
+        for index in range(start, size):
+            text = rendered[index]
+            if text is None:
+                text = rendered[index] = events[index].describe()
+            result.append(text)
+        return result
+
+    def render(self, last_n: Optional[int] = None) -> List[str]:
+        """直近 last_n 件（省略時は全件）を古い順に文字列化"""
+        with self._lock:
+            return self._render(last_n)
+
+    def render_versioned(
+        self, last_n: Optional[int] = None
+    ) -> Tuple[List[str], int, int]:
+        """render() と、その時点の (total, generation) を同じロックの中で取得"""
+        with self._lock:
+            return self._render(last_n), self.total, self.generation
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(tuple(self._events))
+
+    def __getitem__(self, index: int) -> ActionEvent:
+        with self._lock:
+            return self._events[index]
+
+
+class GameSnapshot(NamedTuple):
+    """
+    PokerGame.snapshot() が返すゲーム状態（タプルのみで構成）
+
+    Card はイミュータブルな共有インスタンスなので、カード列はタプルに詰め替えるだけで
+    コピーとして扱える。players は Player.snapshot() のタプルを座席順に並べたもの。
+    """
+
+    hand_number: int
+    phase: GamePhase
+    pot: int
+    current_bet: int
+    dealer_button: int
+    current_player_index: int
+    betting_round_complete: bool
+    last_raiser_index: Optional[int]
+    has_bet_or_raise_this_round: bool
+    community_cards: Tuple[Card, ...]
+    deck_cards: Tuple[Card, ...]
+    players: Tuple[Tuple[Any, ...], ...]
+    action_events: Tuple[ActionEvent, ...]
+    hands_played: int
+    players_eliminated: Tuple[Any, ...]
+    last_showdown_results: Optional[Dict[str, Any]]
+    rng_state: Any = None  # include_rng=True の場合のみ
@@ -1322,11 +1322,7 @@ class GameUI:
 
             # アクション履歴を更新（全件・最新が上）
             self.action_history_column.controls.clear()
-            all_actions_desc = (
-                list(reversed(self.game.action_history))
-                if self.game.action_history
-                else []
-            )
+            all_actions_desc = list(reversed(self.game.action_log.render()))
             for action in all_actions_desc:
                 self.action_history_column.controls.append(
                     self._create_action_history_item(action)
@@ -1482,7 +1478,7 @@ class GameUI:
     def add_debug_message(self, message: str):
         """デバッグメッセージをログに出力（UIには表示しない）"""
         import datetime
-        import logging
+        from .logging_config import get_logger
 
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         # 旧: UI表示用の保持はしない
@@ -1490,7 +1486,7 @@ class GameUI:
         # self.debug_messages = self.debug_messages[-5:]
 
         # ロガーを使用
-        logger = logging.getLogger("poker_game")
+        logger = get_logger("ui")
         logger.debug(message)
 
     def show_phase_transition_confirmation(self):
@@ -0,0 +1,253 @@
+"""
+Structured JSONL hand history with a hand-offset index
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .game import PokerGame
+
+# レコード形式を変更した場合に上げる
+SCHEMA_VERSION = 1
+
+# hand レコードの events に並ぶ各要素の意味（ActionEvent から hand_number を除いたもの）
+EVENT_FIELDS = (
+    "player_id",
+    "action",
+    "amount",
+    "phase",
+    "timestamp",
+    "cards",
+    "detail",
+)
+
+INDEX_SUFFIX = ".idx"
+
+
+def hand_history_path_for(log_path: str) -> str:
+    """テキストログ（poker_game_*.log）に対応するハンド履歴ファイルのパス"""
+    base, _ = os.path.splitext(log_path)
+    return base + ".hands.jsonl"
+
+
+def build_hand_record(
+    game: "PokerGame", start_chips: Dict[int, int], started: float
+) -> Dict[str, Any]:
+    """終了したハンドを1件のレコードに変換"""
+    return {
+        "type": "hand",
+        "game": game.game_id,
+        "hand": game.hand_number,
+        "started": started,
+        "ended": time.time(),
+        "dealer": game.dealer_button,
+        "blinds": [game.small_blind, game.big_blind],
+        "players": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "start_chips": start_chips.get(p.id, p.chips),
+                "end_chips": p.chips,
+                "hole_cards": [str(card) for card in p.hole_cards],
+            }
+            for p in game.players
+        ],
+        "board": [str(card) for card in game.community_cards],
+        "events": [
+            [
+                event.player_id,
+                event.action,
+                event.amount,
+                event.phase,
+                event.timestamp,
+                list(event.cards),
+                event.detail,
+            ]
+            for event in game.action_log
+            if event.hand_number == game.hand_number
+        ],
+        "showdown": game.last_showdown_results,
+    }
+
+
+class HandHistoryWriter:
+    """
+    ハンド履歴を JSONL ファイルに書き出す
+
+    1行目はスキーマバージョン等を持つヘッダー、以降は1ハンド1行。
+    各ハンドの (game, hand, バイトオフセット) をインデックスファイル（.idx）に追記する。
+    書き込みはバックグラウンドスレッドで行い、ゲームスレッドはキューに積むだけ。
+    複数のゲーム（テーブル）から同じライターを共有できる。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+        if self._file.tell() == 0:
+            header = {
+                "type": "header",
+                "schema": SCHEMA_VERSION,
+                "created": time.time(),
+                "event_fields": list(EVENT_FIELDS),
+            }
+            self._file.write(json.dumps(header).encode("utf-8") + b"\n")
+            self._file.flush()
+
+        self._closed = False
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="HandHistoryWriter", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, record: Dict[str, Any]):
+        """レコードを書き込みキューに積む"""
+        if self._closed:
+            raise ValueError("HandHistoryWriter is closed")
+        self._queue.put(record)
+
+    def write_hand(
+        self, game: "PokerGame", start_chips: Dict[int, int], started: float
+    ):
+        """終了したハンドを書き込む"""
+        self.write(build_hand_record(game, start_chips, started))
+
+    def _write_loop(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            offset = self._file.tell()
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+            self._file.write(line.encode("utf-8") + b"\n")
+            self._file.flush()
+            # インデックスは本体を書いた後に追記（途中で落ちても本体から復元できる）
+            self._index.write(
+                json.dumps([record.get("game"), record.get("hand"), offset]) + "\n"
+            )
+            self._index.flush()
+
+    def close(self):
+        """キューに残ったレコードを書き出してファイルを閉じる"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        self._index.close()
+
+
+class HandHistoryReader:
+    """
+    ハンド履歴ファイルを読む
+
+    インデックスを使って任意のハンドへ直接シークする。インデックスが無い・
+    本体より遅れている場合は、不足分だけ本体を走査して補う。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+        if header.get("type") != "header":
+            raise ValueError(f"{path} is not a hand history file")
+        if header.get("schema", 0) > SCHEMA_VERSION:
+            raise ValueError(
+                f"Unsupported hand history schema {header.get('schema')} "
+                f"(supported: {SCHEMA_VERSION})"
+            )
+        self.header = header
+        self._entries: List[Tuple[Optional[str], int, int]] = []
+        self.refresh()
+
+    def refresh(self):
+        """インデックスを読み直し、その後に書き足されたハンドを取り込む"""
+        entries: List[Tuple[Optional[str], int, int]] = []
+        try:
+            with open(self.path + INDEX_SUFFIX, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        game, hand, offset = json.loads(line)
+                    except ValueError:
+                        break  # 書きかけの行
+                    entries.append((game, hand, offset))
+        except FileNotFoundError:
+            pass
+
+        with open(self.path, "rb") as f:
+            if entries:
+                f.seek(entries[-1][2])
+                f.readline()
+            else:
+                f.readline()  # ヘッダー
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break  # EOF または書きかけの行
+                record = json.loads(line)
+                if record.get("type") == "hand":
+                    entries.append((record.get("game"), record["hand"], offset))
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hands(self) -> List[Tuple[Optional[str], int]]:
+        """(game, hand) の一覧（ファイル内の順）"""
+        return [(game, hand) for game, hand, _ in self._entries]
+
+    def read_at(self, position: int) -> Dict[str, Any]:
+        """position 番目（0始まり）のハンドレコードを読む"""
+        with open(self.path, "rb") as f:
+            f.seek(self._entries[position][2])
+            return json.loads(f.readline())
+
+    def read_hand(self, hand_number: int, game: Optional[str] = None) -> Dict[str, Any]:
+        """
+        ハンド番号でレコードを読む
+
+        game を省略した場合、同じ番号のハンドが複数あれば最後に書かれたものを返す。
+        """
+        for position in range(len(self._entries) - 1, -1, -1):
+            entry_game, entry_hand, _ = self._entries[position]
+            if entry_hand == hand_number and (game is None or entry_game == game):
+                return self.read_at(position)
+        raise KeyError(hand_number)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, "rb") as f:
+            for _, _, offset in self._entries:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+
+_default_writer: Optional[HandHistoryWriter] = None
+
+
+def set_default_writer(writer: Optional[HandHistoryWriter]):
+    """ヘッドレスでない PokerGame が使う既定のライターを設定"""
+    global _default_writer
+    if _default_writer is not None and _default_writer is not writer:
+        _default_writer.close()
+    _default_writer = writer
+
+
+def get_default_writer() -> Optional[HandHistoryWriter]:
+    """既定のライター（未設定なら None）"""
+    return _default_writer
+
+
+atexit.register(set_default_writer, None)
@@ -0,0 +1,136 @@
+"""
+Queue-based logging pipeline for the poker_game logger hierarchy
+"""
+
+import atexit
+import logging
+import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+# 全ロガーの親。サブシステム毎のロガーはこの子として作る
+ROOT_LOGGER = "poker_game"
+
+# サブシステム名 -> ロガー名
+SUBSYSTEMS = {
+    "engine": f"{ROOT_LOGGER}.engine",  # PokerGame（game.py）
+    "players": f"{ROOT_LOGGER}.players",  # プレイヤー / LLM 呼び出し（player_models.py）
+    "ui": f"{ROOT_LOGGER}.ui",  # Flet / CLI の UI
+}
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# サブシステム毎のログレベルを指定する環境変数（例: "engine=INFO,players=DEBUG"）
+LOG_LEVELS_ENV = "ADK_POKER_LOG_LEVELS"
+
+_listener: Optional[QueueListener] = None
+
+# ライブラリとしてはハンドラーを設定しない（setup_logging を呼ぶまでは何も出力しない）
+logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """サブシステムのロガーを取得"""
+    return logging.getLogger(SUBSYSTEMS[subsystem])
+
+
+def parse_log_levels(spec: str) -> Dict[str, int]:
+    """ "engine=INFO,players=DEBUG" 形式の指定をサブシステム -> レベルの辞書に変換"""
+    levels: Dict[str, int] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, sep, level_name = item.partition("=")
+        name = name.strip()
+        level = logging.getLevelName(level_name.strip().upper())
+        if not sep or name not in SUBSYSTEMS or not isinstance(level, int):
+            raise ValueError(f"Invalid log level setting: {item!r}")
+        levels[name] = level
+    return levels
+
+
+def start_queue_logging(
+    handlers: List[logging.Handler], levels: Optional[Dict[str, int]] = None
+) -> QueueListener:
+    """
+    poker_game ロガーに QueueHandler を付け、handlers への書き込みを
+    バックグラウンドスレッド（QueueListener）で行う
+
+    ゲームスレッドはキューに積むだけでディスクやコンソールへの I/O を待たない。
+    既存のパイプラインがあれば停止して置き換える。
+    """
+    global _listener
+    stop_queue_logging()
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.handlers.clear()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG)
+
+    invalid_env = None
+    if levels is None:
+        try:
+            levels = parse_log_levels(os.environ.get(LOG_LEVELS_ENV, ""))
+        except ValueError as e:
+            levels, invalid_env = {}, e
+    for name, logger_name in SUBSYSTEMS.items():
+        logging.getLogger(logger_name).setLevel(levels.get(name, logging.NOTSET))
+
+    # respect_handler_level: ハンドラー毎のレベル（ファイルは DEBUG、コンソールは INFO）を維持
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    if invalid_env is not None:
+        root.warning("Ignoring %s: %s", LOG_LEVELS_ENV, invalid_env)
+    return _listener
+
+
+def stop_queue_logging():
+    """
+    バックグラウンドの書き込みスレッドを停止（キューに残ったログは書き出す）
+
+    poker_game ロガーは設定前と同じ NullHandler だけの状態に戻す。
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        root = logging.getLogger(ROOT_LOGGER)
+        root.handlers.clear()
+        root.addHandler(logging.NullHandler())
+
+
+def setup_logging(
+    log_dir: str = "logs",
+    levels: Optional[Dict[str, int]] = None,
+    console_level: int = logging.INFO,
+) -> str:
+    """
+    ファイル（DEBUG）とコンソール（console_level）へのログ出力を設定
+
+    levels を省略した場合は環境変数 ADK_POKER_LOG_LEVELS から読む。
+    作成したログファイルのパスを返す。
+    """
+    os.makedirs(log_dir, exist_ok=True)
+
+    # タイムスタンプ付きのログファイル名を生成
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_filename = os.path.join(log_dir, f"poker_game_{timestamp}.log")
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_filename, encoding="utf-8")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(formatter)
+
+    start_queue_logging([file_handler, console_handler], levels)
+    return log_filename
+
+
+atexit.register(stop_queue_logging)
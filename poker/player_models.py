@@ -3,22 +3,25 @@ Poker player models: Player classes and related types
 """
 
 import os
-import random
 import logging
 import asyncio
 import json
 import requests
+import httpx
 import uuid
 import re
 import logging
 import time
+import threading
+import weakref
 import concurrent.futures as cf
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
-from .game_models import Card, GameState, PlayerInfo
+from .game_models import Card, GameState, PlayerInfo, create_rng
+from .logging_config import get_logger
 
 from google.adk.agents import Agent
 from google.adk.runners import Runner
@@ -28,6 +31,112 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# LLM API への同時リクエスト数の上限（共有スレッド数・コネクションプールの大きさ）
+API_MAX_CONNECTIONS = 32
+
+# url 毎に共有する HTTP セッション（keep-alive のコネクションプール）
+_http_sessions: Dict[str, requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+_api_executor: Optional[cf.ThreadPoolExecutor] = None
+# イベントループ毎・url 毎に共有する非同期 HTTP クライアント
+# (asyncio.AbstractEventLoop -> {url: httpx.AsyncClient})
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_http_session(url: str) -> requests.Session:
+    """
+    url 毎に共有される requests.Session を取得
+
+    同じ adk api_server に接続するプレイヤー間で keep-alive のコネクションを使い回し、
+    判断毎の TCP 接続確立を省く。
+    """
+    with _http_sessions_lock:
+        session = _http_sessions.get(url)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=API_MAX_CONNECTIONS
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            _http_sessions[url] = session
+        return session
+
+
+def get_api_executor() -> cf.ThreadPoolExecutor:
+    """LLM API リクエスト用の共有スレッドプールを取得（初回呼び出し時に作成）"""
+    global _api_executor
+    with _http_sessions_lock:
+        if _api_executor is None:
+            _api_executor = cf.ThreadPoolExecutor(
+                max_workers=API_MAX_CONNECTIONS, thread_name_prefix="llm-api"
+            )
+        return _api_executor
+
+
+def get_async_http_client(url: str) -> httpx.AsyncClient:
+    """
+    実行中のイベントループで url 毎に共有される httpx.AsyncClient を取得
+
+    AsyncClient のコネクションは作成したイベントループに紐付くため、ループ毎に保持する。
+    """
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(
+                max_connections=API_MAX_CONNECTIONS,
+                max_keepalive_connections=API_MAX_CONNECTIONS,
+            ),
+        )
+        clients[url] = client
+    return client
+
+
+async def close_async_http_clients():
+    """実行中のイベントループで作成した非同期 HTTP クライアントをすべて閉じる"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+class DecisionRunner:
+    """
+    同期的なゲームループから make_decision_async を1つのイベントループ上で実行する
+
+    ループを使い回すため、非同期 HTTP クライアントのコネクションや
+    ADK の Runner が判断をまたいで再利用される。作成したスレッドで使用すること。
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def decide(self, player: "Player", game_state: GameState) -> Dict[str, Any]:
+        """プレイヤーの判断をイベントループ上で実行して結果を返す"""
+        return self.loop.run_until_complete(player.make_decision_async(game_state))
+
+    def close(self):
+        """HTTP クライアントを閉じてイベントループを終了"""
+        if self.loop.is_closed():
+            return
+        self.loop.run_until_complete(close_async_http_clients())
+        self.loop.close()
+
+
+def _reset_shared_clients():
+    """fork した子プロセスでは親のソケット・スレッドを使わず作り直す"""
+    global _api_executor, _http_sessions_lock
+    _http_sessions.clear()
+    _async_clients.clear()
+    _http_sessions_lock = threading.Lock()
+    _api_executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_clients)
+
 
 class PlayerStatus(Enum):
     """プレイヤーの状態"""
@@ -70,6 +179,33 @@ class Player(ABC):
         """新しいベッティングラウンド用にリセット"""
         self.current_bet = 0
 
+    def snapshot(self) -> Tuple[Any, ...]:
+        """ハンド中に変化する状態をタプルで取得（PokerGame.snapshot 用）"""
+        return (
+            self.chips,
+            self.current_bet,
+            self.total_bet_this_hand,
+            self.status,
+            tuple(self.hole_cards),
+            self.is_dealer,
+            self.is_small_blind,
+            self.is_big_blind,
+        )
+
+    def restore(self, state: Tuple[Any, ...]):
+        """snapshot() で取得した状態に戻す"""
+        (
+            self.chips,
+            self.current_bet,
+            self.total_bet_this_hand,
+            self.status,
+            hole_cards,
+            self.is_dealer,
+            self.is_small_blind,
+            self.is_big_blind,
+        ) = state
+        self.hole_cards = list(hole_cards)
+
     def add_hole_card(self, card: Card):
         """ホールカードを追加"""
         if len(self.hole_cards) >= 2:
@@ -122,6 +258,15 @@ class Player(ABC):
         """
         pass
 
+    async def make_decision_async(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        make_decision の非同期版
+
+        デフォルトは make_decision をそのまま呼ぶ（ランダム等の即時に決まるプレイヤー用）。
+        LLM のように待ち時間のあるプレイヤーはオーバーライドしてイベントループを止めないようにする。
+        """
+        return self.make_decision(game_state)
+
     def _parse_llm_response(
         self, response: str, game_state: GameState, response_type: str = "LLM"
     ) -> Dict[str, Any]:
@@ -140,7 +285,7 @@ class Player(ABC):
         import re
         import logging
 
-        logger = logging.getLogger("poker_game")
+        logger = get_logger("players")
         logger.debug(f"[{self.name}] Starting {response_type} response parsing")
         logger.debug(f"[{self.name}] Raw response content: {repr(response)}")
 
@@ -304,8 +449,12 @@ class HumanPlayer(Player):
 class RandomPlayer(Player):
     """ランダムプレイヤークラス（ランダム行動）"""
 
-    def __init__(self, player_id: int, name: str, initial_chips: int = 1000):
+    def __init__(
+        self, player_id: int, name: str, initial_chips: int = 1000, rng: Any = None
+    ):
         super().__init__(player_id, name, initial_chips)
+        # 乱数（create_rng が受け付ける値。None はグローバルな random）
+        self.rng = create_rng(rng)
         # 要件定義書に従った確率重み
         self.action_weights = {"fold": 30, "check_call": 50, "raise": 15, "all_in": 5}
 
@@ -344,7 +493,7 @@ class RandomPlayer(Player):
                 # "raise (min 40)" のような形式から最低レイズ額を抽出
                 amount = int(action.split("min ")[1].split(")")[0])
                 # ランダムにレイズ額を決定（最低額の1-3倍）
-                raise_amount = amount * random.randint(1, 3)
+                raise_amount = amount * self.rng.randint(1, 3)
                 raise_amount = min(raise_amount, self.chips)
                 action_options.append({"action": "raise", "amount": raise_amount})
                 weights.append(self.action_weights["raise"])
@@ -353,7 +502,7 @@ class RandomPlayer(Player):
                 weights.append(self.action_weights["all_in"])
 
         # 重み付きランダム選択
-        selected_action = random.choices(action_options, weights=weights)[0]
+        selected_action = self.rng.choices(action_options, weights=weights)[0]
         return selected_action
 
 
@@ -370,6 +519,9 @@ class LLMPlayer(Player):
         super().__init__(player_id, name, initial_chips)
         self.model = model
         self._agent = None
+        # Runner とセッションサービスは判断をまたいで使い回す
+        self._session_service: Optional[InMemorySessionService] = None
+        self._runner: Optional[Runner] = None
         self.last_decision_reasoning = ""  # 最後の判断理由を保存
         self._setup_agent()
 
@@ -419,10 +571,34 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         except ImportError:
             print("Warning: ADK not available, falling back to random behavior")
             self._agent = None
+            return
+
+        self._session_service = InMemorySessionService()
+        self._runner = Runner(
+            agent=self._agent,
+            app_name="poker_game",
+            session_service=self._session_service,
+        )
 
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
-        LLMを使った意思決定
+        LLMを使った意思決定（make_decision_async を新しいイベントループで実行）
+
+        Args:
+            game_state: 型安全なゲーム状態オブジェクト
+
+        Returns:
+            {"action": "fold|check|call|raise|all_in", "amount": int}
+        """
+        if self._agent is None:
+            # ADKが利用できない場合はランダム行動
+            random_player = RandomPlayer(self.id, self.name, self.chips)
+            return random_player.make_decision(game_state)
+        return asyncio.run(self.make_decision_async(game_state))
+
+    async def make_decision_async(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        LLMを使った意思決定（非同期版）
 
         Args:
             game_state: 型安全なゲーム状態オブジェクト
@@ -436,7 +612,7 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
             return random_player.make_decision(game_state)
 
         # ロガーは先に用意して例外時にも参照可能にする
-        logger = logging.getLogger("poker_game")
+        logger = get_logger("players")
         try:
             # ゲーム状態をプロンプトに変換
             prompt = self._create_decision_prompt(game_state)
@@ -444,40 +620,34 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
             # ロガーを使ってプロンプトをログファイルに出力
             logger.info(f"LLM Prompt for {self.name}: {prompt}")
 
-            # ADKエージェントに問い合わせ
-            session_service = InMemorySessionService()
-            runner = Runner(
-                agent=self._agent,
+            # ADKエージェントに問い合わせ（判断毎に新しいセッションで、前の会話を持ち込まない）
+            user_id = f"player_{self.id}"
+            session = await self._session_service.create_session(
                 app_name="poker_game",
-                session_service=session_service,
+                user_id=user_id,
+                session_id=f"session_{self.id}_{uuid.uuid4().hex}",
             )
 
-            async def get_decision():
-                session = await session_service.create_session(
-                    app_name="poker_game",
-                    user_id=f"player_{self.id}",
-                    session_id=f"session_{self.id}",
-                )
-
-                # Content型のメッセージを作成
-                content = types.Content(role="user", parts=[types.Part(text=prompt)])
+            # Content型のメッセージを作成
+            content = types.Content(role="user", parts=[types.Part(text=prompt)])
 
-                # run_asyncはイベントストリームを返すので、最終レスポンスを取得
-                final_response_text = None
-                async for event in runner.run_async(
-                    user_id=f"player_{self.id}",
+            # run_asyncはイベントストリームを返すので、最終レスポンスを取得
+            response_content = None
+            try:
+                async for event in self._runner.run_async(
+                    user_id=user_id,
                     session_id=session.id,
                     new_message=content,
                 ):
                     if event.is_final_response():
                         if event.content and event.content.parts:
-                            final_response_text = event.content.parts[0].text
+                            response_content = event.content.parts[0].text
                         break
+            finally:
+                await self._session_service.delete_session(
+                    app_name="poker_game", user_id=user_id, session_id=session.id
+                )
 
-                return final_response_text
-
-            # 非同期関数を同期的に実行 (Python 3.7+)
-            response_content = asyncio.run(get_decision())
             logger.info(f"LLM Response for {self.name}: {response_content}")
 
             print(f"test: {type(response_content)}")
@@ -551,13 +721,96 @@ class LLMApiPlayer(Player):
         user_id: str,
         url: str = "http://localhost:8000",
         initial_chips: int = 1000,
+        session_scope: str = "hand",
     ):
+        """
+        Args:
+            session_scope: ADKセッションを使い回す単位
+                ("hand": ハンド毎, "game": プレイヤーの生存期間中, "decision": 判断毎に新規作成)
+        """
         super().__init__(player_id, name, initial_chips)
+        if session_scope not in ("hand", "game", "decision"):
+            raise ValueError(f"Invalid session_scope: {session_scope}")
         self.app_name = app_name
         self.user_id = user_id
         self.url = url
+        self.session_scope = session_scope
+        self.http = get_http_session(url)
+        self._session_id: Optional[str] = None  # 作成済みのADKセッション
         self.last_decision_reasoning = ""  # 最後の判断理由を保存
 
+    def _session_url(self, session_id: str) -> str:
+        """ADKセッション作成エンドポイントのURL"""
+        return f"{self.url}/apps/{self.app_name}/users/{self.user_id}/sessions/{session_id}"
+
+    def _run_payload(self, session_id: str, input_json: str) -> Dict[str, Any]:
+        """/run リクエストの本文"""
+        return {
+            "app_name": self.app_name,
+            "user_id": self.user_id,
+            "session_id": session_id,
+            "new_message": {
+                "role": "user",
+                "parts": [{"text": input_json}],
+            },
+        }
+
+    def _reuse_session_id(self) -> Optional[str]:
+        """使い回せる作成済みのADKセッションID（なければ None）"""
+        if self.session_scope == "decision":
+            return None
+        return self._session_id
+
+    def _on_session_created(
+        self, create_session: Any, session_id: str, logger: logging.Logger
+    ):
+        """セッション作成レスポンスの処理（成功したらIDを保持する）"""
+        if create_session.status_code != 200:
+            logger.error(
+                f"Session creation failed with status {create_session.status_code}: {create_session.text}"
+            )
+        else:
+            logger.debug(f"Create Session: {create_session.json()}")
+            self._session_id = session_id
+
+    def _ensure_session(self, logger: logging.Logger) -> str:
+        """
+        ADKセッションIDを取得（未作成なら作成する）
+
+        作成に失敗した場合もそのIDで実行を試み、次の判断で作成をやり直す。
+        """
+        reuse = self._reuse_session_id()
+        if reuse is not None:
+            return reuse
+
+        session_id = str(uuid.uuid4())
+        try:
+            create_session = self.http.post(
+                self._session_url(session_id), json={}, timeout=5
+            )
+            self._on_session_created(create_session, session_id, logger)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Session creation request error for {self.name}: {e}")
+        return session_id
+
+    async def _ensure_session_async(
+        self, client: httpx.AsyncClient, logger: logging.Logger
+    ) -> str:
+        """_ensure_session の非同期版"""
+        reuse = self._reuse_session_id()
+        if reuse is not None:
+            return reuse
+
+        session_id = str(uuid.uuid4())
+        try:
+            create_session = await client.post(
+                self._session_url(session_id), json={}, timeout=5
+            )
+            self._on_session_created(create_session, session_id, logger)
+        except httpx.HTTPError as e:
+            logger.error(f"Session creation request error for {self.name}: {e}")
+        return session_id
+
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
         LLMを使った意思決定
@@ -570,45 +823,21 @@ class LLMApiPlayer(Player):
         """
 
         try:
-            logger = logging.getLogger("poker_game")
-            session_id = str(uuid.uuid4())
+            logger = get_logger("players")
 
             # ゲーム状態をJSON文字列に変換
             input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
             logger.debug(f"LLM Prompt for {self.name}: {input_json}")
 
-            # セッションの作成（短いタイムアウト）
-            try:
-                create_session = requests.post(
-                    f"{self.url}/apps/{self.app_name}/users/{self.user_id}/sessions/{session_id}",
-                    json={},
-                    headers={"Content-Type": "application/json"},
-                    timeout=5,
-                )
-                if create_session.status_code != 200:
-                    logger.error(
-                        f"Session creation failed with status {create_session.status_code}: {create_session.text}"
-                    )
-                else:
-                    logger.debug(f"Create Session: {create_session.json()}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Session creation request error for {self.name}: {e}")
+            # セッションの取得（session_scope の単位で使い回す）
+            session_id = self._ensure_session(logger)
 
-            # 実際の実行リクエストを別スレッドで発行し、20秒待機・10秒ごとにログ
+            # 実際の実行リクエストを共有スレッドプールで発行し、20秒待機・10秒ごとにログ
             def run_request():
                 try:
-                    return requests.post(
+                    return self.http.post(
                         f"{self.url}/run",
-                        json={
-                            "app_name": self.app_name,
-                            "user_id": self.user_id,
-                            "session_id": session_id,
-                            "new_message": {
-                                "role": "user",
-                                "parts": [{"text": input_json}],
-                            },
-                        },
-                        headers={"Content-Type": "application/json"},
+                        json=self._run_payload(session_id, input_json),
                         timeout=44,  # スレッド側は44秒でタイムアウト
                     )
                 except Exception as e:
@@ -618,48 +847,126 @@ class LLMApiPlayer(Player):
             logged_10 = False
             logged_20 = False
             logged_30 = False
-            with cf.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_request)
-                response = None
-                while True:
-                    elapsed = time.time() - start
-                    # 10秒ごとのログ出力
-                    if not logged_10 and elapsed >= 10:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 10 seconds elapsed"
-                        )
-                        logged_10 = True
-                    if not logged_20 and elapsed >= 20:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 20 seconds elapsed"
-                        )
-                        logged_20 = True
-                    if not logged_30 and elapsed >= 30:
-                        logger.info(
-                            f"Waiting for LLM API response for {self.name}... 30 seconds elapsed"
-                        )
-                        logged_30 = True
-                    try:
-                        # 短い待機でポーリング
-                        response = future.result(timeout=0.2)
-                        break
-                    except cf.TimeoutError:
-                        pass
-                    if elapsed >= 40:
-                        logger.warning(
-                            f"LLM API response timeout for {self.name} after 40 seconds - folding"
-                        )
-                        if hasattr(self, "last_decision_reasoning"):
-                            self.last_decision_reasoning = (
-                                "40秒経過しても応答がないため、フォールドします"
-                            )
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "reasoning": "40秒経過しても応答がないため、フォールドします",
-                        }
-
-            # スレッド結果の処理
+            future = get_api_executor().submit(run_request)
+            response = None
+            while True:
+                elapsed = time.time() - start
+                # 10秒ごとのログ出力
+                if not logged_10 and elapsed >= 10:
+                    logger.info(
+                        f"Waiting for LLM API response for {self.name}... 10 seconds elapsed"
+                    )
+                    logged_10 = True
+                if not logged_20 and elapsed >= 20:
+                    logger.info(
+                        f"Waiting for LLM API response for {self.name}... 20 seconds elapsed"
+                    )
+                    logged_20 = True
+                if not logged_30 and elapsed >= 30:
+                    logger.info(
+                        f"Waiting for LLM API response for {self.name}... 30 seconds elapsed"
+                    )
+                    logged_30 = True
+                try:
+                    # 短い待機でポーリング
+                    response = future.result(timeout=0.2)
+                    break
+                except cf.TimeoutError:
+                    pass
+                if elapsed >= 40:
+                    return self._timeout_decision(logger)
+
+            return self._handle_run_response(
+                response, session_id, input_json, game_state, logger
+            )
+
+        except Exception as e:
+            logger = get_logger("players")
+            logger.error(f"LLM decision error for {self.name}: {e}")
+            # エラー時はランダム行動
+            random_player = RandomPlayer(self.id, self.name, self.chips)
+            return random_player.make_decision(game_state)
+
+    async def make_decision_async(self, game_state: GameState) -> Dict[str, Any]:
+        """
+        LLMを使った意思決定（非同期版）
+
+        httpx.AsyncClient で adk api_server に問い合わせるため、待ち時間中も
+        同じイベントループ上の他のテーブル・プレイヤーの処理が進む。
+
+        Args:
+            game_state: 型安全なゲーム状態オブジェクト
+
+        Returns:
+            {"action": "fold|check|call|raise|all_in", "amount": int}
+        """
+        try:
+            logger = get_logger("players")
+
+            # ゲーム状態をJSON文字列に変換
+            input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
+            logger.debug(f"LLM Prompt for {self.name}: {input_json}")
+
+            client = get_async_http_client(self.url)
+            session_id = await self._ensure_session_async(client, logger)
+
+            request = asyncio.ensure_future(
+                client.post(
+                    f"{self.url}/run",
+                    json=self._run_payload(session_id, input_json),
+                    timeout=44,
+                )
+            )
+            # 10秒ごとにログを出しながら最大40秒待機
+            for waited in (10, 20, 30, 40):
+                done, _ = await asyncio.wait({request}, timeout=10)
+                if done:
+                    break
+                if waited < 40:
+                    logger.info(
+                        f"Waiting for LLM API response for {self.name}... {waited} seconds elapsed"
+                    )
+            if not request.done():
+                request.cancel()
+                return self._timeout_decision(logger)
+
+            try:
+                response = request.result()
+            except Exception as e:
+                response = e
+            return self._handle_run_response(
+                response, session_id, input_json, game_state, logger
+            )
+
+        except Exception as e:
+            logger = get_logger("players")
+            logger.error(f"LLM decision error for {self.name}: {e}")
+            # エラー時はランダム行動
+            random_player = RandomPlayer(self.id, self.name, self.chips)
+            return random_player.make_decision(game_state)
+
+    def _timeout_decision(self, logger: logging.Logger) -> Dict[str, Any]:
+        """40秒経過しても応答がない場合の判断（フォールド）"""
+        logger.warning(
+            f"LLM API response timeout for {self.name} after 40 seconds - folding"
+        )
+        self.last_decision_reasoning = "40秒経過しても応答がないため、フォールドします"
+        return {
+            "action": "fold",
+            "amount": 0,
+            "reasoning": "40秒経過しても応答がないため、フォールドします",
+        }
+
+    def _handle_run_response(
+        self,
+        response: Any,
+        session_id: str,
+        input_json: str,
+        game_state: GameState,
+        logger: logging.Logger,
+    ) -> Dict[str, Any]:
+        """/run の結果（requests / httpx のレスポンス、または例外）から判断を作成"""
+        try:
             if isinstance(response, Exception):
                 logger.error(f"LLM decision error for {self.name}: {response}")
                 random_player = RandomPlayer(self.id, self.name, self.chips)
@@ -677,6 +984,8 @@ class LLMApiPlayer(Player):
                 logger.error(
                     f"API request failed with status {response.status_code}: {response.text}"
                 )
+                # セッションが無効になった可能性があるため、次の判断で作り直す
+                self._session_id = None
                 if response.status_code == 422:
                     logger.error(
                         f"422 Error details - Request data: {json.dumps({
@@ -710,7 +1019,6 @@ class LLMApiPlayer(Player):
             )
 
         except Exception as e:
-            logger = logging.getLogger("poker_game")
             logger.error(f"LLM decision error for {self.name}: {e}")
             # エラー時はランダム行動
             random_player = RandomPlayer(self.id, self.name, self.chips)
@@ -726,6 +1034,8 @@ class LLMApiPlayer(Player):
         """新しいハンド用にリセット（理由もクリア）"""
         super().reset_for_new_hand()
         self.last_decision_reasoning = ""
+        if self.session_scope == "hand":
+            self._session_id = None
 
     def get_last_reasoning(self) -> str:
         """最後の判断理由を取得"""
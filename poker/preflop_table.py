@@ -0,0 +1,161 @@
+"""
+Preflop all-in equity table for the 169 starting-hand classes
+"""
+
+import argparse
+import time
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from .equity import calculate_equity
+from .game_models import Card, Suit
+
+# 13x13 グリッドの並び（0 = A, 12 = 2）
+GRID_RANKS = "AKQJT98765432"
+MIN_PLAYERS = 2
+MAX_PLAYERS = 10
+# [行, 列, プレイヤー数 - MIN_PLAYERS] -> オールイン時のエクイティ
+TABLE_SHAPE = (13, 13, MAX_PLAYERS - MIN_PLAYERS + 1)
+TABLE_DTYPE = np.float32
+
+DEFAULT_TARGET_STD_ERROR = 0.0015
+DEFAULT_MAX_SAMPLES = 2_000_000
+
+
+def _card(card: Union[Card, str]) -> Card:
+    return card if isinstance(card, Card) else Card.from_str(card)
+
+
+def class_index(card1: Union[Card, str], card2: Union[Card, str]) -> Tuple[int, int]:
+    """
+    手札2枚 -> 13x13 グリッド上の (行, 列)
+
+    ペアは対角、スーテッドは上三角（行 < 列）、オフスートは下三角（行 > 列）。
+    """
+    card1, card2 = _card(card1), _card(card2)
+    high, low = sorted((14 - card1.rank, 14 - card2.rank))
+    if card1.suit == card2.suit:
+        return high, low
+    return low, high
+
+
+def class_name(row: int, col: int) -> str:
+    """グリッド上の位置 -> "AA" / "AKs" / "AKo" 形式の名前"""
+    if row == col:
+        return GRID_RANKS[row] * 2
+    if row < col:
+        return GRID_RANKS[row] + GRID_RANKS[col] + "s"
+    return GRID_RANKS[col] + GRID_RANKS[row] + "o"
+
+
+def representative(row: int, col: int) -> Tuple[Card, Card]:
+    """グリッド上の位置のクラスに属する手札の1つ"""
+    high, low = min(row, col), max(row, col)
+    second_suit = Suit.SPADES if row < col else Suit.HEARTS
+    return Card(14 - high, Suit.SPADES), Card(14 - low, second_suit)
+
+
+def build_table(
+    target_std_error: float = DEFAULT_TARGET_STD_ERROR,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    seed: int = 0,
+    processes: int = 1,
+    progress: Optional[Callable[[str, np.ndarray], None]] = None,
+) -> np.ndarray:
+    """
+    全169クラス x 2〜10人のオールイン・エクイティをモンテカルロで計算
+
+    相手は全員ランダムな手札。各セルは (seed, 行, 列, 人数) から乱数を作るので、
+    同じ引数なら同じ表になる。progress(クラス名, 人数毎のエクイティ) はクラス毎に呼ばれる。
+    """
+    table = np.zeros(TABLE_SHAPE, dtype=TABLE_DTYPE)
+    for row in range(13):
+        for col in range(13):
+            hole = representative(row, col)
+            for players in range(MIN_PLAYERS, MAX_PLAYERS + 1):
+                result = calculate_equity(
+                    hole,
+                    num_opponents=players - 1,
+                    mode="monte_carlo",
+                    target_std_error=target_std_error,
+                    time_budget=float("inf"),
+                    max_samples=max_samples,
+                    processes=processes,
+                    seed=[seed, row, col, players],
+                )
+                table[row, col, players - MIN_PLAYERS] = result.equity
+            if progress is not None:
+                progress(class_name(row, col), table[row, col])
+    return table
+
+
+def save_table(table: np.ndarray, path: str):
+    """表を .npy 形式で保存"""
+    if table.shape != TABLE_SHAPE:
+        raise ValueError(f"Preflop table must have shape {TABLE_SHAPE}")
+    np.save(path, table.astype(TABLE_DTYPE, copy=False))
+
+
+def load_table(path: str) -> np.ndarray:
+    """表を mmap で読み込む（読み取り専用、参照したページだけがメモリに載る）"""
+    table = np.load(path, mmap_mode="r")
+    if table.shape != TABLE_SHAPE:
+        raise ValueError(f"{path} is not a preflop equity table")
+    return table
+
+
+def lookup(
+    table: np.ndarray,
+    card1: Union[Card, str],
+    card2: Union[Card, str],
+    num_players: int,
+) -> float:
+    """手札2枚と人数（自分を含む）からエクイティを引く"""
+    if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+        raise ValueError(f"num_players must be between {MIN_PLAYERS} and {MAX_PLAYERS}")
+    row, col = class_index(card1, card2)
+    return float(table[row, col, num_players - MIN_PLAYERS])
+
+
+def main():
+    """表の生成（python -m poker.preflop_table --output preflop_equity.npy）"""
+    parser = argparse.ArgumentParser(
+        description="プリフロップのオールイン・エクイティ表を生成"
+    )
+    parser.add_argument("--output", default="preflop_equity.npy", help="出力先（.npy）")
+    parser.add_argument(
+        "--target-std-error",
+        type=float,
+        default=DEFAULT_TARGET_STD_ERROR,
+        help="各セルの目標標準誤差",
+    )
+    parser.add_argument(
+        "--max-samples",
+        type=int,
+        default=DEFAULT_MAX_SAMPLES,
+        help="各セルの最大サンプル数",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--processes", type=int, default=1, help="並列プロセス数")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    def progress(name: str, equities: np.ndarray):
+        values = " ".join(f"{value:.3f}" for value in equities)
+        print(f"{name:>4}: {values}  ({time.perf_counter() - started:.0f}s)")
+
+    table = build_table(
+        target_std_error=args.target_std_error,
+        max_samples=args.max_samples,
+        seed=args.seed,
+        processes=args.processes,
+        progress=progress,
+    )
+    save_table(table, args.output)
+    print(f"Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,593 @@
+"""
+Opponent hand ranges as 1326-combo weight vectors and range equity
+"""
+
+import re
+from itertools import combinations
+from math import comb
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .batch_evaluator import evaluate_masks, suit_masks
+from .game_models import Card
+
+CardLike = Union[Card, str, int]
+
+# 手札2枚の組み合わせの数。レンジは combinations(range(52), 2) の順の重みベクトル
+NUM_COMBOS = 1326
+# 表記のランク（インデックス + 2 がランク）
+RANK_CHARS = "23456789TJQKA"
+SUIT_LETTERS = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
+
+# アクション -> 直前のレンジのうち強い方から残す割合
+ACTION_KEEP = {"check": 1.0, "call": 0.6, "raise": 0.3, "all_in": 0.15}
+# 残す割合から外れた組に掛ける重み（ブラフやスロープレイの分）
+BLUFF_WEIGHT = 0.1
+
+# エクイティ計算で列挙するボードの上限（これを超えるとサンプリング）。
+# フロップ以降は C(49, 2) = 1176 通り以下なので常に完全列挙になる
+DEFAULT_MAX_RUNOUTS = 1176
+# hand_vs_range がサンプリングする場合の (相手の組, ボード) の対の数
+DEFAULT_SAMPLES = 20000
+# 1回にまとめて評価するボードの数
+RUNOUT_CHUNK_SIZE = 64
+# 強さ（カテゴリ << 20 | キッカー）が収まるビット数
+_STRENGTH_BITS = 24
+
+# 組のインデックス -> 2枚のカードID / ビットマスク / スート毎のランク集合
+COMBO_CARDS = np.asarray(list(combinations(range(52), 2)), dtype=np.int64)
+COMBO_MASKS = np.left_shift(1, COMBO_CARDS).sum(axis=1)
+COMBO_SUITS = suit_masks(COMBO_CARDS)
+
+_COMBO_INDEX = np.full((52, 52), -1, dtype=np.int64)
+_COMBO_INDEX[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(NUM_COMBOS)
+_COMBO_INDEX[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(NUM_COMBOS)
+# カード -> そのカードを含む51組 (52, 51)
+CARD_COMBOS = np.asarray(
+    [
+        [_COMBO_INDEX[card, other] for other in range(52) if other != card]
+        for card in range(52)
+    ],
+    dtype=np.int64,
+)
+# 組の各カードについて、CARD_COMBOS を平坦化した配列での自分の位置 (1326, 2)
+_CARD_COMBO_POSITION = np.zeros((NUM_COMBOS, 2), dtype=np.int64)
+for _card_id in range(52):
+    for _slot, _combo in enumerate(CARD_COMBOS[_card_id]):
+        _column = 0 if COMBO_CARDS[_combo, 0] == _card_id else 1
+        _CARD_COMBO_POSITION[_combo, _column] = _card_id * 51 + _slot
+
+_RANK = r"(10|[2-9TJQKA])"
+_COMBO_PATTERN = re.compile(rf"{_RANK}([shdc♠♥♦♣]){_RANK}([shdc♠♥♦♣])")
+_CLASS_PATTERN = re.compile(r"([2-9TJQKA])([2-9TJQKA])([so]?)")
+
+_HISTORY_ACTIONS = {
+    "folded": "fold",
+    "checked": "check",
+    "called": "call",
+    "raised to": "raise",
+    "went all-in with": "all_in",
+}
+_HISTORY_PATTERN = re.compile(
+    r"Player (\d+) (folded|checked|called|raised to|went all-in with)\b"
+)
+_HAND_START_PATTERN = re.compile(r"Player \d+ posted small blind|Showdown:")
+_DEAL_PREFIXES = ("Flop dealt", "Turn dealt", "River dealt")
+_BOARD_SIZES = (0, 3, 4, 5)
+
+
+class ObservedAction(NamedTuple):
+    """history から読み取ったプレイヤーのアクション"""
+
+    player_id: int
+    action: str  # fold / check / call / raise / all_in
+    board_size: int  # アクション時点のボードの枚数（0 = プリフロップ）
+
+
+def _card_id(card: CardLike) -> int:
+    if isinstance(card, Card):
+        return card.id
+    if isinstance(card, str):
+        return Card.from_str(card).id
+    return int(card)
+
+
+def combo_index(card1: CardLike, card2: CardLike) -> int:
+    """手札2枚 -> レンジのベクトルでのインデックス"""
+    index = int(_COMBO_INDEX[_card_id(card1), _card_id(card2)])
+    if index < 0:
+        raise ValueError("A combo needs two different cards")
+    return index
+
+
+def empty_range() -> np.ndarray:
+    """重みがすべて0のレンジ"""
+    return np.zeros(NUM_COMBOS, dtype=np.float64)
+
+
+def full_range() -> np.ndarray:
+    """すべての組が重み1のレンジ（ランダムな手札）"""
+    return np.ones(NUM_COMBOS, dtype=np.float64)
+
+
+def _class_combos(high: int, low: int, suited: Optional[bool]) -> List[int]:
+    """ランク（0 = 2 〜 12 = A）の組とスーテッドか（None なら両方）-> 組のインデックス"""
+    indices = []
+    for suit1 in range(4):
+        for suit2 in range(4):
+            if high == low and suit1 >= suit2:
+                continue
+            if suited is not None and high != low and (suit1 == suit2) != suited:
+                continue
+            indices.append(int(_COMBO_INDEX[suit1 * 13 + high, suit2 * 13 + low]))
+    return indices
+
+
+def _parse_class(text: str, token: str) -> Tuple[int, int, str]:
+    match = _CLASS_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid range token: {token!r}")
+    first, second, suffix = match.groups()
+    high, low = RANK_CHARS.index(first), RANK_CHARS.index(second)
+    if high < low:
+        high, low = low, high
+    if high == low and suffix:
+        raise ValueError(f"Pairs cannot be suited or offsuit: {token!r}")
+    return high, low, suffix
+
+
+def _token_combos(token: str) -> List[int]:
+    """重みを除いた1つのトークン -> 組のインデックス"""
+    match = _COMBO_PATTERN.fullmatch(token)
+    if match is not None:
+        rank1, suit1, rank2, suit2 = match.groups()
+        card1 = Card.from_str(rank1 + SUIT_LETTERS.get(suit1, suit1))
+        card2 = Card.from_str(rank2 + SUIT_LETTERS.get(suit2, suit2))
+        return [combo_index(card1, card2)]
+
+    plus = token.endswith("+")
+    body = token[:-1] if plus else token
+    if "-" in body:
+        start, end = body.split("-", 1)
+        high1, low1, suffix1 = _parse_class(start, token)
+        high2, low2, suffix2 = _parse_class(end, token)
+        if suffix1 != suffix2 or plus:
+            raise ValueError(f"Invalid range token: {token!r}")
+        if high1 == low1 and high2 == low2:
+            pairs = range(min(high1, high2), max(high1, high2) + 1)
+            classes = [(rank, rank) for rank in pairs]
+        elif high1 == high2 and high1 != low1 and high2 != low2:
+            kickers = range(min(low1, low2), max(low1, low2) + 1)
+            classes = [(high1, kicker) for kicker in kickers]
+        else:
+            raise ValueError(f"Invalid range token: {token!r}")
+        suffix = suffix1
+    else:
+        high, low, suffix = _parse_class(body, token)
+        if not plus:
+            classes = [(high, low)]
+        elif high == low:
+            classes = [(rank, rank) for rank in range(high, 13)]
+        else:
+            classes = [(high, kicker) for kicker in range(low, high)]
+
+    suited = {"s": True, "o": False}.get(suffix)
+    indices = []
+    for high, low in classes:
+        indices.extend(_class_combos(high, low, suited))
+    return indices
+
+
+def parse_range(text: str) -> np.ndarray:
+    """
+    一般的なレンジ表記をレンジのベクトルに変換
+
+    カンマ区切りで "AA", "AKs", "AKo", "AK"（両方）, "QQ+", "ATs+", "22-55",
+    "K9s-K6s", 特定の組 "AsKh" / "A♠K♥" を指定できる。":0.5" を付けると重みを指定でき、
+    同じ組を複数回指定した場合は後のトークンの重みになる。
+    """
+    weights = empty_range()
+    for raw in text.split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, weight_text = token.split(":", 1)
+            token = token.strip()
+            try:
+                weight = float(weight_text)
+            except ValueError:
+                raise ValueError(f"Invalid range weight: {raw.strip()!r}") from None
+            if weight < 0:
+                raise ValueError(f"Range weights must not be negative: {raw.strip()!r}")
+        weights[_token_combos(token)] = weight
+    return weights
+
+
+def remove_cards(weights: np.ndarray, cards: Iterable[CardLike]) -> np.ndarray:
+    """cards のいずれかを含む組の重みを0にしたレンジ（自分の手札やボードとの重なり）"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << _card_id(card)
+    return np.where(COMBO_MASKS & mask, 0.0, weights)
+
+
+def range_fraction(weights: np.ndarray) -> float:
+    """全1326組に対するレンジの大きさ（重み付き、0〜1）"""
+    return float(np.sum(weights)) / NUM_COMBOS
+
+
+def preflop_strengths(table: np.ndarray, num_players: int = 2) -> np.ndarray:
+    """
+    プリフロップのエクイティ表 (13, 13, 9) -> 組毎のプリフロップの強さ (1326,)
+
+    表の並びは poker.preflop_table と同じ（ペアは対角、スーテッドは上三角）。
+    """
+    grid = 12 - COMBO_CARDS % 13
+    suits = COMBO_CARDS // 13
+    high = grid.min(axis=1)
+    low = grid.max(axis=1)
+    suited = suits[:, 0] == suits[:, 1]
+    rows = np.where(suited, high, low)
+    cols = np.where(suited, low, high)
+    return np.asarray(table[rows, cols, num_players - 2], dtype=np.float64)
+
+
+def board_strengths(board: Sequence[CardLike]) -> np.ndarray:
+    """
+    ボード（3〜5枚）と各組で作れる役の強さ (1326,)
+
+    ボードと重なる組の値は意味を持たないので、remove_cards で重みを0にして使う。
+    """
+    board_suits = suit_masks(np.asarray([[_card_id(card) for card in board]]))
+    return evaluate_masks(COMBO_SUITS | board_suits)
+
+
+def narrow_range(
+    weights: np.ndarray,
+    strengths: np.ndarray,
+    keep: float,
+    floor: float = BLUFF_WEIGHT,
+) -> np.ndarray:
+    """
+    レンジのうち強い方から keep の割合（重み付き）を残し、残りの重みに floor を掛ける
+
+    同じ強さの組は同じ扱いにする。keep >= 1 なら元のレンジのまま。
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    if keep >= 1 or total <= 0:
+        return weights.copy()
+    order = np.argsort(-strengths, kind="stable")
+    sorted_weights = weights[order]
+    stronger = np.cumsum(sorted_weights) - sorted_weights
+    kept = (stronger < keep * total) & (sorted_weights > 0)
+    threshold = strengths[order][kept].min()
+    return np.where(strengths >= threshold, weights, weights * floor)
+
+
+def parse_history(
+    history: Sequence[str], community: Sequence[CardLike]
+) -> List[ObservedAction]:
+    """
+    直近のアクション履歴（history）から現在のハンドのアクションを読み取る
+
+    最後のスモールブラインド（またはショーダウン）より前の行は前のハンドとして捨てる。
+    各アクションのボードの枚数は、現在のボードの枚数と以降のカードが配られた行の数から決める。
+    """
+    start = 0
+    for index, line in enumerate(history):
+        if _HAND_START_PATTERN.match(line):
+            start = index + (0 if "blind" in line else 1)
+    lines = history[start:]
+
+    deals = sum(1 for line in lines if line.startswith(_DEAL_PREFIXES))
+    if len(community) not in _BOARD_SIZES:
+        raise ValueError("community must be 0, 3, 4 or 5 cards")
+    street = max(_BOARD_SIZES.index(len(community)) - deals, 0)
+
+    observed = []
+    for line in lines:
+        if line.startswith(_DEAL_PREFIXES):
+            street = min(street + 1, len(_BOARD_SIZES) - 1)
+            continue
+        match = _HISTORY_PATTERN.match(line)
+        if match is not None:
+            action = _HISTORY_ACTIONS[match.group(2)]
+            observed.append(
+                ObservedAction(int(match.group(1)), action, _BOARD_SIZES[street])
+            )
+    return observed
+
+
+def estimate_ranges(
+    observed: Iterable[ObservedAction],
+    community: Sequence[CardLike],
+    preflop: np.ndarray,
+    dead_cards: Iterable[CardLike] = (),
+    action_keep: Optional[Dict[str, float]] = None,
+    floor: float = BLUFF_WEIGHT,
+) -> Dict[int, np.ndarray]:
+    """
+    観測したアクションから、降りていない各プレイヤーのレンジを推定
+
+    ランダムな手札から始め、アクション毎にその時点の強さ（プリフロップは preflop、
+    以降はボードとの役の強さ。ドローは考慮しない）で narrow_range する。
+
+    Args:
+        observed: parse_history の結果
+        community: 現在のボード
+        preflop: 組毎のプリフロップの強さ（preflop_strengths の結果など）
+        dead_cards: 相手が持ち得ないカード（自分の手札など）
+        action_keep: アクション -> 残す割合（既定は ACTION_KEEP）
+    """
+    action_keep = ACTION_KEEP if action_keep is None else action_keep
+    community = [_card_id(card) for card in community]
+    initial = remove_cards(full_range(), [*community, *dead_cards])
+    strengths = {0: preflop}
+    ranges: Dict[int, np.ndarray] = {}
+    folded = set()
+    for player_id, action, board_size in observed:
+        if action == "fold":
+            folded.add(player_id)
+            continue
+        if board_size not in strengths:
+            strengths[board_size] = board_strengths(community[:board_size])
+        ranges[player_id] = narrow_range(
+            ranges.get(player_id, initial),
+            strengths[board_size],
+            action_keep.get(action, 1.0),
+            floor,
+        )
+    return {
+        player_id: weights
+        for player_id, weights in ranges.items()
+        if player_id not in folded
+    }
+
+
+def _grouped_counts(
+    values: np.ndarray, weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    行毎に、各要素より値が小さい要素 / 等しい要素（自分を含む）の重みの合計
+
+    行番号を上位ビットに入れたキーを1回ソートして、全行をまとめて求める。
+    等しいキーの連続区間の両端は、ソート済みの配列上で隣と比べて求める。
+    """
+    groups, width = values.shape
+    offsets = np.arange(groups, dtype=np.int64) << _STRENGTH_BITS
+    keys = (offsets[:, None] | values).ravel()
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    cumulative = np.concatenate(([0.0], np.cumsum(weights.ravel()[order])))
+
+    new_run = np.diff(sorted_keys, prepend=-1) != 0
+    run_starts = np.flatnonzero(new_run)
+    run_ids = np.cumsum(new_run) - 1
+    run_ends = np.append(run_starts[1:], len(keys))
+    left = np.empty_like(order)
+    right = np.empty_like(order)
+    left[order] = run_starts[run_ids]
+    right[order] = run_ends[run_ids]
+
+    start = np.repeat(np.arange(groups) * width, width)
+    less = cumulative[left] - cumulative[start]
+    equal = cumulative[right] - cumulative[left]
+    return less.reshape(groups, width), equal.reshape(groups, width)
+
+
+def _runouts(
+    board: List[int], dead: List[int], max_runouts: int, seed: Optional[int]
+) -> np.ndarray:
+    """残りのボードの全列挙（max_runouts 通りを超える場合はサンプル）(R, 5 - len(board))"""
+    need = 5 - len(board)
+    known = set(board) | set(dead)
+    remaining = np.asarray([c for c in range(52) if c not in known], dtype=np.int64)
+    if comb(len(remaining), need) <= max_runouts:
+        rows = list(combinations(remaining.tolist(), need))
+        return np.asarray(rows, dtype=np.int64).reshape(len(rows), need)
+    rng = np.random.default_rng(seed)
+    picks = rng.random((max_runouts, len(remaining))).argsort(axis=1)[:, :need]
+    return remaining[picks]
+
+
+def _accumulate(
+    hero: np.ndarray,
+    villain: np.ndarray,
+    board: List[int],
+    dead: List[int],
+    max_runouts: int,
+    seed: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    組毎に、相手のレンジに対する (取り分の合計, 対戦数の合計) をボード全体で集計
+
+    相手の組の重みで数え、カードが重なる組み合わせは除く。組 i と相手の組 j が
+    重ならない数は「全体 - i の1枚目を含む j - 2枚目を含む j + i 自身」で求める。
+    """
+    board_mask = 0
+    for card_id in board:
+        board_mask |= 1 << card_id
+    hero = np.where(COMBO_MASKS & board_mask, 0.0, hero)
+    villain = np.where(COMBO_MASKS & board_mask, 0.0, villain)
+    board_suits = suit_masks(np.asarray([board], dtype=np.int64).reshape(1, -1))
+    runouts = _runouts(board, dead, max_runouts, seed)
+
+    share = np.zeros(NUM_COMBOS)
+    total = np.zeros(NUM_COMBOS)
+    first, second = _CARD_COMBO_POSITION[:, 0], _CARD_COMBO_POSITION[:, 1]
+    for begin in range(0, len(runouts), RUNOUT_CHUNK_SIZE):
+        chunk = runouts[begin : begin + RUNOUT_CHUNK_SIZE]
+        count = len(chunk)
+        chunk_suits = suit_masks(chunk) | board_suits
+        strengths = evaluate_masks(
+            (COMBO_SUITS[None, :, :] | chunk_suits[:, None, :]).reshape(-1, 4)
+        ).reshape(count, NUM_COMBOS)
+        chunk_masks = np.left_shift(1, chunk).sum(axis=1)
+        valid = (COMBO_MASKS[None, :] & chunk_masks[:, None]) == 0
+        weights = np.where(valid, villain[None, :], 0.0)
+
+        less, equal = _grouped_counts(strengths, weights)
+        card_strengths = strengths[:, CARD_COMBOS].reshape(count * 52, 51)
+        card_weights = weights[:, CARD_COMBOS].reshape(count * 52, 51)
+        card_less, card_equal = _grouped_counts(card_strengths, card_weights)
+        card_less = card_less.reshape(count, -1)
+        card_equal = card_equal.reshape(count, -1)
+        card_total = np.repeat(card_weights.sum(axis=1).reshape(count, 52), 51, axis=1)
+
+        wins = less - card_less[:, first] - card_less[:, second]
+        ties = equal - card_equal[:, first] - card_equal[:, second] + weights
+        matches = (
+            weights.sum(axis=1)[:, None]
+            - card_total[:, first]
+            - card_total[:, second]
+            + weights
+        )
+        share += np.where(valid, wins + ties / 2, 0.0).sum(axis=0)
+        total += np.where(valid, matches, 0.0).sum(axis=0)
+    share[hero <= 0] = 0.0
+    total[hero <= 0] = 0.0
+    return share, total
+
+
+def combo_equities(
+    hero: np.ndarray,
+    villain: np.ndarray,
+    board: Sequence[CardLike] = (),
+    max_runouts: int = DEFAULT_MAX_RUNOUTS,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    hero のレンジの各組の、villain のレンジに対するエクイティ（引き分けは半分）
+
+    hero の重みが0の組や、相手の組と一度も対戦しない組は NaN。
+    ボードの残りは max_runouts 通り以下なら完全列挙、それを超えるとサンプリング。
+    """
+    board_ids = [_card_id(card) for card in board]
+    share, total = _accumulate(hero, villain, board_ids, [], max_runouts, seed)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, share / total, np.nan)
+
+
+def range_vs_range(
+    hero: np.ndarray,
+    villain: np.ndarray,
+    board: Sequence[CardLike] = (),
+    max_runouts: int = DEFAULT_MAX_RUNOUTS,
+    seed: Optional[int] = None,
+) -> float:
+    """hero のレンジ全体の、villain のレンジに対するエクイティ（組と対戦数の重み付き）"""
+    board_ids = [_card_id(card) for card in board]
+    share, total = _accumulate(hero, villain, board_ids, [], max_runouts, seed)
+    hero = np.asarray(hero, dtype=np.float64)
+    matches = float(np.dot(hero, total))
+    if matches <= 0:
+        raise ValueError("The ranges have no combos that can meet")
+    return float(np.dot(hero, share)) / matches
+
+
+def _hand_vs_range_exact(
+    hole: List[int], villain: np.ndarray, board: List[int], runouts: np.ndarray
+) -> float:
+    """手札1組の、villain のレンジに対するエクイティを残りのボードの全通りで集計"""
+    hero_suits = suit_masks(np.asarray([hole + board], dtype=np.int64))
+    board_suits = suit_masks(np.asarray([board], dtype=np.int64).reshape(1, -1))
+    share = total = 0.0
+    for begin in range(0, len(runouts), RUNOUT_CHUNK_SIZE):
+        chunk = runouts[begin : begin + RUNOUT_CHUNK_SIZE]
+        count = len(chunk)
+        chunk_suits = suit_masks(chunk)
+        # 自分は1組だけなので、相手の各組と強さを直接比べればよい（ソート不要）
+        hero_strengths = evaluate_masks(chunk_suits | hero_suits)[:, None]
+        strengths = evaluate_masks(
+            (COMBO_SUITS[None, :, :] | (chunk_suits | board_suits)[:, None, :]).reshape(
+                -1, 4
+            )
+        ).reshape(count, NUM_COMBOS)
+        chunk_masks = np.left_shift(1, chunk).sum(axis=1)
+        valid = (COMBO_MASKS[None, :] & chunk_masks[:, None]) == 0
+        weights = np.where(valid, villain[None, :], 0.0)
+        outcome = (strengths < hero_strengths) + 0.5 * (strengths == hero_strengths)
+        share += float((weights * outcome).sum())
+        total += float(weights.sum())
+    if total <= 0:
+        raise ValueError("Villain range has no combos left after removing dead cards")
+    return share / total
+
+
+def _hand_vs_range_sampled(
+    hole: List[int],
+    villain: np.ndarray,
+    board: List[int],
+    samples: int,
+    seed: Optional[int],
+) -> float:
+    """
+    手札1組の、villain のレンジに対するエクイティを (相手の組, 残りのボード) の
+    サンプルで推定
+
+    相手の組は重みに比例して、ボードは残りのカードから一様に選ぶ。
+    対戦毎に独立に選ぶので、ボードだけを選んで全組と比べるより少ない評価で分散が小さい。
+    """
+    rng = np.random.default_rng(seed)
+    combos = rng.choice(NUM_COMBOS, size=samples, p=villain / villain.sum())
+    known = 0
+    for card_id in hole + board:
+        known |= 1 << card_id
+    used = COMBO_MASKS[combos] | known
+    need = 5 - len(board)
+    runouts = np.empty((samples, need), dtype=np.int64)
+    for column in range(need):
+        # 既に使われたカードを引いた行だけ引き直す
+        cards = rng.integers(0, 52, samples)
+        clash = (used >> cards) & 1 == 1
+        while clash.any():
+            cards[clash] = rng.integers(0, 52, int(clash.sum()))
+            clash = (used >> cards) & 1 == 1
+        runouts[:, column] = cards
+        used |= np.left_shift(1, cards)
+
+    board_cards = np.broadcast_to(
+        np.asarray(board, dtype=np.int64).reshape(1, -1), (samples, len(board))
+    )
+    shared_suits = suit_masks(np.concatenate([board_cards, runouts], axis=1))
+    hole_suits = suit_masks(np.asarray([hole], dtype=np.int64))
+    hero = evaluate_masks(shared_suits | hole_suits)
+    villains = evaluate_masks(shared_suits | COMBO_SUITS[combos])
+    return float(np.mean((hero > villains) + 0.5 * (hero == villains)))
+
+
+def hand_vs_range(
+    hole: Sequence[CardLike],
+    villain: np.ndarray,
+    board: Sequence[CardLike] = (),
+    max_runouts: int = DEFAULT_MAX_RUNOUTS,
+    seed: Optional[int] = None,
+    samples: int = DEFAULT_SAMPLES,
+) -> float:
+    """
+    手札2枚の、villain のレンジに対するエクイティ（引き分けは半分）
+
+    残りのボードが max_runouts 通り以下なら完全列挙、それを超えると
+    (相手の組, ボード) の対を samples 回サンプリングする。
+    """
+    hole_ids = [_card_id(card) for card in hole]
+    if len(hole_ids) != 2:
+        raise ValueError("hole must be exactly 2 cards")
+    board_ids = [_card_id(card) for card in board]
+    dead_mask = 0
+    for card_id in hole_ids + board_ids:
+        dead_mask |= 1 << card_id
+    villain = np.where(COMBO_MASKS & dead_mask, 0.0, np.asarray(villain, np.float64))
+    if villain.sum() <= 0:
+        raise ValueError("Villain range has no combos left after removing dead cards")
+
+    need = 5 - len(board_ids)
+    if comb(52 - len(hole_ids) - len(board_ids), need) <= max_runouts:
+        # 自分の手札を含むボードは数えないので列挙からも外しておく
+        runouts = _runouts(board_ids, hole_ids, max_runouts, seed)
+        return _hand_vs_range_exact(hole_ids, villain, board_ids, runouts)
+    return _hand_vs_range_sampled(hole_ids, villain, board_ids, samples, seed)
@@ -0,0 +1,126 @@
+"""
+Shared LLM request scheduler for running many tables on one event loop
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Tuple
+
+from .game_models import GameState
+from .player_models import Player
+
+
+@dataclass
+class SchedulerStats:
+    """スケジューラの統計"""
+
+    requests: int = 0
+    max_in_flight: int = 0
+    total_wait: float = 0.0  # 実行枠を待った時間の合計（秒）
+    # エージェント毎のリクエスト数
+    requests_by_agent: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def average_wait(self) -> float:
+        """1リクエストあたりの平均待ち時間（秒）"""
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class LLMRequestScheduler:
+    """
+    複数テーブルの LLM 判断リクエストを1つのイベントループ上で多重化するスケジューラ
+
+    同時実行数を全体（max_concurrency）とエージェント毎（per_agent_limit）で制限する。
+    待機中のリクエストは到着順に並べ、空きのあるエージェントのものから順に実行するため、
+    混雑しているエージェントが他のエージェントのリクエストを塞ぐことはない。
+    make_decision_async をオーバーライドしていない即時に決まるプレイヤー（RandomPlayer 等）は
+    制限の対象外でそのまま実行する。
+    """
+
+    def __init__(self, max_concurrency: int = 32, per_agent_limit: int = 4):
+        if max_concurrency <= 0 or per_agent_limit <= 0:
+            raise ValueError("concurrency limits must be positive")
+        self.max_concurrency = max_concurrency
+        self.per_agent_limit = per_agent_limit
+        self.stats = SchedulerStats()
+        self._waiting: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._in_flight = 0
+        self._in_flight_by_agent: Dict[str, int] = {}
+
+    @staticmethod
+    def agent_key(player: Player) -> str:
+        """同時実行数を数える単位（LLMApiPlayer はエージェント名、それ以外はクラス名）"""
+        return getattr(player, "app_name", None) or type(player).__name__
+
+    @staticmethod
+    def is_instant(player: Player) -> bool:
+        """make_decision_async をオーバーライドしていない（待ち時間のない）プレイヤーか"""
+        return type(player).make_decision_async is Player.make_decision_async
+
+    @property
+    def in_flight(self) -> int:
+        """実行中のリクエスト数"""
+        return self._in_flight
+
+    async def decide(self, player: Player, game_state: GameState) -> Dict[str, Any]:
+        """実行枠を確保してからプレイヤーの判断を実行"""
+        if self.is_instant(player):
+            return player.make_decision(game_state)
+
+        agent = self.agent_key(player)
+        await self._acquire(agent)
+        try:
+            return await player.make_decision_async(game_state)
+        finally:
+            self._release(agent)
+
+    async def _acquire(self, agent: str):
+        """実行枠が空くまで待つ"""
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append((agent, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 枠を確保した直後にキャンセルされた
+                self._release(agent)
+            raise
+
+        self.stats.requests += 1
+        self.stats.total_wait += time.perf_counter() - start
+        self.stats.requests_by_agent[agent] = (
+            self.stats.requests_by_agent.get(agent, 0) + 1
+        )
+
+    def _release(self, agent: str):
+        """実行枠を返却して待機中のリクエストに割り当てる"""
+        self._in_flight -= 1
+        self._in_flight_by_agent[agent] -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """到着順に、空きのあるエージェントの待機リクエストへ実行枠を割り当てる"""
+        if not self._waiting:
+            return
+        remaining: Deque[Tuple[str, asyncio.Future]] = deque()
+        while self._waiting:
+            agent, future = self._waiting.popleft()
+            if future.done():
+                # 待機中にキャンセルされた
+                continue
+            running = self._in_flight_by_agent.get(agent, 0)
+            if (
+                self._in_flight >= self.max_concurrency
+                or running >= self.per_agent_limit
+            ):
+                remaining.append((agent, future))
+                continue
+            self._in_flight += 1
+            self._in_flight_by_agent[agent] = running + 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+            future.set_result(None)
+        self._waiting = remaining
@@ -8,7 +8,7 @@ the same PokerGame instance without introducing a network server.
 from __future__ import annotations
 
 from typing import Optional
-from threading import Lock
+from threading import Condition, Lock
 
 try:
     # Import lazily to avoid circular imports at module import time
@@ -20,12 +20,48 @@ except Exception:
 _lock: Lock = Lock()
 _current_game: Optional["PokerGame"] = None
 
+# Monotonic version of the shared state, bumped whenever the registered game
+# reports a change (or a different game is registered). Waiters block on the
+# condition instead of polling.
+_state_changed = Condition()
+_state_version = 0
+
+
+def notify_state_changed() -> None:
+    """Bump the state version and wake up everyone waiting for a change."""
+    global _state_version
+    with _state_changed:
+        _state_version += 1
+        _state_changed.notify_all()
+
+
+def get_state_version() -> int:
+    """Return the current state version."""
+    with _state_changed:
+        return _state_version
+
+
+def wait_for_state_change(since: int, timeout: Optional[float] = None) -> int:
+    """Block until the state version differs from ``since`` or ``timeout`` passes.
+
+    Returns the current version (equal to ``since`` on timeout).
+    """
+    with _state_changed:
+        _state_changed.wait_for(lambda: _state_version != since, timeout)
+        return _state_version
+
 
 def set_current_game(game: "PokerGame") -> None:
     """Register the active PokerGame instance to be shared by other UIs."""
     global _current_game
     with _lock:
+        previous = _current_game
         _current_game = game
+    if previous is not None and previous is not game:
+        previous.remove_state_listener(notify_state_changed)
+    if game is not None:
+        game.add_state_listener(notify_state_changed)
+    notify_state_changed()
 
 
 def get_current_game() -> Optional["PokerGame"]:
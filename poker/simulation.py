@@ -0,0 +1,268 @@
+"""
+Headless high-throughput simulation runner for PokerGame
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .game import PokerGame
+from .game_models import GamePhase, GameState, create_rng
+from .player_models import Player, PlayerStatus, RandomPlayer
+
+# (player_id, initial_chips, rng) -> Player
+PlayerFactory = Callable[[int, int, Any], Player]
+# (player, game_state) -> 判断（非同期）
+DecideAsync = Callable[[Player, GameState], Awaitable[Dict[str, Any]]]
+
+
+def random_player_factory(player_id: int, initial_chips: int, rng: Any) -> Player:
+    """デフォルトのプレイヤー生成関数（RandomPlayer）"""
+    return RandomPlayer(player_id, f"CPU{player_id}", initial_chips, rng=rng)
+
+
+@dataclass
+class SimulationResult:
+    """シミュレーション結果"""
+
+    hands: int
+    games: int
+    elapsed: float
+    hands_won: Dict[int, int] = field(default_factory=dict)  # player_id -> 勝利数
+    net_chips: Dict[int, int] = field(default_factory=dict)  # player_id -> 収支
+
+    @property
+    def hands_per_second(self) -> float:
+        """1秒あたりのハンド数"""
+        return self.hands / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        data = asdict(self)
+        data["hands_per_second"] = self.hands_per_second
+        return data
+
+
+class SimulationRunner:
+    """
+    ヘッドレスモードの PokerGame を連続で回すランナー
+
+    ログ出力・待機・表示を一切行わず、ゲームが終了（1人以外全員バスト）したら
+    新しいゲームを自動で開始して指定ハンド数まで進める。
+    """
+
+    def __init__(
+        self,
+        num_players: int = 4,
+        small_blind: int = 10,
+        big_blind: int = 20,
+        initial_chips: int = 2000,
+        player_factory: Optional[PlayerFactory] = None,
+        rng: Any = None,
+        deck_buffer_size: int = 256,
+    ):
+        """
+        Args:
+            player_factory: プレイヤー生成関数（デフォルトは RandomPlayer）
+            rng: 乱数（シード / random.Random / numpy.random.Generator）。
+                全ゲーム・全プレイヤーで共有するため、同じシードなら結果を再現できる
+            deck_buffer_size: デッキの並びをまとめて生成するハンド数（0 で毎回シャッフル）
+        """
+        if not 2 <= num_players <= 10:
+            raise ValueError("num_players must be between 2 and 10")
+        self.num_players = num_players
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.initial_chips = initial_chips
+        self.player_factory = player_factory or random_player_factory
+        self.rng = create_rng(rng)
+        self.deck_buffer_size = deck_buffer_size
+        self.game: Optional[PokerGame] = None
+        self.games_played = 0
+
+    def new_game(self) -> PokerGame:
+        """ヘッドレスモードの新しいゲームを作成"""
+        game = PokerGame(
+            small_blind=self.small_blind,
+            big_blind=self.big_blind,
+            initial_chips=self.initial_chips,
+            headless=True,
+            rng=self.rng,
+            deck_buffer_size=self.deck_buffer_size,
+        )
+        for player_id in range(self.num_players):
+            game.add_player(
+                self.player_factory(player_id, self.initial_chips, self.rng)
+            )
+        # ディーラーボタンをランダムに決定
+        game.dealer_button = self.rng.randint(0, self.num_players - 1)
+        self.game = game
+        self.games_played += 1
+        return game
+
+    def play_hand(self) -> Optional[Dict[str, Any]]:
+        """
+        1ハンドを最後まで進める
+
+        Returns:
+            ショーダウン結果（ハンドを開始できなかった場合は None）
+        """
+        game = self._start_hand()
+        if game is None:
+            return None
+
+        while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            while not game.betting_round_complete:
+                player = game.players[game.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    game._advance_to_next_player()
+                    continue
+
+                decision = player.make_decision(game.get_llm_game_state(player.id))
+                self._apply_decision(game, player, decision)
+
+            if not game.advance_to_next_phase():
+                break
+
+        return self._finish_hand(game)
+
+    async def play_hand_async(
+        self, decide: Optional[DecideAsync] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        play_hand の非同期版
+
+        Args:
+            decide: 判断を返すコルーチン関数（デフォルトは player.make_decision_async）。
+                LLMRequestScheduler.decide を渡すと複数テーブルのリクエストを多重化できる
+        """
+        game = self._start_hand()
+        if game is None:
+            return None
+
+        while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            while not game.betting_round_complete:
+                player = game.players[game.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    game._advance_to_next_player()
+                    continue
+
+                game_state = game.get_llm_game_state(player.id)
+                if decide is None:
+                    decision = await player.make_decision_async(game_state)
+                else:
+                    decision = await decide(player, game_state)
+                self._apply_decision(game, player, decision)
+
+            if not game.advance_to_next_phase():
+                break
+
+        return self._finish_hand(game)
+
+    def _start_hand(self) -> Optional[PokerGame]:
+        """新しいハンドを開始（開始できなければ None）"""
+        game = self.game
+        if game is None or game.is_game_over():
+            game = self.new_game()
+
+        game.start_new_hand()
+        if game.current_phase == GamePhase.FINISHED:
+            return None
+        return game
+
+    @staticmethod
+    def _apply_decision(game: PokerGame, player: Player, decision: Dict[str, Any]):
+        """判断を適用（無効なアクションはフォールド扱い）"""
+        if not game.process_player_action(
+            player.id, decision["action"], decision.get("amount", 0)
+        ):
+            game.process_player_action(player.id, "fold", 0)
+
+    @staticmethod
+    def _finish_hand(game: PokerGame) -> Optional[Dict[str, Any]]:
+        """ショーダウンまで進んでいれば実行して結果を返す"""
+        if game.current_phase != GamePhase.SHOWDOWN:
+            return None
+        return game.conduct_showdown()
+
+    def run(self, num_hands: int) -> SimulationResult:
+        """
+        指定ハンド数をシミュレーション
+
+        Args:
+            num_hands: 実行するハンド数（ゲームをまたいで数える）
+
+        Returns:
+            SimulationResult: 勝利数・収支・処理速度
+        """
+        hands_won = {player_id: 0 for player_id in range(self.num_players)}
+        net_chips = {player_id: 0 for player_id in range(self.num_players)}
+        games_before = self.games_played
+        self.game = None
+
+        start = time.perf_counter()
+        for _ in range(num_hands):
+            if self.game is not None and self.game.is_game_over():
+                self._settle(net_chips)
+            result = self.play_hand()
+            if result:
+                for winner in result["results"]:
+                    hands_won[winner["player_id"]] += 1
+        elapsed = time.perf_counter() - start
+
+        if self.game is not None:
+            self._settle(net_chips)
+            self.game = None
+
+        return SimulationResult(
+            hands=num_hands,
+            games=self.games_played - games_before,
+            elapsed=elapsed,
+            hands_won=hands_won,
+            net_chips=net_chips,
+        )
+
+    def _settle(self, net_chips: Dict[int, int]):
+        """現在のゲームの収支を集計に加える"""
+        for player in self.game.players:
+            net_chips[player.id] += player.chips - self.initial_chips
+
+
+def benchmark(
+    num_hands: int = 20000, num_players: int = 4, seed: Optional[int] = None
+) -> SimulationResult:
+    """RandomPlayer のみのヘッドレスゲームで hands/sec を計測"""
+    return SimulationRunner(num_players=num_players, rng=seed).run(num_hands)
+
+
+def print_result(result: SimulationResult):
+    """シミュレーション結果を表示"""
+    print(
+        f"{result.hands} hands / {result.games} games in {result.elapsed:.2f}s "
+        f"({result.hands_per_second:,.0f} hands/sec)"
+    )
+    for player_id in sorted(result.hands_won):
+        print(
+            f"  Player {player_id}: won {result.hands_won[player_id]} hands, "
+            f"net {result.net_chips[player_id]:+d}"
+        )
+
+
+def main():
+    """ベンチマークのエントリポイント（python -m poker.simulation）"""
+    parser = argparse.ArgumentParser(
+        description="ヘッドレスシミュレーションのベンチマーク"
+    )
+    parser.add_argument("--hands", type=int, default=20000, help="ハンド数")
+    parser.add_argument("--players", type=int, default=4, help="プレイヤー数")
+    parser.add_argument("--seed", type=int, default=None, help="乱数シード")
+    args = parser.parse_args()
+
+    print_result(
+        benchmark(num_hands=args.hands, num_players=args.players, seed=args.seed)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,39 @@
 Lightweight HTTP JSON server exposing current PokerGame state for viewer.
 
 This avoids adding external deps (FastAPI, etc.) by using http.server.
+
+Endpoints:
+- ``GET /state``: full snapshot. With ``?since=<version>`` it long-polls and
+  only answers once the state version differs from ``since`` (or after
+  ``timeout`` seconds, default 25).
+- ``GET /state/delta?from=<version>``: only what changed since ``from`` (see
+  ``merge_state_update``); falls back to a full snapshot when ``from`` is too
+  old. Long-polls like ``/state`` when ``from`` is the current version.
+- ``GET /events``: Server-Sent Events stream pushing a full ``state`` event on
+  connect and a ``delta`` event each time the state version changes.
 """
 
 from __future__ import annotations
 
 import json
+import threading
+import uuid
+from collections import OrderedDict
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 
-from .shared_state import get_current_game
+from .shared_state import get_current_game, get_state_version, wait_for_state_change
 from .player_models import PlayerStatus, LLMApiPlayer
 
+# Upper bound for a single long-poll request (seconds)
+LONG_POLL_MAX_TIMEOUT = 60.0
+LONG_POLL_DEFAULT_TIMEOUT = 25.0
+# Idle interval after which an SSE comment is sent to detect closed clients
+SSE_KEEPALIVE_SECONDS = 15.0
+# Number of past versions kept to answer delta requests
+DELTA_HISTORY_SIZE = 64
+
 
 def _card_to_str(card) -> str:
     try:
@@ -30,39 +52,6 @@ def _build_viewer_state() -> Dict[str, Any]:
     if not game:
         return {"ready": False}
 
-    def _latest_action_for_player(player_id: int) -> Tuple[str, int]:
-        """Parse the game's action_history to find the latest action by player.
-
-        Returns (action_label, amount). action_label examples: 'fold', 'check', 'call', 'raise', 'all_in', ''.
-        """
-        history: List[str] = list(getattr(game, "action_history", []))
-        for entry in reversed(history):
-            # Expected formats
-            # 'Player {id} folded'
-            # 'Player {id} checked'
-            # 'Player {id} called {amt}'
-            # 'Player {id} raised to {amt}'
-            # 'Player {id} went all-in with {amt}'
-            try:
-                if entry.startswith(f"Player {player_id} "):
-                    rest = entry.split(" ", 2)[2]
-                    if rest.startswith("folded"):
-                        return ("fold", 0)
-                    if rest.startswith("checked"):
-                        return ("check", 0)
-                    if rest.startswith("called"):
-                        amt = int(rest.split(" ")[1])
-                        return ("call", amt)
-                    if rest.startswith("raised to"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("raise", amt)
-                    if rest.startswith("went all-in with"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("all_in", amt)
-            except Exception:
-                continue
-        return ("", 0)
-
     players: List[Dict[str, Any]] = []
     llm_api_agents: List[Dict[str, Any]] = []
     for p in game.players:
@@ -83,7 +72,8 @@ def _build_viewer_state() -> Dict[str, Any]:
 
         # Collect LLM API agent info (latest action + last reasoning)
         if isinstance(p, LLMApiPlayer):
-            action, amount = _latest_action_for_player(p.id)
+            last = game.action_log.last_action(p.id)
+            action, amount = (last.action, last.amount) if last else ("", 0)
             reasoning = getattr(p, "last_decision_reasoning", "")
             llm_api_agents.append(
                 {
@@ -95,6 +85,8 @@ def _build_viewer_state() -> Dict[str, Any]:
                 }
             )
 
+    # History and its total must come from the same moment for deltas to line up
+    history, history_total, generation = game.action_log.render_versioned()
     state: Dict[str, Any] = {
         "ready": True,
         "hand_number": game.hand_number,
@@ -105,7 +97,12 @@ def _build_viewer_state() -> Dict[str, Any]:
         "current_turn": game.current_player_index,
         "community_cards": [_card_to_str(c) for c in game.community_cards],
         "players": players,
-        "action_history": list(game.action_history),
+        "action_history": history,
+        # Number of events ever logged / kept, so clients can apply deltas
+        "action_history_total": history_total,
+        # Bumped whenever the history is cleared or replaced (new hand, restore)
+        "action_history_generation": generation,
+        "action_history_capacity": game.action_log.capacity,
         "llm_api_agents": llm_api_agents,
         # ショーダウン結果（存在する場合のみ）
         "showdown_results": getattr(game, "last_showdown_results", None),
@@ -113,26 +110,252 @@ def _build_viewer_state() -> Dict[str, Any]:
     return state
 
 
+def _diff_states(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Describe ``new`` as changes on top of ``old``.
+
+    Returns None when the two states cannot be related by a delta (no game,
+    players removed, or action history rewritten) and a full snapshot is needed.
+    """
+    if not old.get("ready") or not new.get("ready"):
+        return None
+    # A cleared or replaced history cannot be expressed as appended entries
+    if old.get("action_history_generation") != new.get("action_history_generation"):
+        return None
+    old_history = old["action_history"]
+    new_history = new["action_history"]
+    appended = new["action_history_total"] - old["action_history_total"]
+    if not 0 <= appended <= len(new_history):
+        return None
+    # Entries before the appended ones must be what the client already has
+    if appended < len(new_history) and (
+        not old_history or new_history[-appended - 1] != old_history[-1]
+    ):
+        return None
+    old_players = {p["id"]: p for p in old["players"]}
+    if any(p["id"] not in old_players for p in new["players"]) or len(
+        old_players
+    ) != len(new["players"]):
+        return None
+
+    skip = ("players", "action_history", "version")
+    return {
+        "delta": True,
+        "from": old["version"],
+        "version": new["version"],
+        "fields": {
+            key: value
+            for key, value in new.items()
+            if key not in skip and old.get(key) != value
+        },
+        "players": [p for p in new["players"] if old_players[p["id"]] != p],
+        "history_append": new_history[len(new_history) - appended :],
+    }
+
+
+def merge_state_update(
+    state: Optional[Dict[str, Any]], update: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Apply a ``/state`` snapshot or a ``/state/delta`` update to a client state.
+
+    Full snapshots replace the state; deltas are merged in place and the
+    updated state is returned. A delta that does not start at the client's
+    version cannot be applied and raises ValueError (refetch ``/state``).
+    """
+    if not update.get("delta"):
+        return update
+    if not state or state.get("version") != update["from"]:
+        raise ValueError(
+            f"delta from version {update['from']} does not match client state "
+            f"{(state or {}).get('version')}"
+        )
+    state.update(update["fields"])
+    if update["players"]:
+        changed = {p["id"]: p for p in update["players"]}
+        state["players"] = [changed.get(p["id"], p) for p in state["players"]]
+    history = state["action_history"]
+    history.extend(update["history_append"])
+    # Keep the same window as the server's ring buffer
+    del history[: max(0, len(history) - state["action_history_capacity"])]
+    state["version"] = update["version"]
+    return state
+
+
+class _SnapshotCache:
+    """Serialized viewer state, rebuilt at most once per state version.
+
+    Concurrent viewers asking for the same version share one serialization, and
+    recent states are kept so deltas between versions can be served.
+    """
+
+    def __init__(self, history_size: int = DELTA_HISTORY_SIZE):
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._body = b""
+        # version -> (id of the game, state) for recent versions
+        self._states: "OrderedDict[int, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._history_size = history_size
+        # from version -> serialized delta to the current version
+        self._deltas: Dict[int, bytes] = {}
+        # Distinguishes versions of different server processes (versions restart at 0)
+        self._etag_prefix = uuid.uuid4().hex[:8]
+
+    def _refresh(self) -> int:
+        """Rebuild the snapshot if the state version moved on (lock held)."""
+        # Read the version before building so a concurrent change is never missed
+        version = get_state_version()
+        if version != self._version:
+            game_id = id(get_current_game())
+            state = _build_viewer_state()
+            state["version"] = version
+            self._body = json.dumps(state).encode("utf-8")
+            self._version = version
+            self._deltas = {}
+            self._states[version] = (game_id, state)
+            while len(self._states) > self._history_size:
+                self._states.popitem(last=False)
+        return version
+
+    def get(self) -> Tuple[int, bytes, str]:
+        """Return (version, JSON body, ETag) for the current state."""
+        with self._lock:
+            version = self._refresh()
+            return version, self._body, self.etag(version)
+
+    def get_delta(self, since: int) -> Tuple[int, bytes, bool]:
+        """Return (version, JSON body, is_delta) describing changes after ``since``.
+
+        Falls back to the full snapshot when ``since`` is no longer retained.
+        """
+        with self._lock:
+            version = self._refresh()
+            body = self._deltas.get(since)
+            if body is not None:
+                return version, body, True
+
+            delta = None
+            if since in self._states:
+                old_game, old_state = self._states[since]
+                new_game, new_state = self._states[version]
+                if old_game == new_game:
+                    delta = _diff_states(old_state, new_state)
+            if delta is None:
+                return version, self._body, False
+            body = json.dumps(delta).encode("utf-8")
+            self._deltas[since] = body
+            return version, body, True
+
+    def etag(self, version: int) -> str:
+        return f'"{self._etag_prefix}-{version}"'
+
+
+_snapshot_cache = _SnapshotCache()
+
+
+def _query_float(query: Dict[str, List[str]], name: str) -> Optional[float]:
+    try:
+        return float(query[name][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
 class _StateHandler(BaseHTTPRequestHandler):
     def do_GET(self):  # noqa: N802 (keep stdlib signature)
         try:
-            if self.path.startswith("/state"):
-                state = _build_viewer_state()
-                body = json.dumps(state).encode("utf-8")
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json; charset=utf-8")
-                self.send_header("Content-Length", str(len(body)))
-                # Allow cross-origin for safety when opened from file or different port
-                self.send_header("Access-Control-Allow-Origin", "*")
-                self.end_headers()
-                self.wfile.write(body)
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/events":
+                self._serve_events()
+            elif url.path == "/state/delta":
+                self._serve_delta(query)
+            elif url.path.startswith("/state"):
+                self._serve_state(query)
             else:
                 self.send_response(404)
                 self.end_headers()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away (viewer closed / reconnecting)
+            return
         except Exception:
             self.send_response(500)
             self.end_headers()
 
+    def _long_poll(self, query: Dict[str, List[str]], since: Optional[float]):
+        """Wait while the client already has the current version."""
+        if since is not None and int(since) == get_state_version():
+            timeout = _query_float(query, "timeout")
+            if timeout is None:
+                timeout = LONG_POLL_DEFAULT_TIMEOUT
+            wait_for_state_change(int(since), min(timeout, LONG_POLL_MAX_TIMEOUT))
+
+    def _serve_state(self, query: Dict[str, List[str]]):
+        self._long_poll(query, _query_float(query, "since"))
+
+        version, body, etag = _snapshot_cache.get()
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("X-State-Version", str(version))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-State-Version", str(version))
+        # Allow cross-origin for safety when opened from file or different port
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_delta(self, query: Dict[str, List[str]]):
+        since = _query_float(query, "from")
+        if since is None:
+            self.send_response(400)
+            self.end_headers()
+            return
+        self._long_poll(query, since)
+
+        version, body, _ = _snapshot_cache.get_delta(int(since))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-State-Version", str(version))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        # Resume support: skip the initial push if the client is already current
+        last_event_id = self.headers.get("Last-Event-ID", "")
+        sent: Optional[int] = int(last_event_id) if last_event_id.isdigit() else None
+        while True:
+            if sent is None:
+                version, body, _ = _snapshot_cache.get()
+                is_delta = False
+            else:
+                version, body, is_delta = _snapshot_cache.get_delta(sent)
+            if version != sent:
+                event = b"delta" if is_delta else b"state"
+                self.wfile.write(
+                    b"id: %d\nevent: %s\ndata: %s\n\n" % (version, event, body)
+                )
+                self.wfile.flush()
+                sent = version
+
+            if wait_for_state_change(sent, SSE_KEEPALIVE_SECONDS) == sent:
+                self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+
     # Suppress stdlib log noise
     def log_message(self, format: str, *args):  # noqa: A003
         return
@@ -0,0 +1,483 @@
+"""
+Multi-process and concurrent multi-table tournament runners
+"""
+
+import asyncio
+import os
+import time
+import concurrent.futures as cf
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .player_models import (
+    LLMApiPlayer,
+    Player,
+    RandomPlayer,
+    close_async_http_clients,
+)
+from .scheduler import LLMRequestScheduler, SchedulerStats
+from .simulation import SimulationRunner
+
+# ラインナップで指定できるエージェント（"random" は RandomPlayer、それ以外は LLMApiPlayer）
+AVAILABLE_AGENTS = [
+    "random",
+    "team1_agent",
+    "team2_agent",
+    "team3_agent",
+    "team4_agent",
+    "beginner_agent",
+]
+
+
+def parse_lineup(lineup: str) -> List[str]:
+    """
+    "team1_agent:2,random:2" 形式の文字列を座席毎のエージェント名リストに変換
+
+    Returns:
+        List[str]: 座席順のエージェント名（2〜10人）
+    """
+    seats: List[str] = []
+    for spec in lineup.split(","):
+        spec = spec.strip()
+        if not spec:
+            continue
+        name, _, count_str = spec.partition(":")
+        name = name.strip()
+        if name not in AVAILABLE_AGENTS:
+            raise ValueError(
+                f"不明なエージェント: {name}. 利用可能: {AVAILABLE_AGENTS}"
+            )
+        try:
+            count = int(count_str) if count_str.strip() else 1
+        except ValueError:
+            raise ValueError(f"無効なプレイヤー数: {count_str}")
+        if count <= 0:
+            raise ValueError(f"プレイヤー数は1以上である必要があります: {count}")
+        seats.extend([name] * count)
+
+    if len(seats) < 2:
+        raise ValueError("最低2人のプレイヤーが必要です")
+    if len(seats) > 10:
+        raise ValueError("最大10人のプレイヤーまでサポートされます")
+    return seats
+
+
+def create_agent_player(
+    agent: str,
+    player_id: int,
+    initial_chips: int,
+    url: str = "http://localhost:8000",
+    rng: Any = None,
+) -> Player:
+    """エージェント名からプレイヤーを作成"""
+    if agent == "random":
+        return RandomPlayer(player_id, f"CPU{player_id}", initial_chips, rng=rng)
+    return LLMApiPlayer(
+        player_id=player_id,
+        name=f"Agent{player_id}",
+        app_name=agent,
+        user_id=f"player_{player_id}",
+        url=url,
+        initial_chips=initial_chips,
+    )
+
+
+@dataclass
+class TableResult:
+    """1テーブル分の結果（リストはすべて座席順）"""
+
+    table_index: int
+    seed: int
+    lineup: List[str]
+    hands: int
+    games: int
+    hands_played: List[int]
+    hands_won: List[int]
+    net_chips: List[int]
+    bust_orders: List[List[int]]  # ゲーム毎にバストした座席（早い順）
+    elapsed: float
+
+
+@dataclass
+class AgentStats:
+    """エージェント毎の集計"""
+
+    agent: str
+    seats: int = 0
+    hands_played: int = 0
+    hands_won: int = 0
+    total_winnings: int = 0
+    busts: int = 0
+    # バストした順位（1 = そのゲームで最初にバスト）
+    bust_positions: List[int] = field(default_factory=list)
+    bb_per_100: float = 0.0
+
+    @property
+    def average_bust_position(self) -> Optional[float]:
+        """平均バスト順位（一度もバストしていなければ None）"""
+        if not self.bust_positions:
+            return None
+        return sum(self.bust_positions) / len(self.bust_positions)
+
+
+@dataclass
+class TournamentResult:
+    """トーナメント全体の結果"""
+
+    tables: List[TableResult]
+    agents: Dict[str, AgentStats]
+    big_blind: int
+    elapsed: float
+    # run_concurrent_tables の場合のみ
+    scheduler: Optional[SchedulerStats] = None
+
+    @property
+    def total_hands(self) -> int:
+        """全テーブルの合計ハンド数"""
+        return sum(table.hands for table in self.tables)
+
+    @property
+    def hands_per_second(self) -> float:
+        """1秒あたりのハンド数（全ワーカー合計）"""
+        return self.total_hands / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        data = asdict(self)
+        data["total_hands"] = self.total_hands
+        data["hands_per_second"] = self.hands_per_second
+        return data
+
+
+class _TableTracker:
+    """1テーブル分の集計（play_table / play_table_async で共有）"""
+
+    def __init__(self, runner: SimulationRunner, num_seats: int, initial_chips: int):
+        self.runner = runner
+        self.initial_chips = initial_chips
+        self.hands_played = [0] * num_seats
+        self.hands_won = [0] * num_seats
+        self.net_chips = [0] * num_seats
+        self.bust_orders: List[List[int]] = []
+        self.game = None
+
+    def before_hand(self):
+        """ゲームが終わっていれば同じ座席で新しいゲームを始め、参加ハンド数を数える"""
+        if self.game is None or self.game.is_game_over():
+            if self.game is not None:
+                self._settle()
+            self.game = self.runner.new_game()
+            self.bust_orders.append([])
+
+        for player in self.game.players:
+            if player.chips > 0:
+                self.hands_played[player.id] += 1
+
+    def after_hand(self, result: Optional[Dict[str, Any]]):
+        """勝者とバストしたプレイヤーを記録"""
+        if result:
+            for winner in result["results"]:
+                self.hands_won[winner["player_id"]] += 1
+
+        for player in self.game.players:
+            if player.chips <= 0 and player.id not in self.bust_orders[-1]:
+                self.bust_orders[-1].append(player.id)
+
+    def _settle(self):
+        for player in self.game.players:
+            self.net_chips[player.id] += player.chips - self.initial_chips
+
+    def to_result(
+        self,
+        table_index: int,
+        seed: int,
+        lineup: List[str],
+        hands: int,
+        elapsed: float,
+    ) -> TableResult:
+        """最後のゲームの収支を加えて TableResult を作成"""
+        if self.game is not None:
+            self._settle()
+            self.game = None
+        return TableResult(
+            table_index=table_index,
+            seed=seed,
+            lineup=lineup,
+            hands=hands,
+            games=len(self.bust_orders),
+            hands_played=self.hands_played,
+            hands_won=self.hands_won,
+            net_chips=self.net_chips,
+            bust_orders=self.bust_orders,
+            elapsed=elapsed,
+        )
+
+
+def _create_table(
+    lineup: List[str],
+    seed: int,
+    small_blind: int,
+    big_blind: int,
+    initial_chips: int,
+    url: str,
+) -> _TableTracker:
+    runner = SimulationRunner(
+        num_players=len(lineup),
+        small_blind=small_blind,
+        big_blind=big_blind,
+        initial_chips=initial_chips,
+        player_factory=lambda player_id, chips, rng: create_agent_player(
+            lineup[player_id], player_id, chips, url, rng
+        ),
+        rng=seed,
+    )
+    return _TableTracker(runner, len(lineup), initial_chips)
+
+
+def play_table(
+    table_index: int,
+    lineup: Sequence[str],
+    num_hands: int,
+    seed: int,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    url: str = "http://localhost:8000",
+) -> TableResult:
+    """
+    1テーブルで num_hands ハンドを実行
+
+    1人を残して全員がバストしたら、同じ座席で新しいゲームを始めて続行する。
+    ワーカープロセスから呼ばれるためモジュールトップレベルに置く。
+    """
+    lineup = list(lineup)
+    table = _create_table(lineup, seed, small_blind, big_blind, initial_chips, url)
+
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        table.before_hand()
+        table.after_hand(table.runner.play_hand())
+    elapsed = time.perf_counter() - start
+
+    return table.to_result(table_index, seed, lineup, num_hands, elapsed)
+
+
+async def play_table_async(
+    table_index: int,
+    lineup: Sequence[str],
+    num_hands: int,
+    seed: int,
+    scheduler: LLMRequestScheduler,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    url: str = "http://localhost:8000",
+) -> TableResult:
+    """play_table の非同期版（判断は scheduler 経由で実行）"""
+    lineup = list(lineup)
+    table = _create_table(lineup, seed, small_blind, big_blind, initial_chips, url)
+
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        table.before_hand()
+        table.after_hand(await table.runner.play_hand_async(scheduler.decide))
+    elapsed = time.perf_counter() - start
+
+    return table.to_result(table_index, seed, lineup, num_hands, elapsed)
+
+
+def aggregate_results(
+    tables: List[TableResult], big_blind: int
+) -> Dict[str, AgentStats]:
+    """テーブル結果をエージェント毎に集計"""
+    agents: Dict[str, AgentStats] = {}
+    for table in tables:
+        for seat, agent in enumerate(table.lineup):
+            stats = agents.setdefault(agent, AgentStats(agent=agent))
+            stats.seats += 1
+            stats.hands_played += table.hands_played[seat]
+            stats.hands_won += table.hands_won[seat]
+            stats.total_winnings += table.net_chips[seat]
+            for bust_order in table.bust_orders:
+                if seat in bust_order:
+                    stats.busts += 1
+                    stats.bust_positions.append(bust_order.index(seat) + 1)
+
+    for stats in agents.values():
+        if stats.hands_played:
+            stats.bb_per_100 = (
+                stats.total_winnings / big_blind / stats.hands_played * 100
+            )
+    return agents
+
+
+def _plan_tables(
+    lineup: str, num_tables: int, seed: Optional[int]
+) -> List[Tuple[int, List[str], int]]:
+    """テーブル毎の (テーブル番号, 座席順のラインナップ, シード) を作成"""
+    seats = parse_lineup(lineup)
+    if num_tables <= 0:
+        raise ValueError("num_tables must be positive")
+
+    table_seeds = [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(num_tables)
+    ]
+    return [
+        (
+            index,
+            # テーブル毎に座席をローテーション
+            seats[index % len(seats) :] + seats[: index % len(seats)],
+            table_seeds[index],
+        )
+        for index in range(num_tables)
+    ]
+
+
+def run_tournament(
+    lineup: str = "random:4",
+    num_tables: int = 8,
+    hands_per_table: int = 1000,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    url: str = "http://localhost:8000",
+) -> TournamentResult:
+    """
+    独立した複数テーブルをプロセスプールに分散して実行し、エージェント毎に集計
+
+    Args:
+        lineup: "team1_agent:2,random:2" 形式のラインナップ
+        num_tables: テーブル数（テーブル毎に座席をずらしてポジションの偏りを減らす）
+        hands_per_table: 1テーブルあたりのハンド数
+        workers: ワーカープロセス数（None ならCPUコア数、1 なら同一プロセスで実行）
+        seed: 全体のシード（テーブル毎のシードはここから派生させる）
+
+    Returns:
+        TournamentResult: テーブル毎の結果とエージェント毎の集計
+    """
+    tasks = [
+        (index, seats, hands_per_table, table_seed)
+        + (small_blind, big_blind, initial_chips, url)
+        for index, seats, table_seed in _plan_tables(lineup, num_tables, seed)
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, num_tables)
+    start = time.perf_counter()
+    if workers <= 1:
+        tables = [play_table(*task) for task in tasks]
+    else:
+        with cf.ProcessPoolExecutor(max_workers=workers) as executor:
+            tables = list(executor.map(play_table, *zip(*tasks)))
+    elapsed = time.perf_counter() - start
+
+    return TournamentResult(
+        tables=tables,
+        agents=aggregate_results(tables, big_blind),
+        big_blind=big_blind,
+        elapsed=elapsed,
+    )
+
+
+async def run_concurrent_tables_async(
+    lineup: str = "team1_agent:2,team2_agent:2",
+    num_tables: int = 4,
+    hands_per_table: int = 20,
+    seed: Optional[int] = None,
+    max_concurrency: int = 32,
+    per_agent_limit: int = 4,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    initial_chips: int = 2000,
+    url: str = "http://localhost:8000",
+) -> TournamentResult:
+    """
+    複数テーブルを1つのイベントループ上で同時に進行し、エージェント毎に集計
+
+    各テーブルは判断待ちの間に他のテーブルへ処理を譲るため、LLM の応答時間が
+    長くても全体のハンド数はテーブル数に比例して伸びる。
+    全テーブルの LLM リクエストは LLMRequestScheduler でまとめて同時実行数を制御する。
+
+    Args:
+        lineup: "team1_agent:2,random:2" 形式のラインナップ
+        num_tables: 同時に進行するテーブル数
+        hands_per_table: 1テーブルあたりのハンド数
+        seed: 全体のシード（テーブル毎のシードはここから派生させる）
+        max_concurrency: エージェントサーバーへの同時リクエスト数の上限
+        per_agent_limit: エージェント毎の同時リクエスト数の上限
+
+    Returns:
+        TournamentResult: テーブル毎の結果・エージェント毎の集計・スケジューラの統計
+    """
+    plans = _plan_tables(lineup, num_tables, seed)
+    scheduler = LLMRequestScheduler(
+        max_concurrency=max_concurrency, per_agent_limit=per_agent_limit
+    )
+
+    start = time.perf_counter()
+    try:
+        tables = await asyncio.gather(
+            *(
+                play_table_async(
+                    index,
+                    seats,
+                    hands_per_table,
+                    table_seed,
+                    scheduler,
+                    small_blind,
+                    big_blind,
+                    initial_chips,
+                    url,
+                )
+                for index, seats, table_seed in plans
+            )
+        )
+    finally:
+        await close_async_http_clients()
+    elapsed = time.perf_counter() - start
+
+    return TournamentResult(
+        tables=list(tables),
+        agents=aggregate_results(list(tables), big_blind),
+        big_blind=big_blind,
+        elapsed=elapsed,
+        scheduler=scheduler.stats,
+    )
+
+
+def run_concurrent_tables(**kwargs: Any) -> TournamentResult:
+    """run_concurrent_tables_async を新しいイベントループで実行"""
+    return asyncio.run(run_concurrent_tables_async(**kwargs))
+
+
+def print_tournament_result(result: TournamentResult):
+    """トーナメント結果を表示"""
+    print(f"\n{'='*70}")
+    print(
+        f"トーナメント完了 - {len(result.tables)}テーブル / {result.total_hands}ハンド "
+        f"({result.elapsed:.1f}秒, {result.hands_per_second:,.0f} hands/sec)"
+    )
+    print(f"{'='*70}")
+
+    ranking = sorted(
+        result.agents.values(), key=lambda stats: stats.bb_per_100, reverse=True
+    )
+    for i, stats in enumerate(ranking):
+        bust = stats.average_bust_position
+        bust_str = f"{bust:.2f}" if bust is not None else "-"
+        print(
+            f"{i+1}位 {stats.agent:>15s}: {stats.bb_per_100:+8.2f} bb/100 "
+            f"| 収支: {stats.total_winnings:+7d} "
+            f"| 勝利: {stats.hands_won}/{stats.hands_played} "
+            f"| バスト: {stats.busts}回 (平均順位 {bust_str})"
+        )
+    if result.scheduler is not None and result.scheduler.requests:
+        print(
+            f"\nLLMリクエスト: {result.scheduler.requests}件 "
+            f"(最大同時実行 {result.scheduler.max_in_flight}, "
+            f"平均待ち {result.scheduler.average_wait:.2f}秒)"
+        )
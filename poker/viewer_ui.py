@@ -2,7 +2,7 @@
 Spectator (viewer) UI for ADK Poker.
 
 This UI displays the full table status with all players' hole cards face-up.
-It is read-only and periodically polls the shared game state.
+It is read-only and receives the shared game state pushed over Server-Sent Events.
 """
 
 from __future__ import annotations
@@ -11,10 +11,13 @@ import asyncio
 import math
 from typing import List, Optional
 import flet as ft
+import httpx
+import json
 import os
-import requests
 import re
 
+from .state_server import merge_state_update
+
 
 class PokerViewerUI:
     def __init__(self):
@@ -25,6 +28,10 @@ class PokerViewerUI:
         self.state_url = os.environ.get(
             "ADK_POKER_STATE_URL", "http://127.0.0.1:8765/state"
         )
+        # State changes are pushed over SSE instead of being polled
+        self.events_url = os.environ.get(
+            "ADK_POKER_EVENTS_URL", self.state_url.replace("/state", "/events")
+        )
         self._last_state: Optional[dict] = None
 
         # Root controls
@@ -984,7 +991,10 @@ class PokerViewerUI:
         }
         return names.get(phase_value, "不明")
 
-    def update_display(self):
+    def update_display(self, update: Optional[dict] = None):
+        if update is not None:
+            # Full snapshot or delta pushed by the state server
+            self._last_state = merge_state_update(self._last_state, update)
         state = self._last_state
         if not state or not state.get("ready"):
             self.game_info_text.value = (
@@ -1160,24 +1170,41 @@ class PokerViewerUI:
         self._showdown_results_column.controls.clear()
         self.showdown_overlay_container.visible = False
 
-    async def _poll_loop(self):
+    async def _event_loop(self):
+        last_event_id: Optional[str] = None
         while True:
+            headers = {"Accept": "text/event-stream"}
+            if last_event_id is not None:
+                headers["Last-Event-ID"] = last_event_id
             try:
-                # Fetch state from HTTP server hosted by main process
+                # Server sends a keepalive comment every 15s, so a longer read
+                # timeout means the connection is dead
+                timeout = httpx.Timeout(5.0, read=30.0)
+                async with httpx.AsyncClient(timeout=timeout) as client:
+                    async with client.stream(
+                        "GET", self.events_url, headers=headers
+                    ) as resp:
+                        resp.raise_for_status()
+                        data_lines: List[str] = []
+                        async for line in resp.aiter_lines():
+                            if line.startswith("id:"):
+                                last_event_id = line[3:].strip()
+                            elif line.startswith("data:"):
+                                data_lines.append(line[5:].lstrip())
+                            elif not line and data_lines:
+                                # Blank line terminates one event
+                                update = json.loads("\n".join(data_lines))
+                                data_lines = []
+                                self.update_display(update)
+            except Exception:
+                # Main process not running yet / restarted: show waiting and retry
+                last_event_id = None
+                self._last_state = {"ready": False}
                 try:
-                    resp = requests.get(self.state_url, timeout=1.0)
-                    if resp.ok:
-                        self._last_state = resp.json()
-                    else:
-                        self._last_state = {"ready": False}
+                    self.update_display()
                 except Exception:
-                    self._last_state = {"ready": False}
-
-                self.update_display()
-                await asyncio.sleep(0.5)
-            except Exception:
-                # Avoid breaking the loop on transient errors
-                await asyncio.sleep(0.5)
+                    pass
+            await asyncio.sleep(1.0)
 
     # --- Flet entry ------------------------------------------------------
     def main(self, page: ft.Page):
@@ -1194,7 +1221,7 @@ class PokerViewerUI:
         page.update()
 
         # Start polling JSON state periodically
-        page.run_task(self._poll_loop)
+        page.run_task(self._event_loop)
 
 
 def run_flet_viewer_app(port: int = 8552):
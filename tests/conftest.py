@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the tests
+"""
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+TEAM4_TOOLS_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "agents", "team4_agent", "tools"
+)
+
+
+def load_team4_tool(name: str):
+    """
+    team4 のツールを単体で読み込む
+
+    agents.team4_agent を import すると ADK のエージェント定義まで読み込まれるので、
+    tools ディレクトリだけをパッケージとして登録する。
+    """
+    if "team4_tools" not in sys.modules:
+        package = types.ModuleType("team4_tools")
+        package.__path__ = [TEAM4_TOOLS_DIR]
+        sys.modules["team4_tools"] = package
+    return importlib.import_module(f"team4_tools.{name}")
+
+
+@pytest.fixture
+def team4_tool():
+    """team4 のツールのモジュールを名前で読み込む関数"""
+    return load_team4_tool
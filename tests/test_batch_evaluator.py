@@ -0,0 +1,95 @@
+"""
+Tests for poker.batch_evaluator module
+"""
+
+import numpy as np
+import pytest
+from poker.game_models import Card, Suit
+from poker.evaluator import HandEvaluator, HandRank
+from poker import batch_evaluator, fast_evaluator
+
+
+def _random_deals(num_hands: int, num_cards: int, seed: int = 0) -> np.ndarray:
+    """重複のないカードIDを各行 num_cards 枚ずつ引いた配列"""
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((num_hands, 52)), axis=1)[:, :num_cards]
+
+
+class TestBatchEvaluator:
+    """NumPy一括評価器のテスト"""
+
+    def test_matches_fast_evaluator(self):
+        """一括評価が1ハンドずつの評価と完全に一致することを確認"""
+        deals = _random_deals(20000, 7)
+        strengths = HandEvaluator.evaluate_batch(deals[:, :2], deals[:, 2:])
+
+        expected = [
+            fast_evaluator.evaluate_cards(Card.from_id(int(c)) for c in row)
+            for row in deals
+        ]
+        assert strengths.tolist() == expected
+
+    def test_padded_board(self):
+        """-1 で埋めたターン時点のボード（6枚評価）のテスト"""
+        deals = _random_deals(2000, 6, seed=1)
+        board = np.concatenate([deals[:, 2:], np.full((len(deals), 1), -1)], axis=1)
+        strengths = batch_evaluator.evaluate_batch(deals[:, :2], board)
+
+        expected = [
+            fast_evaluator.evaluate_cards(Card.from_id(int(c)) for c in row)
+            for row in deals
+        ]
+        assert strengths.tolist() == expected
+
+    def test_evaluate_masks(self):
+        """スート毎のマスクから直接評価しても evaluate_array と一致することを確認"""
+        deals = _random_deals(2000, 7, seed=3)
+        masks = np.zeros((len(deals), 4), dtype=np.int64)
+        for row, cards in enumerate(deals):
+            for card_id in cards:
+                masks[row, card_id // 13] |= 1 << (card_id % 13)
+
+        assert (
+            batch_evaluator.evaluate_masks(masks).tolist()
+            == batch_evaluator.evaluate_array(deals).tolist()
+        )
+
+    def test_shared_board(self):
+        """全行共通のボードを1次元で渡すテスト"""
+        board = [Card(rank, Suit.SPADES) for rank in (10, 11, 12, 13)]
+        board.append(Card(2, Suit.HEARTS))
+        hole = batch_evaluator.cards_to_array(
+            [
+                [Card(14, Suit.SPADES), Card(3, Suit.CLUBS)],
+                [Card(9, Suit.SPADES), Card(3, Suit.DIAMONDS)],
+                [Card(2, Suit.CLUBS), Card(2, Suit.DIAMONDS)],
+            ]
+        )
+        strengths = HandEvaluator.evaluate_batch(hole, [card.id for card in board])
+        categories = batch_evaluator.strengths_to_categories(strengths)
+
+        assert categories.tolist() == [
+            HandRank.ROYAL_FLUSH.value,
+            HandRank.STRAIGHT_FLUSH.value,
+            HandRank.THREE_OF_A_KIND.value,
+        ]
+
+    def test_compare_batch(self):
+        """一括比較が compare_hands と一致することを確認"""
+        deals = _random_deals(3000, 9, seed=2)
+        outcome = HandEvaluator.compare_batch(deals[:, :2], deals[:, 2:4], deals[:, 4:])
+
+        for row, result in zip(deals, outcome):
+            cards = [Card.from_id(int(c)) for c in row]
+            hand1 = HandEvaluator.evaluate_hand(cards[:2], cards[4:])
+            hand2 = HandEvaluator.evaluate_hand(cards[2:4], cards[4:])
+            assert result == HandEvaluator.compare_hands(hand1, hand2)
+
+    def test_array_round_trip(self):
+        """Card のリストとID配列の相互変換テスト"""
+        hands = [[Card(14, Suit.SPADES)], [Card(2, Suit.HEARTS), Card(3, Suit.CLUBS)]]
+        array = batch_evaluator.cards_to_array(hands)
+
+        assert array.shape == (2, 2)
+        assert array[0, 1] == -1
+        assert batch_evaluator.array_to_cards(array) == hands
@@ -0,0 +1,192 @@
+"""
+Tests for poker.canonical module
+"""
+
+import random
+from itertools import permutations
+
+import pytest
+from poker.game_models import ALL_CARDS, Card
+from poker.canonical import (
+    CanonicalCache,
+    canonical_key,
+    canonicalize,
+    invert_suit_map,
+    relabel,
+)
+from poker.equity import EQUITY_CACHE_NAMESPACE, calculate_equity
+
+
+def _cards(texts):
+    return [Card.from_str(text) for text in texts]
+
+
+class TestCanonicalKey:
+    """正規化キーのテスト"""
+
+    def test_invariant_under_suit_permutation(self):
+        """24通りのスートの入れ替えすべてで同じキーになる"""
+        hole = _cards(["A♠", "K♠"])
+        board = _cards(["Q♠", "7♥", "2♦"])
+        key = canonical_key(hole, board)
+
+        for perm in permutations(range(4)):
+            assert canonical_key(relabel(hole, perm), relabel(board, perm)) == key
+
+    def test_independent_of_card_order(self):
+        """カードの並び順や表現（文字列/ID）によらない"""
+        key = canonical_key(["A♠", "K♠"], ["Q♠", "7♥", "2♦"])
+
+        assert canonical_key(["K♠", "A♠"], ["2♦", "Q♠", "7♥"]) == key
+        assert (
+            canonical_key(
+                _cards(["A♠", "K♠"]), [c.id for c in _cards(["Q♠", "7♥", "2♦"])]
+            )
+            == key
+        )
+
+    def test_distinguishes_suitedness(self):
+        """スーテッドとオフスートは別のキー"""
+        assert canonical_key(["A♠", "K♠"]) != canonical_key(["A♠", "K♥"])
+        assert canonical_key(["A♠", "K♥"]) == canonical_key(["A♦", "K♣"])
+
+    def test_distinguishes_hole_from_board(self):
+        """同じカードでも手札とボードの分け方が違えば別のキー"""
+        assert canonical_key(["A♠", "K♠"], ["Q♠"]) != canonical_key(
+            ["A♠", "Q♠"], ["K♠"]
+        )
+
+    def test_preflop_class_count(self):
+        """手札2枚は169通りのクラスに分かれる"""
+        keys = {
+            canonical_key([a, b])
+            for i, a in enumerate(ALL_CARDS)
+            for b in ALL_CARDS[i + 1 :]
+        }
+        assert len(keys) == 169
+
+    def test_flop_class_count(self):
+        """フロップ（3枚）は1755通りのクラスに分かれる"""
+        keys = set()
+        for i, a in enumerate(ALL_CARDS):
+            for j in range(i + 1, 52):
+                for k in range(j + 1, 52):
+                    keys.add(canonical_key([], [a, ALL_CARDS[j], ALL_CARDS[k]]))
+        assert len(keys) == 1755
+
+
+class TestCanonicalize:
+    """正規形の代表への変換のテスト"""
+
+    def test_representative_has_same_key(self):
+        """代表は元と同じキーを持ち、同じクラスなら同じ代表になる"""
+        rng = random.Random(0)
+        for _ in range(50):
+            cards = rng.sample(ALL_CARDS, 7)
+            hole, board = cards[:2], cards[2:]
+            canon_hole, canon_board, _ = canonicalize(hole, board)
+            perm = list(range(4))
+            rng.shuffle(perm)
+            other_hole, other_board, _ = canonicalize(
+                relabel(hole, perm), relabel(board, perm)
+            )
+
+            assert canonical_key(canon_hole, canon_board) == canonical_key(hole, board)
+            assert {c.id for c in canon_hole} == {c.id for c in other_hole}
+            assert {c.id for c in canon_board} == {c.id for c in other_board}
+
+    def test_inverse_map_restores_cards(self):
+        """逆写像で代表のカードを元のスートに戻せる"""
+        hole = _cards(["9♦", "8♦"])
+        board = _cards(["7♦", "2♣", "K♥"])
+        canon_hole, canon_board, suit_map = canonicalize(hole, board)
+
+        inverse = invert_suit_map(suit_map)
+        assert relabel(canon_hole, inverse) == hole
+        assert relabel(canon_board, inverse) == board
+
+
+class TestCanonicalCache:
+    """正規化キーで結果を共有するキャッシュのテスト"""
+
+    def test_get_or_compute(self):
+        """2回目以降は計算せずにキャッシュを返す"""
+        cache = CanonicalCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 0.5
+
+        key = canonical_key(["A♠", "K♠"])
+        assert cache.get_or_compute("test", key, compute) == 0.5
+        assert cache.get_or_compute("test", canonical_key(["A♥", "K♥"]), compute) == 0.5
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_namespaces_are_separate(self):
+        """名前空間が違えば同じキーでも別の結果"""
+        cache = CanonicalCache()
+        cache.put("a", (1, 2, 3, 4), 1)
+
+        assert cache.get("b", (1, 2, 3, 4)) is None
+
+    def test_lru_eviction(self):
+        """上限を超えると最も古く使われた結果から捨てる"""
+        cache = CanonicalCache(maxsize=2)
+        cache.put("n", 1, "one")
+        cache.put("n", 2, "two")
+        cache.get("n", 1)
+        cache.put("n", 3, "three")
+
+        assert len(cache) == 2
+        assert cache.get("n", 1) == "one"
+        assert cache.get("n", 2) is None
+
+    def test_disk_backed_cache_is_shared(self, tmp_path):
+        """ディスクに保存した結果は別のキャッシュ（別プロセス）からも読める"""
+        path = str(tmp_path / "canonical.sqlite")
+        key = canonical_key(["A♠", "K♠"], ["Q♠", "7♥", "2♦"])
+        writer = CanonicalCache(path=path)
+        writer.put("test", key, {"equity": 0.75})
+        writer.close()
+
+        reader = CanonicalCache(path=path)
+        assert reader.get("test", key) == {"equity": 0.75}
+        reader.close()
+
+
+class TestEquityCache:
+    """calculate_equity のキャッシュ連携のテスト"""
+
+    def test_isomorphic_spot_hits_cache(self):
+        """スートを入れ替えた状況はキャッシュの結果を返す"""
+        cache = CanonicalCache()
+        first = calculate_equity(
+            ["A♠", "K♠"], ["Q♠", "J♥", "2♦", "3♣"], mode="exact", cache=cache
+        )
+        second = calculate_equity(
+            ["A♥", "K♥"], ["Q♥", "J♠", "2♣", "3♦"], mode="exact", cache=cache
+        )
+
+        assert cache.hits == 1
+        assert second.equity == pytest.approx(first.equity)
+        assert second.samples == first.samples
+        assert len(cache) == 1
+        assert cache.get(
+            EQUITY_CACHE_NAMESPACE,
+            (canonical_key(["A♠", "K♠"], ["Q♠", "J♥", "2♦", "3♣"], []), 1),
+        )
+
+    def test_ranges_are_not_cached(self):
+        """相手のレンジを指定した計算はキャッシュしない"""
+        cache = CanonicalCache()
+        calculate_equity(
+            ["A♠", "K♠"],
+            ["Q♠", "J♥", "2♦", "3♣", "4♣"],
+            opponent_ranges=[[("Q♥", "Q♦")]],
+            mode="exact",
+            cache=cache,
+        )
+
+        assert len(cache) == 0
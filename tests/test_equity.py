@@ -0,0 +1,107 @@
+"""
+Tests for poker.equity module
+"""
+
+import pytest
+from poker.game_models import Card, Suit
+from poker.equity import EquityResult, calculate_equity
+
+KINGS = [
+    ("K♠", "K♥"),
+    ("K♠", "K♦"),
+    ("K♠", "K♣"),
+    ("K♥", "K♦"),
+    ("K♥", "K♣"),
+    ("K♦", "K♣"),
+]
+
+
+class TestCalculateEquity:
+    """エクイティ計算のテスト"""
+
+    def test_river_exact_nuts(self):
+        """リバーでナッツを持っている場合は必ず勝つ"""
+        result = calculate_equity(["A♠", "K♠"], ["Q♠", "J♠", "10♠", "2♦", "3♣"])
+
+        assert isinstance(result, EquityResult)
+        assert result.exact is True
+        assert result.samples == 990  # C(45, 2)
+        assert result.win == pytest.approx(1.0)
+        assert result.equity == pytest.approx(1.0)
+
+    def test_board_plays_is_tie(self):
+        """ボードのロイヤルフラッシュは全員引き分け"""
+        board = ["A♠", "K♠", "Q♠", "J♠", "10♠"]
+        result = calculate_equity(["2♦", "3♣"], board)
+
+        assert result.exact is True
+        assert result.tie == pytest.approx(1.0)
+        assert result.equity == pytest.approx(0.5)
+
+        sampled = calculate_equity(["2♦", "3♣"], board, num_opponents=2, seed=0)
+        assert sampled.exact is False
+        assert sampled.equity == pytest.approx(1.0 / 3)
+
+    def test_turn_exact_matches_monte_carlo(self):
+        """ターンの完全列挙とモンテカルロの結果が誤差内で一致する"""
+        hole = [Card(14, Suit.SPADES), Card(13, Suit.SPADES)]
+        board = ["Q♠", "J♠", "2♦", "3♣"]
+        exact = calculate_equity(hole, board)
+        sampled = calculate_equity(
+            hole,
+            board,
+            mode="monte_carlo",
+            target_std_error=0.003,
+            time_budget=5.0,
+            seed=1,
+        )
+
+        assert exact.exact is True
+        assert exact.win + exact.tie + exact.lose == pytest.approx(1.0)
+        assert sampled.exact is False
+        assert abs(sampled.equity - exact.equity) < 5 * sampled.std_error + 1e-3
+
+    def test_range_opponent_preflop(self):
+        """AA 対 KK のプリフロップエクイティは約82%"""
+        result = calculate_equity(
+            ["A♠", "A♥"],
+            opponent_ranges=[KINGS],
+            target_std_error=0.003,
+            time_budget=5.0,
+            seed=0,
+        )
+
+        assert result.equity == pytest.approx(0.82, abs=0.015)
+
+    def test_range_with_weights_and_dead_cards(self):
+        """重み付きレンジとデッドカードの除外のテスト"""
+        board = ["2♦", "7♣", "9♥", "J♦", "3♠"]
+        # K♠ を含む組はデッドカードとして除外される
+        weights = {combo: 1.0 for combo in KINGS}
+        result = calculate_equity(
+            ["A♠", "A♥"], board, opponent_ranges=[weights], dead_cards=["K♠"]
+        )
+
+        assert result.exact is True
+        assert result.samples == 3
+        assert result.win == pytest.approx(1.0)
+
+    def test_seed_is_reproducible(self):
+        """同じシードなら同じ結果になる"""
+        kwargs = dict(num_opponents=3, mode="monte_carlo", max_samples=5000, seed=7)
+        first = calculate_equity(["9♥", "9♦"], **kwargs)
+        second = calculate_equity(["9♥", "9♦"], **kwargs)
+
+        assert first.equity == second.equity
+        assert first.samples == second.samples == 5000
+
+    def test_invalid_inputs(self):
+        """不正な入力のテスト"""
+        with pytest.raises(ValueError):
+            calculate_equity(["A♠"])
+        with pytest.raises(ValueError):
+            calculate_equity(["A♠", "A♠"])
+        with pytest.raises(ValueError):
+            calculate_equity(["A♠", "K♠"], ["2♦", "3♦"])
+        with pytest.raises(ValueError):
+            calculate_equity(["A♠", "K♠"], mode="unknown")
@@ -202,6 +202,23 @@ class TestHandEvaluator:
         assert result.kickers == [14]
         assert "Straight" in result.description
 
+    def test_straight_flush_ace_low(self):
+        """A-5ストレートフラッシュがロイヤルフラッシュと判定されないことのテスト"""
+        hole_cards = [Card(14, Suit.HEARTS), Card(2, Suit.HEARTS)]
+        community_cards = [
+            Card(3, Suit.HEARTS),
+            Card(4, Suit.HEARTS),
+            Card(5, Suit.HEARTS),
+            Card(13, Suit.CLUBS),
+            Card(9, Suit.SPADES),
+        ]
+
+        result = HandEvaluator.evaluate_hand(hole_cards, community_cards)
+
+        assert result.rank == HandRank.STRAIGHT_FLUSH
+        assert result.kickers == [5]
+        assert len(result.cards) == 5
+
     def test_straight_ace_low(self):
         """A-5ストレートのテスト"""
         hole_cards = [Card(14, Suit.SPADES), Card(5, Suit.HEARTS)]
@@ -0,0 +1,105 @@
+"""
+Tests for poker.fast_evaluator module
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+from poker.game_models import Card, Suit, cards_to_mask
+from poker.evaluator import HandEvaluator, HandRank
+from poker import fast_evaluator
+
+
+def _legacy_best(cards):
+    """21通りの5枚組を総当たりで評価する旧実装（比較用）"""
+    best = None
+    for five_cards in combinations(cards, 5):
+        result = HandEvaluator._evaluate_five_cards(list(five_cards))
+        if best is None or HandEvaluator.compare_hands(result, best) > 0:
+            best = result
+    return best
+
+
+class TestFastEvaluator:
+    """テーブル駆動評価器のテスト"""
+
+    def test_cards_to_mask_unique_bits(self):
+        """52枚のカードがそれぞれ異なるビットに割り当てられることを確認"""
+        deck = [Card(rank, suit) for suit in Suit for rank in range(2, 15)]
+        ids = {fast_evaluator.card_to_id(card) for card in deck}
+        assert ids == set(range(52))
+        assert cards_to_mask(deck) == (1 << 52) - 1
+
+    def test_royal_flush(self):
+        """ロイヤルフラッシュの強さのテスト"""
+        cards = [Card(rank, Suit.SPADES) for rank in range(10, 15)]
+        strength = fast_evaluator.evaluate_cards(cards)
+
+        assert fast_evaluator.strength_category(strength) == HandRank.ROYAL_FLUSH.value
+        assert fast_evaluator.strength_kickers(strength) == [14]
+
+    def test_wheel_straight_flush_is_not_royal(self):
+        """A-5のストレートフラッシュは5ハイのストレートフラッシュ"""
+        cards = [Card(rank, Suit.HEARTS) for rank in (14, 2, 3, 4, 5)]
+        cards += [Card(11, Suit.HEARTS), Card(9, Suit.CLUBS)]
+        strength = fast_evaluator.evaluate_cards(cards)
+
+        assert (
+            fast_evaluator.strength_category(strength) == HandRank.STRAIGHT_FLUSH.value
+        )
+        assert fast_evaluator.strength_kickers(strength) == [5]
+
+    def test_full_house_from_two_trips(self):
+        """スリーカード2組からフルハウスを作るテスト"""
+        cards = [Card(9, suit) for suit in list(Suit)[:3]]
+        cards += [Card(8, suit) for suit in list(Suit)[:3]]
+        cards += [Card(14, Suit.SPADES)]
+        strength = fast_evaluator.evaluate_cards(cards)
+
+        assert fast_evaluator.strength_category(strength) == HandRank.FULL_HOUSE.value
+        assert fast_evaluator.strength_kickers(strength) == [9, 8]
+
+    def test_two_pair_uses_best_kicker_from_third_pair(self):
+        """ペアが3組ある場合、3組目のペアもキッカーとして使うテスト"""
+        cards = [
+            Card(5, Suit.SPADES),
+            Card(5, Suit.HEARTS),
+            Card(4, Suit.SPADES),
+            Card(4, Suit.HEARTS),
+            Card(3, Suit.SPADES),
+            Card(3, Suit.HEARTS),
+            Card(2, Suit.CLUBS),
+        ]
+        strength = fast_evaluator.evaluate_cards(cards)
+
+        assert fast_evaluator.strength_kickers(strength) == [5, 4, 3]
+
+    @pytest.mark.parametrize("num_cards", [5, 6, 7])
+    def test_matches_legacy_evaluator(self, num_cards):
+        """ランダムなハンドで旧実装と役・キッカーが一致することを確認"""
+        deck = [Card(rank, suit) for suit in Suit for rank in range(2, 15)]
+        rng = random.Random(num_cards)
+
+        for _ in range(2000):
+            cards = rng.sample(deck, num_cards)
+            expected = _legacy_best(cards)
+            strength = fast_evaluator.evaluate_cards(cards)
+
+            assert fast_evaluator.strength_category(strength) == expected.rank.value
+            assert fast_evaluator.strength_kickers(strength) == expected.kickers
+
+    def test_strength_ordering_matches_compare_hands(self):
+        """強さの整数の大小が compare_hands の結果と一致することを確認"""
+        deck = [Card(rank, suit) for suit in Suit for rank in range(2, 15)]
+        rng = random.Random(0)
+
+        for _ in range(2000):
+            cards = rng.sample(deck, 9)
+            hand1 = HandEvaluator.evaluate_hand(cards[:2], cards[4:])
+            hand2 = HandEvaluator.evaluate_hand(cards[2:4], cards[4:])
+            strength1 = HandEvaluator.evaluate_strength(cards[:2], cards[4:])
+            strength2 = HandEvaluator.evaluate_strength(cards[2:4], cards[4:])
+
+            expected = HandEvaluator.compare_hands(hand1, hand2)
+            assert (strength1 > strength2) - (strength1 < strength2) == expected
@@ -0,0 +1,99 @@
+"""
+Tests for poker.flop_table module
+"""
+
+import os
+import random
+from itertools import permutations
+
+import numpy as np
+import pytest
+from poker.canonical import relabel
+from poker.equity import calculate_equity
+from poker.flop_table import (
+    NUM_FLOPS,
+    TABLE_SHAPE,
+    canonical_flops,
+    load_table,
+    lookup,
+    save_table,
+)
+from poker.game_models import ALL_CARDS
+
+TEAM4_TABLE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "agents",
+    "team4_agent",
+    "tools",
+    "flop_equity.npz",
+)
+
+
+class TestCanonicalFlops:
+    """正規形のフロップのテスト"""
+
+    def test_count_and_order(self):
+        """1755通りで、行はカードIDの辞書順"""
+        flops = canonical_flops()
+
+        assert flops.shape == (NUM_FLOPS, 3)
+        assert np.all(np.diff(flops, axis=1) > 0)
+        assert [tuple(row) for row in flops] == sorted(tuple(row) for row in flops)
+
+
+class TestTableFile:
+    """表の保存・読み込みと参照のテスト"""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """保存した表を読み込んで値を引ける"""
+        flops = canonical_flops()
+        table = np.random.default_rng(0).integers(
+            0, 65536, TABLE_SHAPE, dtype=np.uint16
+        )
+        path = str(tmp_path / "flop.npz")
+        save_table(flops, table, path)
+        keys, loaded = load_table(path)
+
+        np.testing.assert_array_equal(loaded, table)
+        # 2♥ 3♥ 4♥ は辞書順で最初の正規形フロップ、A♠ K♠ の組は最後の組
+        assert lookup(keys, loaded, ["A♠", "K♠"], ["2♥", "3♥", "4♥"]) == (
+            pytest.approx(table[0, -1] / 65535)
+        )
+
+    def test_invalid_input(self, tmp_path):
+        """形の違う表や、重なるカードはエラー"""
+        with pytest.raises(ValueError):
+            save_table(canonical_flops(), np.zeros((10, 10)), str(tmp_path / "x.npz"))
+
+        keys = np.zeros(NUM_FLOPS, dtype=np.int64)
+        table = np.zeros(TABLE_SHAPE, dtype=np.uint16)
+        with pytest.raises(ValueError):
+            lookup(keys, table, ["A♠", "K♠"], ["A♠", "2♦", "3♣"])
+
+
+class TestGeneratedTable:
+    """生成済みの表（team4 エージェントが使うもの）のテスト"""
+
+    def test_matches_exact_equity(self):
+        """表の値は calculate_equity の完全列挙と一致する"""
+        keys, table = load_table(TEAM4_TABLE)
+        rng = random.Random(0)
+        for _ in range(3):
+            cards = rng.sample(ALL_CARDS, 5)
+            expected = calculate_equity(cards[:2], cards[2:], mode="exact").equity
+
+            assert lookup(keys, table, cards[:2], cards[2:]) == pytest.approx(
+                expected, abs=1e-4
+            )
+
+    def test_invariant_under_suit_permutation(self):
+        """スートを入れ替えた状況では同じ値を引く"""
+        keys, table = load_table(TEAM4_TABLE)
+        hole, flop = ALL_CARDS[:2], ALL_CARDS[20:23]
+        value = lookup(keys, table, hole, flop)
+
+        for perm in permutations(range(4)):
+            assert lookup(
+                keys, table, relabel(hole, perm), relabel(flop, perm)
+            ) == pytest.approx(value, abs=1e-4)
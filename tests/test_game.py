@@ -2,6 +2,8 @@
 Tests for poker.game module
 """
 
+import json
+
 import pytest
 from poker.player_models import HumanPlayer, RandomPlayer, LLMPlayer, PlayerStatus
 from poker.game import GamePhase, PokerGame
@@ -383,3 +385,144 @@ class TestPokerGame:
         # 全プレイヤーのチップが初期値
         for player in game.players:
             assert player.chips == game.initial_chips
+
+    def test_seeded_game_is_reproducible(self):
+        """同じシードのゲームはデッキ・ディーラー・CPUの行動まで再現される"""
+
+        def play(seed):
+            game = PokerGame(rng=seed)
+            game.setup_cpu_only_game()
+            game.start_new_hand()
+            while not game.betting_round_complete:
+                player = game.players[game.current_player_index]
+                decision = player.make_decision(game.get_llm_game_state(player.id))
+                if not game.process_player_action(
+                    player.id, decision["action"], decision.get("amount", 0)
+                ):
+                    game.process_player_action(player.id, "fold", 0)
+            return (
+                game.dealer_button,
+                [str(card) for p in game.players for card in p.hole_cards],
+                game.action_history,
+            )
+
+        assert play(123) == play(123)
+        assert play(123) != play(124)
+
+    def test_setup_shares_game_rng(self):
+        """ゲームが作るRandomPlayerはゲームの乱数を共有する"""
+        game = PokerGame(rng=5)
+        game.setup_cpu_only_game()
+
+        assert all(player.rng is game.rng for player in game.players)
+        assert game.deck.rng is game.rng
+
+
+class TestGameSnapshot:
+    """PokerGame.snapshot / restore / load_game_state のテスト"""
+
+    def _start(self, headless: bool = True, seed: int = 3) -> PokerGame:
+        game = PokerGame(headless=headless, rng=seed)
+        game.setup_cpu_only_game()
+        game.start_new_hand()
+        game.process_player_action(game.current_player_index, "call", 0)
+        return game
+
+    def _play_out(self, game: PokerGame):
+        while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            while not game.betting_round_complete:
+                player = game.players[game.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    game._advance_to_next_player()
+                    continue
+                decision = player.make_decision(game.get_llm_game_state(player.id))
+                if not game.process_player_action(
+                    player.id, decision["action"], decision.get("amount", 0)
+                ):
+                    game.process_player_action(player.id, "fold", 0)
+            if not game.advance_to_next_phase():
+                break
+        if game.current_phase == GamePhase.SHOWDOWN:
+            game.conduct_showdown()
+
+    @pytest.mark.parametrize("headless", [True, False])
+    def test_restore_after_rollout(self, headless):
+        """ハンドを最後まで進めても restore で分岐点の状態に戻る"""
+        game = self._start(headless=headless)
+        snapshot = game.snapshot()
+        history = list(game.get_llm_game_state(game.current_player_index).history)
+
+        self._play_out(game)
+        assert game.snapshot() != snapshot
+
+        game.restore(snapshot)
+        assert game.snapshot() == snapshot
+        assert game.get_llm_game_state(game.current_player_index).history == history
+
+    def test_include_rng_replays_same_rollout(self):
+        """乱数状態を含めたスナップショットからは同じ展開が再現される"""
+        game = self._start()
+        snapshot = game.snapshot(include_rng=True)
+
+        outcomes = []
+        for _ in range(2):
+            game.restore(snapshot)
+            self._play_out(game)
+            outcomes.append([player.chips for player in game.players])
+
+        assert outcomes[0] == outcomes[1]
+
+    def test_restore_player_count_mismatch(self):
+        """プレイヤー構成が異なるゲームには restore できない"""
+        snapshot = self._start().snapshot()
+        other = PokerGame()
+        other.add_player(RandomPlayer(0, "CPU0"))
+
+        with pytest.raises(ValueError):
+            other.restore(snapshot)
+
+    @pytest.mark.parametrize("headless", [True, False])
+    def test_save_load_round_trip(self, tmp_path, headless):
+        """save_game_state で保存した状態を新しいゲームに読み込める"""
+        game = self._start(headless=headless)
+        filename = tmp_path / "state.json"
+        game.save_game_state(str(filename))
+
+        loaded = PokerGame(headless=headless)
+        loaded.load_game_state(str(filename))
+
+        assert loaded.snapshot() == game.snapshot()
+        assert [player.name for player in loaded.players] == [
+            player.name for player in game.players
+        ]
+        assert all(isinstance(player, RandomPlayer) for player in loaded.players)
+
+    def test_load_updates_existing_players(self, tmp_path):
+        """既存の同じIDのプレイヤーはそのまま使われる"""
+        game = self._start()
+        filename = tmp_path / "state.json"
+        game.save_game_state(str(filename))
+
+        target = PokerGame(headless=True)
+        human = HumanPlayer(0, "You")
+        target.add_player(human)
+        target.load_game_state(str(filename))
+
+        assert target.players[0] is human
+        assert human.hole_cards == game.players[0].hole_cards
+
+    def test_load_without_deck_rebuilds_remaining_cards(self, tmp_path):
+        """デッキが保存されていない形式では場に出ていないカードでデッキを作り直す"""
+        game = self._start()
+        filename = tmp_path / "state.json"
+        game.save_game_state(str(filename))
+        data = json.loads(filename.read_text(encoding="utf-8"))
+        del data["deck"]
+        filename.write_text(json.dumps(data), encoding="utf-8")
+
+        loaded = PokerGame(headless=True)
+        loaded.load_game_state(str(filename))
+
+        dealt = [card for p in loaded.players for card in p.hole_cards]
+        assert len(loaded.deck.cards) == 52 - len(dealt)
+        assert not set(loaded.deck.cards) & set(dealt)
@@ -0,0 +1,125 @@
+"""
+Tests for poker.hand_history module
+"""
+
+import json
+import os
+
+import pytest
+from poker.game import GamePhase, PokerGame
+from poker.hand_history import (
+    SCHEMA_VERSION,
+    HandHistoryReader,
+    HandHistoryWriter,
+    hand_history_path_for,
+)
+from poker.player_models import PlayerStatus
+
+
+def _play_hands(game: PokerGame, hands: int):
+    for _ in range(hands):
+        game.start_new_hand()
+        if game.current_phase == GamePhase.FINISHED:
+            return
+        while game.current_phase not in (GamePhase.SHOWDOWN, GamePhase.FINISHED):
+            while not game.betting_round_complete:
+                player = game.players[game.current_player_index]
+                if player.status != PlayerStatus.ACTIVE:
+                    game._advance_to_next_player()
+                    continue
+                decision = player.make_decision(game.get_llm_game_state(player.id))
+                if not game.process_player_action(
+                    player.id, decision["action"], decision.get("amount", 0)
+                ):
+                    game.process_player_action(player.id, "fold", 0)
+            if not game.advance_to_next_phase():
+                break
+        game.conduct_showdown()
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    path = str(tmp_path / "poker_game_test.hands.jsonl")
+    writer = HandHistoryWriter(path)
+    game = PokerGame(headless=True, rng=1, hand_history=writer)
+    game.setup_cpu_only_game()
+    _play_hands(game, 5)
+    writer.close()
+    return path, game
+
+
+class TestHandHistory:
+    """ハンド履歴の書き込み・読み込みのテスト"""
+
+    def test_path_for_log(self):
+        """テキストログと同じ名前で拡張子だけ変える"""
+        assert hand_history_path_for(
+            os.path.join("logs", "poker_game_1.log")
+        ) == os.path.join("logs", "poker_game_1.hands.jsonl")
+
+    def test_round_trip(self, history_file):
+        """1ハンド1レコードで書かれ、インデックスから直接読める"""
+        path, game = history_file
+        reader = HandHistoryReader(path)
+
+        assert reader.header["schema"] == SCHEMA_VERSION
+        assert reader.hands() == [(game.game_id, n) for n in range(1, 6)]
+        record = reader.read_hand(5)
+        assert record["hand"] == 5
+        assert record["board"] == [str(card) for card in game.community_cards]
+        assert [p["end_chips"] for p in record["players"]] == [
+            p.chips for p in game.players
+        ]
+        assert record["events"][0][1:3] == ["small_blind", game.small_blind]
+        assert record["events"][0][3] == "preflop"
+
+    def test_chips_conserved_per_hand(self, history_file):
+        """各ハンドの開始チップ合計と終了チップ合計は一致する"""
+        path, _ = history_file
+        for record in HandHistoryReader(path):
+            start = sum(p["start_chips"] for p in record["players"])
+            end = sum(p["end_chips"] for p in record["players"])
+            assert start == end
+
+    def test_rebuilds_missing_index(self, history_file):
+        """インデックスが無い・遅れている場合は本体を走査して補う"""
+        path, _ = history_file
+        with open(path + ".idx", encoding="utf-8") as f:
+            lines = f.readlines()
+        with open(path + ".idx", "w", encoding="utf-8") as f:
+            f.writelines(lines[:2])
+        assert [hand for _, hand in HandHistoryReader(path).hands()] == [1, 2, 3, 4, 5]
+
+        os.remove(path + ".idx")
+        assert len(HandHistoryReader(path)) == 5
+
+    def test_partial_line_ignored(self, history_file):
+        """書きかけの最終行は読み飛ばす"""
+        path, _ = history_file
+        with open(path, "ab") as f:
+            f.write(b'{"type":"hand","hand":6')
+        assert len(HandHistoryReader(path)) == 5
+
+    def test_appends_to_existing_file(self, history_file):
+        """既存ファイルにはヘッダーを書き直さず追記する"""
+        path, _ = history_file
+        writer = HandHistoryWriter(path)
+        game = PokerGame(headless=True, rng=2, hand_history=writer)
+        game.setup_cpu_only_game()
+        _play_hands(game, 2)
+        writer.close()
+
+        reader = HandHistoryReader(path)
+        assert len(reader) == 7
+        assert reader.read_hand(1, game=game.game_id)["game"] == game.game_id
+
+    def test_rejects_newer_schema(self, tmp_path):
+        """未対応の新しいスキーマは読まない"""
+        path = tmp_path / "future.hands.jsonl"
+        path.write_text(json.dumps({"type": "header", "schema": SCHEMA_VERSION + 1}))
+        with pytest.raises(ValueError):
+            HandHistoryReader(str(path))
+
+    def test_disabled_by_default_when_headless(self):
+        """ヘッドレスモードでは既定でハンド履歴を書かない"""
+        assert PokerGame(headless=True).hand_history is None
@@ -0,0 +1,256 @@
+"""
+Tests for log_viewer's log index, incremental parsing and tailing
+"""
+
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("flet")
+
+import log_viewer  # noqa: E402
+from log_viewer import (  # noqa: E402
+    LogEventType,
+    LogIndex,
+    LogParser,
+    LogTailer,
+    _StatPollWatch,
+)
+
+
+def _log_line(message: str, millisecond: int = 0) -> str:
+    return f"2025-01-01 12:00:00,{millisecond:03d} - poker_game.engine - INFO - {message}\n"
+
+
+def _hand_lines(hand_number: int) -> str:
+    """1ハンド分のログ（開始・フェーズ変更・アクション・終了の4行）"""
+    messages = [
+        f"=== STARTING NEW HAND #{hand_number} ===",
+        "Phase changed: preflop -> flop",
+        f"ACTION_EXECUTED: Player 1 (Agent1) calls {hand_number * 10}",
+        "=== HAND COMPLETE ===",
+    ]
+    return "".join(_log_line(message, hand_number) for message in messages)
+
+
+def _write(path, text: str, mode: str = "w"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(text)
+
+
+def _summary(events):
+    """比較用に (種類, ハンド番号, メッセージ) の列にする"""
+    return [(e["type"], e.get("hand_number"), e["message"]) for e in events]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """ハンド1〜3が書かれたログファイル"""
+    path = str(tmp_path / "game.log")
+    _write(path, "".join(_hand_lines(n) for n in (1, 2, 3)))
+    return path
+
+
+class TestLogIndex:
+    """ハンド開始位置のインデックスのテスト"""
+
+    def test_indexes_hand_offsets(self, log_path):
+        """各ハンドの開始行のオフセットを記録し、サイドカーに保存する"""
+        LogParser().parse_file(log_path)
+        with open(log_path, "rb") as f:
+            data = f.read()
+
+        index = LogIndex(log_path)
+        assert index.load()
+        assert [hand for hand, _ in index.hands] == [1, 2, 3]
+        for hand, offset in index.hands:
+            assert data[offset:].startswith(
+                _log_line(f"=== STARTING NEW HAND #{hand} ===", hand).encode()
+            )
+        assert index.indexed_size == len(data)
+
+    def test_truncated_file_rebuilds_index(self, log_path):
+        """保存済みのインデックスより短いファイルは索引し直す"""
+        LogParser().parse_file(log_path)
+        _write(log_path, _hand_lines(7))
+
+        parser = LogParser()
+        events = parser.parse_file(log_path)
+
+        assert [hand for hand, _ in parser.index.hands] == [7]
+        assert parser.index.indexed_size == os.path.getsize(log_path)
+        assert {e["hand_number"] for e in events} == {7}
+        assert parser.parse_hand(log_path, 2) == []
+
+    def test_replaced_file_rebuilds_index(self, log_path):
+        """先頭が変わったファイル（同じ長さ以上でも）は索引し直す"""
+        LogParser().parse_file(log_path)
+        _write(log_path, "".join(_hand_lines(n) for n in (4, 5, 6, 7)))
+
+        parser = LogParser()
+        parser.parse_file(log_path)
+
+        assert [hand for hand, _ in parser.index.hands] == [4, 5, 6, 7]
+
+
+class TestLogParser:
+    """全体の解析と差分の解析のテスト"""
+
+    def test_incremental_parse_matches_full_parse(self, log_path):
+        """追記分だけを解析した結果は、全体を解析し直した結果と一致する"""
+        parser = LogParser()
+        first = parser.parse_file(log_path)
+        assert len(first) == 12
+
+        _write(log_path, "".join(_hand_lines(n) for n in (4, 5)), mode="a")
+        appended = parser.parse_new_lines(log_path)
+
+        assert {e["hand_number"] for e in appended} == {4, 5}
+        assert _summary(parser.events) == _summary(LogParser().parse_file(log_path))
+        assert parser.last_file_position == os.path.getsize(log_path)
+        assert [hand for hand, _ in parser.index.hands] == [1, 2, 3, 4, 5]
+        assert parser.parse_new_lines(log_path) == []
+
+    def test_max_hands_parses_last_hands(self, log_path):
+        """max_hands を指定すると最後の数ハンドだけを解析する"""
+        full = LogParser().parse_file(log_path)
+        tail = LogParser().parse_file(log_path, max_hands=2)
+
+        assert _summary(tail) == _summary(full[4:])
+        assert tail[0]["type"] == LogEventType.HAND_START
+        assert _summary(LogParser().parse_file(log_path, max_hands=10)) == _summary(
+            full
+        )
+
+    def test_partial_last_line_waits_for_newline(self, log_path):
+        """書きかけの最終行は、改行が書かれるまで解析もインデックスもしない"""
+        size = os.path.getsize(log_path)
+        line = _log_line("=== STARTING NEW HAND #4 ===", 4)
+        _write(log_path, line[:-10], mode="a")
+
+        parser = LogParser()
+        events = parser.parse_file(log_path)
+        assert len(events) == 12
+        assert parser.last_file_position == size
+        assert parser.parse_hand(log_path, 4) == []
+
+        _write(log_path, line[-10:], mode="a")
+        appended = parser.parse_new_lines(log_path)
+
+        assert _summary(appended) == [
+            (LogEventType.HAND_START, 4, "=== STARTING NEW HAND #4 ===")
+        ]
+        assert parser.index.range_of(4) == (size, os.path.getsize(log_path))
+
+    def test_parse_hand_ranges(self, log_path):
+        """parse_hand は指定したハンドの行だけを解析する"""
+        full = LogParser().parse_file(log_path)
+        parser = LogParser()
+
+        for position, hand in enumerate((1, 2, 3)):
+            events = parser.parse_hand(log_path, hand)
+            assert _summary(events) == _summary(full[4 * position : 4 * position + 4])
+        assert parser.parse_hand(log_path, 99) == []
+
+    def test_parse_hand_picks_last_repeated_number(self, log_path):
+        """同じハンド番号が複数回現れるログ（複数ゲーム）では最後のものを引く"""
+        _write(log_path, _hand_lines(1).replace("calls 10", "calls 999"), mode="a")
+        events = LogParser().parse_hand(log_path, 1)
+
+        assert len(events) == 4
+        assert "calls 999" in events[2]["message"]
+
+
+class TestLogTailer:
+    """stat ポーリングでのリアルタイム追従のテスト"""
+
+    def test_poll_append(self, log_path):
+        """追記された行だけを返す"""
+        parser = LogParser()
+        tailer = LogTailer(parser, log_path, lambda events, reset: None)
+        parser.parse_file(log_path)
+        try:
+            assert tailer.poll() == ([], False)
+            _write(log_path, _hand_lines(4), mode="a")
+            events, reset = tailer.poll()
+        finally:
+            tailer.stop()
+
+        assert reset is False
+        assert {e["hand_number"] for e in events} == {4}
+
+    def test_poll_truncate(self, log_path):
+        """切り詰められたら先頭から解析し直す"""
+        parser = LogParser()
+        tailer = LogTailer(parser, log_path, lambda events, reset: None)
+        parser.parse_file(log_path)
+        tailer.poll()
+        _write(log_path, _hand_lines(8))
+        events, reset = tailer.poll()
+        tailer.stop()
+
+        assert reset is True
+        assert {e["hand_number"] for e in events} == {8}
+        assert parser.events == events
+
+    def test_poll_replace(self, log_path, tmp_path):
+        """別のファイルに置き換えられたら開き直して解析し直す（max_hands を守る）"""
+        parser = LogParser()
+        tailer = LogTailer(parser, log_path, lambda events, reset: None, max_hands=2)
+        parser.parse_file(log_path, max_hands=2)
+        tailer.poll()
+
+        # 元より長いファイルでローテーション
+        rotated = str(tmp_path / "game.log.new")
+        _write(rotated, "".join(_hand_lines(n) for n in range(10, 16)))
+        os.replace(rotated, log_path)
+        events, reset = tailer.poll()
+        tailer.stop()
+
+        assert reset is True
+        assert events[0]["type"] == LogEventType.HAND_START
+        assert {e["hand_number"] for e in events} == {14, 15}
+
+    def test_stat_poll_watch(self, log_path):
+        """stat の変化で起き、wake() では False を返す"""
+        watch = _StatPollWatch(log_path, interval=0.01)
+        _write(log_path, _hand_lines(4), mode="a")
+        assert watch.wait() is True
+
+        threading.Timer(0.05, watch.wake).start()
+        assert watch.wait() is False
+
+    def test_thread_falls_back_to_stat_polling(self, log_path, monkeypatch):
+        """inotify が使えなければ stat ポーリングで追記を通知する"""
+
+        def no_inotify(filepath):
+            raise OSError("inotify is not available")
+
+        monkeypatch.setattr(log_viewer, "_InotifyWatch", no_inotify)
+        monkeypatch.setattr(
+            log_viewer,
+            "_StatPollWatch",
+            lambda filepath: _StatPollWatch(filepath, interval=0.01),
+        )
+        parser = LogParser()
+        parser.parse_file(log_path)
+        received = []
+        notified = threading.Event()
+
+        def on_events(events, reset):
+            received.append((events, reset))
+            notified.set()
+
+        tailer = LogTailer(parser, log_path, on_events)
+        tailer.start()
+        try:
+            assert isinstance(tailer._watch, _StatPollWatch)
+            _write(log_path, _hand_lines(4), mode="a")
+            assert notified.wait(5)
+        finally:
+            tailer.stop()
+
+        events, reset = received[0]
+        assert reset is False
+        assert {e["hand_number"] for e in events} == {4}
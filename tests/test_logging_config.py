@@ -0,0 +1,103 @@
+"""
+Tests for poker.logging_config module
+"""
+
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+from poker.logging_config import (
+    ROOT_LOGGER,
+    get_logger,
+    parse_log_levels,
+    setup_logging,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def restore_logging():
+    yield
+    stop_queue_logging()
+
+
+class TestParseLogLevels:
+    """parse_log_levels のテスト"""
+
+    def test_parse(self):
+        """サブシステム名とレベル名の組を読み取る"""
+        assert parse_log_levels("engine=info, players=DEBUG") == {
+            "engine": logging.INFO,
+            "players": logging.DEBUG,
+        }
+        assert parse_log_levels("") == {}
+
+    @pytest.mark.parametrize("spec", ["engine", "unknown=INFO", "ui=LOUD"])
+    def test_invalid(self, spec):
+        """不明なサブシステムやレベルはエラー"""
+        with pytest.raises(ValueError):
+            parse_log_levels(spec)
+
+
+class TestQueueLogging:
+    """キュー経由のログパイプラインのテスト"""
+
+    def test_records_written_by_listener(self, restore_logging):
+        """ログはバックグラウンドのリスナーを通してハンドラーに届く"""
+        handler = _ListHandler()
+        listener = start_queue_logging([handler], {"engine": logging.WARNING})
+        get_logger("engine").info("filtered %d", 1)
+        get_logger("engine").warning("engine %d", 2)
+        get_logger("players").debug("players %s", "debug")
+        stop_queue_logging()
+
+        assert listener._thread is None
+        assert [record.getMessage() for record in handler.records] == [
+            "engine 2",
+            "players debug",
+        ]
+        assert handler.records[0].name == "poker_game.engine"
+
+    def test_library_does_not_configure_output(self):
+        """import しただけではリスナースレッドを作らず、ゲームを進めても何も出力しない"""
+        script = (
+            "import threading\n"
+            "from poker.game import PokerGame\n"
+            "game = PokerGame()\n"
+            "game.setup_cpu_only_game()\n"
+            "game.start_new_hand()\n"
+            "print(threading.active_count())\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.join(os.path.dirname(__file__), ".."),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "1"
+        assert result.stderr == ""
+
+    def test_setup_logging_writes_file(self, tmp_path, restore_logging):
+        """setup_logging はファイルにDEBUGレベルで書き出す"""
+        log_file = setup_logging(log_dir=str(tmp_path), console_level=logging.CRITICAL)
+        get_logger("players").debug("LLM Prompt for %s:", "Agent0")
+        stop_queue_logging()
+
+        with open(log_file, encoding="utf-8") as f:
+            content = f.read()
+        assert " - poker_game.players - DEBUG - LLM Prompt for Agent0:" in content
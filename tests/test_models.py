@@ -2,16 +2,47 @@
 Tests for poker.models module
 """
 
+import asyncio
+import json
+import time
+import httpx
 import pytest
 import random
-from poker.game_models import Suit, Card, Deck
+import sys
+import threading
+import numpy as np
+from poker.game_models import (
+    ActionEvent,
+    ActionLog,
+    Suit,
+    Card,
+    Deck,
+    DeckPermutations,
+    GameState,
+    NumpyRandom,
+    create_rng,
+    ALL_CARDS,
+    cards_to_ids,
+    cards_from_ids,
+    cards_to_mask,
+    mask_to_cards,
+    cards_from_strs,
+)
 from poker.player_models import (
     PlayerStatus,
     Player,
     HumanPlayer,
     RandomPlayer,
     LLMPlayer,
+    LLMApiPlayer,
+    DecisionRunner,
+    close_async_http_clients,
+    get_async_http_client,
+    get_http_session,
+    get_api_executor,
 )
+from poker import player_models
+from google.genai import types
 
 
 class TestSuit:
@@ -94,6 +125,51 @@ class TestCard:
         card = Card(14, Suit.SPADES)
         assert repr(card) == "Card(A, spades)"
 
+    def test_interning(self):
+        """同じランク・スートのカードは同一インスタンスであることを確認"""
+        assert Card(14, Suit.SPADES) is Card(14, Suit.SPADES)
+        assert len(set(map(id, ALL_CARDS))) == 52
+
+    def test_id_round_trip(self):
+        """整数IDとの相互変換テスト"""
+        for card_id in range(52):
+            card = Card.from_id(card_id)
+            assert card.to_id() == card_id
+            assert card.id == card_id
+            assert card.mask == 1 << card_id
+
+        with pytest.raises(ValueError):
+            Card.from_id(52)
+
+    def test_from_str(self):
+        """文字列表現からの変換テスト"""
+        assert Card.from_str("A♠") is Card(14, Suit.SPADES)
+        assert Card.from_str("10♥") is Card(10, Suit.HEARTS)
+        assert Card.from_str("T♥") is Card(10, Suit.HEARTS)
+        for card in ALL_CARDS:
+            assert Card.from_str(str(card)) is card
+
+        with pytest.raises(ValueError):
+            Card.from_str("1♠")
+
+    def test_bulk_helpers(self):
+        """カード列とID・マスクの一括変換テスト"""
+        cards = cards_from_strs(["A♠", "K♥", "2♣"])
+        ids = cards_to_ids(cards)
+
+        assert cards_from_ids(ids) == cards
+        assert cards_to_mask(cards) == sum(1 << i for i in ids)
+        assert set(mask_to_cards(cards_to_mask(cards))) == set(cards)
+
+    def test_pickle_keeps_interning(self):
+        """pickle/deepcopy後も同一インスタンスであることを確認"""
+        import copy
+        import pickle
+
+        card = Card(12, Suit.DIAMONDS)
+        assert pickle.loads(pickle.dumps(card)) is card
+        assert copy.deepcopy([card])[0] is card
+
 
 class TestDeck:
     """Deckクラスのテスト"""
@@ -174,6 +250,140 @@ class TestDeck:
         assert different, "Shuffle should change card order"
 
 
+class TestRng:
+    """乱数の注入（create_rng / NumpyRandom / DeckPermutations）のテスト"""
+
+    def test_create_rng(self):
+        """シード・random.Random・numpy Generator を random.Random 互換に揃える"""
+        assert create_rng(None) is random
+        own = random.Random(1)
+        assert create_rng(own) is own
+        assert isinstance(create_rng(5), random.Random)
+        assert isinstance(create_rng(np.random.default_rng(5)), NumpyRandom)
+
+    def test_numpy_random_methods(self):
+        """NumpyRandom で random.Random のメソッドが使える"""
+        rng = NumpyRandom(np.random.default_rng(3))
+        assert 1 <= rng.randint(1, 3) <= 3
+        assert rng.choices(["a", "b"], weights=[1, 0]) == ["a"]
+        assert 0 <= rng.getrandbits(100) < 2**100
+
+        state = rng.getstate()
+        first = [rng.random() for _ in range(3)]
+        rng.setstate(state)
+        assert [rng.random() for _ in range(3)] == first
+
+    @pytest.mark.parametrize(
+        "make_rng", [lambda: 42, lambda: np.random.default_rng(42)]
+    )
+    def test_seeded_deck_is_reproducible(self, make_rng):
+        """同じシードのデッキは同じ並びになる"""
+        assert Deck(make_rng()).cards == Deck(make_rng()).cards
+        assert Deck(1).cards != Deck(2).cards
+
+    def test_deck_permutation_buffer(self):
+        """バッファ付きデッキは毎回52枚の異なる並びを払い出す"""
+        deck = Deck(7, buffer_size=4)
+        orders = []
+        for _ in range(10):
+            assert sorted(card.id for card in deck.cards) == list(range(52))
+            orders.append(tuple(card.id for card in deck.cards))
+            deck.reset()
+
+        assert len(set(orders)) == 10
+        assert Deck(7, buffer_size=4).cards == Deck(7, buffer_size=4).cards
+
+    def test_permutations_from_numpy_generator(self):
+        """numpy Generator からは同じ乱数列をそのまま使う"""
+        generator = np.random.default_rng(0)
+        permutations = DeckPermutations(NumpyRandom(generator), size=2)
+        assert permutations.generator is generator
+        assert len(permutations.next_cards()) == 52
+
+
+class TestActionLog:
+    """ActionEvent / ActionLog のテスト"""
+
+    def test_ring_buffer_drops_oldest(self):
+        """容量を超えると古いイベントから捨て、総件数は数え続ける"""
+        log = ActionLog(capacity=3)
+        for amount in range(5):
+            log.append(ActionEvent(0, "call", amount))
+
+        assert len(log) == 3
+        assert log.total == 5
+        assert [event.amount for event in log] == [2, 3, 4]
+
+    def test_last_action_index(self):
+        """プレイヤー毎の最新アクションを引ける（ブラインドは対象外）"""
+        log = ActionLog()
+        log.append(ActionEvent(1, "raise", 60))
+        log.append(ActionEvent(2, "big_blind", 20))
+        log.append(ActionEvent(1, "fold"))
+
+        assert log.last_action(1).action == "fold"
+        assert log.last_action(2) is None
+        log.clear()
+        assert log.last_action(1) is None
+
+    def test_render_is_lazy_and_cached(self):
+        """文字列化は要求された範囲だけ行いキャッシュする"""
+        log = ActionLog()
+        log.append(ActionEvent(0, "check"))
+        log.append(ActionEvent(1, "call", 20))
+
+        assert log.render(1) == ["Player 1 called 20"]
+        assert list(log._rendered) == [None, "Player 1 called 20"]
+        assert log.render() == ["Player 0 checked", "Player 1 called 20"]
+
+    def test_concurrent_append_and_render(self):
+        """別スレッドの render() が追加/クリアと重なってもキャッシュが崩れない"""
+        log = ActionLog(capacity=50)
+        errors = []
+        done = threading.Event()
+
+        def write():
+            for amount in range(20000):
+                log.append(ActionEvent(0, "call", amount))
+                if amount % 997 == 0:
+                    log.clear()
+            done.set()
+
+        def read():
+            try:
+                while not done.is_set():
+                    history, total, _ = log.render_versioned()
+                    amounts = [int(text.rsplit(" ", 1)[1]) for text in history]
+                    # 文字列は古い順に連続し、最後は total - 1 番目のイベント
+                    assert amounts == list(range(total - len(amounts), total))
+            except Exception as error:
+                errors.append(error)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=write), threading.Thread(target=read)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert not errors
+        assert log.render() == [event.describe() for event in log]
+
+    def test_describe_board_and_note(self):
+        """ボードのイベントはカードIDから、note は詳細文字列をそのまま表示"""
+        flop = ActionEvent(-1, "flop", cards=tuple(cards_to_ids(ALL_CARDS[:3])))
+        note = ActionEvent(-1, "note", detail="Showdown: no remaining players")
+
+        assert flop.describe() == "Flop dealt: " + ", ".join(
+            str(card) for card in ALL_CARDS[:3]
+        )
+        assert str(note) == "Showdown: no remaining players"
+
+
 class TestPlayerStatus:
     """PlayerStatusクラスのテスト"""
 
@@ -462,3 +672,218 @@ class TestLLMPlayer:
 
         # 現在はプレースホルダーなのでfoldを返す
         assert result == {"action": "fold", "amount": 0}
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+
+class _FakeHttp:
+    """LLMApiPlayer.http の代わりにリクエストを記録するスタブ"""
+
+    def __init__(self, run_status=200):
+        self.run_status = run_status
+        self.created = []
+        self.runs = []
+
+    def post(self, url, json=None, timeout=None):
+        if url.endswith("/run"):
+            self.runs.append(json["session_id"])
+            text = '{"action": "check", "amount": 0}'
+            return _FakeResponse(
+                self.run_status, [{"content": {"parts": [{"text": text}]}}]
+            )
+        self.created.append(url.rsplit("/", 1)[-1])
+        return _FakeResponse(200, {})
+
+
+class TestLLMApiPlayer:
+    """LLMApiPlayerクラスのテスト"""
+
+    def _state(self):
+        return GameState.from_dict(
+            {"your_id": 0, "phase": "preflop", "actions": ["fold", "check"]}
+        )
+
+    def _player(self, session_scope="hand", run_status=200):
+        player = LLMApiPlayer(
+            0, "Agent0", "team1_agent", "player_0", session_scope=session_scope
+        )
+        player.http = _FakeHttp(run_status)
+        return player
+
+    def test_shared_http_session_per_url(self):
+        """同じ url のプレイヤーは HTTP セッションを共有する"""
+        first = LLMApiPlayer(0, "A", "team1_agent", "u0", url="http://host:1")
+        second = LLMApiPlayer(1, "B", "team2_agent", "u1", url="http://host:1")
+        other = LLMApiPlayer(2, "C", "team1_agent", "u2", url="http://host:2")
+
+        assert first.http is second.http is get_http_session("http://host:1")
+        assert other.http is not first.http
+        assert get_api_executor() is get_api_executor()
+
+    def test_session_reused_within_hand(self):
+        """ADKセッションはハンド中は使い回し、新しいハンドで作り直す"""
+        player = self._player()
+        for _ in range(3):
+            assert player.make_decision(self._state())["action"] == "check"
+
+        assert len(player.http.created) == 1
+        assert player.http.runs == player.http.created * 3
+
+        player.reset_for_new_hand()
+        player.make_decision(self._state())
+        assert len(player.http.created) == 2
+        assert player.http.runs[-1] == player.http.created[-1]
+
+    @pytest.mark.parametrize("scope, expected", [("game", 1), ("decision", 4)])
+    def test_session_scope(self, scope, expected):
+        """session_scope で使い回す単位を変えられる"""
+        player = self._player(session_scope=scope)
+        for _ in range(2):
+            player.make_decision(self._state())
+            player.make_decision(self._state())
+            player.reset_for_new_hand()
+
+        assert len(player.http.created) == expected
+
+    def test_failed_run_recreates_session(self):
+        """実行リクエストが失敗したら次の判断でセッションを作り直す"""
+        player = self._player(run_status=404)
+        assert player.make_decision(self._state())["action"] == "fold"
+        player.make_decision(self._state())
+
+        assert len(player.http.created) == 2
+
+    def test_invalid_session_scope(self):
+        """不正な session_scope はエラー"""
+        with pytest.raises(ValueError):
+            LLMApiPlayer(0, "A", "team1_agent", "u0", session_scope="turn")
+
+
+class _FakeEvent:
+    def __init__(self, text):
+        self.content = types.Content(role="model", parts=[types.Part(text=text)])
+
+    def is_final_response(self):
+        return True
+
+
+class _FakeRunner:
+    """LLMPlayer._runner の代わりに固定の応答を返すスタブ"""
+
+    def __init__(self):
+        self.sessions = []
+
+    async def run_async(self, user_id, session_id, new_message):
+        self.sessions.append(session_id)
+        yield _FakeEvent('{"action": "check", "amount": 0, "reasoning": "ok"}')
+
+
+class TestAsyncDecision:
+    """make_decision_async と DecisionRunner のテスト"""
+
+    def _state(self):
+        return GameState.from_dict(
+            {"your_id": 0, "phase": "preflop", "actions": ["fold", "check"]}
+        )
+
+    def _mock_client(self, monkeypatch, delay=0.0):
+        """adk api_server の代わりに httpx.MockTransport で応答するクライアントを使う"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            if request.url.path == "/run":
+                await asyncio.sleep(delay)
+                text = '{"action": "check", "amount": 0}'
+                return httpx.Response(
+                    200, json=[{"content": {"parts": [{"text": text}]}}]
+                )
+            return httpx.Response(200, json={})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(player_models, "get_async_http_client", lambda url: client)
+        return calls
+
+    def test_default_async_uses_make_decision(self):
+        """同期的なプレイヤーの非同期版は make_decision と同じ判断を返す"""
+        player = RandomPlayer(0, "CPU0", rng=1)
+        decision = asyncio.run(player.make_decision_async(self._state()))
+
+        assert decision["action"] in ["fold", "check"]
+
+    def test_llm_api_player_async(self, monkeypatch):
+        """LLMApiPlayer の非同期版もハンド中はセッションを使い回す"""
+        calls = self._mock_client(monkeypatch)
+        player = LLMApiPlayer(0, "Agent0", "team1_agent", "player_0")
+        runner = DecisionRunner()
+        try:
+            for _ in range(2):
+                assert runner.decide(player, self._state())["action"] == "check"
+        finally:
+            runner.close()
+
+        assert calls.count("/run") == 2
+        assert len([path for path in calls if "/sessions/" in path]) == 1
+
+    def test_llm_api_players_run_concurrently(self, monkeypatch):
+        """同じイベントループ上の複数プレイヤーの待ち時間は重なる"""
+        self._mock_client(monkeypatch, delay=0.3)
+        players = [
+            LLMApiPlayer(i, f"Agent{i}", "team1_agent", f"player_{i}") for i in range(4)
+        ]
+
+        async def decide_all():
+            return await asyncio.gather(
+                *(player.make_decision_async(self._state()) for player in players)
+            )
+
+        start = time.perf_counter()
+        decisions = asyncio.run(decide_all())
+
+        assert [d["action"] for d in decisions] == ["check"] * 4
+        assert time.perf_counter() - start < 1.0
+
+    def test_async_client_per_event_loop(self):
+        """非同期 HTTP クライアントはイベントループ毎・url 毎に共有される"""
+
+        async def clients():
+            first = get_async_http_client("http://host:1")
+            same = get_async_http_client("http://host:1")
+            other = get_async_http_client("http://host:2")
+            await close_async_http_clients()
+            return first, same, other
+
+        first, same, other = asyncio.run(clients())
+        assert first is same
+        assert other is not first
+        assert first.is_closed
+        assert asyncio.run(clients())[0] is not first
+
+    def test_llm_player_reuses_runner(self):
+        """LLMPlayer は Runner を使い回し、判断毎のセッションは削除する"""
+        player = LLMPlayer(0, "LLM Player", 1000)
+        fake = _FakeRunner()
+        player._runner = fake
+
+        runner = DecisionRunner()
+        try:
+            for _ in range(2):
+                assert runner.decide(player, self._state())["action"] == "check"
+            sessions = runner.loop.run_until_complete(
+                player._session_service.list_sessions(
+                    app_name="poker_game", user_id="player_0"
+                )
+            )
+        finally:
+            runner.close()
+
+        assert len(set(fake.sessions)) == 2
+        assert sessions.sessions == []
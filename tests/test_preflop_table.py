@@ -0,0 +1,97 @@
+"""
+Tests for poker.preflop_table module
+"""
+
+import os
+
+import numpy as np
+import pytest
+from poker.preflop_table import (
+    TABLE_SHAPE,
+    class_index,
+    class_name,
+    load_table,
+    lookup,
+    representative,
+    save_table,
+)
+
+TEAM4_TABLE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "agents",
+    "team4_agent",
+    "tools",
+    "preflop_equity.npy",
+)
+
+
+class TestHandClasses:
+    """スターティングハンドのクラス分けのテスト"""
+
+    def test_grid_layout(self):
+        """ペアは対角、スーテッドは上三角、オフスートは下三角"""
+        assert class_index("A♠", "A♥") == (0, 0)
+        assert class_index("K♠", "A♠") == (0, 1)
+        assert class_index("A♠", "K♥") == (1, 0)
+        assert class_index("2♦", "3♣") == (12, 11)
+
+    def test_all_169_classes(self):
+        """169クラスすべてに名前と代表の手札があり、代表は元の位置に戻る"""
+        names = set()
+        for row in range(13):
+            for col in range(13):
+                names.add(class_name(row, col))
+                assert class_index(*representative(row, col)) == (row, col)
+
+        assert len(names) == 169
+        assert class_name(0, 1) == "AKs"
+        assert class_name(1, 0) == "AKo"
+        assert class_name(4, 4) == "TT"
+
+
+class TestTableFile:
+    """表の保存・読み込みと参照のテスト"""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """保存した表を mmap で読み込める"""
+        table = np.random.default_rng(0).random(TABLE_SHAPE, dtype=np.float32)
+        path = str(tmp_path / "preflop.npy")
+        save_table(table, path)
+
+        loaded = load_table(path)
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, table)
+        assert lookup(loaded, "A♠", "K♠", 3) == pytest.approx(float(table[0, 1, 1]))
+
+    def test_wrong_shape_is_rejected(self, tmp_path):
+        """形の違う配列は表として扱わない"""
+        path = str(tmp_path / "bad.npy")
+        np.save(path, np.zeros((13, 13), dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            load_table(path)
+        with pytest.raises(ValueError):
+            save_table(np.zeros((13, 13)), path)
+
+    def test_player_count_range(self):
+        """人数は2〜10人"""
+        table = np.zeros(TABLE_SHAPE, dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            lookup(table, "A♠", "A♥", 1)
+        with pytest.raises(ValueError):
+            lookup(table, "A♠", "A♥", 11)
+
+
+class TestGeneratedTable:
+    """生成済みの表（team4 エージェントが使うもの）のテスト"""
+
+    def test_values_are_consistent(self):
+        """代表的なハンドの値と、人数が増えるとエクイティが下がること"""
+        table = load_table(TEAM4_TABLE)
+
+        assert lookup(table, "A♠", "A♥", 2) == pytest.approx(0.85, abs=0.01)
+        assert lookup(table, "7♠", "2♥", 2) == pytest.approx(0.35, abs=0.01)
+        assert lookup(table, "A♠", "K♠", 2) > lookup(table, "A♠", "K♥", 2)
+        assert np.all(np.diff(table, axis=2) < 0)
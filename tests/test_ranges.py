@@ -0,0 +1,221 @@
+"""
+Tests for poker.ranges module
+"""
+
+import os
+
+import numpy as np
+import pytest
+from poker.equity import calculate_equity
+from poker.game_models import Card
+from poker.preflop_table import load_table, lookup
+from poker.ranges import (
+    COMBO_CARDS,
+    NUM_COMBOS,
+    ObservedAction,
+    combo_equities,
+    combo_index,
+    estimate_ranges,
+    full_range,
+    hand_vs_range,
+    narrow_range,
+    parse_history,
+    parse_range,
+    preflop_strengths,
+    range_fraction,
+    range_vs_range,
+    remove_cards,
+)
+
+TEAM4_TABLE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "agents",
+    "team4_agent",
+    "tools",
+    "preflop_equity.npy",
+)
+
+
+def _combos(weights):
+    """レンジのベクトル -> calculate_equity に渡す {組: 重み}"""
+    return {
+        (Card.from_id(int(first)), Card.from_id(int(second))): float(weight)
+        for (first, second), weight in zip(COMBO_CARDS, weights)
+        if weight > 0
+    }
+
+
+class TestParseRange:
+    """レンジ表記の読み取りのテスト"""
+
+    def test_combo_counts(self):
+        """各表記の組の数"""
+        assert parse_range("AA").sum() == 6
+        assert parse_range("AKs").sum() == 4
+        assert parse_range("AKo").sum() == 12
+        assert parse_range("AK").sum() == 16
+        assert parse_range("QQ+").sum() == 18
+        assert parse_range("ATs+").sum() == 16
+        assert parse_range("KQo+").sum() == 12
+        assert parse_range("22-55").sum() == 24
+        assert parse_range("A5s-A2s").sum() == 16
+        assert parse_range("AA,AKs,KQo+,22-55").sum() == 6 + 4 + 12 + 24
+
+    def test_specific_combos_and_weights(self):
+        """特定の組の指定と重み（後のトークンが優先）"""
+        weights = parse_range("AsKh, A♠K♥:0.5, QQ:0.25")
+
+        assert weights[combo_index("A♠", "K♥")] == 0.5
+        assert weights.sum() == pytest.approx(0.5 + 6 * 0.25)
+
+    def test_invalid_tokens(self):
+        """不正な表記はエラー"""
+        for text in ("AAs", "AX", "22-AKs", "AK:-1", "AK:abc", "QQ-JJ+"):
+            with pytest.raises(ValueError):
+                parse_range(text)
+
+    def test_remove_cards(self):
+        """手札やボードと重なる組を除く"""
+        weights = remove_cards(parse_range("AA,KK"), ["A♠", "K♠", "K♥"])
+
+        assert weights.sum() == 3 + 1
+        assert range_fraction(full_range()) == 1.0
+
+
+class TestNarrowing:
+    """アクションによるレンジの絞り込みのテスト"""
+
+    def test_preflop_strengths_match_table(self):
+        """組毎の強さはプリフロップ表の値と一致する"""
+        table = load_table(TEAM4_TABLE)
+        strengths = preflop_strengths(table)
+
+        for index in range(0, NUM_COMBOS, 17):
+            first, second = (Card.from_id(int(c)) for c in COMBO_CARDS[index])
+            assert strengths[index] == pytest.approx(lookup(table, first, second, 2))
+
+    def test_keeps_strongest_share(self):
+        """強い方から指定した割合を残し、残りは floor 倍"""
+        strengths = np.arange(NUM_COMBOS, dtype=np.float64)
+        narrowed = narrow_range(full_range(), strengths, 0.1, floor=0.0)
+
+        assert narrowed.sum() == pytest.approx(133)
+        assert narrowed[-1] == 1.0 and narrowed[0] == 0.0
+        assert narrow_range(full_range(), strengths, 1.0).sum() == NUM_COMBOS
+
+    def test_equal_strengths_are_kept_together(self):
+        """同じ強さの組は一緒に残す"""
+        strengths = np.zeros(NUM_COMBOS)
+        strengths[:10] = 1.0
+
+        narrowed = narrow_range(full_range(), strengths, 0.5, floor=0.0)
+        assert narrowed.sum() == NUM_COMBOS
+
+    def test_parse_history(self):
+        """前のハンドの行を捨て、各アクションのフェーズを決める"""
+        history = [
+            "Player 1 called 20",
+            "Showdown: Player 2 won 100",
+            "Player 0 posted small blind 10",
+            "Player 1 posted big blind 20",
+            "Player 2 raised to 60",
+            "Player 1 folded",
+            "Flop dealt: Q♥, J♦, 2♣",
+            "Player 2 went all-in with 940",
+        ]
+        community = ["Q♥", "J♦", "2♣"]
+
+        assert parse_history(history, community) == [
+            ObservedAction(2, "raise", 0),
+            ObservedAction(1, "fold", 0),
+            ObservedAction(2, "all_in", 3),
+        ]
+        # 配られた行が残っていなければ、すべて現在のフェーズのアクション
+        assert parse_history(history[-1:], community) == [
+            ObservedAction(2, "all_in", 3)
+        ]
+
+    def test_estimate_ranges(self):
+        """レイズした相手のレンジは狭く、フォールドした相手は含まない"""
+        strengths = preflop_strengths(load_table(TEAM4_TABLE))
+        observed = [
+            ObservedAction(1, "call", 0),
+            ObservedAction(2, "raise", 0),
+            ObservedAction(3, "fold", 0),
+        ]
+        ranges = estimate_ranges(observed, [], strengths, dead_cards=["A♠", "A♥"])
+
+        assert set(ranges) == {1, 2}
+        assert range_fraction(ranges[2]) < range_fraction(ranges[1])
+        assert ranges[2][combo_index("A♦", "A♣")] == 1.0
+        assert ranges[2][combo_index("A♠", "K♠")] == 0.0
+
+
+class TestRangeEquity:
+    """レンジに対するエクイティのテスト"""
+
+    @pytest.mark.parametrize(
+        "board",
+        [["Q♥", "J♦", "2♣", "3♠", "9♣"], ["Q♥", "J♦", "2♣", "3♠"], ["Q♥", "J♦", "2♣"]],
+    )
+    def test_hand_vs_range_matches_exact_equity(self, board):
+        """手札対レンジは calculate_equity の完全列挙と一致する"""
+        villain = parse_range("QQ+,AKs,AJo,76s,22-44")
+        reference = calculate_equity(
+            ["A♠", "K♠"], board, opponent_ranges=[_combos(villain)], mode="exact"
+        )
+
+        assert hand_vs_range(["A♠", "K♠"], villain, board) == pytest.approx(
+            reference.equity
+        )
+
+    def test_range_vs_range_matches_combo_average(self):
+        """レンジ対レンジは、各組のエクイティを対戦数で重み付けした平均"""
+        board = ["Q♥", "J♦", "2♣", "3♠"]
+        hero = parse_range("TT+,AQs+")
+        villain = parse_range("QQ+,AKs,AJo,76s,22-44")
+        equities = combo_equities(hero, villain, board)
+
+        total = weighted = 0.0
+        for (first, second), weight in _combos(remove_cards(hero, board)).items():
+            remaining = remove_cards(villain, [first, second, *board])
+            if remaining.sum() == 0:
+                continue
+            reference = calculate_equity(
+                [first, second],
+                board,
+                opponent_ranges=[_combos(remaining)],
+                mode="exact",
+            )
+            assert equities[combo_index(first, second)] == pytest.approx(
+                reference.equity
+            )
+            total += weight * remaining.sum()
+            weighted += weight * remaining.sum() * reference.equity
+
+        assert range_vs_range(hero, villain, board) == pytest.approx(weighted / total)
+
+    def test_preflop_is_sampled(self):
+        """プリフロップは相手の組とボードをサンプリングし、シードで再現できる"""
+        villain = parse_range("22+,A2s+,KTo+")
+
+        first = hand_vs_range(["A♠", "A♥"], villain, seed=1, max_runouts=200)
+        second = hand_vs_range(["A♠", "A♥"], villain, seed=1, max_runouts=200)
+        assert first == second
+        assert 0.75 < first < 0.95
+
+    def test_sampled_matches_exact(self):
+        """列挙の上限を下げるとサンプリングになり、完全列挙と誤差の範囲で一致する"""
+        board = ["Q♥", "J♦", "2♣"]
+        villain = parse_range("QQ+,AKs,AJo,76s,22-44")
+
+        exact = hand_vs_range(["A♠", "K♠"], villain, board)
+        sampled = hand_vs_range(["A♠", "K♠"], villain, board, max_runouts=0, seed=3)
+        assert sampled != exact
+        assert sampled == pytest.approx(exact, abs=0.015)
+
+    def test_blocked_range_is_rejected(self):
+        """相手のレンジがすべて手札と重なる場合はエラー"""
+        with pytest.raises(ValueError):
+            hand_vs_range(["A♠", "A♥"], parse_range("AsAh"), ["2♣", "3♦", "4♥"])
@@ -0,0 +1,134 @@
+"""
+Tests for poker.scheduler module
+"""
+
+import asyncio
+
+import pytest
+from poker.game_models import GameState
+from poker.player_models import RandomPlayer
+from poker.scheduler import LLMRequestScheduler
+
+
+class SlowAgent(RandomPlayer):
+    """判断に時間がかかるエージェントの代わり（同時実行数を記録する）"""
+
+    running = {}
+    peak = {}
+
+    def __init__(self, player_id: int, app_name: str, delay: float = 0.02):
+        super().__init__(player_id, f"Agent{player_id}", rng=player_id)
+        self.app_name = app_name
+        self.delay = delay
+
+    async def make_decision_async(self, game_state):
+        running = SlowAgent.running
+        running[self.app_name] = running.get(self.app_name, 0) + 1
+        SlowAgent.peak[self.app_name] = max(
+            SlowAgent.peak.get(self.app_name, 0), running[self.app_name]
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            return {"action": "check", "amount": 0}
+        finally:
+            running[self.app_name] -= 1
+
+
+STATE = GameState.from_dict({"your_id": 0, "actions": ["fold", "check"]})
+
+
+@pytest.fixture(autouse=True)
+def reset_slow_agent():
+    SlowAgent.running = {}
+    SlowAgent.peak = {}
+
+
+class TestLLMRequestScheduler:
+    """LLMRequestSchedulerのテスト"""
+
+    def test_per_agent_limit(self):
+        """エージェント毎の同時実行数が上限を超えない"""
+        scheduler = LLMRequestScheduler(max_concurrency=10, per_agent_limit=2)
+        players = [SlowAgent(i, "team1_agent") for i in range(6)]
+
+        async def run():
+            return await asyncio.gather(
+                *(scheduler.decide(player, STATE) for player in players)
+            )
+
+        decisions = asyncio.run(run())
+
+        assert [d["action"] for d in decisions] == ["check"] * 6
+        assert SlowAgent.peak["team1_agent"] == 2
+        assert scheduler.stats.requests == 6
+        assert scheduler.stats.requests_by_agent == {"team1_agent": 6}
+        assert scheduler.in_flight == 0
+
+    def test_busy_agent_does_not_block_others(self):
+        """混雑しているエージェントの待ち行列が他のエージェントを塞がない"""
+        scheduler = LLMRequestScheduler(max_concurrency=10, per_agent_limit=1)
+        slow = [SlowAgent(i, "team1_agent", delay=0.05) for i in range(4)]
+        fast = SlowAgent(9, "team2_agent", delay=0.0)
+        finished = []
+
+        async def decide(player):
+            await scheduler.decide(player, STATE)
+            finished.append(player.app_name)
+
+        async def run():
+            await asyncio.gather(*(decide(player) for player in slow + [fast]))
+
+        asyncio.run(run())
+
+        # team2_agent は team1_agent の2件目より先に終わる
+        assert finished.index("team2_agent") <= 1
+        assert SlowAgent.peak == {"team1_agent": 1, "team2_agent": 1}
+
+    def test_global_limit(self):
+        """全体の同時実行数も制限される"""
+        scheduler = LLMRequestScheduler(max_concurrency=3, per_agent_limit=3)
+        players = [SlowAgent(i, f"team{i % 3}_agent") for i in range(9)]
+
+        async def run():
+            await asyncio.gather(
+                *(scheduler.decide(player, STATE) for player in players)
+            )
+
+        asyncio.run(run())
+
+        assert scheduler.stats.max_in_flight == 3
+
+    def test_instant_player_bypasses_limits(self):
+        """即時に決まるプレイヤーは枠を使わない"""
+        scheduler = LLMRequestScheduler()
+        decision = asyncio.run(scheduler.decide(RandomPlayer(0, "CPU0", rng=1), STATE))
+
+        assert decision["action"] in ["fold", "check"]
+        assert scheduler.stats.requests == 0
+
+    def test_cancelled_request_releases_slot(self):
+        """キャンセルされたリクエストは枠を返却する"""
+        scheduler = LLMRequestScheduler(max_concurrency=1, per_agent_limit=1)
+
+        async def run():
+            first = asyncio.ensure_future(
+                scheduler.decide(SlowAgent(0, "team1_agent", delay=1.0), STATE)
+            )
+            waiting = asyncio.ensure_future(
+                scheduler.decide(SlowAgent(1, "team1_agent"), STATE)
+            )
+            await asyncio.sleep(0.01)
+            waiting.cancel()
+            first.cancel()
+            await asyncio.gather(first, waiting, return_exceptions=True)
+            return await scheduler.decide(SlowAgent(2, "team1_agent"), STATE)
+
+        assert asyncio.run(run())["action"] == "check"
+        assert scheduler.in_flight == 0
+
+    def test_invalid_limits(self):
+        """同時実行数の上限は1以上"""
+        with pytest.raises(ValueError):
+            LLMRequestScheduler(max_concurrency=0)
+        with pytest.raises(ValueError):
+            LLMRequestScheduler(per_agent_limit=0)
@@ -0,0 +1,122 @@
+"""
+Tests for poker.simulation module and PokerGame headless mode
+"""
+
+import random
+
+import pytest
+from poker.game import GamePhase, PokerGame
+from poker.game_models import ActionEvent
+from poker.player_models import RandomPlayer
+from poker.simulation import SimulationResult, SimulationRunner, benchmark
+
+
+class TestHeadlessGame:
+    """PokerGameのヘッドレスモードのテスト"""
+
+    def _setup(self, headless: bool) -> PokerGame:
+        game = PokerGame(headless=headless)
+        game.setup_cpu_only_game()
+        game.dealer_button = 0
+        game.start_new_hand()
+        return game
+
+    def test_history_is_compact(self):
+        """履歴は構造化イベントで保持し、文字列化は要求されるまで行わない"""
+        game = self._setup(headless=True)
+
+        assert all(text is None for text in game.action_log._rendered)
+        assert game.hand_events == [(2, "small_blind", 10), (3, "big_blind", 20)]
+        assert [event.phase for event in game.action_log] == ["preflop", "preflop"]
+
+    def test_history_reset_each_hand(self):
+        """ヘッドレスモードの履歴はハンド毎にリセットされる"""
+        game = self._setup(headless=True)
+        game.process_player_action(game.current_player_index, "fold", 0)
+        game.start_new_hand()
+
+        assert [event[1] for event in game.hand_events] == ["small_blind", "big_blind"]
+
+    def test_game_state_history_matches_normal_mode(self):
+        """ゲーム状態の history は通常モードと同じ文字列になる"""
+        normal = self._setup(headless=False)
+        headless = self._setup(headless=True)
+        for game in (normal, headless):
+            game.process_player_action(game.current_player_index, "call", 0)
+
+        player_id = normal.current_player_index
+        assert (
+            headless.get_llm_game_state(player_id).history
+            == normal.get_llm_game_state(player_id).history
+        )
+        assert normal.action_history[-1] == "Player 0 called 20"
+
+    def test_describe_event(self):
+        """履歴イベントの文字列化"""
+        assert ActionEvent(1, "raise", 60).describe() == "Player 1 raised to 60"
+        assert ActionEvent(2, "fold").describe() == "Player 2 folded"
+        assert (
+            ActionEvent(0, "all_in", 500).describe() == "Player 0 went all-in with 500"
+        )
+
+
+class TestSimulationRunner:
+    """SimulationRunnerのテスト"""
+
+    def test_play_hand_never_creates_chips(self):
+        """ハンドを重ねてもチップが増えたり負になったりしない"""
+        runner = SimulationRunner(num_players=4, initial_chips=500)
+        for _ in range(200):
+            runner.play_hand()
+            chips = [player.chips for player in runner.game.players]
+            assert sum(chips) <= 4 * 500
+            assert min(chips) >= 0
+            assert runner.game.current_phase in (GamePhase.SHOWDOWN, GamePhase.FINISHED)
+
+    def test_run_result(self):
+        """run は指定ハンド数を実行し、ゲームをまたいで集計する"""
+        result = SimulationRunner(num_players=3, initial_chips=200).run(300)
+
+        assert isinstance(result, SimulationResult)
+        assert result.hands == 300
+        assert result.games >= 1
+        assert sum(result.net_chips.values()) <= 0
+        assert sum(result.hands_won.values()) >= 300
+        assert result.hands_per_second > 0
+        assert result.to_dict()["hands_per_second"] == result.hands_per_second
+
+    def test_custom_player_factory(self):
+        """プレイヤー生成関数を差し替えられる"""
+        created = []
+
+        def factory(player_id, initial_chips, rng):
+            player = RandomPlayer(player_id, f"Bot{player_id}", initial_chips, rng=rng)
+            created.append(player)
+            return player
+
+        runner = SimulationRunner(num_players=2, player_factory=factory)
+        runner.play_hand()
+
+        assert [player.name for player in runner.game.players] == ["Bot0", "Bot1"]
+        assert runner.game.headless is True
+
+    def test_same_seed_is_reproducible(self):
+        """同じシードなら同じ結果になる（グローバルな random に依存しない）"""
+        first = SimulationRunner(num_players=4, rng=11).run(200)
+        random.seed(0)
+        second = SimulationRunner(num_players=4, rng=11).run(200)
+
+        assert first.net_chips == second.net_chips
+        assert first.hands_won == second.hands_won
+
+    def test_invalid_player_count(self):
+        """プレイヤー数は2〜10人"""
+        with pytest.raises(ValueError):
+            SimulationRunner(num_players=1)
+
+    def test_benchmark(self):
+        """ベンチマークは hands/sec を返す"""
+        result = benchmark(num_hands=100)
+
+        assert result.hands == 100
+        assert result.hands_per_second > 0
@@ -0,0 +1,224 @@
+"""
+Tests for poker.state_server push endpoints and state change notifications
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from poker.game import PokerGame
+from poker.shared_state import get_state_version, set_current_game
+import poker.state_server as state_server
+from poker.state_server import merge_state_update, start_state_server
+
+
+@pytest.fixture
+def server():
+    game = PokerGame()
+    game.setup_cpu_only_game()
+    set_current_game(game)
+    httpd = start_state_server(port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield game, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get_json(url: str, timeout: float = 5.0, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        return resp.headers, json.loads(resp.read())
+
+
+class TestStateListener:
+    """PokerGameの状態変更通知のテスト"""
+
+    def test_listener_called_on_change(self):
+        """状態を変更するメソッドの後にリスナーが呼ばれる"""
+        game = PokerGame(headless=True)
+        game.setup_cpu_only_game()
+        calls = []
+        game.add_state_listener(lambda: calls.append(1))
+        game.start_new_hand()
+
+        assert calls == [1]
+        game.process_player_action(game.current_player_index, "fold", 0)
+        # 内部で次のプレイヤーに進めても、公開メソッド1回につき通知は1回
+        assert calls == [1, 1]
+
+    def test_listener_error_does_not_break_game(self):
+        """リスナーの例外はゲーム進行に影響しない"""
+        game = PokerGame(headless=True)
+        game.setup_cpu_only_game()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        game.add_state_listener(broken)
+        game.start_new_hand()
+
+        assert game.current_phase.value == "preflop"
+
+    def test_set_current_game_bumps_version(self):
+        """共有ゲームの登録と状態変更でバージョンが進む"""
+        game = PokerGame(headless=True)
+        game.setup_cpu_only_game()
+        before = get_state_version()
+        set_current_game(game)
+        registered = get_state_version()
+        game.start_new_hand()
+
+        assert registered > before
+        assert get_state_version() > registered
+
+
+class TestStateServer:
+    """状態サーバーのロングポーリングとSSEのテスト"""
+
+    def test_state_has_version(self, server):
+        """/state はバージョンを本文とヘッダーで返す"""
+        _, base = server
+        headers, state = _get_json(f"{base}/state")
+
+        assert state["version"] == get_state_version()
+        assert headers["X-State-Version"] == str(state["version"])
+
+    def test_etag_not_modified(self, server):
+        """If-None-Match が現在の ETag と一致すれば 304 を返す"""
+        game, base = server
+        headers, _ = _get_json(f"{base}/state")
+        etag = headers["ETag"]
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            _get_json(f"{base}/state", headers={"If-None-Match": etag})
+        assert excinfo.value.code == 304
+
+        game.start_new_hand()
+        headers, state = _get_json(f"{base}/state", headers={"If-None-Match": etag})
+        assert headers["ETag"] != etag
+        assert state["phase"] == "preflop"
+
+    def test_serialized_once_per_version(self, server, monkeypatch):
+        """同じバージョンへの複数リクエストでは状態の構築は1回だけ"""
+        game, base = server
+        calls = []
+        build = state_server._build_viewer_state
+
+        def counting_build():
+            calls.append(1)
+            return build()
+
+        monkeypatch.setattr(state_server, "_build_viewer_state", counting_build)
+        game.start_new_hand()
+        bodies = [_get_json(f"{base}/state")[1] for _ in range(3)]
+
+        assert len(calls) == 1
+        assert bodies[0] == bodies[1] == bodies[2]
+
+    def test_delta_merges_to_full_state(self, server):
+        """差分を適用した状態は最新のフルスナップショットと一致する"""
+        game, base = server
+        game.start_new_hand()
+        _, state = _get_json(f"{base}/state")
+        game.process_player_action(game.current_player_index, "call", 0)
+
+        _, delta = _get_json(f"{base}/state/delta?from={state['version']}")
+        assert delta["delta"] is True
+        assert "action_history" not in delta["fields"]
+        assert (
+            delta["history_append"]
+            == game.action_history[len(state["action_history"]) :]
+        )
+
+        merged = merge_state_update(state, delta)
+        _, full = _get_json(f"{base}/state")
+        assert merged == full
+
+    @pytest.mark.parametrize("replace", ["restore", "setter"])
+    def test_delta_after_history_replaced_returns_full(self, server, replace):
+        """履歴が作り直された後（restore / setter）はフルスナップショット"""
+        game, base = server
+        game.start_new_hand()
+        snapshot = game.snapshot()
+        game.process_player_action(game.current_player_index, "call", 0)
+        _, state = _get_json(f"{base}/state")
+
+        if replace == "restore":
+            game.restore(snapshot)
+        else:
+            game.action_history = ["x", "y"]
+        _, update = _get_json(f"{base}/state/delta?from={state['version']}")
+
+        assert "delta" not in update
+        merged = merge_state_update(state, update)
+        _, full = _get_json(f"{base}/state")
+        assert merged == full
+        assert merged["action_history"] == game.action_history
+
+    def test_delta_unknown_version_returns_full(self, server):
+        """保持していないバージョンからの差分要求にはフルスナップショットを返す"""
+        _, base = server
+        _, update = _get_json(f"{base}/state/delta?from=-5")
+
+        assert "delta" not in update
+        assert update["ready"] is True
+        assert merge_state_update({"version": 0}, update) is update
+
+    def test_merge_rejects_mismatched_version(self):
+        """クライアントのバージョンと合わない差分は適用できない"""
+        delta = {"delta": True, "from": 3, "version": 4, "fields": {}}
+        with pytest.raises(ValueError):
+            merge_state_update({"version": 2}, delta)
+
+    def test_long_poll_returns_on_change(self, server):
+        """since 指定時は状態が変わるまで待ってから返す"""
+        game, base = server
+        version = get_state_version()
+        timer = threading.Timer(0.2, game.start_new_hand)
+        timer.start()
+        start = time.perf_counter()
+        _, state = _get_json(f"{base}/state?since={version}&timeout=10")
+        timer.join()
+
+        assert state["version"] > version
+        assert time.perf_counter() - start < 5.0
+
+    def test_long_poll_timeout(self, server):
+        """変化がなければタイムアウト後に同じバージョンを返す"""
+        _, base = server
+        version = get_state_version()
+        _, state = _get_json(f"{base}/state?since={version}&timeout=0.2")
+
+        assert state["version"] == version
+
+    def test_events_stream(self, server):
+        """/events は接続時と状態変更時に state イベントを送る"""
+        game, base = server
+        with urllib.request.urlopen(f"{base}/events", timeout=5.0) as resp:
+            assert resp.headers["Content-Type"].startswith("text/event-stream")
+
+            def read_event():
+                fields = {}
+                while True:
+                    line = resp.readline().decode("utf-8").rstrip("\n")
+                    if not line:
+                        return fields
+                    key, _, value = line.partition(": ")
+                    fields[key] = value
+
+            first = read_event()
+            assert first["event"] == "state"
+            assert json.loads(first["data"])["version"] == int(first["id"])
+
+            game.start_new_hand()
+            second = read_event()
+            assert second["event"] == "delta"
+            assert int(second["id"]) > int(first["id"])
+            state = merge_state_update(
+                json.loads(first["data"]), json.loads(second["data"])
+            )
+            assert state["hand_number"] == game.hand_number
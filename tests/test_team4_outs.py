@@ -0,0 +1,66 @@
+"""
+Tests for the team4 agent's get_outs_info tool
+"""
+
+from itertools import combinations
+
+import pytest
+from poker.equity import calculate_equity
+from poker.evaluator import HandEvaluator, HandRank
+from poker.game_models import ALL_CARDS, Card
+
+
+def _brute_force(hole, board):
+    """残りのボードを HandEvaluator で全通り評価した、役毎の完成確率 (%) と outs"""
+    used = {card.id for card in hole + board}
+    remaining = [card for card in ALL_CARDS if card.id not in used]
+    current = HandEvaluator.evaluate_hand(hole, board).rank.value
+
+    counts = {}
+    runouts = list(combinations(remaining, 5 - len(board)))
+    for runout in runouts:
+        rank = HandEvaluator.evaluate_hand(hole, board + list(runout)).rank
+        counts[rank.name] = counts.get(rank.name, 0) + 1
+    outs = {}
+    for card in remaining:
+        rank = HandEvaluator.evaluate_hand(hole, board + [card]).rank
+        if rank.value > current:
+            outs.setdefault(rank.name, []).append(str(card))
+
+    expected = {}
+    for rank in HandRank:
+        if rank.value <= current or (rank.name not in counts and rank.name not in outs):
+            continue
+        expected[rank.name] = {
+            "card": sorted(outs.get(rank.name, [])),
+            "outs": len(outs.get(rank.name, [])),
+            "probability": round(100 * counts.get(rank.name, 0) / len(runouts), 1),
+        }
+    return expected
+
+
+class TestGetOutsInfo:
+    """get_outs_info の完成確率とエクイティのテスト"""
+
+    @pytest.mark.parametrize(
+        "hand, community",
+        [
+            (["9♥", "8♥"], ["7♥", "6♣", "2♥"]),
+            (["A♠", "K♠"], ["Q♠", "J♦", "2♣"]),
+            (["5♦", "5♣"], ["K♥", "5♠", "K♦", "2♣"]),
+            (["J♣", "10♣"], ["9♦", "8♣", "2♥", "3♣"]),
+        ],
+    )
+    def test_matches_brute_force(self, team4_tool, hand, community):
+        """役毎の outs と確率は全列挙と、エクイティは calculate_equity と一致する"""
+        info = team4_tool("outs").get_outs_info(hand, community)
+        hole = [Card.from_str(card) for card in hand]
+        board = [Card.from_str(card) for card in community]
+
+        equity = info.pop("equity")
+        for entry in info.values():
+            entry["card"] = sorted(entry["card"])
+        assert info == _brute_force(hole, board)
+
+        expected = calculate_equity(hole, board, mode="exact").equity
+        assert equity == pytest.approx(100 * expected, abs=0.051)
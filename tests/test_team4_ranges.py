@@ -0,0 +1,103 @@
+"""
+Tests for the team4 agent's get_opponent_ranges tool
+"""
+
+import time
+
+import pytest
+from poker.game_models import ActionEvent, Card
+from poker.ranges import (
+    estimate_ranges,
+    hand_vs_range,
+    parse_history,
+    preflop_strengths,
+    range_fraction,
+)
+
+FLOP = ["Q♥", "J♦", "2♣"]
+
+
+def _ids(*cards):
+    return tuple(Card.from_str(card).id for card in cards)
+
+
+# 前のハンドの行に続けて、今のハンドのプリフロップとフロップ
+HISTORY = [
+    ActionEvent(2, "call", 20, hand_number=1),
+    ActionEvent(2, "win", 80, hand_number=1),
+    ActionEvent(0, "small_blind", 10, hand_number=2),
+    ActionEvent(1, "big_blind", 20, hand_number=2),
+    ActionEvent(2, "raise", 60, hand_number=2),
+    ActionEvent(3, "call", 60, hand_number=2),
+    ActionEvent(0, "fold", hand_number=2),
+    ActionEvent(1, "call", 60, hand_number=2),
+    ActionEvent(-1, "flop", hand_number=2, cards=_ids(*FLOP)),
+    ActionEvent(1, "check", hand_number=2),
+    ActionEvent(2, "raise", 120, hand_number=2),
+    ActionEvent(3, "call", 120, hand_number=2),
+]
+
+
+@pytest.fixture
+def ranges_tool(team4_tool):
+    """空の既定キャッシュを使う get_opponent_ranges のモジュール"""
+    canonical = team4_tool("poker.canonical")
+    cache = canonical.CanonicalCache()
+    canonical.set_default_cache(cache)
+    yield team4_tool("ranges"), cache
+    canonical.set_default_cache(None)
+
+
+class TestGetOpponentRanges:
+    """相手のレンジ推定ツールのテスト"""
+
+    def test_reads_action_event_history(self, team4_tool, ranges_tool):
+        """ActionEvent.describe() の行から相手毎のアクション・レンジ・エクイティを返す"""
+        tool, _ = ranges_tool
+        history = [event.describe() for event in HISTORY]
+        info = tool.get_opponent_ranges(1, ["A♠", "K♠"], FLOP, history)
+
+        # 自分 (1) とフォールドした相手 (0) は含まない
+        assert set(info) == {"Player 2", "Player 3"}
+        assert info["Player 2"]["actions"] == ["preflop: raise", "flop: raise"]
+        assert info["Player 3"]["actions"] == ["preflop: call", "flop: call"]
+
+        strengths = preflop_strengths(team4_tool("preflop").load_table())
+        ranges = estimate_ranges(
+            parse_history(history, FLOP), FLOP, strengths, dead_cards=["A♠", "K♠"]
+        )
+        for player_id in (2, 3):
+            player = info[f"Player {player_id}"]
+            exact = hand_vs_range(["A♠", "K♠"], ranges[player_id], FLOP)
+            assert player["range_percent"] == round(
+                100 * range_fraction(ranges[player_id]), 1
+            )
+            # フロップはサンプリングなので完全列挙とは誤差の範囲で一致する
+            assert player["equity"] == pytest.approx(100 * exact, abs=1.5)
+
+    @pytest.mark.parametrize(
+        "community, events",
+        [
+            ([], HISTORY[:8]),
+            (FLOP, HISTORY),
+            (FLOP + ["3♠"], HISTORY + [ActionEvent(-1, "turn", cards=_ids("3♠"))]),
+        ],
+    )
+    def test_repeats_hit_cache_within_budget(self, ranges_tool, community, events):
+        """スートを付け替えた同じ状況はキャッシュから返す（1回 20 ms 以内）"""
+        tool, cache = ranges_tool
+        history = [event.describe() for event in events]
+
+        first = tool.get_opponent_ranges(1, ["A♠", "K♠"], community, history)
+        # ♠ と ♥ を入れ替えた同じ状況
+        swap = str.maketrans("♠♥", "♥♠")
+        relabelled = [card.translate(swap) for card in community]
+        relabelled_history = [line.translate(swap) for line in history]
+        start = time.perf_counter()
+        second = tool.get_opponent_ranges(
+            1, ["A♥", "K♥"], relabelled, relabelled_history
+        )
+
+        assert time.perf_counter() - start < 0.02
+        assert second == first
+        assert cache.hits == 1 and cache.misses == 1
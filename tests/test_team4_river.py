@@ -0,0 +1,64 @@
+"""
+Tests for the team4 agent's river tool
+"""
+
+from itertools import combinations
+
+import pytest
+from poker.evaluator import HandEvaluator
+from poker.game_models import ALL_CARDS, Card
+
+
+def _brute_force(hand, community):
+    """相手の手札（順序なしの組）を HandEvaluator で全通り評価した、自分より強くない割合"""
+    hole = [Card.from_str(card) for card in hand]
+    board = [Card.from_str(card) for card in community]
+    used = {card.id for card in hole + board}
+    remaining = [card for card in ALL_CARDS if card.id not in used]
+    mine = HandEvaluator.evaluate_hand(hole, board)
+    pairs = list(combinations(remaining, 2))
+    stronger = sum(
+        HandEvaluator.evaluate_hand(list(pair), board) > mine for pair in pairs
+    )
+    return 1 - stronger / len(pairs)
+
+
+@pytest.fixture
+def river_tool(team4_tool):
+    """空の既定キャッシュを使う river のモジュール"""
+    canonical = team4_tool("poker.canonical")
+    cache = canonical.CanonicalCache()
+    canonical.set_default_cache(cache)
+    yield team4_tool("river"), cache
+    canonical.set_default_cache(None)
+
+
+class TestRiver:
+    """リバーの役の強さの割合のテスト"""
+
+    @pytest.mark.parametrize(
+        "hand, community",
+        [
+            (["A♥", "K♠"], ["Q♦", "J♦", "10♦", "9♠", "6♦"]),
+            (["2♣", "7♦"], ["9♠", "J♥", "4♦", "8♣", "Q♠"]),
+            (["A♠", "A♦"], ["A♣", "A♥", "K♠", "K♦", "2♠"]),
+        ],
+    )
+    def test_matches_brute_force(self, river_tool, hand, community):
+        """HandEvaluator で相手の全組を評価した割合と一致する"""
+        tool, _ = river_tool
+
+        assert tool.river(hand, community) == pytest.approx(
+            _brute_force(hand, community)
+        )
+
+    def test_relabelled_suits_hit_cache(self, river_tool):
+        """スートを付け替えた同じ状況はキャッシュから同じ値を返す"""
+        tool, cache = river_tool
+        first = tool.river(["A♥", "K♠"], ["Q♦", "J♦", "10♦", "9♠", "6♦"])
+        # ♥ -> ♣, ♠ -> ♥, ♦ -> ♠ と付け替え、並び順も変える
+        second = tool.river(["K♥", "A♣"], ["6♠", "9♥", "10♠", "J♠", "Q♠"])
+
+        assert second == first
+        assert cache.hits == 1 and cache.misses == 1
+        assert len(cache) == 1
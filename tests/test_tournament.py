@@ -0,0 +1,183 @@
+"""
+Tests for poker.tournament module
+"""
+
+import asyncio
+
+import pytest
+from poker import tournament
+from poker.player_models import LLMApiPlayer, RandomPlayer
+from poker.tournament import (
+    AgentStats,
+    TableResult,
+    aggregate_results,
+    create_agent_player,
+    parse_lineup,
+    play_table,
+    run_concurrent_tables,
+    run_tournament,
+)
+
+
+class TestParseLineup:
+    """ラインナップ解析のテスト"""
+
+    def test_parse(self):
+        """エージェント名と人数を座席順に展開する"""
+        assert parse_lineup("team1_agent:2, random:1") == [
+            "team1_agent",
+            "team1_agent",
+            "random",
+        ]
+
+    def test_count_defaults_to_one(self):
+        """人数を省略すると1人"""
+        assert parse_lineup("random,team2_agent") == ["random", "team2_agent"]
+
+    @pytest.mark.parametrize(
+        "lineup", ["unknown_agent:2", "random:0", "random:x", "random:1", "random:11"]
+    )
+    def test_invalid(self, lineup):
+        """不正なラインナップはエラー"""
+        with pytest.raises(ValueError):
+            parse_lineup(lineup)
+
+    def test_create_agent_player(self):
+        """random はCPU、それ以外はAPIエージェント"""
+        assert isinstance(create_agent_player("random", 0, 100), RandomPlayer)
+        player = create_agent_player("team1_agent", 1, 100)
+        assert isinstance(player, LLMApiPlayer)
+        assert player.app_name == "team1_agent"
+
+
+class TestPlayTable:
+    """1テーブル実行のテスト"""
+
+    def test_play_table(self):
+        """指定ハンド数を実行し、座席毎の結果を返す"""
+        result = play_table(0, ["random", "random", "random"], 200, seed=7)
+
+        assert isinstance(result, TableResult)
+        assert result.hands == 200
+        assert result.games == len(result.bust_orders) >= 1
+        assert len(result.hands_won) == 3
+        assert sum(result.net_chips) <= 0
+        assert all(played <= 200 for played in result.hands_played)
+
+    def test_same_seed_is_reproducible(self):
+        """同じシードなら同じ結果になる"""
+        first = play_table(0, ["random"] * 4, 100, seed=123)
+        second = play_table(0, ["random"] * 4, 100, seed=123)
+
+        assert first.net_chips == second.net_chips
+        assert first.hands_won == second.hands_won
+        assert first.bust_orders == second.bust_orders
+
+
+class TestAggregate:
+    """集計のテスト"""
+
+    def test_aggregate_results(self):
+        """エージェント毎に収支・bb/100・バスト順位を集計する"""
+        table = TableResult(
+            table_index=0,
+            seed=0,
+            lineup=["a", "b", "a"],
+            hands=100,
+            games=1,
+            hands_played=[100, 50, 100],
+            hands_won=[30, 10, 20],
+            net_chips=[400, -2000, 1600],
+            bust_orders=[[1]],
+            elapsed=0.1,
+        )
+        agents = aggregate_results([table], big_blind=20)
+
+        assert agents["a"].seats == 2
+        assert agents["a"].hands_won == 50
+        assert agents["a"].total_winnings == 2000
+        assert agents["a"].bb_per_100 == pytest.approx(2000 / 20 / 200 * 100)
+        assert agents["a"].average_bust_position is None
+        assert agents["b"].busts == 1
+        assert agents["b"].average_bust_position == 1
+        assert agents["b"].bb_per_100 == pytest.approx(-200)
+
+
+class TestRunTournament:
+    """トーナメント全体のテスト"""
+
+    def test_run_in_process(self):
+        """workers=1 では同一プロセスで実行し、座席をローテーションする"""
+        result = run_tournament("random:3", num_tables=3, hands_per_table=50, workers=1)
+
+        assert result.total_hands == 150
+        assert [table.table_index for table in result.tables] == [0, 1, 2]
+        assert isinstance(result.agents["random"], AgentStats)
+        assert result.agents["random"].seats == 9
+        assert result.to_dict()["total_hands"] == 150
+
+    def test_process_pool_matches_in_process(self):
+        """プロセスプールでも同じシードなら同じ結果になる"""
+        kwargs = dict(lineup="random:2", num_tables=2, hands_per_table=50, seed=42)
+        serial = run_tournament(workers=1, **kwargs)
+        parallel = run_tournament(workers=2, **kwargs)
+
+        assert [t.net_chips for t in serial.tables] == [
+            t.net_chips for t in parallel.tables
+        ]
+
+    def test_invalid_table_count(self):
+        """テーブル数は1以上"""
+        with pytest.raises(ValueError):
+            run_tournament("random:2", num_tables=0)
+
+
+class SlowRandomPlayer(RandomPlayer):
+    """判断に時間がかかるエージェントの代わり"""
+
+    async def make_decision_async(self, game_state):
+        await asyncio.sleep(0.001)
+        return self.make_decision(game_state)
+
+
+class TestRunConcurrentTables:
+    """複数テーブル同時進行のテスト"""
+
+    def test_matches_process_runner(self):
+        """同じシードならプロセス版と同じ結果になる"""
+        kwargs = dict(lineup="random:3", num_tables=2, hands_per_table=50, seed=5)
+        concurrent = run_concurrent_tables(**kwargs)
+        serial = run_tournament(workers=1, **kwargs)
+
+        assert [t.net_chips for t in concurrent.tables] == [
+            t.net_chips for t in serial.tables
+        ]
+        assert concurrent.total_hands == 100
+        assert concurrent.scheduler.requests == 0
+
+    def test_tables_share_scheduler(self, monkeypatch):
+        """全テーブルの判断がスケジューラで多重化される"""
+
+        def create(agent, player_id, initial_chips, url="", rng=None):
+            player = SlowRandomPlayer(
+                player_id, f"Agent{player_id}", initial_chips, rng
+            )
+            player.app_name = agent
+            return player
+
+        monkeypatch.setattr(tournament, "create_agent_player", create)
+        result = run_concurrent_tables(
+            lineup="team1_agent:2,team2_agent:2",
+            num_tables=4,
+            hands_per_table=5,
+            seed=1,
+            per_agent_limit=3,
+        )
+
+        assert result.total_hands == 20
+        assert set(result.agents) == {"team1_agent", "team2_agent"}
+        assert 1 < result.scheduler.max_in_flight <= 6
+        assert set(result.scheduler.requests_by_agent) == {
+            "team1_agent",
+            "team2_agent",
+        }